@@ -22,16 +22,30 @@ python3 -m bin.cleanup.cleanup \
     --network=default-vpc \
     --kube_context=gke_grpc-testing_us-central1-a_psm-interop-security
 """
+import collections
+import concurrent.futures
 import dataclasses
 import datetime
 import functools
+import itertools
 import json
 import logging
 import os
 import re
 import subprocess
 import sys
-from typing import Any, Callable, List, Optional
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from absl import app
 from absl import flags
@@ -54,6 +68,11 @@ _KubernetesServerRunner = k8s_xds_server_runner.KubernetesServerRunner
 _GammaServerRunner = gamma_server_runner.GammaServerRunner
 _ClientDeploymentArgs = k8s_xds_client_runner.ClientDeploymentArgs
 _ServerDeploymentArgs = k8s_xds_server_runner.ServerDeploymentArgs
+_TdManager = traffic_director.TrafficDirectorManager
+_TdAppNetManager = traffic_director.TrafficDirectorAppNetManager
+_TdSecureManager = traffic_director.TrafficDirectorSecureManager
+# The name of the resource set, and the function deleting it.
+CleanupTask = Tuple[str, Callable[[], Optional[str]]]
 
 GCLOUD = os.environ.get("GCLOUD", "gcloud")
 GCLOUD_CMD_TIMEOUT_S = datetime.timedelta(seconds=5).total_seconds()
@@ -129,6 +148,26 @@ SECONDARY = flags.DEFINE_bool(
     default=False,
     help="Cleanup secondary (alternative) resources",
 )
+TD_CLEANUP_WORKERS = flags.DEFINE_integer(
+    "td_cleanup_workers",
+    default=4,
+    lower_bound=1,
+    help=(
+        "the number of leaked TD resource sets (all resources with the same"
+        " suffix) to delete concurrently"
+    ),
+)
+K8S_CLEANUP_WORKERS = flags.DEFINE_integer(
+    "k8s_cleanup_workers",
+    default=8,
+    lower_bound=1,
+    help="the number of leaked k8s namespaces to delete concurrently",
+)
+SUMMARY_FILE = flags.DEFINE_string(
+    "summary_file",
+    default=None,
+    help="save the cleanup summary with per-resource timings to a JSON file",
+)
 
 # The cleanup script performs some API calls directly, so some flags normally
 # required to configure framework properly, are not needed here.
@@ -138,18 +177,84 @@ flags.FLAGS.set_default("server_image", "ignored-by-cleanup")
 flags.FLAGS.set_default("client_image", "ignored-by-cleanup")
 
 
+# Cleanup statuses.
+STATUS_DELETED = "deleted"
+STATUS_NOT_FOUND = "not_found"
+STATUS_FAILED = "failed"
+STATUS_KEPT = "kept"
+STATUS_DRY_RUN = "dry_run"
+STATUS_NOT_EXPIRED = "not_expired"
+STATUS_NO_MATCH = "no_match"
+
+# The number of the slowest resources to show in the summary.
+_SUMMARY_SLOWEST_COUNT = 10
+
+
+@dataclasses.dataclass(frozen=True)
+class CleanupRecord:
+    # The type of the resource: "td" or "namespace".
+    kind: str
+    # The name of the leaked resource that triggered the cleanup.
+    name: str
+    status: str
+    duration_sec: float = 0.0
+    error: str = ""
+
+
 @dataclasses.dataclass(eq=False)
 class CleanupResult:
     error_count: int = 0
     error_messages: List[str] = dataclasses.field(default_factory=list)
+    records: List[CleanupRecord] = dataclasses.field(default_factory=list)
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, repr=False
+    )
 
     def add_error(self, msg: str):
-        self.error_count += 1
-        self.error_messages.append(f"  {self.error_count}. {msg}")
+        with self._lock:
+            self.error_count += 1
+            self.error_messages.append(f"  {self.error_count}. {msg}")
+
+    def add_record(self, record: CleanupRecord):
+        with self._lock:
+            self.records.append(record)
 
     def format_messages(self):
         return "\n".join(self.error_messages)
 
+    def format_summary(self, elapsed_sec: float) -> str:
+        with self._lock:
+            records = list(self.records)
+        lines = [f"Cleanup finished in {elapsed_sec:.1f}s"]
+        by_kind: Dict[str, List[CleanupRecord]] = collections.defaultdict(list)
+        for record in records:
+            by_kind[record.kind].append(record)
+        for kind, kind_records in sorted(by_kind.items()):
+            counts = collections.Counter(r.status for r in kind_records)
+            total_sec = sum(r.duration_sec for r in kind_records)
+            statuses = ", ".join(f"{s}={n}" for s, n in sorted(counts.items()))
+            lines.append(f"  {kind}: {statuses}; total time {total_sec:.1f}s")
+        slowest = sorted(records, key=lambda r: r.duration_sec, reverse=True)
+        slowest = [
+            r for r in slowest[:_SUMMARY_SLOWEST_COUNT] if r.duration_sec
+        ]
+        if slowest:
+            lines.append("  Slowest:")
+            for r in slowest:
+                lines.append(
+                    f"    {r.duration_sec:7.1f}s {r.kind} {r.name} [{r.status}]"
+                )
+        return "\n".join(lines)
+
+    def to_json(self, elapsed_sec: float) -> Json:
+        with self._lock:
+            records = [dataclasses.asdict(r) for r in self.records]
+            return {
+                "elapsed_sec": round(elapsed_sec, 3),
+                "error_count": self.error_count,
+                "resources": records,
+            }
+
 
 @dataclasses.dataclass(frozen=True)
 class K8sResourceRule:
@@ -195,16 +300,6 @@ def get_expire_timestamp() -> datetime.datetime:
 
 def exec_gcloud(project: str, *cmds: str) -> Json:
     cmds = [GCLOUD, "--project", project, "--quiet"] + list(cmds)
-    if "list" in cmds:
-        # Add arguments to shape the list output
-        cmds.extend(
-            [
-                "--format",
-                "json",
-                "--filter",
-                f"creationTimestamp <= {get_expire_timestamp().isoformat()}",
-            ]
-        )
     # Executing the gcloud command
     logging.debug("Executing: %s", " ".join(cmds))
     proc = subprocess.Popen(
@@ -231,9 +326,34 @@ def exec_gcloud(project: str, *cmds: str) -> Json:
     return None
 
 
+def list_leaked_resources(
+    list_fn: Callable[..., Iterator[Json]], name_prefixes: List[str]
+) -> Iterator[Json]:
+    """Yields the resources with the given name prefixes past KEEP_PERIOD.
+
+    The name prefixes are matched by the Compute API, and the pages are
+    requested as the resources are consumed. The creation timestamp is
+    checked here: Compute API filters can't combine the regular expressions
+    with the comparison operators.
+    """
+    if not name_prefixes:
+        return
+    resource_filter = f'name eq "(?:{"|".join(name_prefixes)}).*"'
+    expire_timestamp = get_expire_timestamp()
+    for resource in list_fn(resource_filter=resource_filter):
+        created = dateutil.parser.isoparse(resource["creationTimestamp"])
+        if created <= expire_timestamp:
+            yield resource
+        else:
+            logging.debug(
+                "----- Skipped [resource is within expiry date]: %s",
+                resource["name"],
+            )
+
+
 def cleanup_legacy_driver_resources(*, project: str, suffix: str, **kwargs):
     """Removing GCP resources created by run_xds_tests.py."""
-    # Unused, but kept for compatibility with cleanup_td_for_gke.
+    # Unused, but passed to all resource rule cleanup functions.
     del kwargs
     logging.info(
         "----- Removing run_xds_tests.py resources with suffix [%s]", suffix
@@ -339,61 +459,230 @@ def cleanup_legacy_driver_resources(*, project: str, suffix: str, **kwargs):
     )
 
 
-# cleanup_td creates TrafficDirectorManager (and its varients for security and
-# AppNet), and then calls the cleanup() methods.
-#
-# Note that the varients are all based on the basic TrafficDirectorManager, so
-# their `cleanup()` might do duplicate work. But deleting an non-exist resource
-# returns 404, and is OK.
-def cleanup_td_for_gke(
-    *,
-    project,
-    prefix,
-    suffix,
-    network,
-    enable_dualstack: bool = False,
-    compute_api_version: str = "v1",
-):
-    gcp_api_manager = gcp.api.GcpApiManager()
-    plain_td = traffic_director.TrafficDirectorManager(
-        gcp_api_manager,
-        project=project,
-        network=network,
-        resource_prefix=prefix,
-        resource_suffix=suffix,
-        enable_dualstack=enable_dualstack,
-        compute_api_version=compute_api_version,
-    )
-    security_td = traffic_director.TrafficDirectorSecureManager(
-        gcp_api_manager,
-        project=project,
-        network=network,
-        resource_prefix=prefix,
-        resource_suffix=suffix,
-        enable_dualstack=enable_dualstack,
-        compute_api_version=compute_api_version,
-    )
-    appnet_td = traffic_director.TrafficDirectorAppNetManager(
-        gcp_api_manager,
-        project=project,
-        network=network,
-        resource_prefix=prefix,
-        resource_suffix=suffix,
-    )
+@dataclasses.dataclass(frozen=True)
+class TdApis:
+    compute: gcp.compute.ComputeV1
+    netsvc: gcp.network_services.NetworkServicesV1
+    netsec: gcp.network_security.NetworkSecurityV1Beta1
+
+    @classmethod
+    def create(cls, project: str, compute_api_version: str) -> "TdApis":
+        gcp_api_manager = gcp.api.GcpApiManager()
+        return cls(
+            compute=gcp.compute.ComputeV1(
+                gcp_api_manager, project, version=compute_api_version
+            ),
+            netsvc=gcp.network_services.NetworkServicesV1(
+                gcp_api_manager, project
+            ),
+            netsec=gcp.network_security.NetworkSecurityV1Beta1(
+                gcp_api_manager, project
+            ),
+        )
 
-    logger.info(
-        "----- Removing traffic director for gke, prefix %s, suffix %s",
-        prefix,
-        suffix,
+
+@dataclasses.dataclass(frozen=True)
+class TdResourceKind:
+    kind: str
+    # The resource names between the prefix and the suffix,
+    # see TrafficDirectorManager.make_resource_name().
+    names: Tuple[str, ...]
+    # Lists all resources of the kind, accepts Compute API filter expression.
+    list_fn: Callable[[TdApis, str], Iterator[Json]]
+    delete_fn: Callable[[TdApis, str], Any]
+
+
+# All resource kinds created by the TrafficDirectorManager and its variants,
+# in the deletion order: the resources go before the resources they use.
+TD_RESOURCE_KINDS: Tuple[TdResourceKind, ...] = (
+    TdResourceKind(
+        "http_route",
+        (_TdAppNetManager.HTTP_ROUTE_NAME,),
+        lambda apis, _: apis.netsvc.list_http_routes(),
+        lambda apis, name: apis.netsvc.delete_http_route(name),
+    ),
+    TdResourceKind(
+        "grpc_route",
+        (_TdAppNetManager.GRPC_ROUTE_NAME,),
+        lambda apis, _: apis.netsvc.list_grpc_routes(),
+        lambda apis, name: apis.netsvc.delete_grpc_route(name),
+    ),
+    TdResourceKind(
+        "mesh",
+        (_TdAppNetManager.MESH_NAME,),
+        lambda apis, _: apis.netsvc.list_meshes(),
+        lambda apis, name: apis.netsvc.delete_mesh(name),
+    ),
+    TdResourceKind(
+        "firewall_rule",
+        (_TdManager.FIREWALL_RULE_NAME, _TdManager.FIREWALL_RULE_NAME_IPV6),
+        lambda apis, f: apis.compute.list_firewall_rule(resource_filter=f),
+        lambda apis, name: apis.compute.delete_firewall_rule(name),
+    ),
+    TdResourceKind(
+        "forwarding_rule",
+        (
+            _TdManager.FORWARDING_RULE_NAME,
+            _TdManager.FORWARDING_RULE_NAME_IPV6,
+            _TdManager.ALTERNATIVE_FORWARDING_RULE_NAME,
+        ),
+        lambda apis, f: apis.compute.list_forwarding_rule(resource_filter=f),
+        lambda apis, name: apis.compute.delete_forwarding_rule(name),
+    ),
+    TdResourceKind(
+        "target_http_proxy",
+        (_TdManager.TARGET_PROXY_NAME,),
+        lambda apis, f: apis.compute.list_target_http_proxy(resource_filter=f),
+        lambda apis, name: apis.compute.delete_target_http_proxy(name),
+    ),
+    TdResourceKind(
+        "target_grpc_proxy",
+        (
+            _TdManager.TARGET_PROXY_NAME,
+            _TdManager.TARGET_PROXY_NAME_IPV6,
+            _TdManager.ALTERNATIVE_TARGET_PROXY_NAME,
+        ),
+        lambda apis, f: apis.compute.list_target_grpc_proxy(resource_filter=f),
+        lambda apis, name: apis.compute.delete_target_grpc_proxy(name),
+    ),
+    TdResourceKind(
+        "url_map",
+        (_TdManager.URL_MAP_NAME, _TdManager.ALTERNATIVE_URL_MAP_NAME),
+        lambda apis, f: apis.compute.list_url_map(resource_filter=f),
+        lambda apis, name: apis.compute.delete_url_map(name),
+    ),
+    TdResourceKind(
+        "backend_service",
+        (
+            _TdManager.BACKEND_SERVICE_NAME,
+            _TdManager.ALTERNATIVE_BACKEND_SERVICE_NAME,
+            _TdManager.AFFINITY_BACKEND_SERVICE_NAME,
+        ),
+        lambda apis, f: apis.compute.list_backend_service(resource_filter=f),
+        lambda apis, name: apis.compute.delete_backend_service(name),
+    ),
+    TdResourceKind(
+        "health_check",
+        (_TdManager.HEALTH_CHECK_NAME,),
+        lambda apis, f: apis.compute.list_health_check(resource_filter=f),
+        lambda apis, name: apis.compute.delete_health_check(name),
+    ),
+    TdResourceKind(
+        "endpoint_policy",
+        (_TdSecureManager.ENDPOINT_POLICY,),
+        lambda apis, _: apis.netsvc.list_endpoint_policies(),
+        lambda apis, name: apis.netsvc.delete_endpoint_policy(name),
+    ),
+    TdResourceKind(
+        "server_tls_policy",
+        (_TdSecureManager.SERVER_TLS_POLICY_NAME,),
+        lambda apis, _: apis.netsec.list_server_tls_policies(),
+        lambda apis, name: apis.netsec.delete_server_tls_policy(name),
+    ),
+    TdResourceKind(
+        "client_tls_policy",
+        (_TdSecureManager.CLIENT_TLS_POLICY_NAME,),
+        lambda apis, _: apis.netsec.list_client_tls_policies(),
+        lambda apis, name: apis.netsec.delete_client_tls_policy(name),
+    ),
+    TdResourceKind(
+        "authz_policy",
+        (_TdSecureManager.AUTHZ_POLICY_NAME,),
+        lambda apis, _: apis.netsec.list_authz_policies(),
+        lambda apis, name: apis.netsec.delete_authz_policy(name),
+    ),
+)
+
+
+def parse_td_resource_name(
+    resource_name: str, prefixes: List[str], names: Tuple[str, ...]
+) -> Optional[Tuple[str, str]]:
+    """Returns the (prefix, suffix) of a TD resource name, if it's one."""
+    for prefix in sorted(prefixes, key=len, reverse=True):
+        if not resource_name.startswith(f"{prefix}-"):
+            continue
+        rest = resource_name[len(prefix) + 1 :]
+        if rest in names:
+            # Created without a suffix, shared between the tests.
+            return None
+        # F.e. backend-service-alt before backend-service.
+        for name in sorted(names, key=len, reverse=True):
+            if rest.startswith(f"{name}-"):
+                return prefix, rest[len(name) + 1 :]
+    return None
+
+
+@dataclasses.dataclass
+class TdResourceGroup:
+    """All TD resources with the same prefix and suffix."""
+
+    prefix: str
+    suffix: str
+    # Resource names by the resource kind.
+    resources: Dict[str, List[str]] = dataclasses.field(
+        default_factory=lambda: collections.defaultdict(list)
     )
+    last_created: Optional[datetime.datetime] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.prefix}-*-{self.suffix}"
+
+    def add(self, kind: str, name: str, created: datetime.datetime):
+        self.resources[kind].append(name)
+        if self.last_created is None or created > self.last_created:
+            self.last_created = created
+
+
+class TdResourceInventory:
+    """The TD resources of all kinds with the given prefixes, by the suffix.
+
+    Each resource kind is listed once, instead of trying to delete every
+    resource of every suffix: most of them don't exist.
+    """
+
+    prefixes: List[str]
+    groups: Dict[Tuple[str, str], TdResourceGroup]
+
+    def __init__(self, prefixes: List[str]):
+        self.prefixes = prefixes
+        self.groups = {}
+
+    def load(self, apis: TdApis):
+        # Matched by the Compute API. Other APIs don't support filters,
+        # their resources are matched in parse_td_resource_name().
+        name_filter = f'name eq "(?:{"|".join(self.prefixes)})-.*"'
+        for kind in TD_RESOURCE_KINDS:
+            count = 0
+            for resource in kind.list_fn(apis, name_filter):
+                count += self.add(kind, resource)
+            logger.info("Found %i %s resource(s)", count, kind.kind)
+
+    def add(self, kind: TdResourceKind, resource: Json) -> bool:
+        # Cloud API resource names are the full paths.
+        name: str = resource["name"].rsplit("/", 1)[-1]
+        parsed = parse_td_resource_name(name, self.prefixes, kind.names)
+        if parsed is None:
+            return False
+        created = dateutil.parser.isoparse(
+            resource.get("creationTimestamp") or resource["createTime"]
+        )
+        if parsed not in self.groups:
+            self.groups[parsed] = TdResourceGroup(*parsed)
+        self.groups[parsed].add(kind.kind, name, created)
+        return True
+
+
+def cleanup_td_resource_group(group: TdResourceGroup, apis: TdApis):
     logger.info(
-        "--- Cleaning up %s resources...", security_td.__class__.__name__
+        "----- Removing traffic director resources %s: %s",
+        group.name,
+        dict(group.resources),
     )
-    security_td.cleanup(force=True)
-    logger.info("--- Cleaning up %s resources...", appnet_td.__class__.__name__)
-    appnet_td.cleanup(force=True)
-    logger.info("--- Cleaning up %s resources...", plain_td.__class__.__name__)
-    plain_td.cleanup(force=True)
+    for kind in TD_RESOURCE_KINDS:
+        for name in group.resources.get(kind.kind, ()):
+            logger.info("Deleting %s %s", kind.kind, name)
+            kind.delete_fn(apis, name)
 
 
 # cleanup_client creates a client runner, and calls its cleanup() method.
@@ -541,42 +830,122 @@ def cleanup_server(
         raise
 
 
-def delete_leaked_td_resources(
+def run_cleanup_tasks(
+    kind: str,
+    tasks: Iterable[CleanupTask],
+    max_workers: int,
+):
+    """Runs the cleanup tasks concurrently in a bounded thread pool.
+
+    Each task deletes a set of resources depending on each other in their
+    dependency order, so only the independent sets are deleted concurrently.
+    The task returns its cleanup status, None meaning the resources were
+    deleted. The timing and the status of each task is added to the summary.
+
+    The tasks are started as soon as they're yielded, while the rest of the
+    resources are still being listed.
+    """
+    logger.info(
+        "----- Cleaning up %s resources, %i at a time", kind, max_workers
+    )
+    task_count = 0
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=f"cleanup-{kind}"
+    ) as executor:
+        for name, fn in tasks:
+            task_count += 1
+            executor.submit(_run_cleanup_task, kind, name, fn)
+    logger.info("----- Cleaned up %i %s resource set(s)", task_count, kind)
+
+
+def _run_cleanup_task(
+    kind: str, name: str, fn: Callable[[], Optional[str]]
+) -> None:
+    logger.info("----- Cleaning up %s %s", kind, name)
+    error = ""
+    start = time.monotonic()
+    try:
+        status = fn() or STATUS_DELETED
+    except retryers.RetryError as err:
+        status, error = STATUS_FAILED, str(err)
+        _CLEANUP_RESULT.add_error(
+            f"Retries exhausted while cleaning up {kind} {name}: {err}"
+        )
+        logging.exception("----- Skipped [cleanup timed out]: %s", name)
+    except Exception as err:  # noqa pylint: disable=broad-except
+        status, error = STATUS_FAILED, str(err)
+        _CLEANUP_RESULT.add_error(
+            f"Unexpected error while cleaning up {kind} {name}: {err}"
+        )
+        logging.exception("----- Skipped [cleanup unexpected error]: %s", name)
+    duration_sec = time.monotonic() - start
+    _CLEANUP_RESULT.add_record(
+        CleanupRecord(
+            kind=kind,
+            name=name,
+            status=status,
+            duration_sec=round(duration_sec, 3),
+            error=error,
+        )
+    )
+    logger.info(
+        "----- Cleaned up %s %s in %.1fs: %s", kind, name, duration_sec, status
+    )
+
+
+def _td_cleanup_tasks(
     dry_run,
     td_resource_rules,
     project,
     network,
-    resources,
+    resources: Iterable[Json],
     enable_dualstack: bool = False,
     compute_api_version: str = "v1",
-):
+) -> Iterator[CleanupTask]:
+    # All resources with the same suffix are deleted by a single remove_fn
+    # call, which deletes them in the dependency order. The remove_fn calls
+    # for different suffixes are independent, and run concurrently.
+    scheduled = set()
     for resource in resources:
-        logger.info("-----")
-        logger.info("----- Cleaning up resource %s", resource["name"])
+        name: str = resource["name"]
         if dry_run:
             # Skip deletion for dry-runs
-            logging.info("----- Skipped [Dry Run]: %s", resource["name"])
+            logging.info("----- Skipped [Dry Run]: %s", name)
+            _CLEANUP_RESULT.add_record(
+                CleanupRecord("td", name, STATUS_DRY_RUN)
+            )
             continue
         matched = False
         for regex, resource_prefix, keep, remove_fn in td_resource_rules:
-            result = re.search(regex, resource["name"])
-            if result is not None:
-                matched = True
-                if keep(result.group(1)):
-                    logging.info("Skipped [keep]:")
-                    break  # break inner loop, continue outer loop
-                remove_fn(
+            result = re.search(regex, name)
+            if result is None:
+                continue
+            matched = True
+            suffix = result.group(1)
+            if keep(suffix):
+                logging.info("----- Skipped [keep]: %s", name)
+                _CLEANUP_RESULT.add_record(
+                    CleanupRecord("td", name, STATUS_KEPT)
+                )
+            elif (remove_fn, resource_prefix, suffix) not in scheduled:
+                scheduled.add((remove_fn, resource_prefix, suffix))
+                yield name, functools.partial(
+                    remove_fn,
                     project=project,
                     prefix=resource_prefix,
-                    suffix=result.group(1),
+                    suffix=suffix,
                     network=network,
                     enable_dualstack=enable_dualstack,
                     compute_api_version=compute_api_version,
                 )
-                break
+            break
         if not matched:
             logging.info(
-                "----- Skipped [does not matching resource name templates]"
+                "----- Skipped [does not matching resource name templates]: %s",
+                name,
+            )
+            _CLEANUP_RESULT.add_record(
+                CleanupRecord("td", name, STATUS_NO_MATCH)
             )
 
 
@@ -586,29 +955,33 @@ def delete_k8s_resources(
     project,
     network,
     k8s_api_manager,
+    gcp_api_manager,
     gcp_service_account,
     namespaces,
     enable_dualstack: bool = False,
 ):
-    gcp_api_manager = gcp.api.GcpApiManager()
+    tasks: List[CleanupTask] = []
     for ns in namespaces:
         namespace_name: str = ns.metadata.name
         if namespace_name in K8S_PROTECTED_NAMESPACES:
             continue
 
-        logger.info("-----")
-        logger.info("----- Cleaning up k8s namespaces %s", namespace_name)
-
         if ns.metadata.creation_timestamp > get_expire_timestamp():
             logging.info(
                 "----- Skipped [resource is within expiry date]: %s",
                 namespace_name,
             )
+            _CLEANUP_RESULT.add_record(
+                CleanupRecord("namespace", namespace_name, STATUS_NOT_EXPIRED)
+            )
             continue
 
         if dry_run:
             # Skip deletion for dry-runs
-            logging.info("----- Skipped [Dry Run]: %s", ns.metadata.name)
+            logging.info("----- Skipped [Dry Run]: %s", namespace_name)
+            _CLEANUP_RESULT.add_record(
+                CleanupRecord("namespace", namespace_name, STATUS_DRY_RUN)
+            )
             continue
 
         rule: K8sResourceRule = _rule_match_k8s_namespace(
@@ -619,43 +992,56 @@ def delete_k8s_resources(
                 "----- Skipped [does not matching resource name templates]: %s",
                 namespace_name,
             )
+            _CLEANUP_RESULT.add_record(
+                CleanupRecord("namespace", namespace_name, STATUS_NO_MATCH)
+            )
             continue
 
-        # Cleaning up.
-        try:
-            rule.cleanup_ns_fn(
-                project,
-                network,
-                k8s_api_manager,
-                namespace_name,
-                gcp_api_manager,
-                gcp_service_account,
-                suffix=("alt" if SECONDARY.value else None),
-                enable_dualstack=enable_dualstack,
-            )
-        except k8s.NotFound:
-            logging.warning("----- Skipped [not found]: %s", namespace_name)
-        except retryers.RetryError as err:
-            _CLEANUP_RESULT.add_error(
-                "Retries exhausted while waiting for the "
-                f"deletion of namespace {namespace_name}: "
-                f"{err}"
-            )
-            logging.exception(
-                "----- Skipped [cleanup timed out]: %s", namespace_name
-            )
-        except Exception as err:  # noqa pylint: disable=broad-except
-            _CLEANUP_RESULT.add_error(
-                "Unexpected error while deleting "
-                f"namespace {namespace_name}: {err}"
-            )
-            logging.exception(
-                "----- Skipped [cleanup unexpected error]: %s", namespace_name
-            )
+        cleanup_fn = functools.partial(
+            _cleanup_namespace,
+            rule,
+            project,
+            network,
+            k8s_api_manager,
+            namespace_name,
+            gcp_api_manager,
+            gcp_service_account,
+            enable_dualstack=enable_dualstack,
+        )
+        tasks.append((namespace_name, cleanup_fn))
 
+    run_cleanup_tasks("namespace", tasks, K8S_CLEANUP_WORKERS.value)
     logger.info("-----")
 
 
+def _cleanup_namespace(
+    rule: K8sResourceRule,
+    project,
+    network,
+    k8s_api_manager,
+    namespace_name: str,
+    gcp_api_manager,
+    gcp_service_account,
+    *,
+    enable_dualstack: bool = False,
+) -> Optional[str]:
+    try:
+        rule.cleanup_ns_fn(
+            project,
+            network,
+            k8s_api_manager,
+            namespace_name,
+            gcp_api_manager,
+            gcp_service_account,
+            suffix=("alt" if SECONDARY.value else None),
+            enable_dualstack=enable_dualstack,
+        )
+    except k8s.NotFound:
+        logging.warning("----- Skipped [not found]: %s", namespace_name)
+        return STATUS_NOT_FOUND
+    return None
+
+
 def _rule_match_k8s_namespace(
     namespace_name: str, k8s_resource_rules: List[K8sResourceRule]
 ) -> Optional[K8sResourceRule]:
@@ -693,12 +1079,15 @@ def find_and_remove_leaked_k8s_resources(
     # client/servers from the gke framework.
     k8s_api_manager = k8s.KubernetesApiManager(k8s_context)
     nss = k8s_api_manager.core.list_namespace()
+    # Shared by the workers, the transport is per thread.
+    gcp_api_manager = gcp.api.GcpApiManager()
     delete_k8s_resources(
         dry_run,
         k8s_resource_rules,
         project,
         network,
         k8s_api_manager,
+        gcp_api_manager,
         gcp_service_account,
         nss.items,
         enable_dualstack,
@@ -712,41 +1101,83 @@ def find_and_remove_leaked_td_resources(
     enable_dualstack: bool = False,
     compute_api_version: str = "v1",
 ):
-    cleanup_legacy: bool = MODE.value != "td_no_legacy"
+    # Resources of the gke framework: all resource kinds are listed once,
+    # and grouped by the suffix. Only the existing resources are deleted.
+    inventory = TdResourceInventory(TD_RESOURCE_PREFIXES.value)
+    # Shared by the workers, the transport is per thread.
+    apis = TdApis.create(project, compute_api_version)
+    inventory.load(apis)
+    tasks = _td_inventory_cleanup_tasks(dry_run, inventory, apis)
+
+    if MODE.value != "td_no_legacy":
+        tasks = itertools.chain(
+            tasks,
+            _legacy_td_cleanup_tasks(
+                dry_run, project, network, enable_dualstack
+            ),
+        )
+
+    run_cleanup_tasks("td", tasks, TD_CLEANUP_WORKERS.value)
+
+
+def _td_inventory_cleanup_tasks(
+    dry_run, inventory: TdResourceInventory, apis: TdApis
+) -> Iterator[CleanupTask]:
+    expire_timestamp = get_expire_timestamp()
+    for group in inventory.groups.values():
+        if is_marked_as_keep_gke(group.suffix):
+            logging.info("----- Skipped [keep]: %s", group.name)
+            _CLEANUP_RESULT.add_record(
+                CleanupRecord("td", group.name, STATUS_KEPT)
+            )
+        elif group.last_created > expire_timestamp:
+            # Any resource created recently means the suffix is in use.
+            logging.debug(
+                "----- Skipped [resource is within expiry date]: %s",
+                group.name,
+            )
+            _CLEANUP_RESULT.add_record(
+                CleanupRecord("td", group.name, STATUS_NOT_EXPIRED)
+            )
+        elif dry_run:
+            logging.info(
+                "----- Skipped [Dry Run]: %s: %s",
+                group.name,
+                dict(group.resources),
+            )
+            _CLEANUP_RESULT.add_record(
+                CleanupRecord("td", group.name, STATUS_DRY_RUN)
+            )
+        else:
+            yield group.name, functools.partial(
+                cleanup_td_resource_group, group, apis
+            )
+
+
+def _legacy_td_cleanup_tasks(
+    dry_run, project, network, enable_dualstack
+) -> Iterator[CleanupTask]:
+    """Resources created by run_xds_tests.py."""
     td_resource_rules = [
         # itmes in each tuple, in order
         # - regex to match
         # - prefix of the resource (only used by gke resources)
         # - function to check of the resource should be kept
         # - function to delete the resource
+        (
+            r"test-hc(.*)",
+            "",
+            is_marked_as_keep_gce,
+            cleanup_legacy_driver_resources,
+        ),
+        (
+            r"test-template(.*)",
+            "",
+            is_marked_as_keep_gce,
+            cleanup_legacy_driver_resources,
+        ),
     ]
 
-    if cleanup_legacy:
-        td_resource_rules += [
-            (
-                r"test-hc(.*)",
-                "",
-                is_marked_as_keep_gce,
-                cleanup_legacy_driver_resources,
-            ),
-            (
-                r"test-template(.*)",
-                "",
-                is_marked_as_keep_gce,
-                cleanup_legacy_driver_resources,
-            ),
-        ]
-
-    for prefix in TD_RESOURCE_PREFIXES.value:
-        td_resource_rules.append(
-            (
-                f"{prefix}-health-check-(.*)",
-                prefix,
-                is_marked_as_keep_gke,
-                cleanup_td_for_gke,
-            ),
-        )
-
     # List resources older than KEEP_PERIOD. We only list health-checks and
     # instance templates because these are leaves in the resource dependency
     # tree.
@@ -756,39 +1187,31 @@ def find_and_remove_leaked_td_resources(
     # target proxy cannot deleted unless the forwarding rule is deleted). The
     # leaked target-proxy is guaranteed to be a super set of leaked
     # forwarding-rule.
+    #
+    # Leaked instance templates usually mean there are leaked VMs from the gce
+    # framework. The legacy resources with the same suffix as one of the
+    # leaked health checks are only deleted once.
     compute = gcp.compute.ComputeV1(gcp.api.GcpApiManager(), project)
-    leaked_health_checks = []
-    for item in compute.list_health_check()["items"]:
-        if (
-            dateutil.parser.isoparse(item["creationTimestamp"])
-            <= get_expire_timestamp()
-        ):
-            leaked_health_checks.append(item)
-
-    delete_leaked_td_resources(
+    leaked_resources = itertools.chain(
+        list_leaked_resources(compute.list_health_check, ["test-hc"]),
+        list_leaked_resources(
+            compute.list_instance_template, ["test-template"]
+        ),
+    )
+    yield from _td_cleanup_tasks(
         dry_run,
         td_resource_rules,
         project,
         network,
-        leaked_health_checks,
+        leaked_resources,
         enable_dualstack,
-        compute_api_version,
     )
 
-    # Delete leaked instance templates, those usually mean there are leaked VMs
-    # from the gce framework. Also note that this is only needed for the gce
-    # resources.
-    if cleanup_legacy:
-        leaked_instance_templates = exec_gcloud(
-            project, "compute", "instance-templates", "list"
-        )
-        delete_leaked_td_resources(
-            dry_run,
-            td_resource_rules,
-            project,
-            network,
-            leaked_instance_templates,
-        )
+
+def save_summary(summary_file: str, elapsed_sec: float):
+    with open(summary_file, "w") as f:
+        json.dump(_CLEANUP_RESULT.to_json(elapsed_sec), f, indent=2)
+    logger.info("Cleanup summary saved to %s", summary_file)
 
 
 def main(argv):
@@ -808,6 +1231,7 @@ def main(argv):
     enable_dualstack: bool = xds_flags.ENABLE_DUALSTACK.value
     compute_api_version: str = xds_flags.COMPUTE_API_VERSION.value
 
+    start = time.monotonic()
     if MODE.value == "td" or MODE.value == "td_no_legacy":
         find_and_remove_leaked_td_resources(
             dry_run, project, network, enable_dualstack, compute_api_version
@@ -826,6 +1250,10 @@ def main(argv):
         )
 
     logger.info("##################### Done cleaning up #####################")
+    elapsed_sec = time.monotonic() - start
+    logger.info(_CLEANUP_RESULT.format_summary(elapsed_sec))
+    if SUMMARY_FILE.value:
+        save_summary(SUMMARY_FILE.value, elapsed_sec)
     if _CLEANUP_RESULT.error_count > 0:
         logger.error(
             "Cleanup failed for %i resource(s). Errors: [\n%s\n].\n"
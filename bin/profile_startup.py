@@ -0,0 +1,163 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Profile the startup of a test or a helper script.
+
+Runs the script with python -X importtime, and reports the total import
+time, the module trees that took the longest to import, the time until the
+first test started, and the total run time. The script output is passed
+through. The flags after -- are passed to the profiled script, including
+the --flagfile: don't set XDS_K8S_CONFIG when starting this with run.sh.
+
+Typical usage examples:
+
+    # Help.
+    ./run.sh ./bin/profile_startup.py --help
+
+    # Profile the helper script imports.
+    ./run.sh ./bin/profile_startup.py -- bin/run_td_setup.py --help
+
+    # Time to the first test, the test is stopped once it starts.
+    ./run.sh ./bin/profile_startup.py --stop_at_first_test -- \\
+        tests/baseline_test.py --flagfile=config/local-dev.cfg
+"""
+import collections
+import dataclasses
+import subprocess
+import sys
+import time
+from typing import Final, Optional
+
+from absl import app
+from absl import flags
+from absl import logging
+
+_DEPTH = flags.DEFINE_integer(
+    "depth",
+    default=2,
+    lower_bound=1,
+    help=(
+        "Group the imported modules by the package name truncated to this"
+        " many components, f.e. google.cloud for depth 2."
+    ),
+)
+_TOP = flags.DEFINE_integer(
+    "top",
+    default=20,
+    lower_bound=1,
+    help="The number of the slowest module trees to report.",
+)
+_STOP_AT_FIRST_TEST = flags.DEFINE_bool(
+    "stop_at_first_test",
+    default=False,
+    help="Terminate the script once the first test starts.",
+)
+
+logger = logging.get_absl_logger()
+
+_IMPORT_TIME_PREFIX: Final[str] = "import time:"
+# absltest logs this to stderr when a test method starts.
+_TEST_START_MARKER: Final[str] = "[ RUN      ]"
+
+
+@dataclasses.dataclass
+class StartupProfile:
+    # Self import time in microseconds, by the module tree.
+    import_us_by_tree: collections.Counter = dataclasses.field(
+        default_factory=collections.Counter
+    )
+    modules_by_tree: collections.Counter = dataclasses.field(
+        default_factory=collections.Counter
+    )
+    first_test_sec: Optional[float] = None
+    total_sec: float = 0
+    returncode: Optional[int] = None
+
+    @property
+    def import_sec(self) -> float:
+        return sum(self.import_us_by_tree.values()) / 1e6
+
+    def add_import(self, line: str, depth: int):
+        """Adds a line of the python -X importtime output."""
+        fields = line[len(_IMPORT_TIME_PREFIX) :].split("|")
+        if len(fields) != 3:
+            return
+        try:
+            self_us = int(fields[0])
+        except ValueError:
+            # The header line.
+            return
+        tree = ".".join(fields[2].strip().split(".")[:depth])
+        self.import_us_by_tree[tree] += self_us
+        self.modules_by_tree[tree] += 1
+
+    def format(self, top: int) -> str:
+        lines = [
+            f"Total import time: {self.import_sec:.3f}s",
+            "Slowest module trees (self import time, module count):",
+        ]
+        for tree, us in self.import_us_by_tree.most_common(top):
+            lines.append(
+                f"  {us / 1000:9.1f}ms {self.modules_by_tree[tree]:5} {tree}"
+            )
+        if self.first_test_sec is not None:
+            lines.append(f"First test started: {self.first_test_sec:.3f}s")
+        else:
+            lines.append("First test started: never")
+        lines.append(f"Total run time: {self.total_sec:.3f}s")
+        return "\n".join(lines)
+
+
+def profile_startup(
+    cmd: list[str], *, depth: int, stop_at_first_test: bool
+) -> StartupProfile:
+    profile = StartupProfile()
+    time_start = time.monotonic()
+    with subprocess.Popen(
+        [sys.executable, "-X", "importtime", *cmd],
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    ) as process:
+        for line in process.stderr:
+            if line.startswith(_IMPORT_TIME_PREFIX):
+                profile.add_import(line, depth)
+                continue
+            sys.stderr.write(line)
+            if profile.first_test_sec is None and _TEST_START_MARKER in line:
+                profile.first_test_sec = time.monotonic() - time_start
+                if stop_at_first_test:
+                    logger.info("First test started, terminating")
+                    process.terminate()
+                    break
+        profile.returncode = process.wait()
+    profile.total_sec = time.monotonic() - time_start
+    return profile
+
+
+def main(argv):
+    if len(argv) < 2:
+        raise app.UsageError("Provide the script to profile after --.")
+    profile = profile_startup(
+        argv[1:],
+        depth=_DEPTH.value,
+        stop_at_first_test=_STOP_AT_FIRST_TEST.value,
+    )
+    logger.info("Startup profile:\n%s", profile.format(_TOP.value))
+    if profile.returncode and not _STOP_AT_FIRST_TEST.value:
+        sys.exit(profile.returncode)
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,84 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Serve the fake Compute, Network Services and Network Security APIs locally.
+
+Prints the discovery URI flags pointing the framework at the fake server,
+and serves until interrupted.
+
+Typical usage examples:
+
+    # Help.
+    ./run.sh ./bin/run_fake_gcp_api.py --help
+
+    # Slow operations, and every tenth request rate limited.
+    ./run.sh ./bin/run_fake_gcp_api.py --port=8090 \\
+        --operation_latency_sec=5 --error_rate=0.1
+
+    # In another terminal.
+    ./run.sh ./bin/run_td_setup.py --cmd=create \\
+        --v1_discovery_uri='...' --v2_discovery_uri='...'
+"""
+import datetime as dt
+import threading
+
+from absl import app
+from absl import flags
+from absl import logging
+
+from framework.infrastructure.gcp import fake_api_server
+
+_PORT = flags.DEFINE_integer(
+    "port", default=0, lower_bound=0, help="The port, 0 to pick any."
+)
+_OPERATION_LATENCY_SEC = flags.DEFINE_float(
+    "operation_latency_sec",
+    default=0,
+    lower_bound=0,
+    help="Seconds until the long-running operations are done.",
+)
+_ERROR_RATE = flags.DEFINE_float(
+    "error_rate",
+    default=0,
+    lower_bound=0,
+    upper_bound=1,
+    help="The share of the requests rejected with 429 RESOURCE_EXHAUSTED.",
+)
+
+
+def main(argv):
+    if len(argv) > 1:
+        raise app.UsageError("Too many command-line arguments.")
+
+    server = fake_api_server.FakeGcpApiServer(
+        port=_PORT.value,
+        operation_latency=dt.timedelta(seconds=_OPERATION_LATENCY_SEC.value),
+        error_rate=_ERROR_RATE.value,
+    )
+    with server:
+        logging.info(
+            "Point the framework at the fake server with:\n"
+            "  --v1_discovery_uri='%s'\n"
+            "  --v2_discovery_uri='%s'",
+            server.v1_discovery_uri,
+            server.v2_discovery_uri,
+        )
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            logging.info("Requests served: %s", dict(server.request_counts))
+
+
+if __name__ == "__main__":
+    app.run(main)
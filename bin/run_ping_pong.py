@@ -26,7 +26,18 @@ Typical usage examples:
 
     # When server was started with multiple replicas:
     ./run.sh ./bin/run_ping_pong.py --server_replica_count=3
+
+    # Sustained load for 5 min, after a 30s warmup:
+    ./run.sh ./bin/run_ping_pong.py --load_duration_sec=300 --load_warmup_sec=30
+
+    # Sustained load of both RPC types:
+    ./run.sh ./bin/run_ping_pong.py --load_duration_sec=300 \\
+        --load_rpc_types=UNARY_CALL --load_rpc_types=EMPTY_CALL
 """
+import collections
+import dataclasses
+import time
+from typing import Optional
 
 from absl import app
 from absl import flags
@@ -62,6 +73,41 @@ _NUM_RPCS = flags.DEFINE_integer(
     upper_bound=10_000,
     help="The number of RPCs to check.",
 )
+_LOAD_DURATION_SEC = flags.DEFINE_integer(
+    "load_duration_sec",
+    default=0,
+    lower_bound=0,
+    help=(
+        "When set, run the client under the sustained load for this long,"
+        " and report the throughput, the error rates over time, and the"
+        " balance across the peers, instead of checking num_rpcs."
+    ),
+)
+_LOAD_WARMUP_SEC = flags.DEFINE_integer(
+    "load_warmup_sec",
+    default=0,
+    lower_bound=0,
+    help="The sustained load to run before the measured one.",
+)
+_LOAD_SAMPLE_INTERVAL_SEC = flags.DEFINE_integer(
+    "load_sample_interval_sec",
+    default=10,
+    lower_bound=1,
+    help="How often to sample the client stats under the sustained load.",
+)
+_LOAD_RPC_TYPES = flags.DEFINE_multi_enum(
+    "load_rpc_types",
+    default=[grpc_testing.RPC_TYPE_UNARY_CALL],
+    enum_values=grpc_testing.RPC_TYPES_BOTH_CALLS,
+    help="The RPC types the client sends under the sustained load.",
+)
+_LOAD_MAX_ERROR_RATE = flags.DEFINE_float(
+    "load_max_error_rate",
+    default=0.0,
+    lower_bound=0.0,
+    upper_bound=1.0,
+    help="The highest fraction of the failed RPCs under the sustained load.",
+)
 flags.adopt_module_key_flags(common)
 flags.adopt_module_key_flags(xds_flags)
 flags.adopt_module_key_flags(xds_k8s_flags)
@@ -91,6 +137,10 @@ _ChannelState = grpc_channelz.ChannelState
 _XdsTestServer = server_app.XdsTestServer
 _XdsTestClient = client_app.XdsTestClient
 LoadBalancerStatsResponse = grpc_testing.LoadBalancerStatsResponse
+LoadBalancerAccumulatedStatsResponse = (
+    grpc_testing.LoadBalancerAccumulatedStatsResponse
+)
+StatsPerMethodDiff = helpers_grpc.StatsPerMethodDiff
 
 
 def get_client_rpc_stats(
@@ -123,6 +173,183 @@ def run_ping_pong(test_client: _XdsTestClient, num_rpcs: int):
         )
 
 
+@dataclasses.dataclass(frozen=True)
+class LoadSample:
+    # Since the start of the measured load.
+    elapsed_sec: float
+    # Since the previous sample.
+    window_sec: float
+    stats: dict[str, StatsPerMethodDiff]
+
+    @property
+    def rpcs_completed(self) -> int:
+        return sum(s.rpcs_completed for s in self.stats.values())
+
+    @property
+    def rpcs_failed(self) -> int:
+        return sum(s.rpcs_failed for s in self.stats.values())
+
+    @property
+    def qps(self) -> float:
+        return self.rpcs_completed / self.window_sec
+
+    @property
+    def error_rate(self) -> float:
+        if not self.rpcs_completed:
+            return 0.0
+        return self.rpcs_failed / self.rpcs_completed
+
+    def __str__(self) -> str:
+        return (
+            f"{self.elapsed_sec:6.1f}s: {self.qps:8.1f} qps,"
+            f" {self.error_rate:7.2%} errors"
+        )
+
+
+def get_deployed_qps(client_pod: k8s.V1Pod) -> Optional[int]:
+    """The --qps the client pod was started with."""
+    for container in client_pod.spec.containers:
+        for arg in container.args or ():
+            if arg.startswith("--qps="):
+                return int(arg.removeprefix("--qps="))
+    return None
+
+
+def _load_sample(
+    before: LoadBalancerAccumulatedStatsResponse,
+    after: LoadBalancerAccumulatedStatsResponse,
+    *,
+    elapsed_sec: float,
+    window_sec: float,
+) -> LoadSample:
+    return LoadSample(
+        elapsed_sec=elapsed_sec,
+        window_sec=window_sec,
+        stats=helpers_grpc.accumulated_stats_diff(before, after),
+    )
+
+
+def _log_load_report(
+    test_client: _XdsTestClient,
+    total: LoadSample,
+    samples: list[LoadSample],
+    rpcs_by_peer: collections.Counter,
+    expected_qps: Optional[int],
+):
+    lines = [f"Sustained load of {total.window_sec:.1f}s:"]
+    achieved = f"Throughput: {total.qps:.1f} qps"
+    if expected_qps:
+        achieved += (
+            f" of the expected {expected_qps} ({total.qps / expected_qps:.1%})"
+        )
+    lines.append(achieved)
+    for method, stats in sorted(total.stats.items()):
+        if not stats.rpcs_started:
+            continue
+        lines.append(
+            f"{method}: {stats.rpcs_completed / total.window_sec:.1f} qps,"
+            f" {stats.error_rate:.2%} errors, {stats.result_pretty()}"
+        )
+    lines.append("Error rates over time:")
+    lines.extend(f"  {sample}" for sample in samples)
+    lines.append("RPCs by peer, sampled:")
+    peers_total = sum(rpcs_by_peer.values()) or 1
+    for peer, count in sorted(rpcs_by_peer.items()):
+        lines.append(f"  {peer}: {count} ({count / peers_total:.1%})")
+    if len(rpcs_by_peer) > 1:
+        mean = peers_total / len(rpcs_by_peer)
+        spread = max(rpcs_by_peer.values()) - min(rpcs_by_peer.values())
+        lines.append(f"Peer imbalance, (max - min) / mean: {spread / mean:.1%}")
+    logger.info("[%s] %s", test_client.hostname, "\n".join(lines))
+
+
+def run_sustained_load(
+    test_client: _XdsTestClient,
+    *,
+    rpc_types: list[str],
+    duration_sec: int,
+    warmup_sec: int,
+    sample_interval_sec: int,
+    num_rpcs: int,
+    max_error_rate: float,
+    deployed_qps: Optional[int] = None,
+):
+    test_client.wait_for_active_xds_channel()
+    test_client.wait_for_server_channel_ready()
+    test_client.update_config.configure(rpc_types=rpc_types)
+    try:
+        if warmup_sec:
+            logger.info("Warming up for %is", warmup_sec)
+            time.sleep(warmup_sec)
+        total, samples, rpcs_by_peer = _sample_sustained_load(
+            test_client,
+            duration_sec=duration_sec,
+            sample_interval_sec=sample_interval_sec,
+            num_rpcs=num_rpcs,
+        )
+    finally:
+        # Back to the RPC type the client starts with.
+        test_client.update_config.configure_unary()
+
+    # The client sends each of the RPC types at its QPS.
+    expected_qps = deployed_qps * len(rpc_types) if deployed_qps else None
+    _log_load_report(test_client, total, samples, rpcs_by_peer, expected_qps)
+
+    if not total.rpcs_completed:
+        raise AssertionError("No RPCs completed under the sustained load")
+    for backend, rpcs_count in rpcs_by_peer.items():
+        if rpcs_count < 1:
+            raise AssertionError(
+                f"Backend {backend} did not receive a single RPC"
+            )
+    if total.error_rate > max_error_rate:
+        raise AssertionError(
+            f"Expected at most {max_error_rate:.2%} of RPCs to fail:"
+            f" {total.rpcs_failed} of {total.rpcs_completed} failed"
+        )
+
+
+def _sample_sustained_load(
+    test_client: _XdsTestClient,
+    *,
+    duration_sec: int,
+    sample_interval_sec: int,
+    num_rpcs: int,
+) -> tuple[LoadSample, list[LoadSample], collections.Counter]:
+    samples: list[LoadSample] = []
+    rpcs_by_peer = collections.Counter()
+    started_at = time.monotonic()
+    first = previous = test_client.get_load_balancer_accumulated_stats()
+    previous_at = started_at
+    finish_at = started_at + duration_sec
+    while previous_at < finish_at:
+        # The peers of the next num_rpcs RPCs of each sample.
+        lb_stats = test_client.get_load_balancer_stats(num_rpcs=num_rpcs)
+        rpcs_by_peer.update(lb_stats.rpcs_by_peer)
+        next_sample_at = min(previous_at + sample_interval_sec, finish_at)
+        time.sleep(max(0.0, next_sample_at - time.monotonic()))
+
+        current = test_client.get_load_balancer_accumulated_stats()
+        current_at = time.monotonic()
+        sample = _load_sample(
+            previous,
+            current,
+            elapsed_sec=current_at - started_at,
+            window_sec=current_at - previous_at,
+        )
+        samples.append(sample)
+        logger.info("[%s] %s", test_client.hostname, sample)
+        previous, previous_at = current, current_at
+
+    total = _load_sample(
+        first,
+        previous,
+        elapsed_sec=previous_at - started_at,
+        window_sec=previous_at - started_at,
+    )
+    return total, samples, rpcs_by_peer
+
+
 def main(argv):
     if len(argv) > 1:
         raise app.UsageError("Too many command-line arguments.")
@@ -178,7 +405,19 @@ def main(argv):
     )
 
     with test_client:
-        run_ping_pong(test_client, _NUM_RPCS.value)
+        if _LOAD_DURATION_SEC.value:
+            run_sustained_load(
+                test_client,
+                rpc_types=_LOAD_RPC_TYPES.value,
+                duration_sec=_LOAD_DURATION_SEC.value,
+                warmup_sec=_LOAD_WARMUP_SEC.value,
+                sample_interval_sec=_LOAD_SAMPLE_INTERVAL_SEC.value,
+                num_rpcs=_NUM_RPCS.value,
+                max_error_rate=_LOAD_MAX_ERROR_RATE.value,
+                deployed_qps=get_deployed_qps(client_pod),
+            )
+        else:
+            run_ping_pong(test_client, _NUM_RPCS.value)
 
     logger.info("SUCCESS!")
 
@@ -0,0 +1,564 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Run multiple PSM interop test suites concurrently.
+
+Each test is started as a separate process with the flags the scheduler was
+started with, except the scheduler's own. The flags defined only by the tests,
+f.e. --strategy of the URL map tests, must be given as --name=value. Every
+running test gets its own xDS port, not used by the forwarding rules of its
+project, unless the test's flags set it, or --server_xds_port=0 lets each test
+pick one. When the flags pin the resource suffix, every running test gets its
+own resource suffix too.
+Each test writes its log and xUnit report to a subdirectory of --out_dir,
+and the scheduler merges them into out_dir/sponge_log.{log,xml}.
+
+A test is a path to the test module, optionally followed by the test class
+or method to run, separated by a colon. The --tests_file accepts one test per
+line, followed by the flags specific to the test.
+
+Typical usage examples:
+
+    # Help.
+    ./run.sh ./bin/run_tests_parallel.py --help
+
+    # Run three test suites, two at a time.
+    ./run.sh ./bin/run_tests_parallel.py --parallelism=2 \\
+        tests/baseline_test.py tests/affinity_test.py \\
+        tests/security_test.py:SecurityTest.test_mtls
+
+    # Tests from a file, at most 3 tests per GKE cluster.
+    ./run.sh ./bin/run_tests_parallel.py --tests_file=tests.txt \\
+        --max_tests_per_cluster=3
+"""
+import ast
+import collections
+import dataclasses
+import datetime as dt
+import functools
+import pathlib
+import random
+import shlex
+import subprocess
+import sys
+import time
+from typing import Callable, Final, Optional
+import xml.etree.ElementTree as ET
+
+from absl import app
+from absl import flags
+from absl import logging
+
+from framework import xds_flags
+from framework import xds_k8s_flags
+from framework.infrastructure import gcp
+
+_PARALLELISM = flags.DEFINE_integer(
+    "parallelism",
+    default=4,
+    lower_bound=1,
+    help="The maximum number of tests to run at the same time.",
+)
+_MAX_TESTS_PER_PROJECT = flags.DEFINE_integer(
+    "max_tests_per_project",
+    default=None,
+    lower_bound=1,
+    help=(
+        "The maximum number of tests running in the same GCP project."
+        " Use to stay within the project Compute quotas."
+    ),
+)
+_MAX_TESTS_PER_CLUSTER = flags.DEFINE_integer(
+    "max_tests_per_cluster",
+    default=None,
+    lower_bound=1,
+    help="The maximum number of tests running in the same GKE cluster.",
+)
+_TESTS_FILE = flags.DEFINE_string(
+    "tests_file",
+    default=None,
+    help=(
+        "The file with the tests to run, one per line. A test can be followed"
+        " by the flags passed only to this test. Lines starting with # are"
+        " ignored."
+    ),
+)
+_OUT_DIR = flags.DEFINE_string(
+    "out_dir",
+    default=None,
+    help=(
+        "The directory to store test logs and reports."
+        " (default: out/parallel/<datetime>)"
+    ),
+)
+_XDS_PORT_RANGE = flags.DEFINE_list(
+    "xds_port_range",
+    default=["10000", "59999"],
+    help="The range of xDS ports assigned to the tests running concurrently.",
+)
+flags.adopt_module_key_flags(xds_flags)
+flags.adopt_module_key_flags(xds_k8s_flags)
+
+# The flags only the scheduler uses, not passed to the tests.
+_SCHEDULER_FLAGS: Final[tuple[flags.FlagHolder, ...]] = (
+    _PARALLELISM,
+    _MAX_TESTS_PER_PROJECT,
+    _MAX_TESTS_PER_CLUSTER,
+    _TESTS_FILE,
+    _OUT_DIR,
+    _XDS_PORT_RANGE,
+)
+# The flags the scheduler sets for each test.
+_PER_TEST_FLAGS: Final[frozenset[str]] = frozenset(
+    (
+        "flagfile",
+        "log_dir",
+        "resource_suffix",
+        "server_xds_port",
+        "xml_output_file",
+    )
+)
+
+
+@flags.validator(
+    _XDS_PORT_RANGE.name,
+    message="Must be two ports: the first and the last port of the range.",
+)
+def _check_xds_port_range(value):
+    if len(value) != 2 or not all(port.isdigit() for port in value):
+        return False
+    lo, hi = map(int, value)
+    return 0 < lo <= hi <= 65535
+
+
+@flags.multi_flags_validator(
+    (_XDS_PORT_RANGE.name, _PARALLELISM.name),
+    message="The xDS port range must fit a port for each concurrent test.",
+)
+def _check_xds_port_range_size(flags_dict):
+    if not _check_xds_port_range(flags_dict[_XDS_PORT_RANGE.name]):
+        # Reported by the validator above.
+        return True
+    lo, hi = map(int, flags_dict[_XDS_PORT_RANGE.name])
+    return hi - lo + 1 >= flags_dict[_PARALLELISM.name]
+
+
+logger = logging.get_absl_logger()
+
+# Called by the test modules using the secondary cluster.
+_SECONDARY_CLUSTER_FN: Final[str] = "require_secondary_context"
+_POLL_INTERVAL: Final[dt.timedelta] = dt.timedelta(seconds=1)
+
+
+@dataclasses.dataclass
+class TestJob:
+    index: int
+    module: str
+    test_filter: Optional[str]
+    test_flags: list[str]
+    project: str
+    network: str
+    clusters: tuple[str, ...]
+
+    # Assigned when started.
+    xds_port: Optional[int] = None
+    out_dir: Optional[pathlib.Path] = None
+    process: Optional[subprocess.Popen] = None
+    time_start: Optional[float] = None
+    duration: Optional[dt.timedelta] = None
+    returncode: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        name = pathlib.Path(self.module).stem
+        if self.test_filter:
+            name = f"{name}.{self.test_filter}"
+        return f"{self.index:02d}-{name}"
+
+    @property
+    def log_file(self) -> pathlib.Path:
+        return self.out_dir / "sponge_log.log"
+
+    @property
+    def xml_file(self) -> pathlib.Path:
+        return self.out_dir / "sponge_log.xml"
+
+    @property
+    def passed(self) -> bool:
+        return self.returncode == 0
+
+
+def _flag_value(test_flags: list[str], name: str) -> Optional[str]:
+    """The last value of the flag, f.e. --name=value, or --name value."""
+    prefix = f"--{name}="
+    value = None
+    for i, flag in enumerate(test_flags):
+        if flag.startswith(prefix):
+            value = flag[len(prefix) :]
+        elif flag == f"--{name}" and i + 1 < len(test_flags):
+            value = test_flags[i + 1]
+    return value
+
+
+def forwarded_flags(flag_values: flags.FlagValues = flags.FLAGS) -> list[str]:
+    """The flags the scheduler was started with, to pass to each test.
+
+    Includes the flags from the flagfiles, and excludes the scheduler's own
+    flags, and the ones set for each test separately.
+    """
+    skip = _PER_TEST_FLAGS | {holder.name for holder in _SCHEDULER_FLAGS}
+    result = []
+    for name in flag_values:
+        flag = flag_values[name]
+        # Also listed by the short name.
+        if name != flag.name or not flag.present or name in skip:
+            continue
+        # The multi flags are serialized one value per line.
+        result.extend(flag.serialize().splitlines())
+    return result
+
+
+def uses_secondary_cluster(module: str) -> bool:
+    """Whether the test module calls xds_k8s_flags.require_secondary_context.
+
+    The module is parsed, not imported: the test modules define their flags
+    on import.
+    """
+    tree = ast.parse(pathlib.Path(module).read_text(), filename=module)
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if (
+            isinstance(func, ast.Attribute)
+            and func.attr == _SECONDARY_CLUSTER_FN
+        ):
+            return True
+        if isinstance(func, ast.Name) and func.id == _SECONDARY_CLUSTER_FN:
+            return True
+    return False
+
+
+def _make_job(index: int, spec: list[str]) -> TestJob:
+    module, _, test_filter = spec[0].partition(":")
+    if not pathlib.Path(module).is_file():
+        raise app.UsageError(f"Test module not found: {module}")
+    test_flags = spec[1:]
+
+    project = _flag_value(test_flags, "project") or xds_flags.PROJECT.value
+    network = _flag_value(test_flags, "network") or xds_flags.NETWORK.value
+    clusters = [
+        _flag_value(test_flags, "kube_context")
+        or xds_k8s_flags.KUBE_CONTEXT.value
+    ]
+    secondary = (
+        _flag_value(test_flags, "secondary_kube_context")
+        or xds_k8s_flags.SECONDARY_KUBE_CONTEXT.value
+    )
+    if secondary and uses_secondary_cluster(module):
+        clusters.append(secondary)
+
+    return TestJob(
+        index=index,
+        module=module,
+        test_filter=test_filter or None,
+        test_flags=test_flags,
+        project=project,
+        network=network,
+        clusters=tuple(clusters),
+    )
+
+
+def _read_test_specs(tests: list[str]) -> list[list[str]]:
+    specs = [[test] for test in tests]
+    if _TESTS_FILE.value:
+        with open(_TESTS_FILE.value, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    specs.append(shlex.split(line))
+    return specs
+
+
+class Scheduler:
+    """Starts the tests when the concurrency limits allow it."""
+
+    def __init__(
+        self,
+        jobs: list[TestJob],
+        *,
+        out_dir: pathlib.Path,
+        base_flags: list[str],
+        parallelism: int,
+        max_per_project: Optional[int],
+        max_per_cluster: Optional[int],
+        xds_port_range: tuple[int, int],
+        forwarding_rule_ports_fn: Callable[[str, str], set[int]],
+    ):
+        self.pending: collections.deque[TestJob] = collections.deque(jobs)
+        self.running: list[TestJob] = []
+        self.finished: list[TestJob] = []
+        self.out_dir = out_dir
+        self.base_flags = base_flags
+        self.parallelism = parallelism
+        self.max_per_project = max_per_project
+        self.max_per_cluster = max_per_cluster
+        self.xds_port_range = xds_port_range
+        # Called with the project and the network.
+        self.forwarding_rule_ports_fn = forwarding_rule_ports_fn
+        self._project_usage: collections.Counter[str] = collections.Counter()
+        self._cluster_usage: collections.Counter[str] = collections.Counter()
+        self._xds_ports_used: set[int] = set()
+
+    def run(self):
+        while self.pending or self.running:
+            self._start_ready()
+            time.sleep(_POLL_INTERVAL.total_seconds())
+            self._collect_finished()
+
+    def terminate(self):
+        for job in self.running:
+            logger.warning("Terminating %s", job.name)
+            job.process.terminate()
+        for job in self.running:
+            job.process.wait()
+
+    def _can_start(self, job: TestJob) -> bool:
+        if len(self.running) >= self.parallelism:
+            return False
+        if (
+            self.max_per_project
+            and self._project_usage[job.project] >= self.max_per_project
+        ):
+            return False
+        if self.max_per_cluster and any(
+            self._cluster_usage[cluster] >= self.max_per_cluster
+            for cluster in job.clusters
+        ):
+            return False
+        return True
+
+    def _start_ready(self):
+        # Tests blocked by a busy cluster must not hold up the tests
+        # for other clusters.
+        for job in list(self.pending):
+            if len(self.running) >= self.parallelism:
+                return
+            if self._can_start(job):
+                self.pending.remove(job)
+                self._start(job)
+
+    def _allocate_xds_port(self, project: str, network: str) -> int:
+        """Picks a port not used by the forwarding rules, nor other tests.
+
+        The forwarding rules are listed on each call: they're created and
+        deleted by the tests, and the other runs in the project.
+        """
+        lo, hi = self.xds_port_range
+        used = self._xds_ports_used | {
+            port
+            for port in self.forwarding_rule_ports_fn(project, network)
+            if lo <= port <= hi
+        }
+        if len(used) > hi - lo:
+            raise RuntimeError(f"All xDS ports in [{lo}, {hi}] are in use")
+        while True:
+            port = random.randint(lo, hi)
+            if port not in used:
+                self._xds_ports_used.add(port)
+                return port
+
+    def _start(self, job: TestJob):
+        job.out_dir = self.out_dir / job.name
+        job.out_dir.mkdir(parents=True)
+
+        cmd = [sys.executable, job.module, *self.base_flags, *job.test_flags]
+        if _flag_value(job.test_flags, "server_xds_port") is None:
+            if (
+                xds_flags.SERVER_XDS_PORT.present
+                and xds_flags.SERVER_XDS_PORT.value == 0
+            ):
+                # The test finds an unused port itself.
+                cmd.append("--server_xds_port=0")
+            else:
+                job.xds_port = self._allocate_xds_port(job.project, job.network)
+                cmd.append(f"--server_xds_port={job.xds_port}")
+        # Same suffix would make the concurrent tests share the resources.
+        suffix = _flag_value(job.test_flags, "resource_suffix") or (
+            xds_flags.RESOURCE_SUFFIX.value
+        )
+        if suffix:
+            cmd.append(f"--resource_suffix={suffix}-{job.index}")
+        cmd.append(f"--log_dir={job.out_dir}")
+        cmd.append(f"--xml_output_file={job.xml_file}")
+        if job.test_filter:
+            cmd.append(job.test_filter)
+
+        logger.info("Starting %s: %s", job.name, shlex.join(cmd))
+        with open(job.log_file, "wb") as log:
+            job.process = subprocess.Popen(
+                cmd, stdout=log, stderr=subprocess.STDOUT
+            )
+        job.time_start = time.monotonic()
+        self.running.append(job)
+        self._project_usage[job.project] += 1
+        self._cluster_usage.update(job.clusters)
+
+    def _collect_finished(self):
+        for job in list(self.running):
+            returncode = job.process.poll()
+            if returncode is None:
+                continue
+            job.returncode = returncode
+            job.duration = dt.timedelta(
+                seconds=round(time.monotonic() - job.time_start)
+            )
+            self.running.remove(job)
+            self.finished.append(job)
+            self._project_usage[job.project] -= 1
+            self._cluster_usage.subtract(job.clusters)
+            self._xds_ports_used.discard(job.xds_port)
+            logger.info(
+                "%s %s in %s, %d running, %d pending",
+                "PASSED" if job.passed else "FAILED",
+                job.name,
+                job.duration,
+                len(self.running),
+                len(self.pending),
+            )
+
+
+def merge_xml_reports(jobs: list[TestJob], out_file: pathlib.Path):
+    merged = ET.Element("testsuites")
+    for job in jobs:
+        if not job.xml_file.is_file():
+            # The test crashed before writing the report.
+            suite = ET.SubElement(
+                merged, "testsuite", name=job.name, tests="1", errors="1"
+            )
+            case = ET.SubElement(suite, "testcase", name=job.name)
+            ET.SubElement(
+                case,
+                "error",
+                message=f"Exit code {job.returncode}, no xUnit report",
+            )
+            continue
+        root = ET.parse(job.xml_file).getroot()
+        suites = [root] if root.tag == "testsuite" else list(root)
+        for suite in suites:
+            # Tests are run as __main__, disambiguate same class names.
+            suite.set("name", f"{job.name}/{suite.get('name')}")
+        merged.extend(suites)
+
+    for attr in ("tests", "failures", "errors"):
+        total = sum(int(suite.get(attr, 0)) for suite in merged)
+        merged.set(attr, str(total))
+    ET.ElementTree(merged).write(out_file, encoding="utf-8")
+
+
+def merge_logs(jobs: list[TestJob], out_file: pathlib.Path):
+    with open(out_file, "wb") as out:
+        for job in jobs:
+            header = f"\n===== {job.name} ({job.module}) =====\n"
+            out.write(header.encode())
+            with open(job.log_file, "rb") as log:
+                out.write(log.read())
+
+
+def _parse_flags(argv: list[str]) -> list[str]:
+    """Parses the flags the scheduler knows, and keeps the rest in argv.
+
+    The test modules define more flags than the scheduler imports.
+    """
+    try:
+        return flags.FLAGS(argv, known_only=True)
+    except flags.Error as error:
+        sys.stderr.write(f"FATAL Flags parsing error: {error}\n")
+        sys.stderr.write("Pass --helpshort or --helpfull to see help.\n")
+        sys.exit(1)
+
+
+def main(argv):
+    tests = [arg for arg in argv[1:] if not arg.startswith("-")]
+    # The flags only the tests define.
+    unknown_flags = [arg for arg in argv[1:] if arg.startswith("-")]
+    jobs = [
+        _make_job(index, spec)
+        for index, spec in enumerate(_read_test_specs(tests), start=1)
+    ]
+    if not jobs:
+        raise app.UsageError("No tests to run.")
+
+    if _OUT_DIR.value:
+        out_dir = pathlib.Path(_OUT_DIR.value)
+    else:
+        datetime_suffix = dt.datetime.now().strftime("%Y%m%d-%H%M%S")
+        out_dir = pathlib.Path("out", "parallel", datetime_suffix)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    logger.info("Saving test logs and reports to %s", out_dir.absolute())
+
+    port_lo, port_hi = map(int, _XDS_PORT_RANGE.value)
+    gcp_api_manager = gcp.api.GcpApiManager()
+
+    @functools.cache
+    def compute(project: str) -> gcp.compute.ComputeV1:
+        return gcp.compute.ComputeV1(
+            gcp_api_manager,
+            project,
+            version=xds_flags.COMPUTE_API_VERSION.value,
+        )
+
+    def forwarding_rule_ports(project: str, network: str) -> set[int]:
+        return compute(project).list_forwarding_rule_ports(
+            f"global/networks/{network}"
+        )
+
+    scheduler = Scheduler(
+        jobs,
+        out_dir=out_dir,
+        base_flags=[*forwarded_flags(), *unknown_flags],
+        parallelism=_PARALLELISM.value,
+        max_per_project=_MAX_TESTS_PER_PROJECT.value,
+        max_per_cluster=_MAX_TESTS_PER_CLUSTER.value,
+        xds_port_range=(port_lo, port_hi),
+        forwarding_rule_ports_fn=forwarding_rule_ports,
+    )
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        scheduler.terminate()
+        raise
+    finally:
+        gcp_api_manager.close()
+
+    merge_xml_reports(jobs, out_dir / "sponge_log.xml")
+    merge_logs(jobs, out_dir / "sponge_log.log")
+
+    logger.info("----- Test results -----")
+    for job in jobs:
+        logger.info(
+            "%s %-50s %s",
+            "PASSED" if job.passed else "FAILED",
+            job.name,
+            job.duration,
+        )
+    failed = [job for job in jobs if not job.passed]
+    if failed:
+        logger.error("%d of %d tests failed", len(failed), len(jobs))
+        sys.exit(1)
+    logger.info("All %d tests passed", len(jobs))
+
+
+if __name__ == "__main__":
+    app.run(main, flags_parser=_parse_flags)
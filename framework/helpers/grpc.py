@@ -21,6 +21,7 @@ import grpc
 from typing_extensions import TypeAlias
 import yaml
 
+from framework.helpers import logs
 from framework.rpc import grpc_testing
 
 # Type aliases
@@ -29,6 +30,9 @@ _RpcsByMethodPretty: TypeAlias = dict[str, _RpcsByPeerPretty]
 _MetadataByPeerPretty: TypeAlias = dict[str, list[str]]
 _MetadatasByPeerPretty: TypeAlias = dict[str, _MetadataByPeerPretty]
 
+# The tests poll the same stats repeatedly while waiting for a change.
+_stats_format_cache = logs.FormatCache()
+
 
 @functools.cache
 def status_from_int(grpc_status_int: int) -> Optional[grpc.StatusCode]:
@@ -105,6 +109,21 @@ def accumulated_stats_pretty(
           (0, OK): 10
           (14, UNAVAILABLE): 20
     """
+    return _stats_format_cache.get(
+        (logs.message_cache_key(accumulated_stats), ignore_empty),
+        functools.partial(
+            _accumulated_stats_pretty,
+            accumulated_stats,
+            ignore_empty=ignore_empty,
+        ),
+    )
+
+
+def _accumulated_stats_pretty(
+    accumulated_stats: grpc_testing.LoadBalancerAccumulatedStatsResponse,
+    *,
+    ignore_empty: bool,
+) -> str:
     # Only look at stats_per_method, as the other fields are deprecated.
     result: list[dict] = []
     for method, stats in accumulated_stats.stats_per_method.items():
@@ -117,6 +136,70 @@ def accumulated_stats_pretty(
     return yaml.dump(result, sort_keys=False)
 
 
+@dataclasses.dataclass(frozen=True)
+class StatsPerMethodDiff:
+    """The RPCs of a method between two LoadBalancerAccumulatedStatsResponse."""
+
+    method: str
+    rpcs_started: int
+
+    # The number of RPCs completed with each status code, f.e. {0: 20, 14: 1}.
+    result: dict[int, int]
+
+    @property
+    def rpcs_completed(self) -> int:
+        return sum(self.result.values())
+
+    @property
+    def rpcs_failed(self) -> int:
+        return self.rpcs_completed - self.result.get(
+            grpc.StatusCode.OK.value[0], 0
+        )
+
+    @property
+    def error_rate(self) -> float:
+        """The failed fraction of the completed RPCs, 0 when none completed."""
+        if not self.rpcs_completed:
+            return 0.0
+        return self.rpcs_failed / self.rpcs_completed
+
+    def result_pretty(self) -> dict[str, int]:
+        result: dict[str, int] = {}
+        for status_int, count in sorted(self.result.items()):
+            status: Optional[grpc.StatusCode] = status_from_int(status_int)
+            result[status_pretty(status) if status else str(status_int)] = count
+        return result
+
+
+def accumulated_stats_diff(
+    before: grpc_testing.LoadBalancerAccumulatedStatsResponse,
+    after: grpc_testing.LoadBalancerAccumulatedStatsResponse,
+) -> dict[str, StatsPerMethodDiff]:
+    """The RPCs started and completed by method in between the two stats.
+
+    The counters that decreased were reset, f.e. the client restarted,
+    and the RPCs are counted from 0.
+    """
+
+    def _diff(current: int, earlier: int) -> int:
+        return current - earlier if current >= earlier else current
+
+    result: dict[str, StatsPerMethodDiff] = {}
+    for method, stats in after.stats_per_method.items():
+        stats_before = before.stats_per_method.get(method)
+        started_before = stats_before.rpcs_started if stats_before else 0
+        result_before = stats_before.result if stats_before else {}
+        result[method] = StatsPerMethodDiff(
+            method=method,
+            rpcs_started=_diff(stats.rpcs_started, started_before),
+            result={
+                status_int: _diff(count, result_before.get(status_int, 0))
+                for status_int, count in stats.result.items()
+            },
+        )
+    return result
+
+
 @dataclasses.dataclass(frozen=True)
 class PrettyLoadBalancerStats:
     # The number of RPCs that failed to record a remote peer.
@@ -212,6 +295,13 @@ def lb_stats_pretty(lb_stats: grpc_testing.LoadBalancerStatsResponse) -> str:
         psm-grpc-server-b:
           cookie: [bar]
     """
+    return _stats_format_cache.get(
+        logs.message_cache_key(lb_stats),
+        functools.partial(_lb_stats_pretty, lb_stats),
+    )
+
+
+def _lb_stats_pretty(lb_stats: grpc_testing.LoadBalancerStatsResponse) -> str:
     pretty_lb_stats = PrettyLoadBalancerStats.from_response(lb_stats)
     stats_as_dict = dataclasses.asdict(pretty_lb_stats)
 
@@ -16,83 +16,160 @@
 Use this to log resources dumped as a structured document (f.e. YAML),
 and enable colorful syntax highlighting.
 
+The lexers and formatters are shared by all highlighters, and the highlighted
+documents are cached: retry loops log the same resources over and over.
+When the color is off, the code is returned as is.
+
 TODO(sergiitk): This can be used to output protobuf responses formatted as JSON.
 """
+import functools
 import logging
-from typing import Optional
+import os
+import sys
+from typing import TYPE_CHECKING, Final, Optional
 
 from absl import flags
-import pygments
-import pygments.formatter
-import pygments.formatters.other
-import pygments.formatters.terminal
-import pygments.formatters.terminal256
-import pygments.lexer
-import pygments.lexers.data
-import pygments.styles
+
+from framework.helpers import lazy_import
+from framework.helpers import logs
+
+if TYPE_CHECKING:
+    import pygments
+    import pygments.formatter
+    import pygments.formatters.other as pygments_formatters_other
+    import pygments.formatters.terminal256 as pygments_formatters_terminal256
+    import pygments.formatters.terminal as pygments_formatters_terminal
+    import pygments.lexer
+    import pygments.lexers.data as pygments_lexers_data
+    import pygments.styles as pygments_styles
+else:
+    # Only needed when the color is on: the lexers, and the styles plugins
+    # discovery are slow to import.
+    pygments = lazy_import.module("pygments")
+    pygments_formatters_other = lazy_import.module("pygments.formatters.other")
+    pygments_formatters_terminal = lazy_import.module(
+        "pygments.formatters.terminal"
+    )
+    pygments_formatters_terminal256 = lazy_import.module(
+        "pygments.formatters.terminal256"
+    )
+    pygments_lexers_data = lazy_import.module("pygments.lexers.data")
+    pygments_styles = lazy_import.module("pygments.styles")
 
 # The style for terminals supporting 8/16 colors.
 STYLE_ANSI_16 = "ansi16"
-# Join with pygments styles for terminals supporting 88/256 colors.
-ALL_COLOR_STYLES = [STYLE_ANSI_16] + list(pygments.styles.get_all_styles())
+_DEFAULT_COLOR_STYLE = "material"
 
 # Flags.
 COLOR = flags.DEFINE_bool("color", default=True, help="Colorize the output")
-COLOR_STYLE = flags.DEFINE_enum(
+COLOR_ONLY_TTY = flags.DEFINE_bool(
+    "color_only_tty",
+    default=False,
+    help=(
+        "Colorize the output only when stderr is a terminal, f.e. not"
+        " redirected to a file"
+    ),
+)
+COLOR_STYLE = flags.DEFINE_string(
     "color_style",
-    default="material",
-    enum_values=ALL_COLOR_STYLES,
+    default=_DEFAULT_COLOR_STYLE,
     help=(
-        "Color styles for terminals supporting 256 colors. "
-        f"Use {STYLE_ANSI_16} style for terminals supporting 8/16 colors"
+        "Color styles for terminals supporting 256 colors, one of the"
+        f" pygments styles. Use {STYLE_ANSI_16} style for terminals"
+        " supporting 8/16 colors"
     ),
 )
 
 logger = logging.getLogger(__name__)
 
-# Type aliases.
-Lexer = pygments.lexer.Lexer
-YamlLexer = pygments.lexers.data.YamlLexer
-Formatter = pygments.formatter.Formatter
-NullFormatter = pygments.formatters.other.NullFormatter
-TerminalFormatter = pygments.formatters.terminal.TerminalFormatter
-Terminal256Formatter = pygments.formatters.terminal256.Terminal256Formatter
+# Disables the color when set to a non-empty value, see https://no-color.org.
+NO_COLOR_ENV: Final[str] = "NO_COLOR"
+
+# Large CSDS dumps are tens of KB.
+_highlight_cache = logs.FormatCache(maxsize=32)
+
+
+@functools.cache
+def all_color_styles() -> list[str]:
+    """The ansi16 style, and pygments styles for 88/256 colors terminals."""
+    return [STYLE_ANSI_16] + list(pygments_styles.get_all_styles())
+
+
+@flags.validator(
+    COLOR_STYLE.name,
+    message=f"Unrecognized color style, use {STYLE_ANSI_16} or a pygments style",
+)
+def _check_color_style(color_style: str) -> bool:
+    # The pygments styles are only listed for the uncommon styles.
+    if color_style in (STYLE_ANSI_16, _DEFAULT_COLOR_STYLE):
+        return True
+    return color_style in all_color_styles()
+
+
+def color_enabled() -> bool:
+    """Whether the highlighted output goes to a sink that shows colors."""
+    if not COLOR.value or os.environ.get(NO_COLOR_ENV):
+        return False
+    if COLOR_ONLY_TTY.value:
+        return sys.stderr.isatty()
+    return True
+
+
+@functools.cache
+def _formatter(color_style: Optional[str]) -> "pygments.formatter.Formatter":
+    if color_style is None:
+        return pygments_formatters_other.NullFormatter()
+    if color_style == STYLE_ANSI_16:
+        # 8/16 colors support only.
+        return pygments_formatters_terminal.TerminalFormatter()
+    # 88/256 colors.
+    return pygments_formatters_terminal256.Terminal256Formatter(
+        style=color_style
+    )
+
+
+@functools.cache
+def _yaml_lexer() -> "pygments.lexer.Lexer":
+    return pygments_lexers_data.YamlLexer(encoding="utf-8")
 
 
 class Highlighter:
-    formatter: Formatter
-    lexer: Lexer
+    formatter: "pygments.formatter.Formatter"
+    lexer: "pygments.lexer.Lexer"
     color: bool
     color_style: Optional[str] = None
 
     def __init__(
         self,
         *,
-        lexer: Lexer,
+        lexer: "pygments.lexer.Lexer",
         color: Optional[bool] = None,
         color_style: Optional[str] = None,
     ):
         self.lexer = lexer
-        self.color = color if color is not None else COLOR.value
+        self.color = color if color is not None else color_enabled()
 
         if self.color:
             color_style = color_style if color_style else COLOR_STYLE.value
-            if color_style not in ALL_COLOR_STYLES:
+            if color_style not in all_color_styles():
                 raise ValueError(
                     f"Unrecognized color style {color_style}, "
-                    f"valid styles: {ALL_COLOR_STYLES}"
+                    f"valid styles: {all_color_styles()}"
                 )
-            if color_style == STYLE_ANSI_16:
-                # 8/16 colors support only.
-                self.formatter = TerminalFormatter()
-            else:
-                # 88/256 colors.
-                self.formatter = Terminal256Formatter(style=color_style)
+            self.color_style = color_style
+            self.formatter = _formatter(color_style)
         else:
-            self.formatter = NullFormatter()
+            self.formatter = _formatter(None)
 
     def highlight(self, code: str) -> str:
-        return pygments.highlight(code, self.lexer, self.formatter)
+        if not self.color:
+            return code
+        return _highlight_cache.get(
+            (self.lexer, self.formatter, code),
+            functools.partial(
+                pygments.highlight, code, self.lexer, self.formatter
+            ),
+        )
 
 
 class HighlighterYaml(Highlighter):
@@ -100,7 +177,7 @@ class HighlighterYaml(Highlighter):
         self, *, color: Optional[bool] = None, color_style: Optional[str] = None
     ):
         super().__init__(
-            lexer=YamlLexer(encoding="utf-8"),
+            lexer=_yaml_lexer(),
             color=color,
             color_style=color_style,
         )
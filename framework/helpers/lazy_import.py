@@ -0,0 +1,47 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Deferred imports of the heavy dependencies only some of the code paths use.
+
+Usage:
+
+    secretmanager_v1 = lazy_import.module("google.cloud.secretmanager_v1")
+
+The module is imported on the first attribute access, f.e.
+secretmanager_v1.SecretManagerServiceClient. Type annotations evaluated
+at the import time need to be strings, with the real import guarded by
+typing.TYPE_CHECKING.
+
+Unlike importlib.util.LazyLoader, the module is imported with the regular
+import machinery, which is thread-safe.
+"""
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Imports the module on the first access to its attributes."""
+
+    def __getattr__(self, attr: str):
+        # Only called for the attributes not yet copied from the module.
+        real_module = importlib.import_module(self.__name__)
+        self.__dict__.update(real_module.__dict__)
+        return getattr(real_module, attr)
+
+    def __repr__(self):
+        return f"<lazy module {self.__name__!r}>"
+
+
+def module(name: str) -> types.ModuleType:
+    """Returns the module object that imports the module on first use."""
+    return LazyModule(name)
@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """The module contains helpers to initialize and configure logging."""
+import collections
 import functools
 import pathlib
+import threading
+from typing import Callable, Hashable, Optional
 
 from absl import flags
 from absl import logging
+from google.protobuf.message import Message
 
 
 def _ensure_flags_parsed() -> None:
@@ -46,3 +50,75 @@ def log_dir_mkdir(name: str) -> pathlib.Path:
         logging.debug("Created log subdir: %s", log_subdir)
 
     return log_subdir
+
+
+class LazyFormat:
+    """A log message argument formatted only when the record is emitted.
+
+    Logging converts the arguments to strings only when a handler emits
+    the record, so the formatting is skipped for the disabled log levels:
+
+        logger.debug("Loaded:\n%s", LazyFormat(yaml.dump, resource))
+
+    The result is reused when the record is emitted by several handlers.
+    """
+
+    __slots__ = ("_fn", "_args", "_kwargs", "_formatted")
+
+    def __init__(self, fn: Callable[..., str], /, *args, **kwargs):
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._formatted: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            self._formatted = self._fn(*self._args, **self._kwargs)
+        return self._formatted
+
+
+class FormatCache:
+    """A bounded LRU cache of the formatted values.
+
+    Retry loops log the same resources over and over. The key must be cheap
+    to compute compared to the formatting, f.e. a serialized proto message.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache: collections.OrderedDict[
+            Hashable, str
+        ] = collections.OrderedDict()
+
+    def get(self, key: Optional[Hashable], fn: Callable[[], str]) -> str:
+        """Returns the cached value for the key, formatting it on a miss.
+
+        None key is never cached.
+        """
+        if key is None:
+            return fn()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        # Formatted without the lock: a concurrent miss formats twice.
+        formatted = fn()
+        with self._lock:
+            self._cache[key] = formatted
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return formatted
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+def message_cache_key(message: Message) -> tuple[str, bytes]:
+    """The FormatCache key of a proto message."""
+    return (
+        message.DESCRIPTOR.full_name,
+        message.SerializeToString(deterministic=True),
+    )
@@ -0,0 +1,337 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""The parser of the Prometheus text exposition format.
+
+https://prometheus.io/docs/instrumenting/exposition_formats/#text-based-format
+
+The test apps export the CSM observability metrics on their Prometheus
+endpoint. Parsing the scraped /metrics lets the tests check the metrics
+right away, instead of waiting minutes for the Cloud Monitoring ingestion.
+
+The samples are parsed line by line into a Snapshot, with the values of
+each sample name stored in a flat array of doubles, indexed by the label
+set. The difference of two snapshots gives the counter increments and the
+histogram bucket counts in between the scrapes, and the histograms of
+either can be summarized with the mean and the percentiles.
+"""
+import array
+import dataclasses
+import math
+import re
+from typing import Final, Iterable, Iterator, Optional, Union
+
+# Type aliases
+# The sorted (name, value) pairs.
+LabelSet = tuple[tuple[str, str], ...]
+
+COUNTER: Final[str] = "counter"
+GAUGE: Final[str] = "gauge"
+HISTOGRAM: Final[str] = "histogram"
+SUMMARY: Final[str] = "summary"
+UNTYPED: Final[str] = "untyped"
+
+# The sample name suffixes of the metric families with several samples.
+_FAMILY_SUFFIXES: Final[dict[str, tuple[str, ...]]] = {
+    COUNTER: ("_total", "_created"),
+    HISTOGRAM: ("_bucket", "_sum", "_count", "_created"),
+    SUMMARY: ("_sum", "_count", "_created"),
+}
+# The samples only growing until the process restarts.
+_CUMULATIVE_SUFFIXES: Final[dict[str, tuple[str, ...]]] = {
+    COUNTER: ("", "_total"),
+    HISTOGRAM: ("_bucket", "_sum", "_count"),
+    SUMMARY: ("_sum", "_count"),
+}
+
+_SAMPLE_RE: Final[re.Pattern] = re.compile(
+    r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)"
+    r"(?:\{(?P<labels>.*)\})?"
+    r"\s+(?P<value>\S+)(?:\s+(?P<timestamp>-?\d+))?\s*$"
+)
+_LABEL_RE: Final[re.Pattern] = re.compile(
+    r'\s*(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"(?P<value>(?:[^"\\]|\\.)*)"'
+    r"\s*(?:,|$)"
+)
+_UNESCAPE_RE: Final[re.Pattern] = re.compile(r"\\(.)")
+_UNESCAPED: Final[dict[str, str]] = {"n": "\n", "\\": "\\", '"': '"'}
+
+
+class ParseError(ValueError):
+    """The line is not in the Prometheus text exposition format."""
+
+
+def _unescape(value: str) -> str:
+    return _UNESCAPE_RE.sub(
+        lambda m: _UNESCAPED.get(m.group(1), m.group(0)), value
+    )
+
+
+def _parse_labels(labels: str) -> LabelSet:
+    pairs = []
+    pos = 0
+    while pos < len(labels):
+        match = _LABEL_RE.match(labels, pos)
+        if not match:
+            raise ParseError(f"Invalid labels: {labels}")
+        pairs.append((match["name"], _unescape(match["value"])))
+        pos = match.end()
+    return tuple(sorted(pairs))
+
+
+def _parse_value(value: str) -> float:
+    # float() also accepts the +Inf, -Inf and NaN of the format.
+    try:
+        return float(value)
+    except ValueError as error:
+        raise ParseError(f"Invalid sample value: {value}") from error
+
+
+def _matches(label_set: LabelSet, label_filter: dict[str, str]) -> bool:
+    labels = dict(label_set)
+    return all(labels.get(k) == v for k, v in label_filter.items())
+
+
+class Samples:
+    """The values of a sample name, f.e. x_bucket, by the label set."""
+
+    name: str
+    label_sets: list[LabelSet]
+    values: array.array
+
+    def __init__(self, name: str):
+        self.name = name
+        self.label_sets = []
+        self.values = array.array("d")
+        self._index: dict[LabelSet, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def set(self, label_set: LabelSet, value: float):
+        i = self._index.get(label_set)
+        if i is None:
+            self._index[label_set] = len(self.values)
+            self.label_sets.append(label_set)
+            self.values.append(value)
+        else:
+            self.values[i] = value
+
+    def get(
+        self, label_set: LabelSet, default: Optional[float] = None
+    ) -> Optional[float]:
+        i = self._index.get(label_set)
+        return default if i is None else self.values[i]
+
+    def select(self, **label_filter: str) -> dict[LabelSet, float]:
+        """The values of the label sets having all the given labels."""
+        return {
+            label_set: value
+            for label_set, value in zip(self.label_sets, self.values)
+            if _matches(label_set, label_filter)
+        }
+
+    def copy(self) -> "Samples":
+        samples = Samples(self.name)
+        samples.label_sets = list(self.label_sets)
+        samples.values = array.array("d", self.values)
+        samples._index = dict(self._index)
+        return samples
+
+    def subtract(self, earlier: Optional["Samples"]) -> "Samples":
+        """The increase since the earlier samples of a cumulative metric.
+
+        The series missing from the earlier samples started at 0. The series
+        that decreased were reset, f.e. the app restarted, and increased by
+        their current value.
+        """
+        diff = self.copy()
+        if earlier is None:
+            return diff
+        if earlier.label_sets == self.label_sets:
+            # The same series in the same order: no lookups needed.
+            earlier_values = earlier.values
+        else:
+            earlier_values = array.array(
+                "d", (earlier.get(ls, 0.0) for ls in self.label_sets)
+            )
+        diff.values = array.array(
+            "d",
+            (
+                current - before if current >= before else current
+                for current, before in zip(self.values, earlier_values)
+            ),
+        )
+        return diff
+
+
+@dataclasses.dataclass(frozen=True)
+class Histogram:
+    """The cumulative bucket counts of a histogram, f.e. of a scrape diff."""
+
+    # Sorted, the last one is +Inf.
+    upper_bounds: tuple[float, ...]
+    cumulative_counts: tuple[float, ...]
+    count: float
+    sum: float
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else math.nan
+
+    def percentile(self, percent: float) -> float:
+        """The estimated value below which the percent of the observations
+        fall, f.e. 99 for p99.
+
+        Interpolated linearly within the bucket, same as histogram_quantile()
+        of Prometheus. NaN when there are no observations.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError(f"Expected percent in [0, 100], got {percent}")
+        if not self.upper_bounds or not self.cumulative_counts[-1]:
+            return math.nan
+        rank = percent / 100 * self.cumulative_counts[-1]
+        lower_bound, lower_count = 0.0, 0.0
+        for upper_bound, count in zip(
+            self.upper_bounds, self.cumulative_counts
+        ):
+            if count >= rank and count > lower_count:
+                if math.isinf(upper_bound):
+                    # Can't interpolate into the +Inf bucket.
+                    return lower_bound
+                if upper_bound <= 0:
+                    return upper_bound
+                return lower_bound + (upper_bound - lower_bound) * (
+                    (rank - lower_count) / (count - lower_count)
+                )
+            lower_bound, lower_count = upper_bound, count
+        return lower_bound
+
+
+class Snapshot:
+    """The samples of a single scrape of the Prometheus endpoint."""
+
+    # The metric family name to its type, from the # TYPE lines.
+    types: dict[str, str]
+    samples: dict[str, Samples]
+
+    def __init__(self):
+        self.types = {}
+        self.samples = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.samples
+
+    def __getitem__(self, name: str) -> Samples:
+        return self.samples[name]
+
+    def family(self, name: str) -> tuple[str, str]:
+        """The metric family name and type of the sample name."""
+        if name in self.types:
+            return name, self.types[name]
+        for metric_type, suffixes in _FAMILY_SUFFIXES.items():
+            for suffix in suffixes:
+                family = name.removesuffix(suffix)
+                if family != name and self.types.get(family) == metric_type:
+                    return family, metric_type
+        return name, UNTYPED
+
+    def is_cumulative(self, name: str) -> bool:
+        family, metric_type = self.family(name)
+        suffixes = _CUMULATIVE_SUFFIXES.get(metric_type, ())
+        return name.removeprefix(family) in suffixes
+
+    def value(self, name: str, **label_filter: str) -> float:
+        """The sum of the sample values having all the given labels."""
+        if name not in self.samples:
+            return 0.0
+        return math.fsum(self.samples[name].select(**label_filter).values())
+
+    def histogram(self, name: str, **label_filter: str) -> Histogram:
+        """The histogram of the family name, summed over the matching series.
+
+        F.e. histogram("grpc_server_call_duration_seconds", grpc_method=...).
+        """
+        counts: dict[float, float] = {}
+        if f"{name}_bucket" in self.samples:
+            buckets = self.samples[f"{name}_bucket"].select(**label_filter)
+            for label_set, value in buckets.items():
+                upper_bound = _parse_value(dict(label_set)["le"])
+                counts[upper_bound] = counts.get(upper_bound, 0.0) + value
+        upper_bounds = tuple(sorted(counts))
+        return Histogram(
+            upper_bounds=upper_bounds,
+            cumulative_counts=tuple(counts[b] for b in upper_bounds),
+            count=self.value(f"{name}_count", **label_filter),
+            sum=self.value(f"{name}_sum", **label_filter),
+        )
+
+    def __sub__(self, earlier: "Snapshot") -> "Snapshot":
+        """The increase of the cumulative samples since the earlier snapshot.
+
+        The counters, and the histogram and summary buckets, counts and sums
+        are subtracted. The gauges and the other samples keep their current
+        values.
+        """
+        diff = Snapshot()
+        diff.types = dict(self.types)
+        for name, samples in self.samples.items():
+            if self.is_cumulative(name):
+                diff.samples[name] = samples.subtract(earlier.samples.get(name))
+            else:
+                diff.samples[name] = samples.copy()
+        return diff
+
+
+def parse_lines(lines: Iterable[Union[str, bytes]]) -> Snapshot:
+    """Parses the exposition line by line, f.e. from Response.iter_lines().
+
+    Raises:
+        ParseError: A line is not in the text exposition format.
+    """
+    snapshot = Snapshot()
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            parts = line.split(maxsplit=3)
+            if len(parts) == 4 and parts[1] == "TYPE":
+                snapshot.types[parts[2]] = parts[3].strip()
+            # The HELP lines and the comments are skipped.
+            continue
+        match = _SAMPLE_RE.match(line)
+        if not match:
+            raise ParseError(f"Invalid sample line: {line}")
+        name = match["name"]
+        samples = snapshot.samples.get(name)
+        if samples is None:
+            samples = snapshot.samples[name] = Samples(name)
+        label_set = _parse_labels(match["labels"]) if match["labels"] else ()
+        samples.set(label_set, _parse_value(match["value"]))
+    return snapshot
+
+
+def parse(text: str) -> Snapshot:
+    return parse_lines(text.splitlines())
+
+
+def iter_series(snapshot: Snapshot) -> Iterator[tuple[str, LabelSet, float]]:
+    """All the (sample name, label set, value) of the snapshot."""
+    for name, samples in snapshot.samples.items():
+        yield from (
+            (name, label_set, value)
+            for label_set, value in zip(samples.label_sets, samples.values)
+        )
@@ -0,0 +1,160 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""The process-wide adaptive rate limiting of the API requests.
+
+All the threads sending the requests to the same API endpoint share a
+token bucket. Its rate is adjusted with AIMD (additive increase,
+multiplicative decrease): halved when the API responds with 429 Too Many
+Requests, and growing back by about 1 QPS per second of successful
+requests. This way the retries of the parallel workers slow down together,
+instead of each of them retrying on its own and keeping the quota
+exhausted.
+"""
+import logging
+import threading
+import time
+from typing import Final, Optional
+
+from absl import flags
+
+logger = logging.getLogger(__name__)
+
+API_MAX_QPS = flags.DEFINE_float(
+    "api_max_qps",
+    default=20,
+    lower_bound=0,
+    help=(
+        "The maximum rate of the requests to each GCP or Kubernetes API"
+        " endpoint, lowered on 429 Too Many Requests. 0 disables the rate"
+        " limiting."
+    ),
+)
+API_MIN_QPS = flags.DEFINE_float(
+    "api_min_qps",
+    default=0.5,
+    lower_bound=0.01,
+    help="The rate of the requests to an API endpoint is never lowered below.",
+)
+
+# Each second of the successful requests grows the rate by this much.
+_ADDITIVE_INCREASE_QPS: Final[float] = 1.0
+_MULTIPLICATIVE_DECREASE: Final[float] = 0.5
+# The 429s of the requests sent before the rate was lowered are expected,
+# and shouldn't lower it again.
+_DECREASE_COOLDOWN_SEC: Final[float] = 1.0
+
+
+class AdaptiveRateLimiter:
+    """The AIMD-adjusted token bucket, safe to share between the threads."""
+
+    name: str
+    max_qps: float
+    min_qps: float
+
+    def __init__(self, name: str, *, max_qps: float, min_qps: float):
+        if not 0 < min_qps <= max_qps:
+            raise ValueError(
+                f"Expected 0 < min_qps <= max_qps, got {min_qps}, {max_qps}"
+            )
+        self.name = name
+        self.max_qps = max_qps
+        self.min_qps = min_qps
+        self._lock = threading.Lock()
+        self._rate: float = max_qps
+        # Can be negative: the tokens reserved by the waiting threads.
+        self._tokens: float = self._burst()
+        self._updated_at: float = time.monotonic()
+        self._decreased_at: Optional[float] = None
+        self.throttled_count: int = 0
+
+    @property
+    def rate(self) -> float:
+        with self._lock:
+            return self._rate
+
+    def _burst(self) -> float:
+        # Up to a second worth of the requests at once.
+        return max(1.0, self._rate)
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+        self._tokens = min(self._burst(), self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """Blocks until the request can be sent, returns the seconds waited.
+
+        The token is reserved before waiting, so the threads are let through
+        in the order they came.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait_sec = -self._tokens / self._rate if self._tokens < 0 else 0
+        if wait_sec > 0:
+            time.sleep(wait_sec)
+        return wait_sec
+
+    def on_success(self):
+        with self._lock:
+            if self._rate < self.max_qps:
+                self._rate = min(
+                    self.max_qps,
+                    self._rate + _ADDITIVE_INCREASE_QPS / self._rate,
+                )
+
+    def on_throttled(self):
+        with self._lock:
+            self.throttled_count += 1
+            now = time.monotonic()
+            if (
+                self._decreased_at is not None
+                and now - self._decreased_at < _DECREASE_COOLDOWN_SEC
+            ):
+                return
+            self._refill(now)
+            self._decreased_at = now
+            self._rate = max(
+                self.min_qps, self._rate * _MULTIPLICATIVE_DECREASE
+            )
+            self._tokens = min(self._tokens, self._burst())
+            rate = self._rate
+        logger.info(
+            "Too many requests to %s, lowered the rate limit to %.2f QPS",
+            self.name,
+            rate,
+        )
+
+
+_limiters: dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(endpoint: str) -> Optional[AdaptiveRateLimiter]:
+    """The process-wide rate limiter of the API endpoint, f.e. the host.
+
+    None when the rate limiting is disabled, or the flags aren't parsed.
+    """
+    if not flags.FLAGS.is_parsed() or not API_MAX_QPS.value:
+        return None
+    with _limiters_lock:
+        limiter = _limiters.get(endpoint)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(
+                endpoint,
+                max_qps=API_MAX_QPS.value,
+                min_qps=min(API_MIN_QPS.value, API_MAX_QPS.value),
+            )
+            _limiters[endpoint] = limiter
+        return limiter
@@ -0,0 +1,199 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Phase-level timing of the test runs.
+
+When --trace_phases is enabled, the time spent in the significant phases of
+a test (resource provisioning, waits, assertions, cleanup) is recorded as
+spans, and written to the log dir as traces/<test_name>.trace.json, in Chrome
+trace-event format. Open the file in chrome://tracing or ui.perfetto.dev
+to see the flame graph of the test.
+
+Usage:
+
+    with tracing.span("create_backend_service", name=backend_service_name):
+        ...
+
+    @tracing.traced("wait_for_pods")
+    def _wait_for_pods(self, ...):
+        ...
+
+Spans recorded in any thread are nested by their start and end time.
+When tracing is disabled, or outside a test, spans don't record anything.
+"""
+import contextlib
+import functools
+import json
+import os
+import pathlib
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from absl import flags
+from absl import logging
+
+from framework.helpers import logs
+
+TRACE_PHASES = flags.DEFINE_bool(
+    "trace_phases",
+    default=False,
+    help=(
+        "Record the timing of the test phases, and save it to"
+        " <log_dir>/traces/ in Chrome trace-event format."
+    ),
+)
+
+TRACE_DIR_NAME = "traces"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class TraceRecorder:
+    """Collects the trace events. Thread-safe."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._events: list[dict[str, Any]] = []
+        self._thread_names: dict[int, str] = {}
+
+    @staticmethod
+    def now_us() -> int:
+        return time.perf_counter_ns() // 1000
+
+    def add_span(
+        self,
+        name: str,
+        *,
+        start_us: int,
+        end_us: int,
+        category: str = "",
+        args: Optional[dict[str, Any]] = None,
+    ):
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_us,
+            "dur": end_us - start_us,
+            "pid": self.pid,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        with self._lock:
+            self._events.append(event)
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    def trace_events(self) -> list[dict[str, Any]]:
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        metadata = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self.pid,
+                "args": {"name": self.name},
+            }
+        ]
+        for tid, thread_name in thread_names.items():
+            metadata.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self.pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+            )
+        return metadata + events
+
+    def write(self, path: pathlib.Path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traceEvents": self.trace_events(), "displayTimeUnit": "ms"},
+                f,
+            )
+
+
+_recorder: Optional[TraceRecorder] = None
+
+
+@contextlib.contextmanager
+def span(span_name: str, /, *, category: str = "", **args) -> Iterator[None]:
+    """Records the time spent in the block as a span.
+
+    Keyword arguments other than category are saved as the span args.
+    """
+    recorder = _recorder
+    if recorder is None:
+        yield
+        return
+    start_us = recorder.now_us()
+    try:
+        yield
+    finally:
+        recorder.add_span(
+            span_name,
+            start_us=start_us,
+            end_us=recorder.now_us(),
+            category=category,
+            args=args,
+        )
+
+
+def traced(name: Optional[str] = None, *, category: str = "") -> Callable:
+    """Decorator version of span(). Defaults to the function name."""
+
+    def decorator(fn: _F) -> _F:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return fn(*args, **kwargs)
+            with span(span_name, category=category):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def test_trace(test_name: str) -> Iterator[Optional[TraceRecorder]]:
+    """Records the spans of the test, and saves them when it's done."""
+    global _recorder
+    if not TRACE_PHASES.value or _recorder is not None:
+        yield None
+        return
+
+    recorder = TraceRecorder(test_name)
+    _recorder = recorder
+    try:
+        with span(test_name, category="test"):
+            yield recorder
+    finally:
+        _recorder = None
+        try:
+            trace_file = logs.log_dir_mkdir(TRACE_DIR_NAME) / (
+                f"{test_name}.trace.json"
+            )
+            recorder.write(trace_file)
+            logging.info("Test phases trace saved to %s", trace_file)
+        except OSError as e:
+            logging.warning("Failed to save the test phases trace: %r", e)
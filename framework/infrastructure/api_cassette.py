@@ -0,0 +1,433 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Records the GCP and Kubernetes API traffic to a file, and replays it.
+
+With --api_cassette_mode=record, the HTTP requests GcpApiManager and
+KubernetesApiManager send, and the responses they receive, are saved to
+the --api_cassette file when the process exits. With
+--api_cassette_mode=replay, the responses are served from the file, with
+no network access and no credentials. This allows profiling the framework
+itself, f.e. TrafficDirectorManager, the runners, and the waits, offline
+and deterministically.
+
+The requests are matched by the method and the URL. The requests with the
+same method and URL get the responses in the recorded order, and the last
+response is repeated after that. The replayed run must use the same flags
+as the recorded one, including --resource_suffix.
+
+When replaying, the time is virtual: time.sleep() returns immediately,
+and advances time.time() and time.monotonic() by the requested amount.
+This skips the retry and polling waits. datetime.now() and
+threading.Event.wait() still use the real time.
+
+Not recorded: the gRPC-based clients (Secret Manager, Cloud Monitoring),
+streaming Kubernetes responses (the watches and the pod logs), and the port
+forwarding, which runs kubectl.
+"""
+import atexit
+import base64
+import dataclasses
+import functools
+import json
+import logging
+import pathlib
+import tempfile
+import threading
+import time
+from typing import Any, Final, Optional
+import urllib.parse
+
+from absl import flags
+import httplib2
+import urllib3
+
+logger = logging.getLogger(__name__)
+
+MODE_RECORD: Final[str] = "record"
+MODE_REPLAY: Final[str] = "replay"
+
+CASSETTE_MODE = flags.DEFINE_enum(
+    "api_cassette_mode",
+    default=None,
+    enum_values=[MODE_RECORD, MODE_REPLAY],
+    help=(
+        "Record the GCP and Kubernetes API traffic to the --api_cassette"
+        " file, or replay it from the file with no network access."
+    ),
+)
+CASSETTE_PATH = flags.DEFINE_string(
+    "api_cassette",
+    default=None,
+    help="The cassette file to record the API traffic to, or replay from.",
+)
+flags.register_multi_flags_validator(
+    (CASSETTE_MODE, CASSETTE_PATH),
+    lambda values: bool(values["api_cassette_mode"])
+    == bool(values["api_cassette"]),
+    message="--api_cassette_mode and --api_cassette must be set together",
+)
+
+API_GCP: Final[str] = "gcp"
+API_K8S: Final[str] = "k8s"
+
+_FORMAT_VERSION: Final[int] = 1
+# Never saved to the cassette.
+_SECRET_QUERY_PARAMS: Final[frozenset[str]] = frozenset(("key",))
+_SKIPPED_RESPONSE_HEADERS: Final[frozenset[str]] = frozenset(
+    ("set-cookie", "date", "expires")
+)
+# The k8s API query params that make the response a stream.
+_STREAMING_QUERY_PARAMS: Final[tuple[str, ...]] = ("watch", "follow")
+
+
+class CassetteError(Exception):
+    """The request can't be served from the cassette."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Interaction:
+    api: str
+    method: str
+    # Normalized with request_key().
+    uri: str
+    status: int
+    reason: str
+    headers: dict[str, str]
+    body: bytes
+
+    def to_json(self) -> dict[str, Any]:
+        result = dataclasses.asdict(self)
+        try:
+            result["body"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            result["body"] = base64.b64encode(self.body).decode("ascii")
+            result["body_base64"] = True
+        return result
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "Interaction":
+        data = dict(data)
+        if data.pop("body_base64", False):
+            body = base64.b64decode(data["body"])
+        else:
+            body = data["body"].encode("utf-8")
+        data["body"] = body
+        return cls(**data)
+
+
+def request_key(api: str, method: str, uri: str) -> tuple[str, str, str]:
+    """Normalizes the request to match it regardless of the host and secrets.
+
+    Kubernetes API host depends on the cluster endpoint, so only the path is
+    kept. The query params are sorted, and the API keys are dropped.
+    """
+    parsed = urllib.parse.urlsplit(uri)
+    query = sorted(
+        (name, value)
+        for name, value in urllib.parse.parse_qsl(
+            parsed.query, keep_blank_values=True
+        )
+        if name not in _SECRET_QUERY_PARAMS
+    )
+    normalized = parsed.path
+    if api != API_K8S:
+        normalized = f"{parsed.scheme}://{parsed.netloc}{normalized}"
+    if query:
+        normalized += "?" + urllib.parse.urlencode(query)
+    return api, method.upper(), normalized
+
+
+class VirtualClock:
+    """Makes time.sleep() advance the time instead of waiting."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._offset: float = 0
+        self._real_sleep = time.sleep
+        self._real_time = time.time
+        self._real_monotonic = time.monotonic
+
+    @property
+    def skipped(self) -> float:
+        """The total seconds of the skipped sleeps."""
+        return self._offset
+
+    def sleep(self, seconds: float):
+        if seconds < 0:
+            raise ValueError("sleep length must be non-negative")
+        with self._lock:
+            self._offset += seconds
+        # Let the other threads run.
+        self._real_sleep(0)
+
+    def time(self) -> float:
+        return self._real_time() + self._offset
+
+    def monotonic(self) -> float:
+        return self._real_monotonic() + self._offset
+
+    def install(self):
+        time.sleep = self.sleep
+        time.time = self.time
+        time.monotonic = self.monotonic
+
+    def uninstall(self):
+        time.sleep = self._real_sleep
+        time.time = self._real_time
+        time.monotonic = self._real_monotonic
+
+
+class Cassette:
+    path: pathlib.Path
+    mode: str
+
+    def __init__(self, path: pathlib.Path, mode: str):
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._interactions: list[Interaction] = []
+        # The responses not replayed yet, by request_key().
+        self._pending: dict[tuple[str, str, str], list[Interaction]] = {}
+        self._last: dict[tuple[str, str, str], Interaction] = {}
+        self.replayed: int = 0
+        self.clock: Optional[VirtualClock] = None
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == MODE_REPLAY
+
+    @functools.cached_property
+    def k8s_discovery_cache_file(self) -> str:
+        """A new k8s API discovery cache for the process.
+
+        Otherwise, the cache shared with the previous runs may save
+        the discovery requests when recording, but not when replaying.
+        """
+        cache_dir = tempfile.mkdtemp(prefix="api_cassette_")
+        return str(pathlib.Path(cache_dir) / "k8s_discovery.json")
+
+    def load(self):
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _FORMAT_VERSION:
+            raise CassetteError(
+                f"Unsupported cassette version {data.get('version')}"
+            )
+        for item in data["interactions"]:
+            interaction = Interaction.from_json(item)
+            key = (interaction.api, interaction.method, interaction.uri)
+            self._pending.setdefault(key, []).append(interaction)
+            self._interactions.append(interaction)
+        logger.info(
+            "Replaying %i API interactions from %s",
+            len(self._interactions),
+            self.path,
+        )
+
+    def save(self):
+        with self._lock:
+            interactions = [i.to_json() for i in self._interactions]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": _FORMAT_VERSION, "interactions": interactions}, f
+            )
+        logger.info(
+            "Recorded %i API interactions to %s", len(interactions), self.path
+        )
+
+    def close(self):
+        if self.replaying:
+            logger.info(
+                "Replayed %i API requests, skipped %.1fs of sleeps",
+                self.replayed,
+                self.clock.skipped if self.clock else 0,
+            )
+        else:
+            self.save()
+
+    def record(
+        self,
+        api: str,
+        method: str,
+        uri: str,
+        *,
+        status: int,
+        reason: str,
+        headers: dict[str, str],
+        body: bytes,
+    ):
+        _, method, uri = request_key(api, method, uri)
+        interaction = Interaction(
+            api=api,
+            method=method,
+            uri=uri,
+            status=status,
+            reason=reason,
+            headers={
+                name.lower(): str(value)
+                for name, value in headers.items()
+                if name.lower() not in _SKIPPED_RESPONSE_HEADERS
+            },
+            body=body,
+        )
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def replay(self, api: str, method: str, uri: str) -> Interaction:
+        key = request_key(api, method, uri)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending:
+                interaction = pending.pop(0)
+                self._last[key] = interaction
+            elif key in self._last:
+                interaction = self._last[key]
+            else:
+                raise CassetteError(f"Request not recorded: {' '.join(key)}")
+            self.replayed += 1
+        return interaction
+
+    def gcp_http(self, http: Optional[httplib2.Http] = None) -> "CassetteHttp":
+        """Wraps the googleapiclient.discovery transport.
+
+        The wrapped transport is only used when recording.
+        """
+        return CassetteHttp(self, http=None if self.replaying else http)
+
+    def wrap_k8s_client(self, api_client):
+        """Routes the Kubernetes ApiClient requests through the cassette."""
+        rest_client = api_client.rest_client
+        rest_client.pool_manager = CassettePoolManager(
+            self, pool_manager=rest_client.pool_manager
+        )
+
+
+class CassetteHttp:
+    """Records or replays the httplib2.Http requests."""
+
+    def __init__(self, cassette: Cassette, *, http: Optional[httplib2.Http]):
+        self.cassette = cassette
+        # Never used for the requests when replaying, but the API resources
+        # close it.
+        self.http = http if http is not None else httplib2.Http()
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        if self.cassette.replaying:
+            interaction = self.cassette.replay(API_GCP, method, uri)
+            response = httplib2.Response(
+                {**interaction.headers, "status": interaction.status}
+            )
+            response.reason = interaction.reason
+            return response, interaction.body
+
+        response, content = self.http.request(
+            uri, method=method, body=body, headers=headers, **kwargs
+        )
+        self.cassette.record(
+            API_GCP,
+            method,
+            uri,
+            status=response.status,
+            reason=response.reason,
+            headers={k: v for k, v in response.items() if k != "status"},
+            body=content,
+        )
+        return response, content
+
+    def close(self):
+        self.http.close()
+
+
+class CassettePoolManager:
+    """Records or replays the urllib3.PoolManager requests."""
+
+    def __init__(self, cassette: Cassette, *, pool_manager):
+        self.cassette = cassette
+        self.pool_manager = pool_manager
+
+    def request(self, method, url, fields=None, **kwargs):
+        # GET query params are passed as fields.
+        full_url = url
+        if fields and method.upper() in ("GET", "HEAD"):
+            full_url += ("&" if "?" in url else "?") + urllib.parse.urlencode(
+                fields
+            )
+
+        if _is_streaming(full_url):
+            if self.cassette.replaying:
+                raise CassetteError(
+                    f"Streaming response not supported: {method} {url}"
+                )
+            return self.pool_manager.request(
+                method, url, fields=fields, **kwargs
+            )
+
+        if self.cassette.replaying:
+            interaction = self.cassette.replay(API_K8S, method, full_url)
+            return urllib3.HTTPResponse(
+                body=interaction.body,
+                headers=interaction.headers,
+                status=interaction.status,
+                reason=interaction.reason,
+                preload_content=True,
+            )
+
+        # Not streaming, so the whole response can be read, even when the
+        # content is not preloaded, f.e. by the dynamic client.
+        response = self.pool_manager.request(
+            method, url, fields=fields, **kwargs
+        )
+        self.cassette.record(
+            API_K8S,
+            method,
+            full_url,
+            status=response.status,
+            reason=response.reason or "",
+            headers=dict(response.headers),
+            body=response.data,
+        )
+        return response
+
+
+def _is_streaming(url: str) -> bool:
+    """Whether the k8s API keeps sending the response, f.e. a watch."""
+    query = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)
+    return any(
+        value.lower() in ("true", "1")
+        for param in _STREAMING_QUERY_PARAMS
+        for value in query.get(param, ())
+    )
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """Returns the process-wide cassette, or None when not enabled."""
+    global _cassette
+    if not flags.FLAGS.is_parsed() or not CASSETTE_MODE.value:
+        return None
+    with _cassette_lock:
+        if _cassette is None:
+            cassette = Cassette(
+                pathlib.Path(CASSETTE_PATH.value), CASSETTE_MODE.value
+            )
+            if cassette.replaying:
+                cassette.load()
+                cassette.clock = VirtualClock()
+                cassette.clock.install()
+            _cassette = cassette
+            atexit.register(_cassette.close)
+        return _cassette
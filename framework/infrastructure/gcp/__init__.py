@@ -15,5 +15,6 @@ from framework.infrastructure.gcp import api
 from framework.infrastructure.gcp import cloud_run
 from framework.infrastructure.gcp import compute
 from framework.infrastructure.gcp import iam
+from framework.infrastructure.gcp import monitoring
 from framework.infrastructure.gcp import network_security
 from framework.infrastructure.gcp import network_services
@@ -16,11 +16,11 @@ import contextlib
 import functools
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
 
 from absl import flags
-from google.cloud import secretmanager_v1
-import google.cloud.monitoring_v3
+import google.auth.credentials
 from google.longrunning import operations_pb2
 from google.protobuf import json_format
 from google.rpc import code_pb2
@@ -33,7 +33,20 @@ import googleapiclient.model
 import tenacity
 import yaml
 
+from framework.helpers import lazy_import
+from framework.helpers import logs
+from framework.helpers import tracing
 import framework.helpers.highlighter
+from framework.infrastructure import api_cassette
+from framework.infrastructure.gcp import transport
+
+if TYPE_CHECKING:
+    from google.cloud import monitoring_v3
+    from google.cloud import secretmanager_v1
+else:
+    # Only needed by some of the tests.
+    monitoring_v3 = lazy_import.module("google.cloud.monitoring_v3")
+    secretmanager_v1 = lazy_import.module("google.cloud.secretmanager_v1")
 
 logger = logging.getLogger(__name__)
 PRIVATE_API_KEY_SECRET_NAME = flags.DEFINE_string(
@@ -84,6 +97,7 @@ _HttpLib2Error = googleapiclient.http.httplib2.HttpLib2Error
 _HighlighterYaml = framework.helpers.highlighter.HighlighterYaml
 Operation = operations_pb2.Operation
 HttpRequest = googleapiclient.http.HttpRequest
+_LazyFormat = logs.LazyFormat
 
 
 class GcpApiManager:
@@ -100,6 +114,7 @@ class GcpApiManager:
         gcp_ui_url=None,
         verbose_gcp_api: bool = False,
         v2_discovery_force_api_key: bool = False,
+        credentials: Optional[google.auth.credentials.Credentials] = None,
     ):
         # Log GCP API requests and responses.
         # Note: this modifies a global variable on googleapiclient.model.
@@ -116,12 +131,16 @@ class GcpApiManager:
             private_api_key_secret_name or PRIVATE_API_KEY_SECRET_NAME.value
         )
         self.gcp_ui_url = gcp_ui_url or GCP_UI_URL.value
-        # TODO(sergiitk): add options to pass google Credentials
+        # None for the application default credentials.
+        self._credentials = credentials
+        self._http_lock = threading.Lock()
+        self._thread_local_http: Optional[transport.ThreadLocalHttp] = None
         self._exit_stack = contextlib.ExitStack()
 
         self.v2_discovery_force_api_key = (
             v2_discovery_force_api_key or V2_DISCOVERY_FORCE_API_KEY.value
         )
+        self._cassette = api_cassette.get_cassette()
 
     def close(self):
         self._exit_stack.close()
@@ -149,6 +168,9 @@ class GcpApiManager:
                 "private_api_key_secret_name must be set to "
                 "access private_api_key."
             )
+        if self._cassette and self._cassette.replaying:
+            # API keys aren't recorded, and not matched on replay.
+            return "replayed-api-key"
 
         secrets_api = self.secrets("v1")
         version_resource_path = secrets_api.secret_version_path(
@@ -232,7 +254,7 @@ class GcpApiManager:
         client = None
         if version == "v3":
             # TODO(sergiitk): set client_options arg if staging api is needed.
-            client = google.cloud.monitoring_v3.MetricServiceClient()
+            client = monitoring_v3.MetricServiceClient()
 
         if not client:
             raise NotImplementedError(f"Metric Service {version} not supported")
@@ -261,6 +283,7 @@ class GcpApiManager:
             version,
             cache_discovery=False,
             discoveryServiceUrl=self.v1_discovery_uri,
+            http=self._http(),
         )
         self._exit_stack.enter_context(api)
         return api
@@ -292,16 +315,33 @@ class GcpApiManager:
             version,
             cache_discovery=False,
             discoveryServiceUrl=f"{self.v2_discovery_uri}{params_str}",
+            http=self._http(),
         )
         self._exit_stack.enter_context(api)
         return api
 
     def _build_from_file(self, discovery_file):
         with open(discovery_file, "r") as f:
-            api = discovery.build_from_document(f.read())
+            api = discovery.build_from_document(f.read(), http=self._http())
         self._exit_stack.enter_context(api)
         return api
 
+    def _http(self) -> api_cassette.CassetteHttp | transport.ThreadLocalHttp:
+        """The HTTP transport shared by the API resources."""
+        if self._cassette and self._cassette.replaying:
+            return self._cassette.gcp_http()
+        with self._http_lock:
+            if self._thread_local_http is None:
+                credentials = (
+                    self._credentials or transport.default_credentials()
+                )
+                self._thread_local_http = transport.ThreadLocalHttp(
+                    transport.authorized_http_factory(credentials)
+                )
+        if self._cassette:
+            return self._cassette.gcp_http(self._thread_local_http)
+        return self._thread_local_http
+
 
 class Error(Exception):
     """Base error class for GCP API errors."""
@@ -436,6 +476,8 @@ class GcpProjectApiResource:
     _WAIT_FOR_OPERATION_SEC = 60 * 10
     _WAIT_FIXED_SEC = 2
     _GCP_API_RETRIES = 5
+    # Shared by all resources: the formatting doesn't depend on the API.
+    _pretty_format_cache = logs.FormatCache()
 
     def __init__(self, api: discovery.Resource, project: str):
         self.api: discovery.Resource = api
@@ -475,6 +517,14 @@ class GcpProjectApiResource:
         highlight: bool = True,
     ) -> str:
         """Return a string with pretty-printed resource body."""
+        return self._pretty_format_cache.get(
+            self._pretty_format_cache_key(resource, highlight),
+            functools.partial(
+                self._resource_pretty_format, resource, highlight=highlight
+            ),
+        )
+
+    def _resource_pretty_format(self, resource: Any, *, highlight: bool) -> str:
         yaml_out: str = yaml.dump(
             resource,
             explicit_start=True,
@@ -482,6 +532,18 @@ class GcpProjectApiResource:
         )
         return self._highlighter.highlight(yaml_out) if highlight else yaml_out
 
+    @staticmethod
+    def _pretty_format_cache_key(
+        resource: Any, highlight: bool
+    ) -> Optional[tuple[str, bool]]:
+        # Only cache the API bodies: the JSON dump is much cheaper than YAML.
+        if not isinstance(resource, (dict, list)):
+            return None
+        try:
+            return json.dumps(resource, sort_keys=True), highlight
+        except (TypeError, ValueError):
+            return None
+
     def resources_pretty_format(
         self,
         resources: list[Any],
@@ -537,18 +599,29 @@ class GcpStandardCloudApiResource(GcpProjectApiResource, metaclass=abc.ABCMeta):
         collection: discovery.Resource,
         body: dict,
         location: Optional[str] = None,
+        *,
+        wait_for_operation: bool = True,
         **kwargs,
-    ):
+    ) -> Optional[dict[str, Any]]:
+        """Creates the resource.
+
+        Returns the operation when not waiting for it to complete, so the
+        caller can track the readiness of the resource its own way.
+        """
         logger.info(
             "Creating %s resource:\n%s",
             self.api_name,
-            self.resource_pretty_format(body),
+            _LazyFormat(self.resource_pretty_format, body),
         )
         create_req = collection.create(
             parent=self.parent(location), body=body, **kwargs
         )
 
-        self._execute(create_req)
+        with tracing.span(f"{self.api_name}.create", **kwargs):
+            if not wait_for_operation:
+                return create_req.execute(num_retries=self._GCP_API_RETRIES)
+            self._execute(create_req)
+        return None
 
     @property
     @abc.abstractmethod
@@ -563,16 +636,52 @@ class GcpStandardCloudApiResource(GcpProjectApiResource, metaclass=abc.ABCMeta):
     def _get_resource(self, collection: discovery.Resource, full_name):
         resource = collection.get(name=full_name).execute()
         logger.info(
-            "Loaded %s:\n%s", full_name, self.resource_pretty_format(resource)
+            "Loaded %s:\n%s",
+            full_name,
+            _LazyFormat(self.resource_pretty_format, resource),
         )
         return resource
 
+    def _patch_resource(
+        self,
+        collection: discovery.Resource,
+        full_name: str,
+        body: dict,
+        update_mask: Iterable[str],
+    ):
+        update_mask = ",".join(update_mask)
+        logger.info(
+            "Patching %s, fields %s:\n%s",
+            full_name,
+            update_mask,
+            _LazyFormat(self.resource_pretty_format, body),
+        )
+        patch_req = collection.patch(
+            name=full_name, body=body, updateMask=update_mask
+        )
+        with tracing.span(f"{self.api_name}.patch", resource=full_name):
+            self._execute(patch_req)
+
+    def _list_resources(
+        self,
+        collection: discovery.Resource,
+        collection_name: str,
+        location: Optional[str] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yields the resources from all the pages of the list response."""
+        request = collection.list(parent=self.parent(location))
+        while request is not None:
+            resp = request.execute(num_retries=self._GCP_API_RETRIES)
+            yield from resp.get(collection_name, [])
+            request = collection.list_next(request, resp)
+
     def _delete_resource(
         self, collection: discovery.Resource, full_name: str
     ) -> bool:
         logger.debug("Deleting %s", full_name)
         try:
-            self._execute(collection.delete(name=full_name))
+            with tracing.span(f"{self.api_name}.delete", resource=full_name):
+                self._execute(collection.delete(name=full_name))
             return True
         except _HttpError as error:
             if error.resp and error.resp.status == 404:
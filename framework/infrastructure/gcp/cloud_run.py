@@ -13,10 +13,28 @@
 # limitations under the License.
 import abc
 import dataclasses
-from typing import Any, Final
+import datetime as dt
+import logging
+import time
+from typing import Any, Final, Optional
 
+from framework.helpers import retryers
 from framework.infrastructure import gcp
 
+logger = logging.getLogger(__name__)
+
+# Type aliases
+_timedelta = dt.timedelta
+
+# The deployment stages, in the order they complete.
+STAGE_REVISION_READY: Final[str] = "revision_ready"
+STAGE_TRAFFIC_ASSIGNED: Final[str] = "traffic_assigned"
+STAGE_SERVERLESS_NEG_CREATED: Final[str] = "serverless_neg_created"
+
+# https://cloud.google.com/run/docs/reference/rest/v2/Condition#State
+_CONDITION_SUCCEEDED: Final[str] = "CONDITION_SUCCEEDED"
+_CONDITION_FAILED: Final[str] = "CONDITION_FAILED"
+
 
 @dataclasses.dataclass(frozen=True)
 class CloudRunService:
@@ -35,10 +53,90 @@ class CloudRunService:
         )
 
 
+class DeploymentError(gcp.api.Error):
+    """The Cloud Run service or its revision failed to become ready."""
+
+
+@dataclasses.dataclass
+class DeploymentTimings:
+    """The time from the start of the deployment to each of its stages."""
+
+    service_name: str
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+    stages: dict[str, _timedelta] = dataclasses.field(default_factory=dict)
+
+    def record(self, stage: str) -> _timedelta:
+        elapsed = _timedelta(seconds=time.monotonic() - self.started_at)
+        self.stages[stage] = elapsed
+        logger.info(
+            "Cloud Run service %s: %s after %.1fs",
+            self.service_name,
+            stage,
+            elapsed.total_seconds(),
+        )
+        return elapsed
+
+    def __str__(self) -> str:
+        stages = ", ".join(
+            f"{stage}={elapsed.total_seconds():.1f}s"
+            for stage, elapsed in self.stages.items()
+        )
+        return f"{self.service_name}: {stages or 'no stages completed'}"
+
+
+def _ready_condition(resource: dict[str, Any]) -> dict[str, Any]:
+    # Services report it as the terminalCondition, revisions only have
+    # the list of conditions.
+    conditions = resource.get("conditions", [])
+    if "terminalCondition" in resource:
+        conditions = [resource["terminalCondition"]]
+    for condition in conditions:
+        if condition.get("type") == "Ready":
+            return condition
+    return {}
+
+
+def ready_condition_state(resource: dict[str, Any]) -> Optional[str]:
+    """The state of the Ready condition of the service or the revision.
+
+    None while the condition is not reported yet.
+    """
+    return _ready_condition(resource).get("state")
+
+
+def check_revision_ready(revision: dict[str, Any]) -> bool:
+    """Whether the revision is ready to serve.
+
+    Raises:
+        DeploymentError: The revision failed, f.e. its container crashed.
+    """
+    state = ready_condition_state(revision)
+    if state == _CONDITION_FAILED:
+        condition = _ready_condition(revision)
+        reason = condition.get("revisionReason") or condition.get("reason")
+        raise DeploymentError(
+            f"Revision {revision.get('name')} failed:"
+            f" {reason}: {condition.get('message')}"
+        )
+    return state == _CONDITION_SUCCEEDED
+
+
+def is_traffic_assigned(service: dict[str, Any], revision: str) -> bool:
+    """Whether the service routes the traffic to the revision."""
+    if service.get("reconciling"):
+        return False
+    if ready_condition_state(service) != _CONDITION_SUCCEEDED:
+        return False
+    return service.get("latestReadyRevision") == revision
+
+
 class CloudRunV2(gcp.api.GcpStandardCloudApiResource, metaclass=abc.ABCMeta):
     """Cloud Run API v2."""
 
     SERVICES: Final[str] = "services"
+    DEPLOYMENT_TIMEOUT: Final[_timedelta] = _timedelta(minutes=10)
+    _POLL_WAIT_MIN: Final[_timedelta] = _timedelta(seconds=1)
+    _POLL_WAIT_MAX: Final[_timedelta] = _timedelta(seconds=10)
 
     region: str
 
@@ -63,12 +161,90 @@ class CloudRunV2(gcp.api.GcpStandardCloudApiResource, metaclass=abc.ABCMeta):
         """Returns the API version for Cloud Run."""
         return "v2"
 
-    def create_service(self, service_name: str, body: dict) -> None:
-        return self._create_resource(
+    def start_create_service(self, service_name: str, body: dict) -> None:
+        """Sends the create request without waiting for the operation.
+
+        The operation only completes when the service is ready, see
+        wait_for_service_ready to track the deployment stages instead.
+        """
+        self._create_resource(
             collection=self._services_collection,
             location=self.region,
             serviceId=service_name,
             body=body,
+            wait_for_operation=False,
+        )
+
+    def wait_for_service_ready(
+        self,
+        service_name: str,
+        *,
+        timings: Optional[DeploymentTimings] = None,
+        timeout: _timedelta = DEPLOYMENT_TIMEOUT,
+    ) -> CloudRunService:
+        """Waits for the latest revision to become ready and get the traffic.
+
+        Polls the revision conditions with the exponential backoff, so the
+        failed revision is reported as soon as the API knows about it,
+        rather than when the create operation times out.
+
+        Raises:
+            DeploymentError: The revision failed to become ready.
+            RetryError: The service wasn't ready in time.
+        """
+        if timings is None:
+            timings = DeploymentTimings(service_name)
+        full_name = self.resource_full_name(
+            service_name, self.SERVICES, self.region
+        )
+        deadline = time.monotonic() + timeout.total_seconds()
+
+        service = self._poll(
+            lambda: self._get_service_body(full_name),
+            lambda body: bool(body.get("latestCreatedRevision")),
+            deadline=deadline,
+            error_note=f"Service {service_name} has no revision created",
+        )
+        revision = service["latestCreatedRevision"]
+        self._poll(
+            lambda: self._get_revision_body(revision),
+            check_revision_ready,
+            deadline=deadline,
+            error_note=f"Revision {revision} is not ready",
+        )
+        timings.record(STAGE_REVISION_READY)
+
+        service = self._poll(
+            lambda: self._get_service_body(full_name),
+            lambda body: is_traffic_assigned(body, revision),
+            deadline=deadline,
+            error_note=f"Service {service_name} doesn't serve {revision}",
+        )
+        timings.record(STAGE_TRAFFIC_ASSIGNED)
+        return CloudRunService.from_response(full_name, service)
+
+    def _poll(self, get_fn, check_fn, *, deadline: float, error_note: str):
+        retryer = retryers.exponential_retryer_with_timeout(
+            wait_min=self._POLL_WAIT_MIN,
+            wait_max=self._POLL_WAIT_MAX,
+            timeout=_timedelta(seconds=max(0.0, deadline - time.monotonic())),
+            # The errors, f.e. DeploymentError, aren't retried.
+            retry_on_exceptions=(),
+            check_result=check_fn,
+            error_note=error_note,
+        )
+        return retryer(get_fn)
+
+    def _get_service_body(self, full_name: str) -> dict[str, Any]:
+        # Not logged: called repeatedly while waiting for the deployment.
+        return self._services_collection.get(name=full_name).execute(
+            num_retries=self._GCP_API_RETRIES
+        )
+
+    def _get_revision_body(self, full_name: str) -> dict[str, Any]:
+        revisions = self._services_collection.revisions()
+        return revisions.get(name=full_name).execute(
+            num_retries=self._GCP_API_RETRIES
         )
 
     def get_service(self, service_name: str) -> CloudRunService:
@@ -15,14 +15,16 @@ import dataclasses
 import datetime
 import enum
 import logging
-from typing import Any, List, Optional, Set
+from typing import Any, Iterator, List, Mapping, Optional, Set, Tuple
 
 from googleapiclient import discovery
 import googleapiclient.errors
 import httplib2
 
 import framework.errors
+from framework.helpers import logs
 from framework.helpers import retryers
+from framework.helpers import tracing
 from framework.infrastructure import gcp
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,9 @@ logger = logging.getLogger(__name__)
 DEBUG_HEADER_IN_RESPONSE = "x-encrypted-debug-headers"
 DEBUG_HEADER_KEY = "X-Return-Encrypted-Headers"
 
+# Type aliases
+_LazyFormat = logs.LazyFormat
+
 
 class ComputeV1(
     gcp.api.GcpProjectApiResource
@@ -105,12 +110,26 @@ class ComputeV1(
             },
         )
 
-    def list_health_check(self):
-        return self._list_resource(self.api.healthChecks())
+    def list_health_check(
+        self, *, resource_filter: Optional[str] = None
+    ) -> Iterator[dict]:
+        return self._list_resource(
+            self.api.healthChecks(), resource_filter=resource_filter
+        )
+
+    def get_health_check(self, name: str) -> "GcpResource":
+        return self._get_resource(self.api.healthChecks(), healthCheck=name)
 
     def delete_health_check(self, name):
         self._delete_resource(self.api.healthChecks(), "healthCheck", name)
 
+    def list_instance_template(
+        self, *, resource_filter: Optional[str] = None
+    ) -> Iterator[dict]:
+        return self._list_resource(
+            self.api.instanceTemplates(), resource_filter=resource_filter
+        )
+
     def create_firewall_rule(
         self,
         name: str,
@@ -142,6 +161,13 @@ class ComputeV1(
     def delete_firewall_rule(self, name):
         self._delete_resource(self.api.firewalls(), "firewall", name)
 
+    def list_firewall_rule(
+        self, *, resource_filter: Optional[str] = None
+    ) -> Iterator[dict]:
+        return self._list_resource(
+            self.api.firewalls(), resource_filter=resource_filter
+        )
+
     def create_backend_service_traffic_director(
         self,
         name: str,
@@ -248,6 +274,13 @@ class ComputeV1(
             backendService=backend_service.name,
         )
 
+    def list_backend_service(
+        self, *, resource_filter: Optional[str] = None
+    ) -> Iterator[dict]:
+        return self._list_resource(
+            self.api.backendServices(), resource_filter=resource_filter
+        )
+
     def delete_backend_service(self, name):
         self._delete_resource(
             self.api.backendServices(), "backendService", name
@@ -283,6 +316,9 @@ class ComputeV1(
             },
         )
 
+    def get_url_map(self, name: str) -> dict:
+        return self._get_resource_body(self.api.urlMaps(), urlMap=name)
+
     def create_url_map_with_content(self, url_map_body: Any) -> "GcpResource":
         return self._insert_resource(self.api.urlMaps(), url_map_body)
 
@@ -294,6 +330,13 @@ class ComputeV1(
             **kwargs,
         )
 
+    def list_url_map(
+        self, *, resource_filter: Optional[str] = None
+    ) -> Iterator[dict]:
+        return self._list_resource(
+            self.api.urlMaps(), resource_filter=resource_filter
+        )
+
     def delete_url_map(self, name):
         self._delete_resource(self.api.urlMaps(), "urlMap", name)
 
@@ -312,6 +355,13 @@ class ComputeV1(
             },
         )
 
+    def list_target_grpc_proxy(
+        self, *, resource_filter: Optional[str] = None
+    ) -> Iterator[dict]:
+        return self._list_resource(
+            self.api.targetGrpcProxies(), resource_filter=resource_filter
+        )
+
     def delete_target_grpc_proxy(self, name):
         self._delete_resource(
             self.api.targetGrpcProxies(), "targetGrpcProxy", name
@@ -330,6 +380,13 @@ class ComputeV1(
             },
         )
 
+    def list_target_http_proxy(
+        self, *, resource_filter: Optional[str] = None
+    ) -> Iterator[dict]:
+        return self._list_resource(
+            self.api.targetHttpProxies(), resource_filter=resource_filter
+        )
+
     def delete_target_http_proxy(self, name):
         self._delete_resource(
             self.api.targetHttpProxies(), "targetHttpProxy", name
@@ -370,11 +427,38 @@ class ComputeV1(
             self.api.globalForwardingRules(), resource_filter=filter_str
         )
 
+    def list_forwarding_rule_ports(self, network_url: str) -> set[int]:
+        """The ports of the Traffic Director forwarding rules in the network.
+
+        Unlike exists_forwarding_rule, includes all the ports of the ranges.
+        """
+        filter_str = (
+            '(loadBalancingScheme eq "INTERNAL_SELF_MANAGED")'
+            f'(network eq ".*/{network_url}")'
+        )
+        ports = set()
+        for forwarding_rule in self.list_forwarding_rule(
+            resource_filter=filter_str
+        ):
+            port_range = forwarding_rule.get("portRange")
+            if port_range:
+                lo, _, hi = port_range.partition("-")
+                ports.update(range(int(lo), int(hi or lo) + 1))
+        return ports
+
+    def list_forwarding_rule(
+        self, *, resource_filter: Optional[str] = None
+    ) -> Iterator[dict]:
+        return self._list_resource(
+            self.api.globalForwardingRules(), resource_filter=resource_filter
+        )
+
     def delete_forwarding_rule(self, name):
         self._delete_resource(
             self.api.globalForwardingRules(), "forwardingRule", name
         )
 
+    @tracing.traced()
     def wait_for_network_endpoint_group(
         self,
         name: str,
@@ -423,6 +507,13 @@ class ComputeV1(
             raise
         return neg
 
+    def get_backend_service(self, name: str) -> dict:
+        return (
+            self.api.backendServices()
+            .get(project=self.project, backendService=name)
+            .execute()
+        )
+
     def get_network_endpoint_group(self, name, zone):
         neg = (
             self.api.networkEndpointGroups()
@@ -432,6 +523,7 @@ class ComputeV1(
         # TODO(sergiitk): dataclass
         return neg
 
+    @tracing.traced()
     def wait_for_backends_healthy_status(
         self,
         backend_service: GcpResource,
@@ -515,6 +607,74 @@ class ComputeV1(
 
             raise
 
+    @tracing.traced()
+    def wait_for_backend_services_healthy_status(
+        self,
+        expected: Mapping[GcpResource, Tuple[Set[ZonalGcpResource], int]],
+        *,
+        timeout_sec: int = _WAIT_FOR_BACKEND_SEC,
+        wait_sec: int = _WAIT_FOR_BACKEND_SLEEP_SEC,
+    ) -> None:
+        """Waits for several backend services to report backends healthy.
+
+        Same as wait_for_backends_healthy_status(), but polls all given
+        backend services within a single retry loop, so the total wait
+        is bound by the slowest backend service, not by the sum of them.
+
+        Args:
+            expected: Maps a backend service to a tuple of
+                (backends, replica_count).
+        """
+        if not expected:
+            raise ValueError("The list of backend services to wait on is empty")
+        for backend_service, (backends, replica_count) in expected.items():
+            if not backends or not replica_count:
+                raise ValueError(
+                    f"Backend service {backend_service.name}: no backends"
+                    " or replicas to wait on."
+                )
+
+        pending = {bs: set(backends) for bs, (backends, _) in expected.items()}
+        healthy = {bs: set() for bs in expected}
+        waiting = set(expected)
+
+        def _retry_all_backend_services_health() -> bool:
+            for backend_service in list(waiting):
+                if self._retry_backends_health(
+                    backend_service,
+                    pending[backend_service],
+                    healthy[backend_service],
+                    replica_count=expected[backend_service][1],
+                ):
+                    waiting.remove(backend_service)
+            return not waiting
+
+        timeout = datetime.timedelta(seconds=timeout_sec)
+        retryer = retryers.constant_retryer(
+            wait_fixed=datetime.timedelta(seconds=wait_sec),
+            timeout=timeout,
+            check_result=lambda result: result,
+        )
+        try:
+            retryer(_retry_all_backend_services_health)
+        except retryers.RetryError as retry_err:
+            unhealthy = "\n".join(
+                f"  {bs.name}: {[backend.name for backend in pending[bs]]}"
+                for bs in waiting
+            )
+            retry_err.add_note(
+                framework.errors.FrameworkError.note_blanket_error_info_below(
+                    "One or several NEGs (Network Endpoint Groups) didn't"
+                    " report HEALTHY status within expected timeout.",
+                    info_below=(
+                        f"Timeout {timeout} (h:mm:ss) waiting for backend"
+                        " services to report all NEGs in the HEALTHY status."
+                        f"\nUnhealthy backends:\n{unhealthy}"
+                    ),
+                )
+            )
+            raise
+
     def _retry_backends_health(
         self,
         backend_service: GcpResource,
@@ -630,11 +790,18 @@ class ComputeV1(
     def _get_resource(
         self, collection: discovery.Resource, **kwargs
     ) -> "GcpResource":
+        resp = self._get_resource_body(collection, **kwargs)
+        return self.GcpResource(resp["name"], resp["selfLink"])
+
+    def _get_resource_body(
+        self, collection: discovery.Resource, **kwargs
+    ) -> dict:
         resp = collection.get(project=self.project, **kwargs).execute()
         logger.info(
-            "Loaded compute resource:\n%s", self.resource_pretty_format(resp)
+            "Loaded compute resource:\n%s",
+            _LazyFormat(self.resource_pretty_format, resp),
         )
-        return self.GcpResource(resp["name"], resp["selfLink"])
+        return resp
 
     def _exists_resource(
         self, collection: discovery.Resource, resource_filter: str
@@ -654,33 +821,53 @@ class ComputeV1(
         region: str = None,
     ) -> "GcpResource":
         logger.info(
-            "Creating compute resource:\n%s", self.resource_pretty_format(body)
+            "Creating compute resource:\n%s",
+            _LazyFormat(self.resource_pretty_format, body),
         )
-        if region:
-            resp = self._execute(
-                collection.insert(
-                    project=self.project, region=region, body=body
-                ),
-                region=region,
-            )
-        else:
-            resp = self._execute(
-                collection.insert(project=self.project, body=body)
-            )
+        with tracing.span("compute.insert", resource=body["name"]):
+            if region:
+                resp = self._execute(
+                    collection.insert(
+                        project=self.project, region=region, body=body
+                    ),
+                    region=region,
+                )
+            else:
+                resp = self._execute(
+                    collection.insert(project=self.project, body=body)
+                )
         return self.GcpResource(body["name"], resp["targetLink"])
 
     def _patch_resource(self, collection, body, **kwargs):
         logger.info(
-            "Patching compute resource:\n%s", self.resource_pretty_format(body)
-        )
-        self._execute(
-            collection.patch(project=self.project, body=body, **kwargs)
+            "Patching compute resource:\n%s",
+            _LazyFormat(self.resource_pretty_format, body),
         )
+        with tracing.span("compute.patch", **kwargs):
+            self._execute(
+                collection.patch(project=self.project, body=body, **kwargs)
+            )
 
-    def _list_resource(self, collection: discovery.Resource):
-        return collection.list(project=self.project).execute(
-            num_retries=self._GCP_API_RETRIES
-        )
+    def _list_resource(
+        self,
+        collection: discovery.Resource,
+        *,
+        resource_filter: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """Yields the resources from all the pages of the list response.
+
+        The resource_filter is the Compute API filter expression, f.e.
+        'name eq "psm-interop-.*"'. The next page is only requested once
+        all the resources from the current page are consumed.
+        """
+        params = {"project": self.project}
+        if resource_filter:
+            params["filter"] = resource_filter
+        request = collection.list(**params)
+        while request is not None:
+            resp = request.execute(num_retries=self._GCP_API_RETRIES)
+            yield from resp.get("items", [])
+            request = collection.list_next(request, resp)
 
     def _delete_resource(
         self,
@@ -693,7 +880,8 @@ class ComputeV1(
             params = {"project": self.project, resource_type: resource_name}
             if region:
                 params["region"] = region
-            self._execute(collection.delete(**params), region=region)
+            with tracing.span("compute.delete", resource=resource_name):
+                self._execute(collection.delete(**params), region=region)
             return True
         except googleapiclient.errors.HttpError as error:
             if error.resp and error.resp.status == 404:
@@ -0,0 +1,822 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A local stand-in for the Compute, Network Services and Network Security APIs.
+
+The server generates the discovery documents for the subset of the API
+methods the framework uses, and keeps the resources in memory. Point
+GcpApiManager at it with the discovery URI flags:
+
+    with FakeGcpApiServer() as server:
+        manager = gcp.api.GcpApiManager(
+            v1_discovery_uri=server.v1_discovery_uri,
+            v2_discovery_uri=server.v2_discovery_uri,
+            credentials=google.auth.credentials.AnonymousCredentials(),
+        )
+        compute = gcp.compute.ComputeV1(manager, project="fake-project")
+
+The changes are applied immediately, but the long-running operations are
+reported done only after the operation_latency. The zonal NEGs are normally
+created by GKE, so getting any zonal NEG returns one with a single endpoint,
+and all the backends of a backend service are reported healthy. The requests can be rejected
+with 429 RESOURCE_EXHAUSTED at random, to exercise the retries.
+
+The server ignores the credentials, but the clients still need them: with
+the discovery URI flags, these are the application default credentials.
+
+IAM and Cloud Run are not served, nor the alpha APIs needing the private
+API key.
+"""
+import collections
+import dataclasses
+import datetime as dt
+import http
+import http.server
+import itertools
+import json
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Final, Optional
+import urllib.parse
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PAGE_SIZE: Final[int] = 500
+_CLOUD_PLATFORM_SCOPE: Final[
+    str
+] = "https://www.googleapis.com/auth/cloud-platform"
+_OBJECT_SCHEMA: Final[str] = "Object"
+_LIST_SCHEMA: Final[str] = "List"
+# f.e. (portRange eq "8080-8080") (IPAddress eq "0.0.0.0")
+_FILTER_TERM_RE: Final[re.Pattern] = re.compile(
+    r'\(?\s*([\w.]+)\s+(eq|ne)\s+"([^"]*)"\s*\)?'
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class _ComputeCollection:
+    # The discovery resource name, f.e. globalForwardingRules.
+    resource: str
+    # The URL path segment, f.e. forwardingRules.
+    path: str
+    # The resource name parameter, f.e. forwardingRule.
+    param: str
+    # One of global, zones, regions.
+    scope: str
+
+
+_COMPUTE_COLLECTIONS: Final[tuple[_ComputeCollection, ...]] = (
+    _ComputeCollection("healthChecks", "healthChecks", "healthCheck", "global"),
+    _ComputeCollection("firewalls", "firewalls", "firewall", "global"),
+    _ComputeCollection(
+        "backendServices", "backendServices", "backendService", "global"
+    ),
+    _ComputeCollection("urlMaps", "urlMaps", "urlMap", "global"),
+    _ComputeCollection(
+        "targetGrpcProxies", "targetGrpcProxies", "targetGrpcProxy", "global"
+    ),
+    _ComputeCollection(
+        "targetHttpProxies", "targetHttpProxies", "targetHttpProxy", "global"
+    ),
+    _ComputeCollection(
+        "globalForwardingRules", "forwardingRules", "forwardingRule", "global"
+    ),
+    _ComputeCollection(
+        "instanceTemplates", "instanceTemplates", "instanceTemplate", "global"
+    ),
+    _ComputeCollection(
+        "networkEndpointGroups",
+        "networkEndpointGroups",
+        "networkEndpointGroup",
+        "zones",
+    ),
+    _ComputeCollection(
+        "regionNetworkEndpointGroups",
+        "networkEndpointGroups",
+        "networkEndpointGroup",
+        "regions",
+    ),
+)
+_COMPUTE_OPERATIONS: Final[dict[str, str]] = {
+    "global": "globalOperations",
+    "zones": "zoneOperations",
+    "regions": "regionOperations",
+}
+_SCOPE_PARAMS: Final[dict[str, str]] = {"zones": "zone", "regions": "region"}
+_OPERATION_TYPES: Final[dict[str, str]] = {
+    "POST": "insert",
+    "PATCH": "patch",
+    "DELETE": "delete",
+}
+
+# The collections of projects.locations, and their create id parameter.
+_V2_COLLECTIONS: Final[dict[str, dict[str, str]]] = {
+    "networkservices": {
+        "meshes": "meshId",
+        "grpcRoutes": "grpcRouteId",
+        "httpRoutes": "httpRouteId",
+        "endpointPolicies": "endpointPolicyId",
+    },
+    "networksecurity": {
+        "serverTlsPolicies": "serverTlsPolicyId",
+        "clientTlsPolicies": "clientTlsPolicyId",
+        "authorizationPolicies": "authorizationPolicyId",
+    },
+}
+
+
+class _ApiError(Exception):
+    def __init__(self, code: http.HTTPStatus, message: str, status: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status = status
+
+    def body(self) -> dict[str, Any]:
+        return {
+            "error": {
+                "code": self.code.value,
+                "message": self.message,
+                "status": self.status,
+            }
+        }
+
+
+def _not_found(name: str) -> _ApiError:
+    return _ApiError(
+        http.HTTPStatus.NOT_FOUND, f"{name} was not found", "NOT_FOUND"
+    )
+
+
+def _method(
+    method_id: str,
+    http_method: str,
+    path: str,
+    path_params: list[str],
+    *,
+    query_params: tuple[str, ...] = (),
+    request: bool = False,
+    response: str = _OBJECT_SCHEMA,
+) -> dict[str, Any]:
+    parameters = {
+        param: {"type": "string", "required": True, "location": "path"}
+        for param in path_params
+    }
+    for param in query_params:
+        param_type = "integer" if param in ("maxResults", "pageSize") else ""
+        parameters[param] = {
+            "type": param_type or "string",
+            "location": "query",
+        }
+    method = {
+        "id": method_id,
+        "path": path,
+        "httpMethod": http_method,
+        "parameters": parameters,
+        "parameterOrder": path_params,
+        "response": {"$ref": response},
+    }
+    if request:
+        method["request"] = {"$ref": _OBJECT_SCHEMA}
+    return method
+
+
+def _list_schema(schema_id: str, items_field: str) -> dict[str, Any]:
+    return {
+        "id": schema_id,
+        "type": "object",
+        "properties": {
+            items_field: {"type": "array", "items": {"$ref": _OBJECT_SCHEMA}},
+            "nextPageToken": {"type": "string"},
+        },
+    }
+
+
+def _discovery_doc(
+    root_url: str, api: str, version: str, resources: dict, schemas: dict
+) -> dict[str, Any]:
+    return {
+        "kind": "discovery#restDescription",
+        "discoveryVersion": "v1",
+        "id": f"{api}:{version}",
+        "name": api,
+        "version": version,
+        "protocol": "rest",
+        "rootUrl": root_url,
+        "servicePath": f"{api}/{version}/",
+        "batchPath": "batch",
+        "parameters": {},
+        "auth": {"oauth2": {"scopes": {_CLOUD_PLATFORM_SCOPE: {}}}},
+        "schemas": {
+            _OBJECT_SCHEMA: {
+                "id": _OBJECT_SCHEMA,
+                "type": "object",
+                "additionalProperties": {"type": "any"},
+            },
+            **schemas,
+        },
+        "resources": resources,
+    }
+
+
+def compute_discovery_doc(root_url: str, version: str) -> dict[str, Any]:
+    resources = {}
+    for c in _COMPUTE_COLLECTIONS:
+        scope_params = ["project"]
+        scope_path = "projects/{project}/global"
+        if c.scope != "global":
+            scope_param = _SCOPE_PARAMS[c.scope]
+            scope_params.append(scope_param)
+            scope_path = f"projects/{{project}}/{c.scope}/{{{scope_param}}}"
+        base_path = f"{scope_path}/{c.path}"
+        item_path = f"{base_path}/{{{c.param}}}"
+        item_params = [*scope_params, c.param]
+        method_id = f"compute.{c.resource}"
+        methods = {
+            "insert": _method(
+                f"{method_id}.insert",
+                "POST",
+                base_path,
+                scope_params,
+                request=True,
+            ),
+            "get": _method(f"{method_id}.get", "GET", item_path, item_params),
+            "patch": _method(
+                f"{method_id}.patch",
+                "PATCH",
+                item_path,
+                item_params,
+                request=True,
+            ),
+            "delete": _method(
+                f"{method_id}.delete", "DELETE", item_path, item_params
+            ),
+            "list": _method(
+                f"{method_id}.list",
+                "GET",
+                base_path,
+                scope_params,
+                query_params=("filter", "maxResults", "pageToken"),
+                response=_LIST_SCHEMA,
+            ),
+        }
+        if c.resource == "backendServices":
+            methods["getHealth"] = _method(
+                f"{method_id}.getHealth",
+                "POST",
+                f"{item_path}/getHealth",
+                item_params,
+                request=True,
+            )
+        resources[c.resource] = {"methods": methods}
+
+    for scope, resource in _COMPUTE_OPERATIONS.items():
+        params = ["project"]
+        path = "projects/{project}/global/operations/{operation}"
+        if scope != "global":
+            scope_param = _SCOPE_PARAMS[scope]
+            params.append(scope_param)
+            path = f"projects/{{project}}/{scope}/{{{scope_param}}}"
+            path += "/operations/{operation}"
+        resources[resource] = {
+            "methods": {
+                "get": _method(
+                    f"compute.{resource}.get",
+                    "GET",
+                    path,
+                    [*params, "operation"],
+                )
+            }
+        }
+
+    return _discovery_doc(
+        root_url,
+        "compute",
+        version,
+        resources,
+        {_LIST_SCHEMA: _list_schema(_LIST_SCHEMA, "items")},
+    )
+
+
+def v2_discovery_doc(root_url: str, api: str, version: str) -> dict[str, Any]:
+    """The discovery doc of the projects.locations API, f.e. meshes."""
+    location_resources = {}
+    schemas = {}
+    for collection, id_param in _V2_COLLECTIONS[api].items():
+        method_id = f"{api}.projects.locations.{collection}"
+        list_schema = f"List{collection[0].upper()}{collection[1:]}Response"
+        schemas[list_schema] = _list_schema(list_schema, collection)
+        location_resources[collection] = {
+            "methods": {
+                "create": _method(
+                    f"{method_id}.create",
+                    "POST",
+                    f"{{+parent}}/{collection}",
+                    ["parent"],
+                    query_params=(id_param,),
+                    request=True,
+                ),
+                "get": _method(f"{method_id}.get", "GET", "{+name}", ["name"]),
+                "patch": _method(
+                    f"{method_id}.patch",
+                    "PATCH",
+                    "{+name}",
+                    ["name"],
+                    query_params=("updateMask",),
+                    request=True,
+                ),
+                "delete": _method(
+                    f"{method_id}.delete", "DELETE", "{+name}", ["name"]
+                ),
+                "list": _method(
+                    f"{method_id}.list",
+                    "GET",
+                    f"{{+parent}}/{collection}",
+                    ["parent"],
+                    query_params=("pageSize", "pageToken"),
+                    response=list_schema,
+                ),
+            }
+        }
+    location_resources["operations"] = {
+        "methods": {
+            "get": _method(
+                f"{api}.projects.locations.operations.get",
+                "GET",
+                "{+name}",
+                ["name"],
+            )
+        }
+    }
+    resources = {
+        "projects": {
+            "resources": {"locations": {"resources": location_resources}}
+        }
+    }
+    return _discovery_doc(root_url, api, version, resources, schemas)
+
+
+def matches_filter(resource: dict[str, Any], resource_filter: str) -> bool:
+    """Checks the resource against the Compute API filter expression.
+
+    Only the conjunction of the eq and ne terms is supported. The values
+    are RE2 regular expressions matching the whole field.
+    """
+    for field, op, pattern in _FILTER_TERM_RE.findall(resource_filter):
+        value = resource
+        for key in field.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        matched = value is not None and bool(re.fullmatch(pattern, str(value)))
+        if matched != (op == "eq"):
+            return False
+    return True
+
+
+def _merge_patch(resource: dict[str, Any], patch: dict[str, Any]):
+    """Applies the JSON merge patch (RFC 7396), the null fields are removed."""
+    for key, value in patch.items():
+        if value is None:
+            resource.pop(key, None)
+        elif isinstance(value, dict) and isinstance(resource.get(key), dict):
+            _merge_patch(resource[key], value)
+        else:
+            resource[key] = value
+
+
+@dataclasses.dataclass
+class _Operation:
+    body: dict[str, Any]
+    done_at: float
+    # Set in the body once done.
+    result: dict[str, Any]
+
+
+class FakeGcpApiServer:
+    """Serves the fake GCP APIs from a background thread."""
+
+    host: str
+    operation_latency: dt.timedelta
+    error_rate: float
+
+    def __init__(
+        self,
+        *,
+        host: str = "localhost",
+        port: int = 0,
+        operation_latency: dt.timedelta = dt.timedelta(0),
+        error_rate: float = 0,
+        seed: Optional[int] = None,
+    ):
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"error_rate must be in [0, 1], got {error_rate}")
+        self.host = host
+        self.operation_latency = operation_latency
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        # By the collection URL, then by the resource name.
+        self._resources: dict[str, dict[str, dict]] = collections.defaultdict(
+            dict
+        )
+        self._operations: dict[str, _Operation] = {}
+        self._ids = itertools.count(1000)
+        # By "METHOD api", for the benchmarks.
+        self.request_counts: collections.Counter[str] = collections.Counter()
+        self._server = http.server.ThreadingHTTPServer(
+            (host, port), self._make_handler()
+        )
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def v1_discovery_uri(self) -> str:
+        return f"{self.url}/discovery/v1/apis/{{api}}/{{apiVersion}}/rest"
+
+    @property
+    def v2_discovery_uri(self) -> str:
+        # GcpApiManager appends the extra params with &.
+        return (
+            f"{self.url}/discovery/v2/rest?api={{api}}&version={{apiVersion}}"
+        )
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="fake-gcp-api-server",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info("Fake GCP API server listening on %s", self.url)
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakeGcpApiServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _make_handler(self) -> type[http.server.BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+            def do_PATCH(self):
+                server._handle(self, "PATCH")
+
+            def do_DELETE(self):
+                server._handle(self, "DELETE")
+
+            def log_message(
+                self, format, *args
+            ):  # pylint: disable=redefined-builtin
+                logger.debug("%s %s", self.address_string(), format % args)
+
+        return Handler
+
+    def _handle(self, request: http.server.BaseHTTPRequestHandler, method: str):
+        parsed = urllib.parse.urlsplit(request.path)
+        query = dict(urllib.parse.parse_qsl(parsed.query))
+        length = int(request.headers.get("Content-Length") or 0)
+        body = json.loads(request.rfile.read(length) or b"{}")
+        parts = [urllib.parse.unquote(p) for p in parsed.path.split("/") if p]
+        try:
+            status, response = self._dispatch(method, parts, query, body)
+        except _ApiError as error:
+            status, response = error.code, error.body()
+        content = json.dumps(response).encode("utf-8")
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json; charset=UTF-8")
+        request.send_header("Content-Length", str(len(content)))
+        request.end_headers()
+        request.wfile.write(content)
+
+    def _dispatch(
+        self, method: str, parts: list[str], query: dict[str, str], body: dict
+    ) -> tuple[int, dict]:
+        if parts[:1] == ["discovery"]:
+            return http.HTTPStatus.OK, self._discovery(parts, query)
+        if not parts:
+            raise _not_found("/")
+
+        api = parts[0]
+        with self._lock:
+            self.request_counts[f"{method} {api}"] += 1
+            rate_limited = self._rng.random() < self.error_rate
+        if rate_limited:
+            raise _ApiError(
+                http.HTTPStatus.TOO_MANY_REQUESTS,
+                "Quota exceeded",
+                "RESOURCE_EXHAUSTED",
+            )
+        if api == "compute":
+            return self._compute(method, parts, query, body)
+        if api in _V2_COLLECTIONS:
+            return self._v2(method, parts, query, body)
+        raise _not_found(f"API {api}")
+
+    def _discovery(self, parts: list[str], query: dict[str, str]) -> dict:
+        root_url = f"{self.url}/"
+        if parts[1:2] == ["v1"] and len(parts) == 6:
+            # discovery/v1/apis/{api}/{version}/rest
+            api, version = parts[3], parts[4]
+        else:
+            api, version = query.get("api", ""), query.get("version", "")
+        if api == "compute":
+            return compute_discovery_doc(root_url, version)
+        if api in _V2_COLLECTIONS:
+            return v2_discovery_doc(root_url, api, version)
+        raise _not_found(f"API {api}")
+
+    def _new_id(self) -> str:
+        return str(next(self._ids))
+
+    def _add_operation(
+        self, body: dict[str, Any], result: dict[str, Any]
+    ) -> dict[str, Any]:
+        done_at = time.monotonic() + self.operation_latency.total_seconds()
+        self._operations[body["name"]] = _Operation(body, done_at, result)
+        return self._operation_status(body["name"])
+
+    def _operation_status(self, name: str) -> dict[str, Any]:
+        operation = self._operations.get(name)
+        if operation is None:
+            raise _not_found(f"Operation {name}")
+        if time.monotonic() < operation.done_at:
+            return operation.body
+        return {**operation.body, **operation.result}
+
+    def _compute(
+        self, method: str, parts: list[str], query: dict[str, str], body: dict
+    ) -> tuple[int, dict]:
+        # compute/{version}/projects/{project}/{scope...}/{collection}/...
+        if len(parts) < 6 or parts[2] != "projects":
+            raise _not_found("/".join(parts))
+        version, project = parts[1], parts[3]
+        if parts[4] == "global":
+            scope, scope_parts, rest = "global", parts[4:5], parts[5:]
+        else:
+            scope, scope_parts, rest = parts[4], parts[4:6], parts[6:]
+        base_url = f"{self.url}/compute/{version}/projects/{project}"
+        scope_url = "/".join([base_url, *scope_parts])
+
+        with self._lock:
+            if rest[:1] == ["operations"] and len(rest) == 2:
+                return http.HTTPStatus.OK, self._operation_status(rest[1])
+            collection = next(
+                (
+                    c
+                    for c in _COMPUTE_COLLECTIONS
+                    if c.scope == scope and c.path == rest[0]
+                ),
+                None,
+            )
+            if collection is None:
+                raise _not_found("/".join(parts))
+            collection_url = f"{scope_url}/{collection.path}"
+            resources = self._resources[collection_url]
+            name = rest[1] if len(rest) > 1 else None
+
+            if method == "GET" and name is None:
+                return http.HTTPStatus.OK, self._compute_list(
+                    collection, resources, query
+                )
+            if method == "GET":
+                return http.HTTPStatus.OK, self._compute_get(
+                    collection, resources, name, scope_parts
+                )
+            if method == "POST" and name is None:
+                name = body.get("name", "")
+                if name in resources:
+                    raise _ApiError(
+                        http.HTTPStatus.CONFLICT,
+                        f"The resource '{name}' already exists",
+                        "ALREADY_EXISTS",
+                    )
+                resources[name] = self._compute_resource(
+                    collection, body, f"{collection_url}/{name}"
+                )
+            elif method == "POST" and rest[2:] == ["getHealth"]:
+                return http.HTTPStatus.OK, self._compute_health(
+                    resources, name, body
+                )
+            elif method == "PATCH" and name in resources:
+                _merge_patch(resources[name], body)
+            elif method == "DELETE" and name in resources:
+                del resources[name]
+            else:
+                raise _not_found(f"{collection.path}/{name}")
+
+            target_link = f"{collection_url}/{name}"
+            operation_name = f"operation-{self._new_id()}"
+            return http.HTTPStatus.OK, self._add_operation(
+                {
+                    "kind": "compute#operation",
+                    "name": operation_name,
+                    "operationType": _OPERATION_TYPES[method],
+                    "status": "RUNNING",
+                    "targetLink": target_link,
+                    "selfLink": f"{scope_url}/operations/{operation_name}",
+                },
+                {"status": "DONE", "progress": 100},
+            )
+
+    def _compute_resource(
+        self, collection: _ComputeCollection, body: dict, self_link: str
+    ) -> dict[str, Any]:
+        resource = {
+            **body,
+            "kind": f"compute#{collection.param}",
+            "id": self._new_id(),
+            "selfLink": self_link,
+            "creationTimestamp": dt.datetime.now(dt.timezone.utc).isoformat(),
+        }
+        # The API normalizes a single port to a range.
+        port_range = str(resource.get("portRange", ""))
+        if port_range and "-" not in port_range:
+            resource["portRange"] = f"{port_range}-{port_range}"
+        return resource
+
+    def _compute_list(
+        self,
+        collection: _ComputeCollection,
+        resources: dict[str, dict],
+        query: dict[str, str],
+    ) -> dict[str, Any]:
+        items = [
+            resource
+            for resource in resources.values()
+            if matches_filter(resource, query.get("filter", ""))
+        ]
+        start = int(query.get("pageToken") or 0)
+        page_size = int(query.get("maxResults") or _DEFAULT_PAGE_SIZE)
+        result = {"kind": f"compute#{collection.param}List"}
+        if items[start : start + page_size]:
+            result["items"] = items[start : start + page_size]
+        if start + page_size < len(items):
+            result["nextPageToken"] = str(start + page_size)
+        return result
+
+    def _compute_get(
+        self,
+        collection: _ComputeCollection,
+        resources: dict[str, dict],
+        name: str,
+        scope_parts: list[str],
+    ) -> dict[str, Any]:
+        if name in resources:
+            return resources[name]
+        if collection.scope == "zones" and collection.path == (
+            "networkEndpointGroups"
+        ):
+            # Created by GKE, pretend it's there.
+            return {
+                "kind": "compute#networkEndpointGroup",
+                "id": self._new_id(),
+                "name": name,
+                "zone": scope_parts[1],
+                "size": 1,
+                "networkEndpointType": "GCE_VM_IP_PORT",
+                "description": "",
+            }
+        raise _not_found(f"{collection.path}/{name}")
+
+    @staticmethod
+    def _compute_health(
+        resources: dict[str, dict], name: str, body: dict
+    ) -> dict[str, Any]:
+        backend_service = resources.get(name)
+        if backend_service is None:
+            raise _not_found(f"backendServices/{name}")
+        groups = {
+            backend.get("group")
+            for backend in backend_service.get("backends", [])
+        }
+        if body.get("group") not in groups:
+            return {"kind": "compute#backendServiceGroupHealth"}
+        return {
+            "kind": "compute#backendServiceGroupHealth",
+            "healthStatus": [
+                {
+                    "ipAddress": "10.0.0.1",
+                    "port": 8080,
+                    "healthState": "HEALTHY",
+                }
+            ],
+        }
+
+    def _v2(
+        self, method: str, parts: list[str], query: dict[str, str], body: dict
+    ) -> tuple[int, dict]:
+        # {api}/{version}/projects/{project}/locations/{location}/...
+        api = parts[0]
+        if len(parts) < 7 or parts[2] != "projects" or parts[4] != "locations":
+            raise _not_found("/".join(parts))
+        location_name = "/".join(parts[2:6])
+        collection, rest = parts[6], parts[7:]
+
+        with self._lock:
+            if collection == "operations" and len(rest) == 1:
+                return http.HTTPStatus.OK, self._operation_status(
+                    "/".join(parts[2:])
+                )
+            id_param = _V2_COLLECTIONS[api].get(collection)
+            if id_param is None:
+                raise _not_found("/".join(parts))
+            resources = self._resources[f"{api}/{location_name}/{collection}"]
+            collection_name = f"{location_name}/{collection}"
+
+            if method == "GET" and not rest:
+                return http.HTTPStatus.OK, self._v2_list(
+                    collection, resources, query
+                )
+            if method == "GET":
+                if rest[0] not in resources:
+                    raise _not_found(f"{collection_name}/{rest[0]}")
+                return http.HTTPStatus.OK, resources[rest[0]]
+            if method == "POST" and not rest:
+                name = query.get(id_param, "")
+                if name in resources:
+                    raise _ApiError(
+                        http.HTTPStatus.CONFLICT,
+                        f"{collection_name}/{name} already exists",
+                        "ALREADY_EXISTS",
+                    )
+                now = dt.datetime.now(dt.timezone.utc).isoformat()
+                resources[name] = {
+                    **body,
+                    "name": f"{collection_name}/{name}",
+                    "createTime": now,
+                    "updateTime": now,
+                }
+                result = {"response": resources[name]}
+            elif method == "PATCH" and rest and rest[0] in resources:
+                resource = resources[rest[0]]
+                for field in query.get("updateMask", "").split(","):
+                    if field in body:
+                        resource[field] = body[field]
+                    else:
+                        resource.pop(field, None)
+                resource["updateTime"] = dt.datetime.now(
+                    dt.timezone.utc
+                ).isoformat()
+                result = {"response": resource}
+            elif method == "DELETE" and rest and rest[0] in resources:
+                del resources[rest[0]]
+                result = {"response": {}}
+            else:
+                raise _not_found(f"{collection_name}/{'/'.join(rest)}")
+
+            operation_name = f"{location_name}/operations/{self._new_id()}"
+            return http.HTTPStatus.OK, self._add_operation(
+                {"name": operation_name, "done": False, "metadata": {}},
+                {"done": True, **result},
+            )
+
+    @staticmethod
+    def _v2_list(
+        collection: str, resources: dict[str, dict], query: dict[str, str]
+    ) -> dict[str, Any]:
+        items = list(resources.values())
+        start = int(query.get("pageToken") or 0)
+        page_size = int(query.get("pageSize") or _DEFAULT_PAGE_SIZE)
+        result = {}
+        if items[start : start + page_size]:
+            result[collection] = items[start : start + page_size]
+        if start + page_size < len(items):
+            result["nextPageToken"] = str(start + page_size)
+        return result
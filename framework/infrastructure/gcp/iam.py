@@ -11,12 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from concurrent import futures
 import dataclasses
 import datetime
 import functools
 import logging
-from typing import Any, Dict, FrozenSet, Optional
+import threading
+import time
+from typing import Any, Dict, Final, FrozenSet, Iterable, Optional
 
+from framework.helpers import logs
 from framework.helpers import retryers
 from framework.infrastructure import gcp
 from framework.infrastructure.gcp.api import _HttpError
@@ -26,6 +30,7 @@ logger = logging.getLogger(__name__)
 # Type aliases
 _timedelta = datetime.timedelta
 _HttpRequest = gcp.api.HttpRequest
+_LazyFormat = logs.LazyFormat
 
 
 class EtagConflict(gcp.api.Error):
@@ -49,16 +54,6 @@ def handle_etag_conflict(func):
     return wrap_retry_on_etag_conflict
 
 
-def _replace_binding(
-    policy: "Policy", binding: "Policy.Binding", new_binding: "Policy.Binding"
-) -> "Policy":
-    new_bindings = set(policy.bindings)
-    new_bindings.discard(binding)
-    new_bindings.add(new_binding)
-    # pylint: disable=too-many-function-args # No idea why pylint is like that.
-    return dataclasses.replace(policy, bindings=frozenset(new_bindings))
-
-
 @dataclasses.dataclass(frozen=True)
 class ServiceAccount:
     """An IAM service account.
@@ -260,7 +255,8 @@ class IamV1(gcp.api.GcpProjectApiResource):
         request: _HttpRequest = self._service_accounts.get(name=resource_name)
         response: Dict[str, Any] = self._execute(request)
         logger.debug(
-            "Loaded Service Account:\n%s", self.resource_pretty_format(response)
+            "Loaded Service Account:\n%s",
+            _LazyFormat(self.resource_pretty_format, response),
         )
         return ServiceAccount.from_response(response)
 
@@ -273,7 +269,7 @@ class IamV1(gcp.api.GcpProjectApiResource):
         response: Dict[str, Any] = self._execute(request)
         logger.debug(
             "Loaded Service Account Policy:\n%s",
-            self.resource_pretty_format(response),
+            _LazyFormat(self.resource_pretty_format, response),
         )
         return Policy.from_response(response)
 
@@ -289,7 +285,7 @@ class IamV1(gcp.api.GcpProjectApiResource):
         logger.debug(
             "Updating Service Account %s policy:\n%s",
             account,
-            self.resource_pretty_format(body),
+            _LazyFormat(self.resource_pretty_format, body),
         )
         try:
             request: _HttpRequest = self._service_accounts.setIamPolicy(
@@ -318,7 +314,7 @@ class IamV1(gcp.api.GcpProjectApiResource):
         logger.info(
             "Adding Attestation Rule to Managed Identity %s:\n%s",
             resource_name,
-            self.resource_pretty_format(body),
+            _LazyFormat(self.resource_pretty_format, body),
         )
         try:
             request: _HttpRequest = self._managed_identities.addAttestationRule(
@@ -344,7 +340,7 @@ class IamV1(gcp.api.GcpProjectApiResource):
         logger.info(
             "Removing Attestation Rule on Managed Identity %s:\n%s",
             resource_name,
-            self.resource_pretty_format(body),
+            _LazyFormat(self.resource_pretty_format, body),
         )
         try:
             request: _HttpRequest = (
@@ -364,40 +360,20 @@ class IamV1(gcp.api.GcpProjectApiResource):
                 logger.warning("Failed to delete %s, %r", resource_name, error)
         return False
 
-    @handle_etag_conflict
     def add_service_account_iam_policy_binding(
         self, account: str, role: str, member: str
     ) -> None:
         """Add an IAM policy binding to an IAM service account.
 
+        The concurrent changes of the same service account policy are
+        applied together, see ServiceAccountPolicyBatcher.
+
         See for details on updating policy bindings:
         https://cloud.google.com/iam/docs/reference/rest/v1/projects.serviceAccounts/setIamPolicy
         """
-        policy: Policy = self.get_service_account_iam_policy(account)
-        binding: Optional[Policy.Binding] = policy.find_binding_for_role(role)
-        if binding and member in binding.members:
-            logger.debug(
-                "Member %s already has role %s for Service Account %s",
-                member,
-                role,
-                account,
-            )
-            return
-
-        if binding is None:
-            updated_binding = Policy.Binding(role, frozenset([member]))
-        else:
-            updated_members: FrozenSet[str] = binding.members.union({member})
-            updated_binding: Policy.Binding = (
-                dataclasses.replace(  # pylint: disable=too-many-function-args
-                    binding, members=updated_members
-                )
-            )
-
-        updated_policy: Policy = _replace_binding(
-            policy, binding, updated_binding
+        get_policy_batcher(self, account).apply(
+            self, BindingChange(role=role, member=member, add=True)
         )
-        self.set_service_account_iam_policy(account, updated_policy)
         logger.debug(
             "Role %s granted to member %s for Service Account %s",
             role,
@@ -405,48 +381,208 @@ class IamV1(gcp.api.GcpProjectApiResource):
             account,
         )
 
-    @handle_etag_conflict
     def remove_service_account_iam_policy_binding(
         self, account: str, role: str, member: str
     ) -> None:
         """Remove an IAM policy binding from the IAM policy of a service
         account.
 
+        The concurrent changes of the same service account policy are
+        applied together, see ServiceAccountPolicyBatcher.
+
         See for details on updating policy bindings:
         https://cloud.google.com/iam/docs/reference/rest/v1/projects.serviceAccounts/setIamPolicy
         """
-        policy: Policy = self.get_service_account_iam_policy(account)
-        binding: Optional[Policy.Binding] = policy.find_binding_for_role(role)
-
-        if binding is None:
-            logger.debug(
-                "Noop: Service Account %s has no bindings for role %s",
-                account,
-                role,
-            )
-            return
-        if member not in binding.members:
-            logger.debug(
-                "Noop: Service Account %s binding for role %s has no member %s",
-                account,
-                role,
-                member,
-            )
-            return
-
-        updated_members: FrozenSet[str] = binding.members.difference({member})
-        updated_binding: Policy.Binding = (
-            dataclasses.replace(  # pylint: disable=too-many-function-args
-                binding, members=updated_members
-            )
-        )
-        updated_policy: Policy = _replace_binding(
-            policy, binding, updated_binding
+        get_policy_batcher(self, account).apply(
+            self, BindingChange(role=role, member=member, add=False)
         )
-        self.set_service_account_iam_policy(account, updated_policy)
         logger.debug(
             "Role %s revoked from member %s for Service Account %s",
             role,
             member,
             account,
         )
+
+
+@dataclasses.dataclass(frozen=True)
+class BindingChange:
+    """Adds or removes the member of the unconditional role binding."""
+
+    role: str
+    member: str
+    add: bool
+
+
+def apply_binding_changes(
+    policy: Policy, changes: Iterable[BindingChange]
+) -> Policy:
+    """The policy with the changes applied in order.
+
+    The same policy when the changes are no-op, f.e. the member is already
+    bound to the role.
+    """
+    updated_policy = policy
+    for change in changes:
+        binding = updated_policy.find_binding_for_role(change.role)
+        members = binding.members if binding else frozenset()
+        if change.add:
+            updated_members = members.union({change.member})
+        else:
+            updated_members = members.difference({change.member})
+        if updated_members == members:
+            continue
+
+        new_bindings = set(updated_policy.bindings)
+        new_bindings.discard(binding)
+        if updated_members:
+            new_bindings.add(Policy.Binding(change.role, updated_members))
+        # pylint: disable=too-many-function-args
+        updated_policy = dataclasses.replace(
+            updated_policy, bindings=frozenset(new_bindings)
+        )
+    return updated_policy
+
+
+class ServiceAccountPolicyBatcher:
+    """Applies the concurrent binding changes of a service account together.
+
+    The first thread to submit a change reads the policy, applies all the
+    changes pending by then, and writes the policy once. The changes
+    submitted in the meantime are applied in the next batch by the same
+    thread, with the IAM client it passed. The policy written last is cached
+    for a short while, so the no-op changes don't need any requests. When the
+    policy was changed elsewhere, the write fails with the etag conflict:
+    then the changes are merged into the reloaded policy and written again
+    right away.
+    """
+
+    POLICY_CACHE_TTL: Final[_timedelta] = _timedelta(seconds=30)
+    MERGE_ATTEMPTS: Final[int] = 5
+
+    def __init__(self, account: str):
+        self.account = account
+        self._lock = threading.Lock()
+        self._pending: list[tuple[BindingChange, futures.Future]] = []
+        self._running: bool = False
+        self._policy: Optional[Policy] = None
+        self._policy_loaded_at: float = 0
+
+    def apply(self, iam: IamV1, change: BindingChange) -> None:
+        """Blocks until the change is applied, raises if it failed.
+
+        The IAM client is only used by the calling thread.
+        """
+        future = futures.Future()
+        with self._lock:
+            self._pending.append((change, future))
+            leader = not self._running
+            self._running = True
+        if leader:
+            self._run_batches(iam)
+        future.result()
+
+    def _run_batches(self, iam: IamV1):
+        batch = []
+        try:
+            while True:
+                with self._lock:
+                    batch, self._pending = self._pending, []
+                    if not batch:
+                        self._running = False
+                        return
+                try:
+                    self._apply_batch(iam, [change for change, _ in batch])
+                except Exception as error:  # pylint: disable=broad-except
+                    for _, future in batch:
+                        future.set_exception(error)
+                else:
+                    for _, future in batch:
+                        future.set_result(None)
+        finally:
+            if batch:
+                # Interrupted, f.e. by KeyboardInterrupt: let the next thread
+                # take over, and don't leave the waiting threads blocked.
+                with self._lock:
+                    batch.extend(self._pending)
+                    self._pending = []
+                    self._running = False
+                for _, future in batch:
+                    future.cancel()
+
+    def _cached_policy(self) -> Optional[Policy]:
+        if self._policy is None:
+            return None
+        age = time.monotonic() - self._policy_loaded_at
+        if age > self.POLICY_CACHE_TTL.total_seconds():
+            return None
+        return self._policy
+
+    def _cache_policy(self, policy: Optional[Policy]):
+        self._policy = policy
+        self._policy_loaded_at = time.monotonic()
+
+    @handle_etag_conflict
+    def _apply_batch(self, iam: IamV1, changes: list[BindingChange]):
+        policy = self._cached_policy()
+        for _ in range(self.MERGE_ATTEMPTS):
+            if policy is None:
+                policy = iam.get_service_account_iam_policy(self.account)
+                self._cache_policy(policy)
+
+            updated_policy = apply_binding_changes(policy, changes)
+            if updated_policy is policy:
+                logger.debug(
+                    "Noop: Service Account %s policy already has changes %s",
+                    self.account,
+                    changes,
+                )
+                return
+            try:
+                self._cache_policy(
+                    iam.set_service_account_iam_policy(
+                        self.account, updated_policy
+                    )
+                )
+            except EtagConflict:
+                # Merge the changes into the policy changed concurrently.
+                logger.info(
+                    "Service Account %s policy changed concurrently, reloading",
+                    self.account,
+                )
+                policy = None
+                continue
+            except Exception:
+                self._cache_policy(None)
+                raise
+            logger.debug(
+                "Service Account %s policy updated with %i changes",
+                self.account,
+                len(changes),
+            )
+            return
+
+        # Retried by handle_etag_conflict with backoff.
+        self._cache_policy(None)
+        raise EtagConflict(
+            f"Service Account {self.account} policy changed concurrently"
+            f" {self.MERGE_ATTEMPTS} times in a row"
+        )
+
+
+_policy_batchers: dict[str, ServiceAccountPolicyBatcher] = {}
+_policy_batchers_lock = threading.Lock()
+
+
+def get_policy_batcher(iam: IamV1, account: str) -> ServiceAccountPolicyBatcher:
+    """The process-wide policy batcher of the service account.
+
+    Shared by all IAM clients of the project: the clients are per-thread,
+    and the batcher doesn't keep any.
+    """
+    resource_name = iam.service_account_resource_name(account)
+    with _policy_batchers_lock:
+        batcher = _policy_batchers.get(resource_name)
+        if batcher is None:
+            batcher = ServiceAccountPolicyBatcher(account)
+            _policy_batchers[resource_name] = batcher
+        return batcher
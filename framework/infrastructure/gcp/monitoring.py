@@ -0,0 +1,243 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""The concurrent Cloud Monitoring time series queries.
+
+The list_time_series API only queries one metric at a time, and the CSM
+observability tests check a dozen of them. MetricQueryEngine sends all the
+queries at once, with bounded parallelism. The metrics are ingested with a
+delay, so the queries that found no time series are sent again, without
+repeating the ones that did.
+"""
+import concurrent.futures
+import dataclasses
+import datetime as dt
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Final, Iterable
+
+from google.api_core import exceptions as gapi_errors
+from google.api_core import retry as gapi_retries
+
+from framework.helpers import lazy_import
+
+if TYPE_CHECKING:
+    from google.cloud import monitoring_v3
+else:
+    # Only needed by some of the tests.
+    monitoring_v3 = lazy_import.module("google.cloud.monitoring_v3")
+
+logger = logging.getLogger(__name__)
+
+# Type aliases
+_timedelta = dt.timedelta
+TimeSeries = "monitoring_v3.types.TimeSeries"
+# Builds the filter from the metric type, the namespace of the workload
+# reporting the metric, and the namespace of its peer.
+MetricFilterFn = Callable[[str, str, str], str]
+
+
+@dataclasses.dataclass(frozen=True)
+class MetricQuery:
+    # The metric type, f.e. prometheus.googleapis.com/.../counter
+    metric: str
+    # The monitoring filter, including the metric type.
+    filter: str
+
+
+def build_metric_queries(
+    *,
+    client_namespace: str,
+    server_namespace: str,
+    histogram_filter_fn: MetricFilterFn,
+    counter_filter_fn: MetricFilterFn,
+    histogram_client_metrics: Iterable[str] = (),
+    histogram_server_metrics: Iterable[str] = (),
+    counter_client_metrics: Iterable[str] = (),
+    counter_server_metrics: Iterable[str] = (),
+) -> list[MetricQuery]:
+    """The queries of the client and the server metrics of a test run."""
+    queries = []
+    for metrics, filter_fn, namespace, remote_namespace in (
+        (
+            histogram_server_metrics,
+            histogram_filter_fn,
+            server_namespace,
+            client_namespace,
+        ),
+        (
+            histogram_client_metrics,
+            histogram_filter_fn,
+            client_namespace,
+            server_namespace,
+        ),
+        (
+            counter_server_metrics,
+            counter_filter_fn,
+            server_namespace,
+            client_namespace,
+        ),
+        (
+            counter_client_metrics,
+            counter_filter_fn,
+            client_namespace,
+            server_namespace,
+        ),
+    ):
+        queries.extend(
+            MetricQuery(metric, filter_fn(metric, namespace, remote_namespace))
+            for metric in metrics
+        )
+    return queries
+
+
+def list_time_series_retry() -> gapi_retries.Retry:
+    """The retry settings of the list_time_series calls."""
+    # Based on default retry settings for list_time_series method:
+    # https://github.com/googleapis/google-cloud-python/blob/google-cloud-monitoring-v2.18.0/packages/google-cloud-monitoring/google/cloud/monitoring_v3/services/metric_service/transports/base.py#L210-L218
+    # Modified: predicate extended to retry on a wider range of error types.
+    return gapi_retries.Retry(
+        initial=0.1,
+        maximum=30.0,
+        multiplier=1.3,
+        predicate=gapi_retries.if_exception_type(
+            # Retry on 5xx, not just 503 ServiceUnavailable. This also
+            # covers gRPC Unknown, DataLoss, and DeadlineExceeded statuses.
+            # 501 MethodNotImplemented not excluded because most likely
+            # reason we'd see this error is server misconfiguration, so we
+            # want to give it a chance to recovering this situation too.
+            gapi_errors.ServerError,
+            # Retry on 429/ResourceExhausted: recoverable rate limiting.
+            gapi_errors.TooManyRequests,
+        ),
+        deadline=90.0,
+    )
+
+
+class MetricQueryEngine:
+    """Runs the time series queries concurrently, caching the results.
+
+    Create one for each test: the results found are cached for the lifetime
+    of the engine by the query and its interval, so the same query over the
+    same interval is only sent once, and the queries of the later assertion
+    phases, over their own intervals, are never served stale results.
+    """
+
+    DEFAULT_MAX_WORKERS: Final[int] = 8
+    DEFAULT_EMPTY_RETRY_ATTEMPTS: Final[int] = 3
+    DEFAULT_EMPTY_RETRY_WAIT: Final[_timedelta] = _timedelta(seconds=20)
+
+    project: str
+    max_workers: int
+    empty_retry_attempts: int
+    empty_retry_wait: _timedelta
+
+    def __init__(
+        self,
+        metric_client: "monitoring_v3.MetricServiceClient",
+        project: str,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        empty_retry_attempts: int = DEFAULT_EMPTY_RETRY_ATTEMPTS,
+        empty_retry_wait: _timedelta = DEFAULT_EMPTY_RETRY_WAIT,
+    ):
+        self.metric_client = metric_client
+        self.project = project
+        self.max_workers = max_workers
+        self.empty_retry_attempts = empty_retry_attempts
+        self.empty_retry_wait = empty_retry_wait
+        self._retry = list_time_series_retry()
+        self._cache: dict[tuple[MetricQuery, Any, Any], list[TimeSeries]] = {}
+        self._cache_lock = threading.Lock()
+
+    def query(
+        self,
+        queries: Iterable[MetricQuery],
+        interval: "monitoring_v3.TimeInterval",
+    ) -> dict[MetricQuery, list[TimeSeries]]:
+        """The time series found by each of the queries.
+
+        The queries with no time series found are retried up to
+        empty_retry_attempts times, and then returned with an empty list.
+        """
+        queries = list(dict.fromkeys(queries))
+        results: dict[MetricQuery, list[TimeSeries]] = {}
+        pending: list[MetricQuery] = []
+        with self._cache_lock:
+            for query in queries:
+                cached = self._cache.get(self._cache_key(query, interval))
+                if cached is None:
+                    pending.append(query)
+                else:
+                    results[query] = cached
+
+        for attempt in range(1, self.empty_retry_attempts + 1):
+            if not pending:
+                break
+            if attempt > 1:
+                logger.info(
+                    "No time series found for %i metrics, retrying in %s: %s",
+                    len(pending),
+                    self.empty_retry_wait,
+                    [query.metric for query in pending],
+                )
+                time.sleep(self.empty_retry_wait.total_seconds())
+            found = self._list_time_series_concurrently(pending, interval)
+            results.update(found)
+            pending = [query for query, series in found.items() if not series]
+
+        return {query: results[query] for query in queries}
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _cache_key(
+        query: MetricQuery, interval: "monitoring_v3.TimeInterval"
+    ) -> tuple[MetricQuery, Any, Any]:
+        return query, interval.start_time, interval.end_time
+
+    def _list_time_series_concurrently(
+        self,
+        queries: list[MetricQuery],
+        interval: "monitoring_v3.TimeInterval",
+    ) -> dict[MetricQuery, list[TimeSeries]]:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(queries)),
+            thread_name_prefix="metric-query",
+        ) as executor:
+            futures = {
+                query: executor.submit(self._list_time_series, query, interval)
+                for query in queries
+            }
+        return {query: future.result() for query, future in futures.items()}
+
+    def _list_time_series(
+        self, query: MetricQuery, interval: "monitoring_v3.TimeInterval"
+    ) -> list[TimeSeries]:
+        logger.info("Requesting list_time_series for metric %s", query.metric)
+        response = self.metric_client.list_time_series(
+            name=f"projects/{self.project}",
+            filter=query.filter,
+            interval=interval,
+            view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
+            retry=self._retry,
+        )
+        # Fetches all the pages in this thread.
+        time_series = list(response)
+        if time_series:
+            with self._cache_lock:
+                self._cache[self._cache_key(query, interval)] = time_series
+        return time_series
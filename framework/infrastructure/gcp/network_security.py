@@ -15,7 +15,7 @@
 import abc
 import dataclasses
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from google.rpc import code_pb2
 import tenacity
@@ -158,6 +158,11 @@ class NetworkSecurityV1Beta1(_NetworkSecurityBase):
         )
         return ServerTlsPolicy.from_response(name, response)
 
+    def list_server_tls_policies(self) -> Iterator[dict[str, Any]]:
+        return self._list_resources(
+            self._api_locations.serverTlsPolicies(), self.SERVER_TLS_POLICIES
+        )
+
     def delete_server_tls_policy(self, name: str) -> bool:
         return self._delete_resource(
             collection=self._api_locations.serverTlsPolicies(),
@@ -178,6 +183,11 @@ class NetworkSecurityV1Beta1(_NetworkSecurityBase):
         )
         return ClientTlsPolicy.from_response(name, response)
 
+    def list_client_tls_policies(self) -> Iterator[dict[str, Any]]:
+        return self._list_resources(
+            self._api_locations.clientTlsPolicies(), self.CLIENT_TLS_POLICIES
+        )
+
     def delete_client_tls_policy(self, name: str) -> bool:
         return self._delete_resource(
             collection=self._api_locations.clientTlsPolicies(),
@@ -198,6 +208,11 @@ class NetworkSecurityV1Beta1(_NetworkSecurityBase):
         )
         return ClientTlsPolicy.from_response(name, response)
 
+    def list_authz_policies(self) -> Iterator[dict[str, Any]]:
+        return self._list_resources(
+            self._api_locations.authorizationPolicies(), self.AUTHZ_POLICIES
+        )
+
     def delete_authz_policy(self, name: str) -> bool:
         return self._delete_resource(
             collection=self._api_locations.authorizationPolicies(),
@@ -15,7 +15,7 @@
 import abc
 import dataclasses
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from google.rpc import code_pb2
 import tenacity
@@ -407,6 +407,11 @@ class NetworkServicesV1(_NetworkServicesBase):
         )
         return EndpointPolicy.from_response(name, response)
 
+    def list_endpoint_policies(self) -> Iterator[dict[str, Any]]:
+        return self._list_resources(
+            self._api_locations.endpointPolicies(), self.ENDPOINT_POLICIES
+        )
+
     def delete_endpoint_policy(self, name: str) -> bool:
         return self._delete_resource(
             collection=self._api_locations.endpointPolicies(),
@@ -425,6 +430,9 @@ class NetworkServicesV1(_NetworkServicesBase):
         )
         return Mesh.from_response(name, result)
 
+    def list_meshes(self) -> Iterator[dict[str, Any]]:
+        return self._list_resources(self._api_locations.meshes(), self.MESHES)
+
     def delete_mesh(self, name: str) -> bool:
         return self._delete_resource(
             collection=self._api_locations.meshes(),
@@ -445,19 +453,55 @@ class NetworkServicesV1(_NetworkServicesBase):
             httpRouteId=name,
         )
 
+    def patch_grpc_route(
+        self, name: str, body: dict, update_mask: Iterable[str]
+    ) -> None:
+        self._patch_resource(
+            collection=self._api_locations.grpcRoutes(),
+            full_name=self.resource_full_name(name, self.GRPC_ROUTES),
+            body=body,
+            update_mask=update_mask,
+        )
+
+    def patch_http_route(
+        self, name: str, body: dict, update_mask: Iterable[str]
+    ) -> None:
+        self._patch_resource(
+            collection=self._api_locations.httpRoutes(),
+            full_name=self.resource_full_name(name, self.HTTP_ROUTES),
+            body=body,
+            update_mask=update_mask,
+        )
+
     def get_grpc_route(self, name: str) -> GrpcRoute:
-        full_name = self.resource_full_name(name, self.GRPC_ROUTES)
-        result = self._get_resource(
-            collection=self._api_locations.grpcRoutes(), full_name=full_name
+        return GrpcRoute.from_response(name, self.get_grpc_route_body(name))
+
+    def get_grpc_route_body(self, name: str) -> dict[str, Any]:
+        """The GrpcRoute resource as returned by the API."""
+        return self._get_resource(
+            collection=self._api_locations.grpcRoutes(),
+            full_name=self.resource_full_name(name, self.GRPC_ROUTES),
         )
-        return GrpcRoute.from_response(name, result)
 
     def get_http_route(self, name: str) -> HttpRoute:
-        full_name = self.resource_full_name(name, self.HTTP_ROUTES)
-        result = self._get_resource(
-            collection=self._api_locations.httpRoutes(), full_name=full_name
+        return HttpRoute.from_response(name, self.get_http_route_body(name))
+
+    def get_http_route_body(self, name: str) -> dict[str, Any]:
+        """The HttpRoute resource as returned by the API."""
+        return self._get_resource(
+            collection=self._api_locations.httpRoutes(),
+            full_name=self.resource_full_name(name, self.HTTP_ROUTES),
+        )
+
+    def list_grpc_routes(self) -> Iterator[dict[str, Any]]:
+        return self._list_resources(
+            self._api_locations.grpcRoutes(), self.GRPC_ROUTES
+        )
+
+    def list_http_routes(self) -> Iterator[dict[str, Any]]:
+        return self._list_resources(
+            self._api_locations.httpRoutes(), self.HTTP_ROUTES
         )
-        return HttpRoute.from_response(name, result)
 
     def delete_grpc_route(self, name: str) -> bool:
         return self._delete_resource(
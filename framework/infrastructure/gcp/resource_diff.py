@@ -0,0 +1,145 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""The structural diff of the GCP resources, to skip the no-op updates.
+
+The desired body is compared with the resource loaded from the API the way
+a patch would apply it: the fields missing from the desired body are kept
+as is, so the output-only fields, f.e. selfLink or createTime, and the
+defaults filled in by the API never count as changes. The lists are
+replaced by a patch, so they are compared item by item, and the fields of
+their items missing from the desired body count as changes too.
+
+For the same reason, a patch keeps the top-level fields set on the current
+resource, but no longer desired, f.e. left by a different test config.
+unmanaged_fields() finds them, so that they're cleared by the patch.
+"""
+import re
+from typing import Any, Final
+
+# The top-level fields set by the API, never in the desired body.
+OUTPUT_ONLY_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        # Compute API.
+        "kind",
+        "id",
+        "creationTimestamp",
+        "selfLink",
+        "selfLinkWithId",
+        "fingerprint",
+        "region",
+        # Network Services and Network Security APIs.
+        "name",
+        "createTime",
+        "updateTime",
+        "etag",
+    }
+)
+
+# The API returns the references to the other resources as the full URLs.
+_COMPUTE_URL_RE: Final[re.Pattern] = re.compile(
+    r"^https://[^/]+/compute/[^/]+/"
+)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return _COMPUTE_URL_RE.sub("", value)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        # The int64 fields are strings in the JSON responses.
+        return str(value)
+    return value
+
+
+def _is_empty(value: Any) -> bool:
+    # The API omits the fields with the default values from the responses.
+    if isinstance(value, dict):
+        return all(_is_empty(item) for item in value.values())
+    if isinstance(value, bool):
+        return not value
+    return value in (None, 0, "", "0", [])
+
+
+def changed_fields(current: Any, desired: Any, path: str = "") -> list[str]:
+    """The paths of the desired fields that differ from the current ones.
+
+    F.e. ["hostRules[0].hosts", "defaultService"]. Empty when the patch
+    wouldn't change anything.
+    """
+    return _changed_fields(current, desired, path, replaced=False)
+
+
+def _changed_fields(
+    current: Any, desired: Any, path: str, *, replaced: bool
+) -> list[str]:
+    # The replaced values are the items of the lists: the patch doesn't
+    # merge them, so the fields not desired are dropped.
+    if isinstance(desired, dict):
+        if not isinstance(current, dict):
+            return [path]
+        changes = []
+        for key, desired_value in desired.items():
+            key_path = f"{path}.{key}" if path else key
+            if key not in current:
+                if not _is_empty(desired_value):
+                    changes.append(key_path)
+                continue
+            changes.extend(
+                _changed_fields(
+                    current[key], desired_value, key_path, replaced=replaced
+                )
+            )
+        if replaced:
+            changes.extend(
+                f"{path}.{key}" if path else key
+                for key in unmanaged_fields(current, desired)
+            )
+        return changes
+
+    if isinstance(desired, list):
+        if not isinstance(current, list) or len(current) != len(desired):
+            return [path]
+        changes = []
+        for i, (current_item, desired_item) in enumerate(zip(current, desired)):
+            changes.extend(
+                _changed_fields(
+                    current_item, desired_item, f"{path}[{i}]", replaced=True
+                )
+            )
+        return changes
+
+    if _normalize(current) != _normalize(desired):
+        return [path]
+    return []
+
+
+def unmanaged_fields(current: dict, desired: dict) -> list[str]:
+    """The top-level fields set on the current resource, but not desired.
+
+    The output-only fields are not included.
+    """
+    return sorted(
+        key
+        for key, value in current.items()
+        if key not in desired
+        and key not in OUTPUT_ONLY_FIELDS
+        and not _is_empty(value)
+    )
+
+
+def top_level_fields(paths: list[str]) -> list[str]:
+    """The top-level fields of the changed paths, f.e. for the update mask."""
+    fields = (re.split(r"[.\[]", path, maxsplit=1)[0] for path in paths)
+    return sorted(set(fields))
@@ -0,0 +1,143 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""The thread-safe HTTP transport for the googleapiclient API resources.
+
+httplib2.Http is not thread-safe, and googleapiclient uses the one passed
+to discovery.build for all the requests of the API resource. ThreadLocalHttp
+gives each thread its own Http instead, so the API resources can be shared
+by the thread pool workers. Each Http keeps its connections open, and the
+thread pool workers are long-lived, so the TCP and TLS connections are
+reused across the requests of a thread. The requests to each API endpoint
+are rate limited by the process-wide framework.helpers.rate_limiter.
+"""
+import logging
+import threading
+from typing import Callable, Final
+import urllib.parse
+
+import google.auth
+import google.auth.credentials
+import google_auth_httplib2
+import googleapiclient.http
+import httplib2
+
+from framework.helpers import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+CLOUD_PLATFORM_SCOPE: Final[
+    str
+] = "https://www.googleapis.com/auth/cloud-platform"
+
+# The 403 Forbidden error reasons meaning 429 Too Many Requests.
+_RATE_LIMIT_REASONS: Final[tuple[bytes, ...]] = (
+    b"userRateLimitExceeded",
+    b"rateLimitExceeded",
+)
+
+# Type aliases
+HttpFactory = Callable[[], httplib2.Http]
+
+
+def default_credentials() -> google.auth.credentials.Credentials:
+    """The application default credentials, for all the Cloud APIs."""
+    credentials, _ = google.auth.default(scopes=[CLOUD_PLATFORM_SCOPE])
+    return credentials
+
+
+def authorized_http_factory(
+    credentials: google.auth.credentials.Credentials,
+) -> HttpFactory:
+    """Authorized Http instances sharing the credentials.
+
+    The threads may refresh the expired token concurrently, which is
+    harmless: each of them gets a valid token.
+    """
+
+    def new_http() -> httplib2.Http:
+        return google_auth_httplib2.AuthorizedHttp(
+            credentials, http=googleapiclient.http.build_http()
+        )
+
+    return new_http
+
+
+def _is_rate_limited(response: httplib2.Response, content: bytes) -> bool:
+    if response.status == 429:
+        return True
+    # Same as googleapiclient.http._should_retry_response.
+    return response.status == 403 and any(
+        reason in content for reason in _RATE_LIMIT_REASONS
+    )
+
+
+class ThreadLocalHttp:
+    """The httplib2.Http replacement creating an Http per thread."""
+
+    def __init__(self, http_factory: HttpFactory):
+        self._http_factory = http_factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # To close the connections, including of the finished threads.
+        self._instances: dict[threading.Thread, httplib2.Http] = {}
+
+    def thread_http(self) -> httplib2.Http:
+        """The Http of the current thread."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._http_factory()
+            self._local.http = http
+            with self._lock:
+                finished = self._pop_finished()
+                self._instances[threading.current_thread()] = http
+            for finished_http in finished:
+                finished_http.close()
+            logger.debug(
+                "New GCP API connection pool for thread %s",
+                threading.current_thread().name,
+            )
+        return http
+
+    def _pop_finished(self) -> list[httplib2.Http]:
+        finished = [t for t in self._instances if not t.is_alive()]
+        return [self._instances.pop(t) for t in finished]
+
+    @property
+    def http(self) -> "ThreadLocalHttp":
+        # discovery.Resource.close() closes the wrapped http, as with
+        # AuthorizedHttp: close the connections of all the threads.
+        return self
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        limiter = rate_limiter.get_rate_limiter(
+            urllib.parse.urlsplit(uri).netloc
+        )
+        if limiter:
+            limiter.acquire()
+        response, content = self.thread_http().request(
+            uri, method=method, body=body, headers=headers, **kwargs
+        )
+        if limiter:
+            if _is_rate_limited(response, content):
+                limiter.on_throttled()
+            elif response.status < 500:
+                limiter.on_success()
+        return response, content
+
+    def close(self):
+        with self._lock:
+            instances = list(self._instances.values())
+            self._instances.clear()
+        for http in instances:
+            http.close()
@@ -22,6 +22,7 @@ import logging
 import pathlib
 import threading
 from typing import Any, Callable, Final, List, Optional, Tuple, Union
+import urllib.parse
 import warnings
 
 from kubernetes import client
@@ -35,9 +36,11 @@ import urllib3.exceptions
 import yaml
 
 import framework.errors
+from framework.helpers import rate_limiter
 from framework.helpers import retryers
 import framework.helpers.datetime
 import framework.helpers.highlighter
+from framework.infrastructure import api_cassette
 from framework.infrastructure.k8s_internal import k8s_log_collector
 from framework.infrastructure.k8s_internal import k8s_port_forwarder
 
@@ -47,6 +50,7 @@ logger = logging.getLogger(__name__)
 PodLogCollector = k8s_log_collector.PodLogCollector
 PortForwarder = k8s_port_forwarder.PortForwarder
 V1Deployment = client.V1Deployment
+V1DeploymentList = client.V1DeploymentList
 V1ServiceAccount = client.V1ServiceAccount
 V1Pod = client.V1Pod
 V1PodList = client.V1PodList
@@ -130,6 +134,31 @@ class NotFound(Exception):
     """Indicates the resource is not found on the API server."""
 
 
+class _RateLimitedPoolManager:
+    """Sends the urllib3.PoolManager requests through the rate limiter."""
+
+    def __init__(self, limiter: rate_limiter.AdaptiveRateLimiter, pool_manager):
+        self.limiter = limiter
+        self.pool_manager = pool_manager
+
+    @classmethod
+    def wrap_client(cls, api_client: client.ApiClient):
+        host = urllib.parse.urlsplit(api_client.configuration.host).netloc
+        limiter = rate_limiter.get_rate_limiter(host)
+        if limiter:
+            rest_client = api_client.rest_client
+            rest_client.pool_manager = cls(limiter, rest_client.pool_manager)
+
+    def request(self, method, url, *args, **kwargs):
+        self.limiter.acquire()
+        response = self.pool_manager.request(method, url, *args, **kwargs)
+        if response.status == 429:
+            self.limiter.on_throttled()
+        elif response.status < 500:
+            self.limiter.on_success()
+        return response
+
+
 class KubernetesApiManager:
     _client: client.ApiClient
     _dynamic_client: dynamic.DynamicClient
@@ -142,7 +171,11 @@ class KubernetesApiManager:
     def __init__(self, context: str):
         self.context = context
         self._client = self._new_client_from_context(context)
-        self._dynamic_client = dynamic.DynamicClient(self._client)
+        cassette = api_cassette.get_cassette()
+        self._dynamic_client = dynamic.DynamicClient(
+            self._client,
+            cache_file=cassette.k8s_discovery_cache_file if cassette else None,
+        )
         self.apps = client.AppsV1Api(self.client)
         self.core = client.CoreV1Api(self.client)
         self._apis = {self.apps, self.core}
@@ -258,9 +291,14 @@ class KubernetesApiManager:
 
     @classmethod
     def _new_client_from_context(cls, context: str) -> "client.ApiClient":
-        client_instance = kubernetes.config.new_client_from_config(
-            context=context
-        )
+        cassette = api_cassette.get_cassette()
+        if cassette and cassette.replaying:
+            # The kube config isn't needed to replay the requests.
+            client_instance = client.ApiClient(client.Configuration())
+        else:
+            client_instance = kubernetes.config.new_client_from_config(
+                context=context
+            )
         logger.info(
             'Using kubernetes context "%s", active host: %s',
             context,
@@ -268,6 +306,10 @@ class KubernetesApiManager:
         )
         # TODO(sergiitk): fine-tune if we see the total wait unreasonably long.
         client_instance.configuration.retries = 10
+        if not (cassette and cassette.replaying):
+            _RateLimitedPoolManager.wrap_client(client_instance)
+        if cassette:
+            cassette.wrap_k8s_client(client_instance)
         return client_instance
 
     def _load_dynamic_api(
@@ -909,6 +951,18 @@ class KubernetesNamespace:  # pylint: disable=too-many-public-methods
         )
         retryer(self.get_service_account, name)
 
+    def wait_for_namespace_created(
+        self,
+        timeout_sec: int = WAIT_MEDIUM_TIMEOUT_SEC,
+        wait_sec: int = WAIT_SHORT_SLEEP_SEC,
+    ) -> None:
+        retryer = retryers.constant_retryer(
+            wait_fixed=_timedelta(seconds=wait_sec),
+            timeout=_timedelta(seconds=timeout_sec),
+            check_result=lambda namespace: namespace is not None,
+        )
+        retryer(self.get)
+
     def wait_for_namespace_deleted(
         self,
         timeout_sec: Optional[int] = None,
@@ -982,6 +1036,12 @@ class KubernetesNamespace:  # pylint: disable=too-many-public-methods
             self._api.apps.read_namespaced_deployment, name, self.name
         )
 
+    def list_deployments(self) -> List[V1Deployment]:
+        deployment_list: V1DeploymentList = self._execute(
+            self._api.apps.list_namespaced_deployment, self.name
+        )
+        return deployment_list.items
+
     def delete_deployment(
         self, name: str, grace_period_seconds: int = DELETE_GRACE_PERIOD_SEC
     ) -> None:
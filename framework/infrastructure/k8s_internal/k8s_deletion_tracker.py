@@ -0,0 +1,185 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Confirms k8s resource deletions in the background.
+
+Deleting a namespace takes minutes. Instead of blocking on it, the runners
+can hand the deletion off to the process-wide tracker, which polls the
+resources until they're gone. Creating a resource with the same name waits
+for the pending deletion to complete. The deletions not confirmed by the
+time the process exits are reported as stragglers.
+"""
+import atexit
+import dataclasses
+import datetime as dt
+import logging
+import threading
+import time
+from typing import Callable, Final, Optional
+
+from absl import flags
+
+logger = logging.getLogger(__name__)
+
+ASYNC_DELETION = flags.DEFINE_bool(
+    "async_k8s_deletion",
+    default=False,
+    help=(
+        "Don't wait for k8s namespaces and deployments to be deleted."
+        " The deletions are confirmed in the background, and the ones not"
+        " confirmed by the exit are reported."
+    ),
+)
+
+_POLL_INTERVAL: Final[dt.timedelta] = dt.timedelta(seconds=5)
+
+# Returns True once the resource is deleted.
+IsDeletedFn = Callable[[], bool]
+
+
+@dataclasses.dataclass(eq=False)
+class PendingDeletion:
+    kind: str
+    namespace: str
+    name: str
+    is_deleted: IsDeletedFn
+    timeout: dt.timedelta
+    time_requested: float = dataclasses.field(default_factory=time.monotonic)
+    done: threading.Event = dataclasses.field(default_factory=threading.Event)
+    reported_overdue: bool = False
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return self.kind, self.namespace, self.name
+
+    @property
+    def age(self) -> dt.timedelta:
+        return dt.timedelta(
+            seconds=round(time.monotonic() - self.time_requested)
+        )
+
+    @property
+    def overdue(self) -> bool:
+        return self.age > self.timeout
+
+    def __str__(self):
+        if self.kind == "namespace":
+            return f"namespace {self.name}"
+        return f"{self.kind} {self.namespace}/{self.name}"
+
+
+class DeletionTracker:
+    """Polls the handed-off deletions in a background thread."""
+
+    def __init__(self, poll_interval: dt.timedelta = _POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, str, str], PendingDeletion] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(
+        self,
+        kind: str,
+        namespace: str,
+        name: str,
+        *,
+        is_deleted: IsDeletedFn,
+        timeout: dt.timedelta,
+    ) -> PendingDeletion:
+        deletion = PendingDeletion(
+            kind=kind,
+            namespace=namespace,
+            name=name,
+            is_deleted=is_deleted,
+            timeout=timeout,
+        )
+        with self._lock:
+            self._pending[deletion.key] = deletion
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="k8s-deletion-tracker", daemon=True
+                )
+                self._thread.start()
+        logger.info("Deletion of %s handed off to the background", deletion)
+        return deletion
+
+    def wait_if_pending(
+        self, kind: str, namespace: str, name: str, timeout: dt.timedelta
+    ) -> bool:
+        """Waits for the pending deletion of the resource, if any.
+
+        Returns False if the deletion is still pending after the timeout.
+        """
+        with self._lock:
+            deletion = self._pending.get((kind, namespace, name))
+        if deletion is None:
+            return True
+        logger.info("Waiting for the pending deletion of %s", deletion)
+        return deletion.done.wait(timeout.total_seconds())
+
+    def pending(self) -> list[PendingDeletion]:
+        with self._lock:
+            return list(self._pending.values())
+
+    def shutdown(self):
+        """Stops polling, and reports the deletions not yet confirmed."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._poll()
+        for deletion in self.pending():
+            logger.warning(
+                "Deletion of %s not confirmed after %s", deletion, deletion.age
+            )
+
+    def _run(self):
+        while not self._stop_event.wait(self.poll_interval.total_seconds()):
+            self._poll()
+
+    def _poll(self):
+        for deletion in self.pending():
+            try:
+                deleted = deletion.is_deleted()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug("Failed to check %s deletion: %r", deletion, e)
+                continue
+            if deleted:
+                with self._lock:
+                    if self._pending.get(deletion.key) is deletion:
+                        del self._pending[deletion.key]
+                deletion.done.set()
+                logger.info(
+                    "Deletion of %s confirmed in %s", deletion, deletion.age
+                )
+            elif deletion.overdue and not deletion.reported_overdue:
+                deletion.reported_overdue = True
+                logger.warning(
+                    "Deletion of %s still pending after %s",
+                    deletion,
+                    deletion.age,
+                )
+
+
+_tracker: Optional[DeletionTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_tracker() -> DeletionTracker:
+    """Returns the process-wide deletion tracker."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = DeletionTracker()
+            atexit.register(_tracker.shutdown)
+        return _tracker
@@ -14,13 +14,16 @@
 import functools
 import logging
 import random
-from typing import Any, Dict, Final, List, Optional
+import threading
+from typing import Any, Callable, Dict, Final, List, Optional
 
 import googleapiclient.errors
 from typing_extensions import TypeAlias
 
 from framework import xds_flags
+from framework.helpers import tracing
 from framework.infrastructure import gcp
+from framework.infrastructure.gcp import resource_diff
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +55,10 @@ Mesh = gcp.network_services.Mesh
 # Testing metadata consts
 TEST_AFFINITY_METADATA_KEY = "xds_md"
 
+# The forwarding rule ports picked by find_unused_forwarding_rule_port.
+_reserved_ports: set[int] = set()
+_reserved_ports_lock = threading.Lock()
+
 
 class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
     # Constants
@@ -97,6 +104,16 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
     affinity_backend_service_protocol: BackendServiceProtocol = _BackendUnset
     alternative_backend_service_protocol: BackendServiceProtocol = _BackendUnset
 
+    # Resources provisioned in advance, f.e. by the isolated environment pool.
+    # Used instead of creating new ones when the requested configuration
+    # matches, and only deleted by a forced cleanup().
+    pooled_health_check: Optional[GcpResource] = None
+    pooled_health_check_port: Optional[int] = None
+    pooled_backend_service: Optional[GcpResource] = None
+    # Set when the pooled resources had to be deleted to make room for
+    # the resources with a different configuration.
+    pooled_resources_released: bool = False
+
     # Protected
     _ensure_firewall: bool = False
 
@@ -181,6 +198,7 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
             self.create_target_proxy_ipv6()
             self.create_forwarding_rule_ipv6(service_port)
 
+    @tracing.traced()
     def cleanup(self, *, force=False):
         # Cleanup in the reverse order of creation
         self.delete_firewall_rules(force=force)
@@ -199,6 +217,39 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
         self.delete_affinity_backend_service(force=force)
         self.delete_health_check(force=force)
 
+    def adopt_pooled_resources(
+        self,
+        *,
+        health_check: GcpResource,
+        health_check_port: Optional[int],
+        backend_service: GcpResource,
+    ):
+        """Use pre-provisioned GRPC health check and backend service."""
+        self.pooled_health_check = health_check
+        self.pooled_health_check_port = health_check_port
+        self.pooled_backend_service = backend_service
+        self.pooled_resources_released = False
+
+    def _release_pooled_backend_service(self):
+        if not self.pooled_backend_service:
+            return
+        name = self.pooled_backend_service.name
+        logger.info('Releasing pre-provisioned Backend Service "%s"', name)
+        self.compute.delete_backend_service(name)
+        self.pooled_backend_service = None
+        self.pooled_resources_released = True
+
+    def _release_pooled_health_check(self):
+        # Backend service depends on the health check.
+        self._release_pooled_backend_service()
+        if not self.pooled_health_check:
+            return
+        name = self.pooled_health_check.name
+        logger.info('Releasing pre-provisioned Health Check "%s"', name)
+        self.compute.delete_health_check(name)
+        self.pooled_health_check = None
+        self.pooled_resources_released = True
+
     @functools.lru_cache(None)
     def make_resource_name(self, name: str) -> str:
         """Make dash-separated resource name with resource prefix and suffix."""
@@ -222,6 +273,20 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
         if protocol is None:
             protocol = _HealthCheckGRPC
 
+        if self.pooled_health_check:
+            if (
+                protocol is _HealthCheckGRPC
+                and port == self.pooled_health_check_port
+            ):
+                logger.info(
+                    'Using pre-provisioned %s Health Check "%s"',
+                    protocol.name,
+                    self.pooled_health_check.name,
+                )
+                self.health_check = self.pooled_health_check
+                return
+            self._release_pooled_health_check()
+
         name = self.make_resource_name(self.HEALTH_CHECK_NAME)
         logger.info('Creating %s Health Check "%s"', protocol.name, name)
         resource = self.compute.create_health_check(name, protocol, port=port)
@@ -234,6 +299,14 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
             name = self.health_check.name
         else:
             return
+        if self.pooled_health_check and name == self.pooled_health_check.name:
+            if force:
+                self._release_pooled_health_check()
+                self.health_check = None
+                return
+            logger.info('Keeping pre-provisioned Health Check "%s"', name)
+            self.health_check = None
+            return
         logger.info('Deleting Health Check "%s"', name)
         self.compute.delete_health_check(name)
         self.health_check = None
@@ -249,6 +322,29 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
         if protocol is None:
             protocol = _BackendGRPC
 
+        if self.pooled_backend_service:
+            if (
+                protocol is _BackendGRPC
+                and self.health_check is self.pooled_health_check
+                and not any(
+                    (
+                        subset_size,
+                        affinity_header,
+                        locality_lb_policies,
+                        outlier_detection,
+                    )
+                )
+            ):
+                logger.info(
+                    'Using pre-provisioned %s Backend Service "%s"',
+                    protocol.name,
+                    self.pooled_backend_service.name,
+                )
+                self.backend_service = self.pooled_backend_service
+                self.backend_service_protocol = protocol
+                return
+            self._release_pooled_backend_service()
+
         name = self.make_resource_name(self.BACKEND_SERVICE_NAME)
         logger.info('Creating %s Backend Service "%s"', protocol.name, name)
         resource = self.compute.create_backend_service_traffic_director(
@@ -276,6 +372,26 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
             name = self.backend_service.name
         else:
             return
+        if (
+            self.pooled_backend_service
+            and name == self.pooled_backend_service.name
+        ):
+            if force:
+                self._release_pooled_backend_service()
+                self.backend_service = None
+                return
+            # Detach the NEGs, so they can be deleted with the k8s service.
+            logger.info(
+                'Keeping pre-provisioned Backend Service "%s",'
+                " removing its backends",
+                name,
+            )
+            self.compute.backend_service_remove_all_backends(
+                self.pooled_backend_service
+            )
+            self.backend_service = None
+            self.backends = set()
+            return
         logger.info('Deleting Backend Service "%s"', name)
         self.compute.delete_backend_service(name)
         self.backend_service = None
@@ -494,6 +610,37 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
             replica_count=replica_count,
         )
 
+    def wait_for_all_backends_healthy_status(
+        self,
+        *,
+        replica_count: int = 1,
+        alternative_replica_count: int = 1,
+        affinity_replica_count: int = 1,
+    ):
+        """Waits for all backend services with backends to report healthy.
+
+        Unlike calling wait_for_*backends_healthy_status() one by one,
+        the health of all backend services is polled together.
+        """
+        expected = {}
+        if self.backends:
+            expected[self.backend_service] = (self.backends, replica_count)
+        if self.alternative_backends:
+            expected[self.alternative_backend_service] = (
+                self.alternative_backends,
+                alternative_replica_count,
+            )
+        if self.affinity_backends:
+            expected[self.affinity_backend_service] = (
+                self.affinity_backends,
+                affinity_replica_count,
+            )
+        logger.info(
+            "Waiting for Backend Services %s to report backends healthy",
+            [backend_service.name for backend_service in expected],
+        )
+        self.compute.wait_for_backend_services_healthy_status(expected)
+
     @staticmethod
     def _generate_url_map_body(
         name: str,
@@ -545,24 +692,57 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
         src_address = f"{src_host}:{src_port}"
         name = self.make_resource_name(self.URL_MAP_NAME)
         matcher_name = self.make_resource_name(self.URL_MAP_PATH_MATCHER_NAME)
+        body = self._generate_url_map_body(
+            name, matcher_name, [src_address], backend_service
+        )
+        current = self.compute.get_url_map(self.url_map.name)
+        changes = resource_diff.changed_fields(current, body)
+        unmanaged = resource_diff.unmanaged_fields(current, body)
+        if not changes and not unmanaged:
+            logger.info('URL map "%s" is up to date, skipping the patch', name)
+            return
         logger.info(
-            'Patching URL map "%s": %s -> %s',
+            'Patching URL map "%s": %s -> %s, changed: %s',
             name,
             src_address,
             backend_service.name,
+            ", ".join(changes + unmanaged),
         )
+        # JSON merge patch: the null fields are cleared.
         self.compute.patch_url_map(
-            self.url_map,
-            self._generate_url_map_body(
-                name, matcher_name, [src_address], backend_service
-            ),
+            self.url_map, {**body, **dict.fromkeys(unmanaged)}
         )
 
     def create_url_map_with_content(self, url_map_body: Any) -> GcpResource:
-        logger.info("Creating URL map: %s", url_map_body)
-        resource = self.compute.create_url_map_with_content(url_map_body)
-        self.url_map = resource
-        return resource
+        """Creates the URL map, or patches the existing one if different."""
+        name = url_map_body["name"]
+        try:
+            current = self.compute.get_url_map(name)
+        except googleapiclient.errors.HttpError as error:
+            if error.resp.status != 404:
+                raise
+            logger.info("Creating URL map: %s", url_map_body)
+            self.url_map = self.compute.create_url_map_with_content(
+                url_map_body
+            )
+            return self.url_map
+
+        self.url_map = GcpResource(current["name"], current["selfLink"])
+        changes = resource_diff.changed_fields(current, url_map_body)
+        unmanaged = resource_diff.unmanaged_fields(current, url_map_body)
+        if changes or unmanaged:
+            logger.info(
+                'Patching existing URL map "%s", changed: %s',
+                name,
+                ", ".join(changes + unmanaged),
+            )
+            # JSON merge patch: the null fields are cleared.
+            self.compute.patch_url_map(
+                self.url_map, {**url_map_body, **dict.fromkeys(unmanaged)}
+            )
+        else:
+            logger.info('Reusing existing URL map "%s", up to date', name)
+        return self.url_map
 
     def delete_url_map(self, force=False):
         if force:
@@ -716,9 +896,19 @@ class TrafficDirectorManager:  # pylint: disable=too-many-public-methods
         hi: int = 65535,
         attempts: int = 25,
     ) -> int:
-        for _ in range(attempts):
-            src_port = random.randint(lo, hi)
-            if not self.compute.exists_forwarding_rule(src_port):
+        """Picks a port not used by the forwarding rules in the network.
+
+        The forwarding rules are listed once. The picked port is reserved in
+        this process, so that the tests running concurrently in the process
+        never get the same port.
+        """
+        used_ports = self.compute.list_forwarding_rule_ports(self.network_url)
+        with _reserved_ports_lock:
+            for _ in range(attempts):
+                src_port = random.randint(lo, hi)
+                if src_port in used_ports or src_port in _reserved_ports:
+                    continue
+                _reserved_ports.add(src_port)
                 return src_port
         # TODO(sergiitk): custom exception
         raise RuntimeError("Couldn't find unused forwarding rule port")
@@ -969,34 +1159,76 @@ class TrafficDirectorAppNetManager(TrafficDirectorManager):
         )
         body = {
             "meshes": [self.mesh.url],
-            "hostnames": host,
+            "hostnames": [host],
             "rules": [
                 {"action": {"destinations": [{"serviceName": service_name}]}}
             ],
         }
-        name = self.make_resource_name(self.GRPC_ROUTE_NAME)
-        logger.info("Creating GrpcRoute %s", name)
-        self.netsvc.create_grpc_route(name, body)
-        self.grpc_route = self.netsvc.get_grpc_route(name)
-        logger.debug("Loaded GrpcRoute: %s", self.grpc_route)
-        return self.grpc_route
+        return self.create_grpc_route_with_content(body)
 
     def create_grpc_route_with_content(self, body: Any) -> GrpcRoute:
+        """Creates the GrpcRoute, or patches the existing one if different."""
         name = self.make_resource_name(self.GRPC_ROUTE_NAME)
-        logger.info("Creating GrpcRoute %s", name)
-        self.netsvc.create_grpc_route(name, body)
+        self._create_or_patch_route(
+            "GrpcRoute",
+            name,
+            body,
+            get_body_fn=self.netsvc.get_grpc_route_body,
+            create_fn=self.netsvc.create_grpc_route,
+            patch_fn=self.netsvc.patch_grpc_route,
+        )
         self.grpc_route = self.netsvc.get_grpc_route(name)
         logger.debug("Loaded GrpcRoute: %s", self.grpc_route)
         return self.grpc_route
 
     def create_http_route_with_content(self, body: Any) -> HttpRoute:
+        """Creates the HttpRoute, or patches the existing one if different."""
         name = self.make_resource_name(self.HTTP_ROUTE_NAME)
-        logger.info("Creating HttpRoute %s", name)
-        self.netsvc.create_http_route(name, body)
+        self._create_or_patch_route(
+            "HttpRoute",
+            name,
+            body,
+            get_body_fn=self.netsvc.get_http_route_body,
+            create_fn=self.netsvc.create_http_route,
+            patch_fn=self.netsvc.patch_http_route,
+        )
         self.http_route = self.netsvc.get_http_route(name)
         logger.debug("Loaded HttpRoute: %s", self.http_route)
         return self.http_route
 
+    @staticmethod
+    def _create_or_patch_route(
+        kind: str,
+        name: str,
+        body: Any,
+        *,
+        get_body_fn: Callable[[str], dict],
+        create_fn: Callable[[str, Any], None],
+        patch_fn: Callable[[str, Any, list[str]], None],
+    ) -> None:
+        try:
+            current = get_body_fn(name)
+        except googleapiclient.errors.HttpError as error:
+            if error.resp.status != 404:
+                raise
+            logger.info("Creating %s %s", kind, name)
+            create_fn(name, body)
+            return
+
+        changes = resource_diff.changed_fields(current, body)
+        # The fields in the update mask, but not in the body, are cleared.
+        changes.extend(resource_diff.unmanaged_fields(current, body))
+        if not changes:
+            logger.info("Reusing existing %s %s, up to date", kind, name)
+            return
+        logger.info(
+            "Patching existing %s %s, changed: %s",
+            kind,
+            name,
+            ", ".join(changes),
+        )
+        patch_fn(name, body, resource_diff.top_level_fields(changes))
+
     def delete_grpc_route(self, force=False):
         if force:
             name = self.make_resource_name(self.GRPC_ROUTE_NAME)
@@ -24,6 +24,7 @@ import google.protobuf.message
 import grpc
 
 import framework.errors
+from framework.helpers import logs
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,9 @@ logger = logging.getLogger(__name__)
 Message = google.protobuf.message.Message
 RpcError = grpc.RpcError
 
+# Clients polling the test apps send the same requests over and over.
+_request_format_cache = logs.FormatCache()
+
 
 class GrpcClientHelper:
     DEFAULT_RPC_DEADLINE_SEC = 90
@@ -78,16 +82,23 @@ class GrpcClientHelper:
     def _log_rpc_request(self, rpc, req, call_kwargs, log_level=logging.DEBUG):
         logger.log(
             logging.DEBUG if log_level is None else log_level,
-            "[%s] >> RPC %s.%s(request=%s(%r), %s)",
+            "[%s] >> RPC %s.%s(request=%s(%s), %s)",
             self.log_target,
             self.log_service_name,
             rpc,
             req.__class__.__name__,
-            json_format.MessageToDict(req),
+            logs.LazyFormat(_format_request, req),
             ", ".join({f"{k}={v}" for k, v in call_kwargs.items()}),
         )
 
 
+def _format_request(req: Message) -> str:
+    return _request_format_cache.get(
+        logs.message_cache_key(req),
+        lambda: repr(json_format.MessageToDict(req)),
+    )
+
+
 class GrpcApp:
     channels: Dict[int, grpc.Channel]
 
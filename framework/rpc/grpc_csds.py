@@ -21,23 +21,14 @@ import logging
 import re
 from typing import Any, Final, Optional, Type, cast
 
-from google.protobuf import json_format
-from typing_extensions import TypeAlias
-
-# Needed to load the descriptors so that Any is parsed
-# TODO(sergiitk): replace with import xds_protos when it works
-# isort: off
-# pylint: disable=unused-import,ungrouped-imports
-import framework.rpc.xds_protos_imports
-
-# pylint: enable=unused-import,ungrouped-imports
-# isort: on
-
 from envoy.service.status.v3 import csds_pb2
 from envoy.service.status.v3 import csds_pb2_grpc
+from google.protobuf import json_format
 import grpc
+from typing_extensions import TypeAlias
 
 import framework.rpc
+from framework.rpc import xds_protos_registry
 
 logger = logging.getLogger(__name__)
 
@@ -152,6 +143,7 @@ class DumpedXdsConfig(dict):
 
     @classmethod
     def from_message(cls, client_config: ClientConfig) -> "DumpedXdsConfig":
+        xds_protos_registry.load_any_types(client_config)
         return DumpedXdsConfig(json_format.MessageToDict(client_config))
 
     def __str__(self) -> str:
@@ -186,7 +178,10 @@ class CsdsClient(framework.rpc.grpc.GrpcClientHelper):
                 "Unexpected number of client configs: %s", len(response.config)
             )
             return None
-        return response.config[0]
+        client_config = response.config[0]
+        # Needed to load the descriptors so that Any is parsed.
+        xds_protos_registry.load_any_types(client_config)
+        return client_config
 
     def fetch_client_status_parsed(self, **kwargs) -> Optional[DumpedXdsConfig]:
         """Same as fetch_client_status, but also parses."""
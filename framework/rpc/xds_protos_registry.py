@@ -0,0 +1,194 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Loads the xDS protos packed into google.protobuf.Any on demand.
+
+CSDS responses pack the xDS resources into Any. To parse them, the message
+descriptors of the packed types must be in the default descriptor pool,
+i.e. the *_pb2 modules defining them must be imported. Importing all of the
+xds-protos modules (see xds_protos_imports) takes most of a second, so by
+default load_any_types() only imports the modules of the types it finds in
+the message, using the precomputed type name -> module index.
+
+The index must be regenerated when xds-protos is upgraded, with the version
+pinned in requirements.lock installed:
+
+    python -m framework.rpc.xds_protos_registry
+
+--xds_protos_eager_import restores importing all the modules at once.
+"""
+import functools
+import importlib
+import json
+import logging
+import pathlib
+import sys
+import threading
+from typing import Final, Optional
+
+from absl import app
+from absl import flags
+from google.protobuf import descriptor_pool
+from google.protobuf import message_factory
+from google.protobuf.message import Message
+
+logger = logging.getLogger(__name__)
+
+EAGER_IMPORT = flags.DEFINE_bool(
+    "xds_protos_eager_import",
+    default=False,
+    help=(
+        "Import all xDS proto modules on the first CSDS config parse, instead"
+        " of only the ones needed to unpack the received resources."
+    ),
+)
+
+INDEX_PATH: Final[pathlib.Path] = (
+    pathlib.Path(__file__).parent / "xds_protos_index.json"
+)
+_ANY_FULL_NAME: Final[str] = "google.protobuf.Any"
+
+_eager_import_lock = threading.Lock()
+_eager_imported: bool = False
+
+
+@functools.cache
+def _load_index() -> dict[str, str]:
+    try:
+        with open(INDEX_PATH, encoding="utf-8") as f:
+            index = json.load(f)
+    except OSError as e:
+        logger.warning("Failed to load xDS protos index, %r", e)
+        return {}
+    return index["types"]
+
+
+def _import_all():
+    global _eager_imported
+    with _eager_import_lock:
+        if _eager_imported:
+            return
+        # pylint: disable=import-outside-toplevel,unused-import
+        import framework.rpc.xds_protos_imports
+
+        _eager_imported = True
+
+
+def _find_module(type_name: str) -> Optional[str]:
+    """Returns the module defining the type, or the type it's nested in."""
+    index = _load_index()
+    name = type_name
+    while name:
+        if name in index:
+            return index[name]
+        name, _, _ = name.rpartition(".")
+    return None
+
+
+def import_type(type_name: str) -> bool:
+    """Imports the module defining the message type, if not imported yet.
+
+    Returns False when the module for the type is unknown.
+    """
+    pool = descriptor_pool.Default()
+    try:
+        pool.FindMessageTypeByName(type_name)
+        return True
+    except KeyError:
+        pass
+    module_name = _find_module(type_name)
+    if module_name is None:
+        logger.debug("No xDS protos module for type %s", type_name)
+        return False
+    if module_name not in sys.modules:
+        logger.debug("Importing %s for type %s", module_name, type_name)
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            # The index was generated for a different xds-protos version.
+            logger.warning("Failed to import %s: %r", module_name, e)
+            return False
+    return True
+
+
+def load_any_types(message: Message):
+    """Imports the modules of all types packed into the message's Any fields.
+
+    The packed messages are unpacked to find the Any fields nested in them.
+    """
+    if flags.FLAGS.is_parsed() and EAGER_IMPORT.value:
+        _import_all()
+        return
+    _load_message(message)
+
+
+def _load_message(message: Message):
+    if message.DESCRIPTOR.full_name == _ANY_FULL_NAME:
+        _load_any(message)
+        return
+    for field, value in message.ListFields():
+        message_type = field.message_type
+        if message_type is None:
+            continue
+        if message_type.GetOptions().map_entry:
+            if message_type.fields_by_name["value"].message_type is None:
+                continue
+            values = value.values()
+        elif field.is_repeated:
+            values = value
+        else:
+            values = (value,)
+        for item in values:
+            _load_message(item)
+
+
+def _load_any(any_message: Message):
+    type_name = any_message.type_url.rpartition("/")[2]
+    if not type_name or not import_type(type_name):
+        return
+    descriptor = descriptor_pool.Default().FindMessageTypeByName(type_name)
+    packed = message_factory.GetMessageClass(descriptor)()
+    packed.ParseFromString(any_message.value)
+    _load_message(packed)
+
+
+def generate_index() -> dict:
+    """Indexes the top-level messages of all xds-protos modules."""
+    _import_all()
+    types: dict[str, str] = {}
+    for module_name in sorted(sys.modules):
+        # Protobuf well-known types are always loaded.
+        if not module_name.endswith("_pb2") or module_name.startswith(
+            "google.protobuf."
+        ):
+            continue
+        descriptor = getattr(sys.modules[module_name], "DESCRIPTOR", None)
+        if descriptor is None:
+            continue
+        for message_type in descriptor.message_types_by_name.values():
+            types.setdefault(message_type.full_name, module_name)
+    return {"types": dict(sorted(types.items()))}
+
+
+def main(argv):
+    if len(argv) > 1:
+        raise app.UsageError("Too many command-line arguments.")
+    index = generate_index()
+    with open(INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=0)
+        f.write("\n")
+    logger.info("Indexed %i types to %s", len(index["types"]), INDEX_PATH)
+
+
+if __name__ == "__main__":
+    app.run(main)
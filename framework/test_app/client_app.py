@@ -22,6 +22,7 @@ from typing import Iterable, List, Optional
 
 import framework.errors
 from framework.helpers import retryers
+from framework.helpers import tracing
 import framework.rpc
 from framework.rpc import grpc_channelz
 from framework.rpc import grpc_csds
@@ -145,6 +146,7 @@ class XdsTestClient(framework.rpc.grpc.GrpcApp):
     def get_csds_parsed(self, **kwargs) -> Optional[grpc_csds.DumpedXdsConfig]:
         return self.csds.fetch_client_status_parsed(**kwargs)
 
+    @tracing.traced()
     def get_load_balancer_stats(
         self,
         *,
@@ -167,6 +169,7 @@ class XdsTestClient(framework.rpc.grpc.GrpcApp):
             metadata_keys=metadata_keys,
         )
 
+    @tracing.traced()
     def get_load_balancer_accumulated_stats(
         self,
         *,
@@ -177,6 +180,7 @@ class XdsTestClient(framework.rpc.grpc.GrpcApp):
             timeout_sec=timeout_sec
         )
 
+    @tracing.traced()
     def wait_for_server_channel_ready(
         self,
         *,
@@ -205,6 +209,7 @@ class XdsTestClient(framework.rpc.grpc.GrpcApp):
                 raise retry_err from cause
             raise
 
+    @tracing.traced()
     def wait_for_active_xds_channel(
         self,
         *,
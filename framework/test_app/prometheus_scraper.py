@@ -0,0 +1,309 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scrapes the Prometheus endpoints of all the test app pods together.
+
+All the targets are scraped concurrently at the same ticks, aligned to the
+multiples of the interval, so the samples of the different pods are taken
+at the same time, and adding the replicas doesn't add to the wall time.
+Each round shares a single deadline: the scrape of a slow pod is cut off
+by the next tick, instead of delaying it. The deadline is checked while
+reading the response too, not only by the timeout of each read, so a pod
+trickling its metrics slowly is cut off as well.
+
+The parsed samples of the whole run are written to a single file, as the
+columns of the scrape time, the target, the sample name, the label set and
+the value. The repeated strings are stored once, and referred to by their
+index in the columns.
+"""
+import concurrent.futures
+import dataclasses
+import datetime as dt
+import json
+import logging
+import math
+import pathlib
+import threading
+import time
+from typing import Any, Final, Iterable, Optional, Union
+
+import requests
+
+from framework.helpers import prometheus
+from framework.test_app import client_app
+from framework.test_app import server_app
+
+logger = logging.getLogger(__name__)
+
+# Type aliases
+_timedelta = dt.timedelta
+TestApp = Union[client_app.XdsTestClient, server_app.XdsTestServer]
+
+DEFAULT_INTERVAL: Final[_timedelta] = _timedelta(seconds=10)
+# A read returns once the chunk is full, so the deadline is checked at least
+# this often, in bytes.
+_CHUNK_SIZE: Final[int] = 128
+
+
+def _lines_until(
+    lines: Iterable[bytes], deadline: float, url: str
+) -> Iterable[bytes]:
+    """Yields the lines until the deadline, then aborts the response.
+
+    The timeout of requests only bounds each connect and read, so a response
+    that keeps sending within it would overrun the deadline.
+    """
+    for line in lines:
+        if time.time() > deadline:
+            raise requests.Timeout(f"Response of {url} overran the deadline")
+        yield line
+
+
+@dataclasses.dataclass(frozen=True)
+class ScrapeTarget:
+    # F.e. "server" or "client".
+    role: str
+    pod_name: str
+    host: str
+    port: int
+
+    @classmethod
+    def from_test_app(cls, role: str, app: TestApp) -> "ScrapeTarget":
+        if not app.monitoring_port:
+            raise ValueError(f"{app.hostname} has no monitoring port")
+        return cls(
+            role=role,
+            pod_name=app.hostname,
+            host=app.rpc_host,
+            port=int(app.monitoring_port),
+        )
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+
+class _Columns:
+    """The samples of all the scrapes, by column."""
+
+    def __init__(self):
+        self.time: list[float] = []
+        self.target: list[int] = []
+        self.name: list[int] = []
+        self.labels: list[int] = []
+        self.value: list[float] = []
+        self.names: dict[str, int] = {}
+        self.label_sets: dict[prometheus.LabelSet, int] = {}
+
+    def append(
+        self, scraped_at: float, target: int, snapshot: prometheus.Snapshot
+    ):
+        for name, label_set, value in prometheus.iter_series(snapshot):
+            self.time.append(scraped_at)
+            self.target.append(target)
+            self.name.append(self.names.setdefault(name, len(self.names)))
+            self.labels.append(
+                self.label_sets.setdefault(label_set, len(self.label_sets))
+            )
+            self.value.append(value)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "names": list(self.names),
+            "label_sets": [dict(label_set) for label_set in self.label_sets],
+            "columns": {
+                "time": self.time,
+                "target": self.target,
+                "name": self.name,
+                "labels": self.labels,
+                # NaN and Inf are written as JSON null and strings.
+                "value": [_json_value(value) for value in self.value],
+            },
+        }
+
+
+def _json_value(value: float) -> Union[float, str, None]:
+    if math.isnan(value):
+        return None
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return value
+
+
+class PrometheusScraper:
+    """Scrapes the targets in the background until stopped."""
+
+    targets: tuple[ScrapeTarget, ...]
+    interval: _timedelta
+    output_path: Optional[pathlib.Path]
+    rounds: int
+
+    def __init__(
+        self,
+        targets: Iterable[ScrapeTarget],
+        *,
+        interval: _timedelta = DEFAULT_INTERVAL,
+        output_path: Optional[pathlib.Path] = None,
+    ):
+        self.targets = tuple(targets)
+        if not self.targets:
+            raise ValueError("No scrape targets")
+        self.interval = interval
+        self.output_path = output_path
+        self.rounds = 0
+        self._first: dict[ScrapeTarget, prometheus.Snapshot] = {}
+        self._latest: dict[ScrapeTarget, prometheus.Snapshot] = {}
+        self._errors: dict[ScrapeTarget, int] = {}
+        self._columns = _Columns()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.targets), thread_name_prefix="prometheus"
+        )
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PrometheusScraper":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="prometheus-scraper", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Scraping %i Prometheus endpoints every %s: %s",
+            len(self.targets),
+            self.interval,
+            [target.pod_name for target in self.targets],
+        )
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._write_output()
+        if self._errors:
+            logger.warning(
+                "Failed Prometheus scrapes by pod: %s",
+                {t.pod_name: count for t, count in self._errors.items()},
+            )
+
+    def latest(self, target: ScrapeTarget) -> Optional[prometheus.Snapshot]:
+        with self._lock:
+            return self._latest.get(target)
+
+    def increase(self, target: ScrapeTarget) -> Optional[prometheus.Snapshot]:
+        """The increase of the samples from the first to the latest scrape."""
+        with self._lock:
+            first, latest = self._first.get(target), self._latest.get(target)
+        if first is None or latest is None:
+            return None
+        return latest - first
+
+    def _run(self):
+        interval_sec = self.interval.total_seconds()
+        next_tick = math.ceil(time.time() / interval_sec) * interval_sec
+        while not self._stop_event.wait(max(0.0, next_tick - time.time())):
+            self.scrape_round(deadline=next_tick + interval_sec)
+            # Skip the ticks missed while scraping, if any.
+            next_tick = (math.floor(time.time() / interval_sec) + 1) * (
+                interval_sec
+            )
+
+    def scrape_round(self, *, deadline: float):
+        """Scrapes all the targets concurrently, within the deadline."""
+        scraped_at = time.time()
+        futures = {
+            self._executor.submit(self._scrape, target, deadline): target
+            for target in self.targets
+        }
+        for future in concurrent.futures.as_completed(futures):
+            target = futures[future]
+            snapshot = future.result()
+            with self._lock:
+                if snapshot is None:
+                    self._errors[target] = self._errors.get(target, 0) + 1
+                    continue
+                self._first.setdefault(target, snapshot)
+                self._latest[target] = snapshot
+                self._columns.append(
+                    scraped_at, self.targets.index(target), snapshot
+                )
+        with self._lock:
+            self.rounds += 1
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _scrape(
+        self, target: ScrapeTarget, deadline: float
+    ) -> Optional[prometheus.Snapshot]:
+        timeout = deadline - time.time()
+        if timeout <= 0:
+            return None
+        try:
+            with self._session().get(
+                target.url, timeout=timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                return prometheus.parse_lines(
+                    _lines_until(
+                        response.iter_lines(chunk_size=_CHUNK_SIZE),
+                        deadline,
+                        target.url,
+                    )
+                )
+        except (requests.RequestException, prometheus.ParseError) as error:
+            logger.warning(
+                "Prometheus endpoint %s of %s failed: %r",
+                target.url,
+                target.pod_name,
+                error,
+            )
+            return None
+
+    def _write_output(self):
+        if not self.output_path:
+            return
+        with self._lock:
+            output = {
+                "targets": [
+                    dataclasses.asdict(target) for target in self.targets
+                ],
+                **self._columns.as_dict(),
+            }
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump(output, f)
+        logger.info(
+            "Wrote %i Prometheus samples of %i scrape rounds to %s",
+            len(output["columns"]["value"]),
+            self.rounds,
+            self.output_path,
+        )
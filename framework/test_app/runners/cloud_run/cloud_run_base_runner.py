@@ -16,10 +16,11 @@ Common functionality for running xDS Test Client and Server on CloudRun.
 """
 from abc import ABCMeta
 import collections
+import concurrent.futures
 import dataclasses
 import datetime as dt
 import logging
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import framework
 import framework.helpers.datetime
@@ -32,6 +33,25 @@ logger = logging.getLogger(__name__)
 _HighlighterYaml = framework.helpers.highlighter.HighlighterYaml
 _helper_datetime = framework.helpers.datetime
 _timedelta = dt.timedelta
+DeploymentTimings = gcp.cloud_run.DeploymentTimings
+
+
+def run_concurrently(*fns: Callable[[], Any]) -> list[Any]:
+    """Runs the deployment steps in parallel, returns their results in order.
+
+    F.e. deploys the test client and the test servers at the same time. Waits
+    for all the steps even when one of them fails, so none of them is left
+    running unobserved, then raises the first error.
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(fns) or 1, thread_name_prefix="cloud-run-deploy"
+    ) as executor:
+        futures = [executor.submit(fn) for fn in fns]
+        concurrent.futures.wait(futures)
+    for future in futures:
+        if future.exception() is not None:
+            raise future.exception()
+    return [future.result() for future in futures]
 
 
 @dataclasses.dataclass(frozen=True)
@@ -53,6 +73,7 @@ class CloudRunBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
     region: str
     gcp_api_manager: gcp.api.GcpApiManager
     current_revision: Optional[str] = None
+    deployment_timings: Optional[DeploymentTimings] = None
 
     run_history: collections.deque[RunHistory]
 
@@ -99,6 +120,10 @@ class CloudRunBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
             api_manager=self.gcp_api_manager,
         )
 
+    def _reset_state(self):
+        super()._reset_state()
+        self.deployment_timings = None
+
     def run(self, **kwargs) -> None:
         if self.time_start_requested and not self.time_stopped:
             if self.time_start_completed:
@@ -114,6 +139,28 @@ class CloudRunBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
         self._reset_state()
         self.time_start_requested = dt.datetime.now()
 
+    def _deploy_service(
+        self,
+        service_name: str,
+        service_body: dict[str, Any],
+        timings: Optional[DeploymentTimings] = None,
+    ) -> gcp.cloud_run.CloudRunService:
+        """Creates the service and waits for its revision to serve traffic.
+
+        The timings of the deployment stages are recorded to the given
+        timings, f.e. shared with the serverless NEG created meanwhile.
+        """
+        if timings is None:
+            timings = DeploymentTimings(service_name)
+        self.deployment_timings = timings
+        logger.info("Deploying Cloud Run service '%s'", service_name)
+        self.cloud_run.start_create_service(service_name, service_body)
+        service = self.cloud_run.wait_for_service_ready(
+            service_name, timings=timings
+        )
+        logger.info("Deployed Cloud Run service %s", timings)
+        return service
+
     def _start_completed(self):
         self.time_start_completed = dt.datetime.now()
 
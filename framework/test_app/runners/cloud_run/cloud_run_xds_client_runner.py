@@ -90,6 +90,7 @@ class CloudRunClientRunner(cloud_run_base_runner.CloudRunBaseRunner):
         *,
         server_target: str,
         mesh_name: str,
+        timings: Optional[cloud_run_base_runner.DeploymentTimings] = None,
     ) -> client_app.XdsTestClient:
         """Deploys and manages the xDS Test Client on Cloud Run."""
         super().run()
@@ -109,6 +110,7 @@ class CloudRunClientRunner(cloud_run_base_runner.CloudRunBaseRunner):
             server_target=server_target,
             stats_port=self.stats_port,
             network=self.network,
+            timings=timings,
         )
         self.current_revision = self.service.revision
         client = self._make_client_from_service(server_target, self.service)
@@ -180,6 +182,7 @@ class CloudRunClientRunner(cloud_run_base_runner.CloudRunBaseRunner):
         server_target: str,
         stats_port: int,
         network: str,
+        timings: Optional[cloud_run_base_runner.DeploymentTimings] = None,
     ) -> gcp.cloud_run.CloudRunService:
         if not service_name:
             raise ValueError("service_name cannot be empty or None")
@@ -225,7 +228,6 @@ class CloudRunClientRunner(cloud_run_base_runner.CloudRunBaseRunner):
                 },
             },
         }
-        logger.info("Deploying Cloud Run service '%s'", service_name)
         if self.enable_spiffe:
             service_body["template"]["containers"][0]["env"] += [
                 # TODO: Remove this when environment variable is changed in JAVA.
@@ -254,8 +256,7 @@ class CloudRunClientRunner(cloud_run_base_runner.CloudRunBaseRunner):
                 ),
                 "vpc_access": {"network_interfaces": {"network": network}},
             }
-        self.cloud_run.create_service(service_name, service_body)
-        return self.cloud_run.get_service(service_name)
+        return self._deploy_service(service_name, service_body, timings)
 
     @override
     def cleanup(self, *, force=False):
@@ -63,7 +63,12 @@ class CloudRunServerRunner(cloud_run_base_runner.CloudRunBaseRunner):
         self.current_revision = None
 
     @override
-    def run(self, **kwargs) -> list[server_app.XdsTestServer]:
+    def run(
+        self,
+        *,
+        timings: Optional[cloud_run_base_runner.DeploymentTimings] = None,
+        **kwargs,
+    ) -> list[server_app.XdsTestServer]:
         """Deploys and manages the xDS Test Server on Cloud Run."""
         logger.info(
             "Starting cloud run server with service %s and image %s",
@@ -75,6 +80,7 @@ class CloudRunServerRunner(cloud_run_base_runner.CloudRunBaseRunner):
         self.service = self.deploy_service(
             service_name=self.service_name,
             image_name=self.image_name,
+            timings=timings,
         )
         self.current_revision = self.service.revision
         servers = [
@@ -91,6 +97,7 @@ class CloudRunServerRunner(cloud_run_base_runner.CloudRunBaseRunner):
         image_name: str,
         *,
         test_port: int = DEFAULT_TEST_PORT,
+        timings: Optional[cloud_run_base_runner.DeploymentTimings] = None,
     ) -> gcp.cloud_run.CloudRunService:
         if not service_name:
             raise ValueError("service_name cannot be empty or None")
@@ -109,9 +116,7 @@ class CloudRunServerRunner(cloud_run_base_runner.CloudRunBaseRunner):
             },
         }
 
-        logger.info("Deploying Cloud Run service '%s'", service_name)
-        self.cloud_run.create_service(service_name, service_body)
-        return self.cloud_run.get_service(service_name)
+        return self._deploy_service(service_name, service_body, timings)
 
     @override
     def cleanup(self, *, force=False):
@@ -22,22 +22,29 @@ import datetime as dt
 import functools
 import logging
 import pathlib
-from typing import List, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, cast
 
 import absl.logging
-import mako.lookup
-import mako.template
 from typing_extensions import LiteralString, override
 import yaml
 
+from framework.helpers import lazy_import
 from framework.helpers import retryers
+from framework.helpers import tracing
 import framework.helpers.datetime
 import framework.helpers.highlighter
 import framework.helpers.rand
 from framework.infrastructure import gcp
 from framework.infrastructure import k8s
+from framework.infrastructure.k8s_internal import k8s_deletion_tracker
 from framework.test_app.runners import base_runner
 
+if TYPE_CHECKING:
+    from mako import lookup as mako_lookup
+else:
+    # Only needed to render the manifests.
+    mako_lookup = lazy_import.module("mako.lookup")
+
 logger = logging.getLogger(__name__)
 
 # Type aliases
@@ -70,7 +77,8 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
     runners, and their variants.
 
     Multithreading note: objects of this class (and any child classes)
-    support single-thread synchronous operations only.
+    support single-thread synchronous operations only. Different runner
+    objects may run concurrently from separate threads.
     """
 
     # Pylint wants abstract classes to override abstract methods.
@@ -312,6 +320,16 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
             for manifest in yml:
                 yield manifest
 
+    @classmethod
+    def render_namespace_manifest(
+        cls, namespace_name: str, template: str = "namespace.yaml"
+    ) -> dict:
+        """Renders namespace manifest without creating the namespace."""
+        yaml_doc = cls._template_lookup.get_template(template).render(
+            namespace_name=namespace_name
+        )
+        return next(cls._manifests_from_str(yaml_doc))
+
     def _render_template(self, template_name: str, **template_vars):
         template = self._template_lookup.get_template(template_name)
         return template.render(**template_vars)
@@ -319,8 +337,8 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
     @classmethod
     @property
     @functools.cache
-    def _template_lookup(cls) -> mako.lookup.TemplateLookup:
-        return mako.lookup.TemplateLookup(
+    def _template_lookup(cls) -> "mako_lookup.TemplateLookup":
+        return mako_lookup.TemplateLookup(
             directories=(str(cls.template_root_path),),
             input_encoding="utf-8",
             output_encoding="utf-8",
@@ -416,7 +434,15 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
         )
         return pod_monitoring
 
+    @tracing.traced()
     def _create_namespace(self, template, **kwargs) -> k8s.V1Namespace:
+        self._wait_for_pending_deletion(
+            "namespace",
+            self.k8s_namespace.name,
+            get_resource=self.k8s_namespace.get,
+            wait_for_deleted=self.k8s_namespace.wait_for_namespace_deleted,
+            timeout_sec=self.k8s_namespace.WAIT_LONG_TIMEOUT_SEC,
+        )
         namespace = self._create_from_template(template, **kwargs)
         if not isinstance(namespace, k8s.V1Namespace):
             raise _RunnerError(
@@ -462,6 +488,7 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
             gcp_service_account,
         )
 
+        # The concurrent runners' changes are batched by the IAM client.
         gcp_iam.add_service_account_iam_policy_binding(
             gcp_service_account,
             self.ROLE_WORKLOAD_IDENTITY_USER,
@@ -565,6 +592,7 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
         log_msg = f"[ns/{self.k8s_namespace.name}] {msg}"
         absl.logging.info(log_msg, *args)
 
+    @tracing.traced()
     def _create_deployment(self, template, **kwargs) -> k8s.V1Deployment:
         # Not making deployment_name an explicit kwarg to be consistent with
         # the rest of the _create_* methods, which pass kwargs as-is
@@ -592,6 +620,18 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
         else:
             self.deployment_id = kwargs["deployment_id"]
 
+        name = kwargs["deployment_name"]
+        self._wait_for_pending_deletion(
+            "deployment",
+            name,
+            get_resource=functools.partial(
+                self.k8s_namespace.get_deployment, name
+            ),
+            wait_for_deleted=functools.partial(
+                self.k8s_namespace.wait_for_deployment_deleted, name
+            ),
+            timeout_sec=self.k8s_namespace.WAIT_MEDIUM_TIMEOUT_SEC,
+        )
         deployment = self._create_from_template(template, **kwargs)
         if not isinstance(deployment, k8s.V1Deployment):
             raise _RunnerError(
@@ -772,6 +812,7 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
         )
         return backend_policy
 
+    @tracing.traced()
     def _create_service(self, template, **kwargs) -> k8s.V1Service:
         service = self._create_from_template(template, **kwargs)
         if not isinstance(service, k8s.V1Service):
@@ -888,6 +929,7 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
             self.k8s_namespace.wait_for_get_backend_policy_deleted(name)
         logger.info("GCPBackendPolicy %s deleted", name)
 
+    @tracing.traced()
     def _delete_deployment(self, name, wait_for_deletion=True):
         logger.info("Deleting deployment %s", name)
         self.stop_pod_dependencies()
@@ -902,10 +944,20 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
             logger.warning("Deployment %s deletion failed: %s", name, e)
             return
 
+        if wait_for_deletion and self._async_deletion:
+            self._hand_off_deletion(
+                "deployment",
+                name,
+                is_deleted=lambda: self.k8s_namespace.get_deployment(name)
+                is None,
+                timeout_sec=self.k8s_namespace.WAIT_MEDIUM_TIMEOUT_SEC,
+            )
+            return
         if wait_for_deletion:
             self.k8s_namespace.wait_for_deployment_deleted(name)
         logger.info("Deployment %s deleted", name)
 
+    @tracing.traced()
     def _delete_service(self, name, wait_for_deletion=True):
         logger.info("Deleting service %s", name)
         try:
@@ -939,6 +991,7 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
             self.k8s_namespace.wait_for_service_account_deleted(name)
         logger.info("Service account %s deleted", name)
 
+    @tracing.traced()
     def delete_namespace(self, wait_for_deletion=True):
         logger.info("Deleting namespace %s", self.k8s_namespace.name)
         try:
@@ -955,10 +1008,65 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
             )
             return
 
+        if wait_for_deletion and self._async_deletion:
+            self._hand_off_deletion(
+                "namespace",
+                self.k8s_namespace.name,
+                is_deleted=lambda: self.k8s_namespace.get() is None,
+                timeout_sec=self.k8s_namespace.WAIT_LONG_TIMEOUT_SEC,
+            )
+            return
         if wait_for_deletion:
             self.k8s_namespace.wait_for_namespace_deleted()
         logger.info("Namespace %s deleted", self.k8s_namespace.name)
 
+    @property
+    def _async_deletion(self) -> bool:
+        return k8s_deletion_tracker.ASYNC_DELETION.value
+
+    def _hand_off_deletion(
+        self,
+        kind: str,
+        name: str,
+        *,
+        is_deleted: k8s_deletion_tracker.IsDeletedFn,
+        timeout_sec: int,
+    ):
+        k8s_deletion_tracker.get_tracker().track(
+            kind,
+            self.k8s_namespace.name,
+            name,
+            is_deleted=is_deleted,
+            timeout=dt.timedelta(seconds=timeout_sec),
+        )
+
+    def _wait_for_pending_deletion(
+        self,
+        kind: str,
+        name: str,
+        *,
+        get_resource: Callable[[], Any],
+        wait_for_deleted: Callable[[], None],
+        timeout_sec: int,
+    ):
+        """Waits for the resource with the same name to finish deleting.
+
+        Only waits if the resource is still terminating: either its deletion
+        is pending in this process, or it's marked for deletion in k8s.
+        """
+        if k8s_deletion_tracker.get_tracker().wait_if_pending(
+            kind,
+            self.k8s_namespace.name,
+            name,
+            timeout=dt.timedelta(seconds=timeout_sec),
+        ):
+            resource = get_resource()
+            if resource is None or not resource.metadata.deletion_timestamp:
+                return
+        logger.info("Waiting for terminating %s %s to be deleted", kind, name)
+        wait_for_deleted()
+
+    @tracing.traced()
     def _wait_deployment_with_available_replicas(self, name, count=1, **kwargs):
         logger.info(
             "Waiting for deployment %s to report %s available replica(s)",
@@ -997,6 +1105,7 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
         # Pods may not  be started yet, just return the names.
         return pod_names
 
+    @tracing.traced()
     def _wait_pod_started(self, name, **kwargs) -> k8s.V1Pod:
         logger.info("Waiting for pod %s to start", name)
         self.k8s_namespace.wait_for_pod_started(name, **kwargs)
@@ -1064,6 +1173,7 @@ class KubernetesBaseRunner(base_runner.BaseRunner, metaclass=ABCMeta):
         self.pod_log_collectors.append(pod_log_collector)
         return pod_log_collector
 
+    @tracing.traced()
     def _wait_service_neg_status_annotation(
         self,
         service_name: str,
@@ -140,9 +140,16 @@ class XdsTestServer(framework.rpc.grpc.GrpcApp):
 
     @property
     def xds_uri(self) -> str:
-        if not self.xds_host:
+        return self.make_xds_uri(self.xds_host, self.xds_port)
+
+    @staticmethod
+    def make_xds_uri(xds_host: str, xds_port: Optional[int] = None) -> str:
+        """The xDS URI of the server, known before the server is started."""
+        if not xds_host:
             return ""
-        return f"xds:///{self.xds_address}"
+        if not xds_port:
+            return f"xds:///{xds_host}"
+        return f"xds:///{xds_host}:{xds_port}"
 
     def get_test_server(self) -> grpc_channelz.Server:
         """Return channelz representation of a server running TestService.
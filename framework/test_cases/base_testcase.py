@@ -20,11 +20,14 @@ import unittest
 from absl import logging
 from absl.testing import absltest
 
+from framework.helpers import tracing
+
 
 class BaseTestCase(absltest.TestCase):
     # @override
     def run(self, result: Optional[unittest.TestResult] = None) -> None:
-        super().run(result)
+        with tracing.test_trace(self.test_name):
+            super().run(result)
         # TODO(sergiitk): should this method be returning result? See
         #   super().run and xds_k8s_testcase.XdsKubernetesBaseTestCase.subTest
         test_errors = [error for test, error in result.errors if test is self]
@@ -12,18 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime as dt
+import functools
 import logging
+from typing import Optional
 
 from typing_extensions import override
 
 from framework import xds_flags
 from framework import xds_k8s_testcase
 from framework.helpers import retryers
+from framework.infrastructure import gcp
 from framework.infrastructure import k8s
 from framework.infrastructure import traffic_director
 import framework.infrastructure.mesh_resource_manager.cloud_run_mesh_manager as td_cloud_run
 from framework.test_app import client_app
 from framework.test_app import server_app
+from framework.test_app.runners.cloud_run import cloud_run_base_runner
 from framework.test_app.runners.cloud_run import cloud_run_xds_client_runner
 from framework.test_app.runners.cloud_run import cloud_run_xds_server_runner
 from framework.test_app.runners.k8s import k8s_xds_client_runner
@@ -38,6 +42,7 @@ CloudRunMeshManager = td_cloud_run.CloudRunMeshManager
 KubernetesClientRunner = k8s_xds_client_runner.KubernetesClientRunner
 XdsTestServer = server_app.XdsTestServer
 XdsTestClient = client_app.XdsTestClient
+DeploymentTimings = cloud_run_base_runner.DeploymentTimings
 
 
 class CloudRunXdsKubernetesTestCase(
@@ -84,7 +89,12 @@ class CloudRunXdsKubernetesTestCase(
             **kwargs,
         )
 
-    def startTestServers(self, server_runner=None) -> list[XdsTestServer]:
+    def startTestServers(
+        self,
+        server_runner=None,
+        *,
+        timings: Optional[DeploymentTimings] = None,
+    ) -> list[XdsTestServer]:
         if server_runner is None:
             self.server_runner = CloudRunServerRunner(
                 project=self.project,
@@ -95,13 +105,32 @@ class CloudRunXdsKubernetesTestCase(
                 gcp_api_manager=self.gcp_api_manager,
             )
 
-        test_servers = self.server_runner.run()
+        test_servers = self.server_runner.run(timings=timings)
         for test_server in test_servers:
             test_server.set_xds_address(
                 self.server_xds_host, self.server_xds_port
             )
         return test_servers
 
+    def startTestServersWithServerlessNeg(self) -> list[XdsTestServer]:
+        """Deploys the test server, creating its serverless NEG meanwhile.
+
+        The serverless NEG only refers to the service by name, so it doesn't
+        need to wait for the deployment.
+        """
+        timings = DeploymentTimings(self.server_namespace)
+        test_servers, _ = cloud_run_base_runner.run_concurrently(
+            functools.partial(self.startTestServers, timings=timings),
+            functools.partial(self.createServerlessNeg, timings),
+        )
+        logger.info("Test server deployment stages: %s", timings)
+        return test_servers
+
+    def createServerlessNeg(self, timings: Optional[DeploymentTimings] = None):
+        self.td.create_neg_serverless(self.server_namespace)
+        if timings is not None:
+            timings.record(gcp.cloud_run.STAGE_SERVERLESS_NEG_CREATED)
+
     @override
     def assertEDSConfigExists(self, config):
         """No-op for Cloud Run as EDS is not required."""
@@ -162,7 +191,54 @@ class CloudRunXdsTestCase(CloudRunXdsKubernetesTestCase):
         super().setUpClass()
 
     def startCloudRunTestClient(
-        self, test_server: XdsTestServer, *, enable_spiffe: bool = False
+        self,
+        test_server: XdsTestServer,
+        *,
+        enable_spiffe: bool = False,
+        timings: Optional[DeploymentTimings] = None,
+    ) -> XdsTestClient:
+        return self._startCloudRunTestClient(
+            test_server.xds_uri, enable_spiffe=enable_spiffe, timings=timings
+        )
+
+    def startCloudRunTestServerAndClient(
+        self, *, enable_spiffe: bool = False
+    ) -> tuple[XdsTestServer, XdsTestClient]:
+        """Deploys the test server, its serverless NEG, and the test client
+        concurrently.
+
+        The client only needs the xDS address of the server, known before
+        the server is deployed. It keeps retrying until the TD resources
+        routing to the server are created.
+        """
+        server_target = XdsTestServer.make_xds_uri(
+            self.server_xds_host, self.server_xds_port
+        )
+        server_timings = DeploymentTimings(self.server_namespace)
+        client_timings = DeploymentTimings(self.client_namespace)
+        test_servers, _, test_client = cloud_run_base_runner.run_concurrently(
+            functools.partial(self.startTestServers, timings=server_timings),
+            functools.partial(self.createServerlessNeg, server_timings),
+            functools.partial(
+                self._startCloudRunTestClient,
+                server_target,
+                enable_spiffe=enable_spiffe,
+                timings=client_timings,
+            ),
+        )
+        logger.info(
+            "Cloud Run deployment stages:\n%s\n%s",
+            server_timings,
+            client_timings,
+        )
+        return test_servers[0], test_client
+
+    def _startCloudRunTestClient(
+        self,
+        server_target: str,
+        *,
+        enable_spiffe: bool,
+        timings: Optional[DeploymentTimings],
     ) -> XdsTestClient:
         self.client_runner = CloudRunClientRunner(
             project=self.project,
@@ -176,8 +252,9 @@ class CloudRunXdsTestCase(CloudRunXdsKubernetesTestCase):
             enable_spiffe=enable_spiffe,
         )
         test_client = self.client_runner.run(
-            server_target=test_server.xds_uri,
+            server_target=server_target,
             mesh_name=self.td.mesh.url,
+            timings=timings,
         )
         return test_client
 
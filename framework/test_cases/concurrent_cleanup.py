@@ -0,0 +1,122 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Runs independent test cleanup steps concurrently.
+
+Most of the teardown time is spent waiting for the k8s namespaces and GCP
+resources to be deleted. The steps that don't depend on each other, f.e.
+the test client and the TD resources, are deleted at the same time.
+A step starts once all the steps it depends on are done, and is retried
+on its own, without repeating the steps that succeeded.
+"""
+import concurrent.futures
+import dataclasses
+import datetime as dt
+import logging
+from typing import Callable, Final, Sequence
+
+from framework.helpers import retryers
+from framework.helpers import tracing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ATTEMPTS: Final[int] = 3
+DEFAULT_RETRY_WAIT: Final[dt.timedelta] = dt.timedelta(seconds=10)
+
+
+@dataclasses.dataclass(frozen=True)
+class CleanupStep:
+    name: str
+    fn: Callable[[], None]
+    # The names of the steps that must be done before this step starts.
+    # The step starts even when a step it depends on has failed.
+    after: tuple[str, ...] = ()
+
+
+def run_cleanup_steps(
+    steps: Sequence[CleanupStep],
+    *,
+    attempts: int = DEFAULT_ATTEMPTS,
+    retry_wait: dt.timedelta = DEFAULT_RETRY_WAIT,
+) -> None:
+    """Runs the steps concurrently, respecting their dependencies.
+
+    Raises:
+        RetryError: One of the steps failed all attempts. The other
+            failed steps, if any, are added as the exception notes.
+        ValueError: The steps have unknown or circular dependencies.
+    """
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Cleanup step names must be unique: {names}")
+    for step in steps:
+        unknown = set(step.after) - set(names)
+        if unknown:
+            raise ValueError(f"Step {step.name} depends on unknown {unknown}")
+
+    pending: dict[str, CleanupStep] = {step.name: step for step in steps}
+    running: dict[concurrent.futures.Future, str] = {}
+    done: set[str] = set()
+    errors: dict[str, retryers.RetryError] = {}
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(steps) or 1, thread_name_prefix="cleanup"
+    ) as executor:
+        while pending or running:
+            for name, step in list(pending.items()):
+                if done.issuperset(step.after):
+                    del pending[name]
+                    future = executor.submit(
+                        _run_step, step, attempts, retry_wait
+                    )
+                    running[future] = name
+
+            if not running:
+                raise ValueError(
+                    f"Circular dependencies in cleanup steps: {list(pending)}"
+                )
+
+            finished, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in finished:
+                name = running.pop(future)
+                done.add(name)
+                error = future.exception()
+                if error is not None:
+                    errors[name] = error
+
+    if errors:
+        first_name, first_error = next(iter(errors.items()))
+        for name, error in errors.items():
+            if name != first_name:
+                first_error.add_note(
+                    f"Cleanup step {name} also failed: {error}"
+                )
+        raise first_error
+
+
+def _run_step(
+    step: CleanupStep, attempts: int, retry_wait: dt.timedelta
+) -> None:
+    retryer = retryers.constant_retryer(
+        wait_fixed=retry_wait,
+        attempts=attempts,
+        log_level=logging.INFO,
+    )
+    with tracing.span(f"cleanup.{step.name}"):
+        try:
+            retryer(step.fn)
+        except retryers.RetryError:
+            logger.exception("Cleanup step %s failed", step.name)
+            raise
@@ -0,0 +1,351 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A pool of pre-provisioned isolated test environments.
+
+Each isolated test starts with the same baseline infrastructure: the client
+and server namespaces, health check firewall rules, the GRPC health check, and
+the GRPC backend service. When --isolated_env_pool_size is set, the pool
+provisions these resources in a background thread, and
+IsolatedXdsKubernetesTestCase leases a ready environment instead of creating
+them in setUp(). After a successful cleanup the environment is returned to the
+pool, verified to match the baseline, and leased again. Environments that
+can't be verified are deleted in the background.
+
+The pool uses its own GCP and Kubernetes API managers: it outlives the test
+classes, which close theirs in tearDownClass().
+"""
+import atexit
+import dataclasses
+import datetime as dt
+import logging
+import queue
+import threading
+from typing import Final, Optional
+
+from absl import flags
+
+from framework.helpers import rand as helpers_rand
+from framework.infrastructure import gcp
+from framework.infrastructure import k8s
+from framework.infrastructure import traffic_director
+from framework.test_app.runners.k8s import k8s_base_runner
+from framework.test_app.runners.k8s import k8s_xds_client_runner
+from framework.test_app.runners.k8s import k8s_xds_server_runner
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE = flags.DEFINE_integer(
+    "isolated_env_pool_size",
+    default=0,
+    lower_bound=0,
+    help=(
+        "The number of isolated test environments to keep pre-provisioned"
+        " in the background. 0 disables the pool."
+    ),
+)
+LEASE_TIMEOUT_SEC = flags.DEFINE_integer(
+    "isolated_env_pool_lease_timeout_sec",
+    default=60,
+    lower_bound=0,
+    help=(
+        "How long to wait for a pre-provisioned environment before falling"
+        " back to provisioning the test resources in the test setUp."
+    ),
+)
+
+# Type aliases
+GcpResource = gcp.compute.ComputeV1.GcpResource
+_TrafficDirectorManager = traffic_director.TrafficDirectorManager
+_KubernetesServerRunner = k8s_xds_server_runner.KubernetesServerRunner
+_KubernetesClientRunner = k8s_xds_client_runner.KubernetesClientRunner
+_KubernetesBaseRunner = k8s_base_runner.KubernetesBaseRunner
+
+# Backend service fields that must be unset in a reusable environment.
+_BACKEND_SERVICE_CUSTOM_FIELDS: Final[tuple[str, ...]] = (
+    "backends",
+    "circuitBreakers",
+    "consistentHash",
+    "localityLbPolicies",
+    "outlierDetection",
+    "subsetting",
+)
+_RETRY_DELAY: Final[dt.timedelta] = dt.timedelta(seconds=30)
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolConfig:
+    """The settings every environment in the pool is provisioned with."""
+
+    project: str
+    network: str
+    resource_prefix: str
+    compute_api_version: str
+    kube_context: str
+    health_check_port: Optional[int]
+    enable_dualstack: bool = False
+    ensure_firewall: bool = False
+    firewall_allowed_ports: tuple[str, ...] = ()
+    firewall_source_range: str = ""
+    firewall_source_range_ipv6: str = ""
+
+
+@dataclasses.dataclass
+class IsolatedEnv:
+    resource_suffix: str
+    server_namespace: str
+    client_namespace: str
+    health_check: Optional[GcpResource] = None
+    health_check_port: Optional[int] = None
+    backend_service: Optional[GcpResource] = None
+
+    def adopt(
+        self,
+        td: _TrafficDirectorManager,
+        runners: tuple[_KubernetesBaseRunner, ...],
+    ):
+        """Makes the test resource managers use the leased resources."""
+        td.adopt_pooled_resources(
+            health_check=self.health_check,
+            health_check_port=self.health_check_port,
+            backend_service=self.backend_service,
+        )
+        namespaces = (self.server_namespace, self.client_namespace)
+        for runner in runners:
+            if runner.k8s_namespace.name in namespaces:
+                runner.reuse_namespace = True
+
+
+class IsolatedEnvPool:
+    config: PoolConfig
+    size: int
+
+    def __init__(self, config: PoolConfig, size: int):
+        self.config = config
+        self.size = size
+        self._available: queue.Queue[IsolatedEnv] = queue.Queue()
+        self._returned: queue.Queue[tuple[IsolatedEnv, bool]] = queue.Queue()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._gcp_api_manager = gcp.api.GcpApiManager()
+        self._k8s_api_manager = k8s.KubernetesApiManager(config.kube_context)
+        self._thread = threading.Thread(
+            target=self._run, name="isolated-env-pool", daemon=True
+        )
+
+    def start(self):
+        logger.info("Starting isolated environment pool of size %s", self.size)
+        self._thread.start()
+
+    def lease(self, timeout: dt.timedelta) -> Optional[IsolatedEnv]:
+        """Returns a ready environment, or None if none ready in time."""
+        try:
+            env = self._available.get(timeout=timeout.total_seconds())
+        except queue.Empty:
+            logger.warning(
+                "No pre-provisioned environment ready in %s", timeout
+            )
+            return None
+        # Start provisioning a replacement.
+        self._wakeup.set()
+        logger.info("Leased environment %s", env.resource_suffix)
+        return env
+
+    def release(self, env: IsolatedEnv, *, reusable: bool):
+        """Returns the environment to the pool or schedules its deletion."""
+        if not reusable:
+            logger.info(
+                "Environment %s is not reusable, discarding",
+                env.resource_suffix,
+            )
+        # Both handled by the pool thread.
+        self._returned.put((env, reusable))
+        self._wakeup.set()
+
+    def close(self):
+        """Stops the provisioning and deletes the idle environments."""
+        if self._stop_event.is_set():
+            return
+        logger.info("Stopping isolated environment pool")
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        # The pool thread is stopped, safe to use the API managers.
+        while not self._available.empty():
+            self._discard(self._available.get_nowait())
+        while not self._returned.empty():
+            env, _ = self._returned.get_nowait()
+            self._discard(env)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                try:
+                    env, reusable = self._returned.get_nowait()
+                except queue.Empty:
+                    env, reusable = None, False
+
+                if env is not None and reusable:
+                    self._reuse(env)
+                elif env is not None:
+                    self._discard(env)
+                elif self._available.qsize() < self.size:
+                    self._available.put(self._provision())
+                else:
+                    self._wakeup.wait()
+                    self._wakeup.clear()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Isolated environment pool error")
+                self._stop_event.wait(_RETRY_DELAY.total_seconds())
+
+    def _make_td(self, resource_suffix: str) -> _TrafficDirectorManager:
+        return _TrafficDirectorManager(
+            self._gcp_api_manager,
+            project=self.config.project,
+            resource_prefix=self.config.resource_prefix,
+            resource_suffix=resource_suffix,
+            network=self.config.network,
+            compute_api_version=self.config.compute_api_version,
+            enable_dualstack=self.config.enable_dualstack,
+        )
+
+    def _make_env(self, resource_suffix: str) -> IsolatedEnv:
+        prefix = self.config.resource_prefix
+        return IsolatedEnv(
+            resource_suffix=resource_suffix,
+            server_namespace=_KubernetesServerRunner.make_namespace_name(
+                prefix, resource_suffix
+            ),
+            client_namespace=_KubernetesClientRunner.make_namespace_name(
+                prefix, resource_suffix
+            ),
+            health_check_port=self.config.health_check_port,
+        )
+
+    def _provision(self) -> IsolatedEnv:
+        env = self._make_env(helpers_rand.random_resource_suffix())
+        logger.info("Provisioning environment %s", env.resource_suffix)
+        td = self._make_td(env.resource_suffix)
+        try:
+            for name in (env.server_namespace, env.client_namespace):
+                k8s.KubernetesNamespace(
+                    self._k8s_api_manager, name
+                ).create_single_resource(
+                    _KubernetesBaseRunner.render_namespace_manifest(name)
+                )
+            if self.config.ensure_firewall:
+                td.create_firewall_rules(
+                    allowed_ports=list(self.config.firewall_allowed_ports),
+                    source_range=self.config.firewall_source_range,
+                    source_range_ipv6=self.config.firewall_source_range_ipv6,
+                )
+            td.create_health_check(port=self.config.health_check_port)
+            td.create_backend_service()
+        except Exception:
+            self._discard(env)
+            raise
+        env.health_check = td.health_check
+        env.backend_service = td.backend_service
+        logger.info("Environment %s ready", env.resource_suffix)
+        return env
+
+    def _reuse(self, env: IsolatedEnv):
+        try:
+            problem = self._verify(env)
+        except Exception as e:  # pylint: disable=broad-except
+            problem = repr(e)
+        if problem:
+            logger.info(
+                "Environment %s can't be reused: %s",
+                env.resource_suffix,
+                problem,
+            )
+            self._discard(env)
+            return
+        logger.info("Environment %s returned to pool", env.resource_suffix)
+        self._available.put(env)
+
+    def _verify(self, env: IsolatedEnv) -> str:
+        """Returns the reason the environment differs from the baseline."""
+        td = self._make_td(env.resource_suffix)
+        td.compute.get_health_check(env.health_check.name)
+        backend_service: dict = td.compute.get_backend_service(
+            env.backend_service.name
+        )
+        for field in _BACKEND_SERVICE_CUSTOM_FIELDS:
+            if backend_service.get(field):
+                return f"backend service {field} is set"
+        if backend_service.get("sessionAffinity", "NONE") != "NONE":
+            return "backend service sessionAffinity is set"
+        if backend_service.get("healthChecks") != [env.health_check.url]:
+            return "backend service health check changed"
+
+        for name in (env.server_namespace, env.client_namespace):
+            k8s_namespace = k8s.KubernetesNamespace(self._k8s_api_manager, name)
+            namespace: Optional[k8s.V1Namespace] = k8s_namespace.get()
+            if not namespace or namespace.status.phase != "Active":
+                return f"namespace {name} is not active"
+            # Deployments being deleted are waited for on creation.
+            if any(
+                not deployment.metadata.deletion_timestamp
+                for deployment in k8s_namespace.list_deployments()
+            ):
+                return f"namespace {name} has deployments"
+        return ""
+
+    def _discard(self, env: IsolatedEnv):
+        logger.info("Deleting environment %s", env.resource_suffix)
+        td = self._make_td(env.resource_suffix)
+        try:
+            td.delete_backend_service(force=True)
+            td.delete_health_check(force=True)
+            if self.config.ensure_firewall:
+                td.delete_firewall_rule(force=True)
+                td.delete_firewall_rule_ipv6(force=True)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(
+                "Failed to delete environment %s", env.resource_suffix
+            )
+        for name in (env.server_namespace, env.client_namespace):
+            try:
+                # Don't wait for the deletion.
+                k8s.KubernetesNamespace(self._k8s_api_manager, name).delete()
+            except k8s.NotFound:
+                pass
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to delete namespace %s", name)
+
+
+_pool: Optional[IsolatedEnvPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(config: PoolConfig) -> Optional[IsolatedEnvPool]:
+    """Returns the process-wide pool, starting it on the first call.
+
+    Returns None when the pool is disabled, or when the pool was started
+    with a different config.
+    """
+    global _pool
+    if not POOL_SIZE.value:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = IsolatedEnvPool(config, POOL_SIZE.value)
+            _pool.start()
+            atexit.register(_pool.close)
+    if _pool.config != config:
+        logger.info("Test config differs from the pool config, not leasing")
+        return None
+    return _pool
@@ -16,6 +16,7 @@ from collections.abc import Sequence
 import contextlib
 import datetime as dt
 import enum
+import functools
 import hashlib
 import logging
 import re
@@ -33,21 +34,29 @@ from typing_extensions import TypeAlias, override
 from framework import xds_flags
 from framework import xds_k8s_flags
 from framework.helpers import grpc as helpers_grpc
+from framework.helpers import logs as helpers_logs
 from framework.helpers import rand as helpers_rand
+from framework.helpers import rate_limiter
 from framework.helpers import retryers
 from framework.helpers import skips
+from framework.helpers import tracing
 import framework.helpers.highlighter
+from framework.infrastructure import api_cassette
 from framework.infrastructure import gcp
 from framework.infrastructure import k8s
 from framework.infrastructure import traffic_director
+from framework.infrastructure.k8s_internal import k8s_deletion_tracker
 from framework.rpc import grpc_channelz
 from framework.rpc import grpc_csds
 from framework.rpc import grpc_testing
+from framework.rpc import xds_protos_registry
 from framework.test_app import client_app
 from framework.test_app import server_app
 from framework.test_app.runners.k8s import k8s_xds_client_runner
 from framework.test_app.runners.k8s import k8s_xds_server_runner
 from framework.test_cases import base_testcase
+from framework.test_cases import concurrent_cleanup
+from framework.test_cases import isolated_env_pool
 
 logger = logging.getLogger(__name__)
 # TODO(yashkt): We will no longer need this flag once Core exposes local certs
@@ -59,6 +68,12 @@ _CHECK_LOCAL_CERTS = flags.DEFINE_bool(
 )
 flags.adopt_module_key_flags(xds_flags)
 flags.adopt_module_key_flags(xds_k8s_flags)
+flags.adopt_module_key_flags(isolated_env_pool)
+flags.adopt_module_key_flags(tracing)
+flags.adopt_module_key_flags(k8s_deletion_tracker)
+flags.adopt_module_key_flags(xds_protos_registry)
+flags.adopt_module_key_flags(api_cassette)
+flags.adopt_module_key_flags(rate_limiter)
 
 # Type aliases
 TrafficDirectorManager = traffic_director.TrafficDirectorManager
@@ -69,6 +84,7 @@ XdsTestClient = client_app.XdsTestClient
 ClientDeploymentArgs = k8s_xds_client_runner.ClientDeploymentArgs
 KubernetesServerRunner = k8s_xds_server_runner.KubernetesServerRunner
 KubernetesClientRunner = k8s_xds_client_runner.KubernetesClientRunner
+CleanupStep = concurrent_cleanup.CleanupStep
 TestConfig: TypeAlias = skips.TestConfig
 Lang: TypeAlias = skips.Lang
 _CsdsClient = grpc_csds.CsdsClient
@@ -77,6 +93,7 @@ _LoadBalancerAccumulatedStatsResponse = (
     grpc_testing.LoadBalancerAccumulatedStatsResponse
 )
 _ChannelState = grpc_channelz.ChannelState
+_LazyFormat = helpers_logs.LazyFormat
 # TODO(sergiitk): replace datetime with dt.datetime everywhere
 datetime = dt
 # TODO(sergiitk): replace _timedelta with dt.timedelta everywhere
@@ -392,6 +409,7 @@ class XdsKubernetesBaseTestCase(
         # Remove backends from the Backend Service
         self.td.backend_service_remove_neg_backends(neg_name, neg_zones)
 
+    @tracing.traced()
     def assertSuccessfulRpcs(
         self,
         test_client: XdsTestClient,
@@ -434,6 +452,7 @@ class XdsKubernetesBaseTestCase(
             diff.stats_per_method[method].rpcs_started = rpcs_started
         return diff
 
+    @tracing.traced()
     def assertRpcStatusCodes(
         self,
         test_client: XdsTestClient,
@@ -456,7 +475,7 @@ class XdsKubernetesBaseTestCase(
                 " measurement:\n%s"
             ),
             test_client.hostname,
-            self._pretty_accumulated_stats(before_stats),
+            _LazyFormat(self._pretty_accumulated_stats, before_stats),
         )
 
         time.sleep(duration.total_seconds())
@@ -469,7 +488,7 @@ class XdsKubernetesBaseTestCase(
             ),
             test_client.hostname,
             duration.total_seconds(),
-            self._pretty_accumulated_stats(after_stats),
+            _LazyFormat(self._pretty_accumulated_stats, after_stats),
         )
 
         diff_stats = self.diffAccumulatedStatsPerMethod(
@@ -483,7 +502,9 @@ class XdsKubernetesBaseTestCase(
             test_client.hostname,
             expected_status_fmt,
             method,
-            self._pretty_accumulated_stats(diff_stats, ignore_empty=True),
+            _LazyFormat(
+                self._pretty_accumulated_stats, diff_stats, ignore_empty=True
+            ),
         )
 
         # Used in stack traces. Don't highlight for better compatibility.
@@ -518,6 +539,7 @@ class XdsKubernetesBaseTestCase(
                     f"\nDiff stats:\n{diff_stats_fmt}"
                 )
 
+    @tracing.traced()
     def assertRpcsEventuallyReachMinServers(
         self,
         test_client: XdsTestClient,
@@ -553,6 +575,7 @@ class XdsKubernetesBaseTestCase(
                     f" at least {num_expected_servers} servers",
                 )
 
+    @tracing.traced()
     def assertRpcsEventuallyGoToGivenServers(
         self,
         test_client: XdsTestClient,
@@ -608,6 +631,7 @@ class XdsKubernetesBaseTestCase(
                 f"Unexpected server {server_hostname} received RPCs",
             )
 
+    @tracing.traced()
     def assertXdsConfigExistsWithRetry(
         self,
         test_client,
@@ -676,6 +700,7 @@ class XdsKubernetesBaseTestCase(
         )
         self.assertSameElements(want, seen)
 
+    @tracing.traced()
     def assertRouteConfigUpdateTrafficHandoff(
         self,
         test_client: XdsTestClient,
@@ -800,6 +825,7 @@ class XdsKubernetesBaseTestCase(
                     f"Expected {expected_count} EDS endpoints to be DRAINING",
                 )
 
+    @tracing.traced()
     def assertFailedRpcs(
         self, test_client: XdsTestClient, num_rpcs: Optional[int] = 100
     ):
@@ -828,7 +854,7 @@ class XdsKubernetesBaseTestCase(
         logger.info(
             "[%s] << Received LoadBalancerStatsResponse:\n%s",
             test_client.hostname,
-            self._pretty_lb_stats(lb_stats),
+            _LazyFormat(self._pretty_lb_stats, lb_stats),
         )
         return lb_stats
 
@@ -841,6 +867,7 @@ class XdsKubernetesBaseTestCase(
                 msg=f"Backend {backend} did not receive a single RPC",
             )
 
+    @tracing.traced()
     def assertClientEventuallyReachesSteadyState(
         self,
         test_client: XdsTestClient,
@@ -890,7 +917,7 @@ class XdsKubernetesBaseTestCase(
         logging.info(
             "[%s] << Received LoadBalancerAccumulatedStatsResponse:\n%s",
             test_client.hostname,
-            self._pretty_accumulated_stats(stats),
+            _LazyFormat(self._pretty_accumulated_stats, stats),
         )
         rpcs_started = stats.num_rpcs_started_by_method[rpc_type]
         rpcs_succeeded = stats.num_rpcs_succeeded_by_method[rpc_type]
@@ -922,13 +949,21 @@ class IsolatedXdsKubernetesTestCase(
 
     Base class for tests cases where infra resources are created before
     each test, and destroyed after.
+
+    With --isolated_env_pool_size, the baseline resources are leased from
+    a pool of environments pre-provisioned in the background.
     """
 
+    isolated_env: Optional[isolated_env_pool.IsolatedEnv] = None
+    env_pool: Optional[isolated_env_pool.IsolatedEnvPool] = None
+
+    @tracing.traced()
     def setUp(self):
         """Hook method for setting up the test fixture before exercising it."""
         super().setUp()
 
-        # Random suffix per test.
+        # Pre-provisioned environment, or random suffix per test.
+        self.isolated_env = self.leaseIsolatedEnv()
         self.createRandomSuffix()
 
         # TD Manager
@@ -950,8 +985,14 @@ class IsolatedXdsKubernetesTestCase(
             )
         )
 
+        if self.isolated_env:
+            self.isolated_env.adopt(
+                self.td, runners=(self.server_runner, self.client_runner)
+            )
+
         # Create healthcheck firewall rules if necessary.
-        if self.ensure_firewall:
+        # Pre-provisioned environments already have them.
+        if self.ensure_firewall and not self.isolated_env:
             self.td.create_firewall_rules(
                 allowed_ports=self.firewall_allowed_ports,
                 source_range=self.firewall_source_range,
@@ -968,8 +1009,49 @@ class IsolatedXdsKubernetesTestCase(
             self.server_xds_port = self.td.find_unused_forwarding_rule_port()
             logger.info("Found unused xds port: %s", self.server_xds_port)
 
+    def leaseIsolatedEnv(self) -> Optional[isolated_env_pool.IsolatedEnv]:
+        if not self.resource_suffix_randomize:
+            return None
+        self.env_pool = isolated_env_pool.get_pool(
+            isolated_env_pool.PoolConfig(
+                project=self.project,
+                network=self.network,
+                resource_prefix=self.resource_prefix,
+                compute_api_version=self.compute_api_version,
+                kube_context=xds_k8s_flags.KUBE_CONTEXT.value,
+                health_check_port=self.server_maintenance_port,
+                enable_dualstack=self.enable_dualstack,
+                ensure_firewall=self.ensure_firewall,
+                firewall_allowed_ports=tuple(self.firewall_allowed_ports),
+                firewall_source_range=self.firewall_source_range,
+                firewall_source_range_ipv6=self.firewall_source_range_ipv6,
+            )
+        )
+        if not self.env_pool:
+            return None
+        return self.env_pool.lease(
+            _timedelta(seconds=isolated_env_pool.LEASE_TIMEOUT_SEC.value)
+        )
+
+    def releaseIsolatedEnv(self, *, cleanup_succeeded: bool):
+        if not self.isolated_env:
+            return
+        # Forced cleanup deletes the namespaces, as well as any resources
+        # replaced by the test with differently configured ones.
+        self.env_pool.release(
+            self.isolated_env,
+            reusable=(
+                cleanup_succeeded
+                and not self.force_cleanup
+                and not self.td.pooled_resources_released
+            ),
+        )
+        self.isolated_env = None
+
     def createRandomSuffix(self):
-        if self.resource_suffix_randomize:
+        if self.isolated_env:
+            self.resource_suffix = self.isolated_env.resource_suffix
+        elif self.resource_suffix_randomize:
             self.resource_suffix = helpers_rand.random_resource_suffix()
         logger.info(
             "Test run resource prefix: %s, suffix: %s",
@@ -989,6 +1071,7 @@ class IsolatedXdsKubernetesTestCase(
     def initKubernetesClientRunner(self, **kwargs) -> KubernetesClientRunner:
         raise NotImplementedError
 
+    @tracing.traced()
     def tearDown(self):
         logger.info("----- TestMethod %s teardown -----", self.test_name)
         logger.debug("Getting pods restart times")
@@ -1004,16 +1087,15 @@ class IsolatedXdsKubernetesTestCase(
         except (retryers.RetryError, k8s.NotFound) as e:
             logger.exception(e)
 
-        retryer = retryers.constant_retryer(
-            wait_fixed=_timedelta(seconds=10),
-            attempts=3,
-            log_level=logging.INFO,
-        )
+        cleanup_succeeded = False
         try:
-            retryer(self.cleanup)
+            # Failed cleanup steps are retried by cleanup() itself.
+            self.cleanup()
+            cleanup_succeeded = True
         except retryers.RetryError:
             logger.exception("Got error during teardown")
         finally:
+            self.releaseIsolatedEnv(cleanup_succeeded=cleanup_succeeded)
             logger.info("----- Test client/server logs -----")
             self.client_runner.logs_explorer_run_history_links()
             self.server_runner.logs_explorer_run_history_links()
@@ -1039,13 +1121,38 @@ class IsolatedXdsKubernetesTestCase(
             )
 
     def cleanup(self):
-        self.td.cleanup(force=self.force_cleanup)
-        self.client_runner.cleanup(
-            force=self.force_cleanup, force_namespace=self.force_cleanup
-        )
-        self.server_runner.cleanup(
-            force=self.force_cleanup, force_namespace=self.force_cleanup
-        )
+        concurrent_cleanup.run_cleanup_steps(self.cleanupSteps())
+
+    def cleanupSteps(self) -> list[CleanupStep]:
+        """The cleanup steps, run concurrently unless they depend on each other.
+
+        Server runners are cleaned up after TD resources, so the NEGs are
+        detached from the backend services before the k8s services that own
+        them are deleted. The client runner doesn't wait for TD: the GCP API
+        transport is per thread, and its workload identity revoke goes
+        through the IAM policy batcher.
+        """
+        force = self.force_cleanup
+        return [
+            CleanupStep("td", functools.partial(self.td.cleanup, force=force)),
+            CleanupStep(
+                "client_runner",
+                functools.partial(
+                    self.client_runner.cleanup,
+                    force=force,
+                    force_namespace=force,
+                ),
+            ),
+            CleanupStep(
+                "server_runner",
+                functools.partial(
+                    self.server_runner.cleanup,
+                    force=force,
+                    force_namespace=force,
+                ),
+                after=("td",),
+            ),
+        ]
 
     def _start_test_client(
         self,
@@ -1290,6 +1397,7 @@ class SecurityXdsKubernetesTestCase(IsolatedXdsKubernetesTestCase):
             **kwargs,
         )
 
+    @tracing.traced()
     def assertTestAppSecurity(
         self,
         mode: SecurityMode,
@@ -1460,6 +1568,7 @@ class SecurityXdsKubernetesTestCase(IsolatedXdsKubernetesTestCase):
             msg="(Plaintext) Client local certificate must be empty.",
         )
 
+    @tracing.traced()
     def assertClientCannotReachServerRepeatedly(
         self,
         test_client: XdsTestClient,
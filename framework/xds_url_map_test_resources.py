@@ -13,9 +13,19 @@
 # limitations under the License.
 """A test framework built for urlMap related xDS test cases."""
 
+import concurrent.futures
 import functools
 import inspect
-from typing import Any, Final, Iterable, Mapping, Tuple
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from absl import flags
 from absl import logging
@@ -299,59 +309,104 @@ class GcpResourceManager(metaclass=_MetaSingletonAndAbslFlags):
         self.td.create_target_proxy()
         # Forwarding Rule
         self.td.create_forwarding_rule(self.server_xds_port)
-        # Kubernetes Test Server
-        self.test_server_runner.run(
-            test_port=self.server_port,
-            maintenance_port=self.server_maintenance_port,
+        # Kubernetes Test Servers, and their NEGs added to Backend Services.
+        self._run_test_servers()
+        # Wait for healthy backends
+        self.td.wait_for_all_backends_healthy_status(
             replica_count=self.TEST_SERVER_REPLICA_COUNT,
+            alternative_replica_count=(
+                self.TEST_SERVER_ALTERNATIVE_REPLICA_COUNT
+            ),
+            affinity_replica_count=self.TEST_SERVER_AFFINITY_REPLICA_COUNT,
         )
-        # Kubernetes Test Server Alternative
-        self.test_server_alternative_runner.run(
-            test_port=self.server_port,
-            maintenance_port=self.server_maintenance_port,
-            replica_count=self.TEST_SERVER_ALTERNATIVE_REPLICA_COUNT,
-        )
-        # Kubernetes Test Server Affinity. 3 endpoints to test that only the
-        # picked sub-channel is connected.
-        self.test_server_affinity_runner.run(
+
+    def _run_test_servers(self) -> None:
+        """Deploys all test servers concurrently.
+
+        The NEG of each test server is added to its backend service as soon
+        as the NEG status annotation is assigned to the Kubernetes Service,
+        without waiting for the rest of the deployments.
+
+        All GCP API calls, except IAM bindings made by the runners, are made
+        from the calling thread.
+        """
+        # Default test server runner creates the namespace, the rest reuse it.
+        runners: List[Tuple[_KubernetesServerRunner, int, bool]] = [
+            (self.test_server_runner, self.TEST_SERVER_REPLICA_COUNT, False),
+            (
+                self.test_server_alternative_runner,
+                self.TEST_SERVER_ALTERNATIVE_REPLICA_COUNT,
+                True,
+            ),
+            # 3 endpoints to test that only the picked sub-channel is connected.
+            (
+                self.test_server_affinity_runner,
+                self.TEST_SERVER_AFFINITY_REPLICA_COUNT,
+                True,
+            ),
+        ]
+        add_neg_backends: List[Callable[[str, List[str]], None]] = [
+            self.td.backend_service_add_neg_backends,
+            self.td.alternative_backend_service_add_neg_backends,
+            self.td.affinity_backend_service_add_neg_backends,
+        ]
+        # The first error is raised only after the executor waits for the
+        # in-flight deployments and NEG waits, so that the cleanup doesn't
+        # race with them. No more NEGs are added after the first error.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(runners) * 2,
+            thread_name_prefix="url-map-setup",
+        ) as executor:
+            run_futures = [
+                executor.submit(
+                    self._run_test_server,
+                    runner,
+                    replica_count=replica_count,
+                    wait_for_namespace=wait_for_namespace,
+                )
+                for runner, replica_count, wait_for_namespace in runners
+            ]
+            neg_futures = {
+                executor.submit(self._wait_for_neg, runner.service_name): add
+                for (runner, _, _), add in zip(runners, add_neg_backends)
+            }
+            error: Optional[BaseException] = None
+            for future in concurrent.futures.as_completed(
+                [*run_futures, *neg_futures]
+            ):
+                error = future.exception()
+                if error is not None:
+                    break
+                if future in neg_futures:
+                    neg_name, neg_zones = future.result()
+                    neg_futures[future](neg_name, neg_zones)
+        if error is not None:
+            raise error
+
+    def _run_test_server(
+        self,
+        runner: _KubernetesServerRunner,
+        *,
+        replica_count: int,
+        wait_for_namespace: bool,
+    ) -> None:
+        if wait_for_namespace:
+            self.k8s_namespace.wait_for_namespace_created()
+        runner.run(
             test_port=self.server_port,
             maintenance_port=self.server_maintenance_port,
-            replica_count=self.TEST_SERVER_AFFINITY_REPLICA_COUNT,
+            replica_count=replica_count,
         )
-        # Add backend to default backend service
-        neg_name, neg_zones = self.k8s_namespace.parse_service_neg_status(
-            self.test_server_runner.service_name, self.server_port
-        )
-        self.td.backend_service_add_neg_backends(neg_name, neg_zones)
-        # Add backend to alternative backend service
-        (
-            neg_name_alt,
-            neg_zones_alt,
-        ) = self.k8s_namespace.parse_service_neg_status(
-            self.test_server_alternative_runner.service_name, self.server_port
-        )
-        self.td.alternative_backend_service_add_neg_backends(
-            neg_name_alt, neg_zones_alt
-        )
-        # Add backend to affinity backend service
-        (
-            neg_name_affinity,
-            neg_zones_affinity,
-        ) = self.k8s_namespace.parse_service_neg_status(
-            self.test_server_affinity_runner.service_name, self.server_port
-        )
-        self.td.affinity_backend_service_add_neg_backends(
-            neg_name_affinity, neg_zones_affinity
-        )
-        # Wait for healthy backends
-        self.td.wait_for_backends_healthy_status(
-            replica_count=self.TEST_SERVER_REPLICA_COUNT,
-        )
-        self.td.wait_for_alternative_backends_healthy_status(
-            replica_count=self.TEST_SERVER_ALTERNATIVE_REPLICA_COUNT,
+
+    def _wait_for_neg(self, service_name: str) -> Tuple[str, List[str]]:
+        # The namespace and the service are created concurrently by a runner,
+        # so the wait is longer than the one runners use.
+        self.k8s_namespace.wait_for_service_neg_status_annotation(
+            service_name,
+            timeout_sec=self.k8s_namespace.WAIT_MEDIUM_TIMEOUT_SEC,
         )
-        self.td.wait_for_affinity_backends_healthy_status(
-            replica_count=self.TEST_SERVER_AFFINITY_REPLICA_COUNT,
+        return self.k8s_namespace.parse_service_neg_status(
+            service_name, self.server_port
         )
 
     def cleanup(self) -> None:
@@ -29,6 +29,7 @@ import grpc
 from framework import xds_k8s_testcase
 from framework import xds_url_map_test_resources
 from framework.helpers import grpc as helpers_grpc
+from framework.helpers import logs as helpers_logs
 from framework.helpers import retryers
 from framework.helpers import skips
 from framework.infrastructure import k8s
@@ -60,6 +61,7 @@ HostRule = xds_url_map_test_resources.HostRule
 PathMatcher = xds_url_map_test_resources.PathMatcher
 _KubernetesClientRunner = k8s_xds_client_runner.KubernetesClientRunner
 _timedelta = datetime.timedelta
+_LazyFormat = helpers_logs.LazyFormat
 
 
 def _split_camel(s: str, delimiter: str = "-") -> str:
@@ -351,8 +353,9 @@ class XdsUrlMapTestCase(
         finally:
             logging.info(
                 "latest xDS config:\n%s",
-                GcpResourceManager().td.compute.resource_pretty_format(
-                    self._client_config_dict
+                _LazyFormat(
+                    GcpResourceManager().td.compute.resource_pretty_format,
+                    self._client_config_dict,
                 ),
             )
 
@@ -378,7 +381,7 @@ class XdsUrlMapTestCase(
         logging.info(
             "[%s] << Received LoadBalancerStatsResponse:\n%s",
             test_client.hostname,
-            helpers_grpc.lb_stats_pretty(lb_stats),
+            _LazyFormat(helpers_grpc.lb_stats_pretty, lb_stats),
         )
         return grpc_testing.RpcDistributionStats.from_message(lb_stats)
 
@@ -413,7 +416,7 @@ class XdsUrlMapTestCase(
                 " %s: before:\n%s"
             ),
             test_client.hostname,
-            helpers_grpc.accumulated_stats_pretty(before_stats),
+            _LazyFormat(helpers_grpc.accumulated_stats_pretty, before_stats),
         )
         time.sleep(length)
         after_stats = test_client.get_load_balancer_accumulated_stats()
@@ -423,7 +426,7 @@ class XdsUrlMapTestCase(
                 " %s: after: \n%s"
             ),
             test_client.hostname,
-            helpers_grpc.accumulated_stats_pretty(after_stats),
+            _LazyFormat(helpers_grpc.accumulated_stats_pretty, after_stats),
         )
 
         # Validate the diff
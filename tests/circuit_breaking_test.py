@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import logging
 
 from absl import flags
@@ -72,12 +73,21 @@ class CircuitBreakingTest(xds_k8s_testcase.RegularXdsKubernetesTestCase):
             reuse_namespace=True,
         )
 
-    def cleanup(self):
-        super().cleanup()
+    def cleanupSteps(self) -> list[xds_k8s_testcase.CleanupStep]:
+        steps = super().cleanupSteps()
         if hasattr(self, "alternate_server_runner"):
-            self.alternate_server_runner.cleanup(
-                force=self.force_cleanup, force_namespace=self.force_cleanup
+            steps.append(
+                xds_k8s_testcase.CleanupStep(
+                    "alternate_server_runner",
+                    functools.partial(
+                        self.alternate_server_runner.cleanup,
+                        force=self.force_cleanup,
+                        force_namespace=self.force_cleanup,
+                    ),
+                    after=("td",),
+                )
             )
+        return steps
 
     def test_circuit_breaking(self) -> None:
         with self.subTest("00_create_health_check"):
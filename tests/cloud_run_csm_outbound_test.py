@@ -44,36 +44,29 @@ class CloudRunCsmOutboundTest(cloud_run_testcase.CloudRunXdsTestCase):
         with self.subTest("0_create_mesh"):
             self.td.create_mesh()
 
-        with self.subTest("1_start_cloudrun_test_server"):
-            test_server: _XdsTestServer = self.startTestServers()[0]
+        with self.subTest("1_start_cloudrun_test_server_and_client"):
+            test_client: _XdsTestClient
+            _, test_client = self.startCloudRunTestServerAndClient()
 
-        with self.subTest("2_create_serverless_neg"):
-            self.td.create_neg_serverless(self.server_namespace)
-
-        with self.subTest("3_create_backend_service"):
+        with self.subTest("2_create_backend_service"):
             self.td.create_backend_service(
                 protocol=gcp.compute.ComputeV1.BackendServiceProtocol.HTTP2
             )
 
-        with self.subTest("4_add_server_backends_to_backend_service"):
+        with self.subTest("3_add_server_backends_to_backend_service"):
             self.td.backend_service_add_cloudrun_backends()
 
-        with self.subTest("5_create_grpc_route"):
+        with self.subTest("4_create_grpc_route"):
             self.td.create_grpc_route(
                 self.server_xds_host, self.server_xds_port
             )
 
-        with self.subTest("6_start_cloudrun_test_client"):
-            test_client: _XdsTestClient = self.startCloudRunTestClient(
-                test_server
-            )
-
-        with self.subTest("7_test_client_xds_config_exists"):
+        with self.subTest("5_test_client_xds_config_exists"):
             self.assertXdsConfigExistsWithRetry(
                 test_client, secure_channel=True
             )
 
-        with self.subTest("8_test_server_received_rpcs_from_test_client"):
+        with self.subTest("6_test_server_received_rpcs_from_test_client"):
             self.assertSuccessfulRpcs(test_client, secure_channel=True)
 
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime as dt
+import functools
 import logging
 from typing import Final
 
@@ -100,22 +101,40 @@ class DualStackTest(xds_k8s_testcase.RegularXdsKubernetesTestCase):
             **runner_args,
         )
 
-    def cleanup(self):
-        self.td.cleanup(force=self.force_cleanup)
-        self.client_runner.cleanup(
-            force=self.force_cleanup, force_namespace=self.force_cleanup
-        )
-
-        # Don't set force_namespace: all runners share the same namespace.
-        if self.v4_server_runner:
-            self.v4_server_runner.cleanup(force=self.force_cleanup)
-        if self.v6_server_runner:
-            self.v6_server_runner.cleanup(force=self.force_cleanup)
-
-        # Pass force_namespace at the last step.
-        self.server_runner.cleanup(
-            force=self.force_cleanup, force_namespace=self.force_cleanup
+    @override
+    def cleanupSteps(self) -> list[xds_k8s_testcase.CleanupStep]:
+        force = self.force_cleanup
+        # The server runners share the namespace and the service,
+        # clean them up one by one. Pass force_namespace at the last step.
+        steps = [
+            step
+            for step in super().cleanupSteps()
+            if step.name != "server_runner"
+        ]
+        server_after = "td"
+        for name in ("v4_server_runner", "v6_server_runner"):
+            runner = getattr(self, name)
+            if runner:
+                steps.append(
+                    xds_k8s_testcase.CleanupStep(
+                        name,
+                        functools.partial(runner.cleanup, force=force),
+                        after=(server_after,),
+                    )
+                )
+                server_after = name
+        steps.append(
+            xds_k8s_testcase.CleanupStep(
+                "server_runner",
+                functools.partial(
+                    self.server_runner.cleanup,
+                    force=force,
+                    force_namespace=force,
+                ),
+                after=(server_after,),
+            )
         )
+        return steps
 
     def test_dualstack(self) -> None:
         self.assertTrue(
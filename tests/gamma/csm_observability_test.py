@@ -14,23 +14,20 @@
 import dataclasses
 import logging
 import time
-from typing import Any, Callable, Iterable, TextIO
+from typing import Any, Iterable
 import unittest.mock
 
 from absl import flags
 from absl.testing import absltest
-from google.api_core import exceptions as gapi_errors
-from google.api_core import retry as gapi_retries
 from google.cloud import monitoring_v3
-import requests
-from requests.exceptions import RequestException
 import yaml
 
 from framework import xds_gamma_testcase
 from framework import xds_k8s_testcase
 from framework.helpers import skips
+from framework.infrastructure.gcp import monitoring
+from framework.test_app import prometheus_scraper
 from framework.test_app.runners.k8s import gamma_server_runner
-from framework.test_app.runners.k8s import k8s_base_runner
 from framework.test_app.runners.k8s import k8s_xds_client_runner
 
 logger = logging.getLogger(__name__)
@@ -101,7 +98,10 @@ ALL_METRICS = HISTOGRAM_METRICS + COUNTER_METRICS
 GammaServerRunner = gamma_server_runner.GammaServerRunner
 ClientDeploymentArgs = k8s_xds_client_runner.ClientDeploymentArgs
 KubernetesClientRunner = k8s_xds_client_runner.KubernetesClientRunner
-BuildQueryFn = Callable[[str, str], str]
+MetricQuery = monitoring.MetricQuery
+MetricQueryEngine = monitoring.MetricQueryEngine
+PrometheusScraper = prometheus_scraper.PrometheusScraper
+ScrapeTarget = prometheus_scraper.ScrapeTarget
 ANY = unittest.mock.ANY
 
 
@@ -144,31 +144,6 @@ class MetricTimeSeries:
         return yaml.dump(metric, sort_keys=False)
 
 
-# This class is purely for debugging purposes. We want to log what we see
-# from the Prometheus endpoint before being sent to Cloud Monitoring.
-# Once we determined the root cause of b/323596669 we can remove this
-# class.
-class PrometheusLogger:
-    def __init__(
-        self, k8s_runner: k8s_base_runner.KubernetesBaseRunner, pod_name: str
-    ):
-        logfile_name = (
-            f"{k8s_runner.k8s_namespace.name}_{pod_name}_prometheus.log"
-        )
-        log_path = k8s_runner.logs_subdir / logfile_name
-        self.log_stream: TextIO = open(
-            log_path, "w", errors="ignore", encoding="utf-8"
-        )
-
-    def write(self, line):
-        self.log_stream.write(line)
-        self.log_stream.write("\n")
-        self.log_stream.flush()
-
-    def close(self):
-        self.log_stream.close()
-
-
 class CsmObservabilityTest(xds_gamma_testcase.GammaXdsKubernetesTestCase):
     metric_client: monitoring_v3.MetricServiceClient
 
@@ -185,6 +160,11 @@ class CsmObservabilityTest(xds_gamma_testcase.GammaXdsKubernetesTestCase):
         super().setUpClass()
         cls.metric_client = cls.gcp_api_manager.monitoring_metric_service("v3")
 
+    def setUp(self):
+        super().setUp()
+        # Caches the time series found for the test run.
+        self.query_engine = MetricQueryEngine(self.metric_client, self.project)
+
     # These parameters are more pertaining to the test itself, not to
     # each run().
     def initKubernetesClientRunner(self, **kwargs) -> KubernetesClientRunner:
@@ -231,9 +211,7 @@ class CsmObservabilityTest(xds_gamma_testcase.GammaXdsKubernetesTestCase):
                 TEST_RUN_SECS,
             )
             if self.server_runner.should_collect_logs_prometheus:
-                self._sleep_and_ping_prometheus_endpoint(
-                    test_server, test_client
-                )
+                self._scrape_prometheus_endpoints(test_client)
             else:
                 time.sleep(TEST_RUN_SECS)
 
@@ -243,40 +221,9 @@ class CsmObservabilityTest(xds_gamma_testcase.GammaXdsKubernetesTestCase):
                 start_time={"seconds": start_secs},
                 end_time={"seconds": end_secs},
             )
-            server_histogram_results = self.query_metrics(
-                HISTOGRAM_SERVER_METRICS,
-                self.build_histogram_query,
-                self.server_namespace,
-                self.client_namespace,
-                interval,
-            )
-            client_histogram_results = self.query_metrics(
-                HISTOGRAM_CLIENT_METRICS,
-                self.build_histogram_query,
-                self.client_namespace,
-                self.server_namespace,
-                interval,
-            )
-            server_counter_results = self.query_metrics(
-                COUNTER_SERVER_METRICS,
-                self.build_counter_query,
-                self.server_namespace,
-                self.client_namespace,
-                interval,
-            )
-            client_counter_results = self.query_metrics(
-                COUNTER_CLIENT_METRICS,
-                self.build_counter_query,
-                self.client_namespace,
-                self.server_namespace,
-                interval,
+            all_results = self.query_metrics(
+                self.build_metric_queries(), interval
             )
-            all_results = {
-                **server_histogram_results,
-                **client_histogram_results,
-                **server_counter_results,
-                **client_counter_results,
-            }
             self.assertNotEmpty(all_results, msg="No query metrics results")
 
         with self.subTest("6_check_metrics_time_series"):
@@ -493,49 +440,31 @@ class CsmObservabilityTest(xds_gamma_testcase.GammaXdsKubernetesTestCase):
             label_matcher.pop("otel_scope_version", None)
             label_matcher.pop("otel_scope_name", None)
 
+    def build_metric_queries(self) -> list[MetricQuery]:
+        return monitoring.build_metric_queries(
+            client_namespace=self.client_namespace,
+            server_namespace=self.server_namespace,
+            histogram_filter_fn=self.build_histogram_query,
+            counter_filter_fn=self.build_counter_query,
+            histogram_client_metrics=HISTOGRAM_CLIENT_METRICS,
+            histogram_server_metrics=HISTOGRAM_SERVER_METRICS,
+            counter_client_metrics=COUNTER_CLIENT_METRICS,
+            counter_server_metrics=COUNTER_SERVER_METRICS,
+        )
+
     def query_metrics(
         self,
-        metric_names: Iterable[str],
-        build_query_fn: BuildQueryFn,
-        namespace: str,
-        remote_namespace: str,
+        queries: Iterable[MetricQuery],
         interval: monitoring_v3.TimeInterval,
     ) -> dict[str, MetricTimeSeries]:
         """
-        A helper function to make the cloud monitoring API call to query
-        metrics created by this test run.
+        A helper function to make the cloud monitoring API calls to query
+        metrics created by this test run, all at the same time.
         """
-        # Based on default retry settings for list_time_series method:
-        # https://github.com/googleapis/google-cloud-python/blob/google-cloud-monitoring-v2.18.0/packages/google-cloud-monitoring/google/cloud/monitoring_v3/services/metric_service/transports/base.py#L210-L218
-        # Modified: predicate extended to retry on a wider range of error types.
-        retry_settings = gapi_retries.Retry(
-            initial=0.1,
-            maximum=30.0,
-            multiplier=1.3,
-            predicate=gapi_retries.if_exception_type(
-                # Retry on 5xx, not just 503 ServiceUnavailable. This also
-                # covers gRPC Unknown, DataLoss, and DeadlineExceeded statuses.
-                # 501 MethodNotImplemented not excluded because most likely
-                # reason we'd see this error is server misconfiguration, so we
-                # want to give it a chance to recovering this situation too.
-                gapi_errors.ServerError,
-                # Retry on 429/ResourceExhausted: recoverable rate limiting.
-                gapi_errors.TooManyRequests,
-            ),
-            deadline=90.0,
-        )
         results = {}
-        for metric in metric_names:
-            logger.info("Requesting list_time_series for metric %s", metric)
-            response = self.metric_client.list_time_series(
-                name=f"projects/{self.project}",
-                filter=build_query_fn(metric, namespace, remote_namespace),
-                interval=interval,
-                view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-                retry=retry_settings,
-            )
-            time_series = list(response)
-
+        found = self.query_engine.query(queries, interval)
+        for query, time_series in found.items():
+            metric = query.metric
             self.assertLen(
                 time_series,
                 1,
@@ -580,59 +509,25 @@ class CsmObservabilityTest(xds_gamma_testcase.GammaXdsKubernetesTestCase):
             f"No data point with {ref_bytes}±{tolerance*100}% bytes found"
         )
 
-    def _sleep_and_ping_prometheus_endpoint(
-        self, test_server: _XdsTestServer, test_client: _XdsTestClient
-    ):
-        server_prometheus_logger = PrometheusLogger(
-            self.server_runner, test_server.hostname
-        )
-        client_prometheus_logger = PrometheusLogger(
-            self.client_runner, test_client.hostname
-        )
-        try:
-            for i in range(0, TEST_RUN_SECS // 10):
-                time.sleep(10)
-                curr_secs = int(time.time())
-                server_prometheus_logger.write(
-                    f"Prometheus endpoint content at {curr_secs}"
-                )
-                server_prometheus_logger.write(
-                    self._ping_prometheus_endpoint(
-                        test_server.rpc_host,
-                        test_server.monitoring_port,
-                    )
-                )
-                client_prometheus_logger.write(
-                    f"Prometheus endpoint content at {curr_secs}"
-                )
-                client_prometheus_logger.write(
-                    self._ping_prometheus_endpoint(
-                        test_client.rpc_host,
-                        test_client.monitoring_port,
-                    )
-                )
-        finally:
-            server_prometheus_logger.close()
-            client_prometheus_logger.close()
-
-    @classmethod
-    def _ping_prometheus_endpoint(
-        cls, monitoring_host: str, monitoring_port: int
-    ) -> str:
+    def _scrape_prometheus_endpoints(self, test_client: _XdsTestClient):
         """
-        A helper function to ping the pod's Prometheus endpoint to get what GMP
-        sees from the OTel exporter before passing metrics to Cloud Monitoring.
+        Scrapes the Prometheus endpoints of all the test server pods and the
+        test client while the client runs, to record what GMP sees from the
+        OTel exporter before passing metrics to Cloud Monitoring.
         """
-        try:
-            prometheus_log = requests.get(
-                f"http://{monitoring_host}:{monitoring_port}/metrics"
-            )
-            return "\n".join(prometheus_log.text.splitlines())
-        except RequestException as e:
-            logger.warning("Http request to Prometheus endpoint failed: %r", e)
-            # It's OK the caller will receive nothing in case of an exception.
-            # Caller can continue.
-            return ""
+        # Purely for debugging purposes: once we determined the root cause
+        # of b/323596669 we can remove this.
+        targets = [
+            ScrapeTarget.from_test_app("server", test_server)
+            for test_server in self.server_runner.pods_to_servers.values()
+        ]
+        targets.append(ScrapeTarget.from_test_app("client", test_client))
+        output_path = (
+            self.server_runner.logs_subdir
+            / f"{self.server_namespace}_prometheus_samples.json"
+        )
+        with PrometheusScraper(targets, output_path=output_path):
+            time.sleep(TEST_RUN_SECS)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from absl.testing import absltest
+
+from framework.helpers import grpc as helpers_grpc
+from framework.rpc import grpc_testing
+
+
+def _accumulated_stats(
+    stats_per_method: dict[str, tuple[int, dict[int, int]]],
+) -> grpc_testing.LoadBalancerAccumulatedStatsResponse:
+    response = grpc_testing.LoadBalancerAccumulatedStatsResponse()
+    for method, (rpcs_started, result) in stats_per_method.items():
+        response.stats_per_method[method].rpcs_started = rpcs_started
+        response.stats_per_method[method].result.update(result)
+    return response
+
+
+class AccumulatedStatsDiffTest(absltest.TestCase):
+    def test_diff(self):
+        before = _accumulated_stats({"UNARY_CALL": (100, {0: 95, 14: 5})})
+        after = _accumulated_stats(
+            {
+                "UNARY_CALL": (300, {0: 285, 14: 10, 4: 3}),
+                "EMPTY_CALL": (50, {0: 50}),
+            }
+        )
+        diff = helpers_grpc.accumulated_stats_diff(before, after)
+
+        unary = diff["UNARY_CALL"]
+        self.assertEqual(unary.rpcs_started, 200)
+        self.assertEqual(unary.result, {0: 190, 14: 5, 4: 3})
+        self.assertEqual(unary.rpcs_completed, 198)
+        self.assertEqual(unary.rpcs_failed, 8)
+        self.assertAlmostEqual(unary.error_rate, 8 / 198)
+        self.assertEqual(
+            unary.result_pretty(),
+            {
+                "(0, OK)": 190,
+                "(4, DEADLINE_EXCEEDED)": 3,
+                "(14, UNAVAILABLE)": 5,
+            },
+        )
+
+        empty = diff["EMPTY_CALL"]
+        self.assertEqual(empty.rpcs_started, 50)
+        self.assertEqual(empty.rpcs_failed, 0)
+        self.assertEqual(empty.error_rate, 0)
+
+    def test_client_restarted(self):
+        before = _accumulated_stats({"UNARY_CALL": (100, {0: 100})})
+        after = _accumulated_stats({"UNARY_CALL": (20, {0: 18, 14: 2})})
+        diff = helpers_grpc.accumulated_stats_diff(before, after)
+        self.assertEqual(diff["UNARY_CALL"].rpcs_started, 20)
+        self.assertEqual(diff["UNARY_CALL"].result, {0: 18, 14: 2})
+
+    def test_no_rpcs_completed(self):
+        stats = _accumulated_stats({"UNARY_CALL": (0, {})})
+        diff = helpers_grpc.accumulated_stats_diff(stats, stats)
+        self.assertEqual(diff["UNARY_CALL"].error_rate, 0)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,128 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pathlib
+import subprocess
+import sys
+from unittest import mock
+
+from absl import flags
+from absl.testing import absltest
+from absl.testing import flagsaver
+
+from framework.helpers import highlighter
+
+_YAML_DOC = "name: test\nitems:\n- 1\n"
+_REPO_ROOT = pathlib.Path(__file__).parents[3]
+
+
+class HighlighterYamlTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        highlighter._highlight_cache.clear()
+
+    def test_color_off_returns_code_as_is(self):
+        hl = highlighter.HighlighterYaml(color=False)
+        with mock.patch.object(
+            highlighter.pygments, "highlight"
+        ) as pygments_highlight:
+            self.assertEqual(hl.highlight(_YAML_DOC), _YAML_DOC)
+        pygments_highlight.assert_not_called()
+
+    def test_highlighted_once(self):
+        hl = highlighter.HighlighterYaml(color=True, color_style="ansi16")
+        with mock.patch.object(
+            highlighter.pygments, "highlight", return_value="highlighted"
+        ) as pygments_highlight:
+            self.assertEqual(hl.highlight(_YAML_DOC), "highlighted")
+            self.assertEqual(hl.highlight(_YAML_DOC), "highlighted")
+            # Shared by the highlighters with the same style.
+            other_hl = highlighter.HighlighterYaml(
+                color=True, color_style="ansi16"
+            )
+            self.assertEqual(other_hl.highlight(_YAML_DOC), "highlighted")
+        pygments_highlight.assert_called_once()
+
+    def test_styles_cached_separately(self):
+        hl_16 = highlighter.HighlighterYaml(color=True, color_style="ansi16")
+        hl_256 = highlighter.HighlighterYaml(color=True, color_style="default")
+        self.assertIsNot(hl_16.formatter, hl_256.formatter)
+        self.assertIs(hl_16.lexer, hl_256.lexer)
+        self.assertNotEqual(
+            hl_16.highlight(_YAML_DOC), hl_256.highlight(_YAML_DOC)
+        )
+
+    def test_unknown_style(self):
+        with self.assertRaises(ValueError):
+            highlighter.HighlighterYaml(color=True, color_style="no-such")
+
+    def test_pygments_imported_on_use(self):
+        script = (
+            "import sys\n"
+            "from framework.helpers import highlighter\n"
+            "print('pygments' in sys.modules)\n"
+            "highlighter.HighlighterYaml(color=True, color_style='ansi16')\n"
+            "print('pygments.lexers.data' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            cwd=_REPO_ROOT,
+            check=True,
+            text=True,
+        )
+        self.assertEqual(result.stdout.split(), ["False", "True"])
+
+
+class ColorStyleFlagTest(absltest.TestCase):
+    def test_valid(self):
+        for color_style in ("ansi16", "material", "default", "monokai"):
+            with self.subTest(color_style):
+                with flagsaver.flagsaver(color_style=color_style):
+                    self.assertEqual(highlighter.COLOR_STYLE.value, color_style)
+
+    def test_unknown(self):
+        with self.assertRaisesRegex(
+            flags.IllegalFlagValueError, "Unrecognized color style"
+        ):
+            flags.FLAGS.color_style = "no-such"
+
+
+class ColorEnabledTest(absltest.TestCase):
+    @flagsaver.flagsaver(color=True, color_only_tty=False)
+    def test_enabled(self):
+        with mock.patch.dict(os.environ, {highlighter.NO_COLOR_ENV: ""}):
+            self.assertTrue(highlighter.color_enabled())
+
+    @flagsaver.flagsaver(color=False)
+    def test_disabled_by_flag(self):
+        self.assertFalse(highlighter.color_enabled())
+
+    @flagsaver.flagsaver(color=True)
+    def test_disabled_by_env(self):
+        with mock.patch.dict(os.environ, {highlighter.NO_COLOR_ENV: "1"}):
+            self.assertFalse(highlighter.color_enabled())
+
+    @flagsaver.flagsaver(color=True, color_only_tty=True)
+    def test_only_tty(self):
+        with mock.patch.dict(os.environ, {highlighter.NO_COLOR_ENV: ""}):
+            with mock.patch("sys.stderr") as stderr:
+                stderr.isatty.return_value = False
+                self.assertFalse(highlighter.color_enabled())
+                stderr.isatty.return_value = True
+                self.assertTrue(highlighter.color_enabled())
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,48 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import sys
+
+from absl.testing import absltest
+
+from framework.helpers import lazy_import
+
+# Not imported by the unit tests otherwise.
+_MODULE_NAME = "xml.dom.minidom"
+
+
+class LazyImportTest(absltest.TestCase):
+    def test_imported_on_attribute_access(self):
+        sys.modules.pop(_MODULE_NAME, None)
+        minidom = lazy_import.module(_MODULE_NAME)
+        self.assertNotIn(_MODULE_NAME, sys.modules)
+
+        document = minidom.parseString("<a/>")
+
+        self.assertIn(_MODULE_NAME, sys.modules)
+        self.assertEqual(document.documentElement.tagName, "a")
+        self.assertIs(minidom.Document, sys.modules[_MODULE_NAME].Document)
+
+    def test_missing_attribute(self):
+        json_module = lazy_import.module("json")
+        with self.assertRaises(AttributeError):
+            json_module.no_such_attribute  # pylint: disable=pointless-statement
+
+    def test_missing_module(self):
+        missing = lazy_import.module("no_such_module_for_lazy_import_test")
+        with self.assertRaises(ModuleNotFoundError):
+            missing.anything  # pylint: disable=pointless-statement
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,83 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+
+from absl.testing import absltest
+
+from framework.helpers import logs
+from framework.rpc import grpc_testing
+
+
+class LazyFormatTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+        self.logger = logging.getLogger(f"{__name__}.{self.id()}")
+        self.logger.propagate = False
+
+    def _format(self, value, *, suffix=""):
+        self.calls.append(value)
+        return f"formatted {value}{suffix}"
+
+    def test_not_formatted_when_level_disabled(self):
+        self.logger.setLevel(logging.INFO)
+        self.logger.debug("%s", logs.LazyFormat(self._format, 1))
+        self.assertEmpty(self.calls)
+
+    def test_formatted_once_when_emitted(self):
+        self.logger.setLevel(logging.DEBUG)
+        with self.assertLogs(self.logger, logging.DEBUG) as cm:
+            lazy = logs.LazyFormat(self._format, 1, suffix="!")
+            self.logger.debug("value: %s", lazy)
+            self.assertEqual(str(lazy), "formatted 1!")
+        self.assertEqual(cm.records[0].getMessage(), "value: formatted 1!")
+        self.assertEqual(self.calls, [1])
+
+
+class FormatCacheTest(absltest.TestCase):
+    def test_cached_by_key(self):
+        cache = logs.FormatCache()
+        self.assertEqual(cache.get("a", lambda: "1"), "1")
+        self.assertEqual(cache.get("a", lambda: "2"), "1")
+        self.assertEqual(cache.get("b", lambda: "3"), "3")
+
+    def test_none_key_not_cached(self):
+        cache = logs.FormatCache()
+        self.assertEqual(cache.get(None, lambda: "1"), "1")
+        self.assertEqual(cache.get(None, lambda: "2"), "2")
+
+    def test_least_recently_used_evicted(self):
+        cache = logs.FormatCache(maxsize=2)
+        cache.get("a", lambda: "a1")
+        cache.get("b", lambda: "b1")
+        # Makes "b" the least recently used.
+        cache.get("a", lambda: "a2")
+        cache.get("c", lambda: "c1")
+        self.assertEqual(cache.get("a", lambda: "a3"), "a1")
+        self.assertEqual(cache.get("b", lambda: "b2"), "b2")
+
+    def test_message_cache_key(self):
+        stats = grpc_testing.LoadBalancerStatsResponse(num_failures=1)
+        same_stats = grpc_testing.LoadBalancerStatsResponse(num_failures=1)
+        other_stats = grpc_testing.LoadBalancerStatsResponse(num_failures=2)
+        self.assertEqual(
+            logs.message_cache_key(stats), logs.message_cache_key(same_stats)
+        )
+        self.assertNotEqual(
+            logs.message_cache_key(stats), logs.message_cache_key(other_stats)
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
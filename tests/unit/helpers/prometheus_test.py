@@ -0,0 +1,152 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+
+from absl.testing import absltest
+
+from framework.helpers import prometheus
+
+_METHOD = "grpc.testing.TestService/UnaryCall"
+
+
+def _exposition(started: int, buckets: tuple[int, int, int, int]) -> str:
+    """The CSM observability metrics as exported by the OTel exporter."""
+    le_0_01, le_0_1, le_1, le_inf = buckets
+    return f"""\
+# HELP grpc_server_call_started_total Number of server calls started.
+# TYPE grpc_server_call_started_total counter
+grpc_server_call_started_total{{grpc_method="{_METHOD}"}} {started}
+grpc_server_call_started_total{{grpc_method="other"}} 7
+# HELP grpc_server_call_duration_seconds End-to-end time.
+# TYPE grpc_server_call_duration_seconds histogram
+grpc_server_call_duration_seconds_bucket{{grpc_method="{_METHOD}",le="0.01"}} {le_0_01}
+grpc_server_call_duration_seconds_bucket{{grpc_method="{_METHOD}",le="0.1"}} {le_0_1}
+grpc_server_call_duration_seconds_bucket{{grpc_method="{_METHOD}",le="1"}} {le_1}
+grpc_server_call_duration_seconds_bucket{{grpc_method="{_METHOD}",le="+Inf"}} {le_inf}
+grpc_server_call_duration_seconds_sum{{grpc_method="{_METHOD}"}} {le_inf * 0.05}
+grpc_server_call_duration_seconds_count{{grpc_method="{_METHOD}"}} {le_inf}
+# TYPE process_open_fds gauge
+process_open_fds 12
+"""
+
+
+class ParseTest(absltest.TestCase):
+    def test_parse(self):
+        snapshot = prometheus.parse(_exposition(10, (1, 5, 9, 10)))
+        self.assertEqual(
+            snapshot.family("grpc_server_call_duration_seconds_bucket"),
+            ("grpc_server_call_duration_seconds", prometheus.HISTOGRAM),
+        )
+        self.assertEqual(
+            snapshot.value(
+                "grpc_server_call_started_total", grpc_method=_METHOD
+            ),
+            10,
+        )
+        self.assertEqual(snapshot.value("grpc_server_call_started_total"), 17)
+        self.assertEqual(snapshot.value("process_open_fds"), 12)
+        self.assertEqual(snapshot.value("missing"), 0)
+
+    def test_parse_lines_bytes(self):
+        lines = _exposition(10, (1, 5, 9, 10)).encode().splitlines()
+        snapshot = prometheus.parse_lines(iter(lines))
+        self.assertLen(snapshot["grpc_server_call_duration_seconds_bucket"], 4)
+
+    def test_labels_escaped(self):
+        snapshot = prometheus.parse(
+            'm{b="x,y}",a="quote \\" slash \\\\ nl \\n"} 1.5e3 1700000000000'
+        )
+        self.assertEqual(
+            snapshot["m"].label_sets,
+            [(("a", 'quote " slash \\ nl \n'), ("b", "x,y}"))],
+        )
+        self.assertEqual(snapshot.value("m"), 1500)
+
+    def test_special_values(self):
+        snapshot = prometheus.parse("a +Inf\nb -Inf\nc NaN")
+        self.assertEqual(snapshot.value("a"), math.inf)
+        self.assertEqual(snapshot.value("b"), -math.inf)
+        self.assertTrue(math.isnan(snapshot.value("c")))
+
+    def test_invalid(self):
+        with self.assertRaises(prometheus.ParseError):
+            prometheus.parse('m{a="1" b="2"} 1')
+        with self.assertRaises(prometheus.ParseError):
+            prometheus.parse("m one")
+
+
+class SnapshotDiffTest(absltest.TestCase):
+    def test_counters_and_buckets_subtracted(self):
+        before = prometheus.parse(_exposition(10, (1, 5, 9, 10)))
+        after = prometheus.parse(_exposition(30, (3, 20, 28, 30)))
+        diff = after - before
+
+        self.assertEqual(
+            diff.value("grpc_server_call_started_total", grpc_method=_METHOD),
+            20,
+        )
+        self.assertEqual(
+            diff.value("grpc_server_call_started_total", grpc_method="other"),
+            0,
+        )
+        histogram = diff.histogram(
+            "grpc_server_call_duration_seconds", grpc_method=_METHOD
+        )
+        self.assertEqual(histogram.upper_bounds, (0.01, 0.1, 1, math.inf))
+        self.assertEqual(histogram.cumulative_counts, (2, 15, 19, 20))
+        self.assertEqual(histogram.count, 20)
+        self.assertAlmostEqual(histogram.mean, 0.05)
+        # Gauges aren't subtracted.
+        self.assertEqual(diff.value("process_open_fds"), 12)
+
+    def test_new_series_and_reset(self):
+        before = prometheus.parse('c_total{a="1"} 10\n# TYPE c counter\n')
+        after = prometheus.parse(
+            '# TYPE c counter\nc_total{a="1"} 4\nc_total{a="2"} 3\n'
+        )
+        diff = after - before
+        self.assertEqual(diff.value("c_total", a="1"), 4)
+        self.assertEqual(diff.value("c_total", a="2"), 3)
+
+
+class HistogramTest(absltest.TestCase):
+    def _histogram(self, counts: tuple[float, ...]) -> prometheus.Histogram:
+        return prometheus.Histogram(
+            upper_bounds=(0.01, 0.1, 1, math.inf),
+            cumulative_counts=counts,
+            count=counts[-1],
+            sum=0,
+        )
+
+    def test_percentile(self):
+        histogram = self._histogram((0, 50, 100, 100))
+        self.assertAlmostEqual(histogram.percentile(50), 0.1)
+        self.assertAlmostEqual(histogram.percentile(25), 0.055)
+        self.assertAlmostEqual(histogram.percentile(75), 0.55)
+        self.assertAlmostEqual(histogram.percentile(100), 1)
+
+    def test_percentile_inf_bucket(self):
+        histogram = self._histogram((0, 0, 90, 100))
+        self.assertEqual(histogram.percentile(99), 1)
+
+    def test_percentile_empty(self):
+        self.assertTrue(
+            math.isnan(self._histogram((0, 0, 0, 0)).percentile(50))
+        )
+        with self.assertRaises(ValueError):
+            self._histogram((0, 0, 0, 1)).percentile(101)
+
+
+if __name__ == "__main__":
+    absltest.main()
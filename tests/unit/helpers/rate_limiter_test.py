@@ -0,0 +1,103 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest import mock
+
+from absl.testing import absltest
+from absl.testing import flagsaver
+
+from framework.helpers import rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class AdaptiveRateLimiterTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        for name in ("monotonic", "sleep"):
+            patcher = mock.patch.object(
+                rate_limiter.time, name, getattr(self.clock, name)
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self):
+        limiter = rate_limiter.AdaptiveRateLimiter("api", max_qps=10, min_qps=1)
+        waited = [limiter.acquire() for _ in range(12)]
+        self.assertEqual(waited[:10], [0] * 10)
+        self.assertAlmostEqual(waited[10], 0.1)
+        # Reserved after the previous one.
+        self.assertAlmostEqual(waited[11], 0.1)
+
+    def test_throttled_halves_rate(self):
+        limiter = rate_limiter.AdaptiveRateLimiter("api", max_qps=10, min_qps=1)
+        limiter.on_throttled()
+        self.assertEqual(limiter.rate, 5)
+        # The requests in flight.
+        limiter.on_throttled()
+        self.assertEqual(limiter.rate, 5)
+        self.clock.now += 1
+        limiter.on_throttled()
+        self.assertEqual(limiter.rate, 2.5)
+        self.assertEqual(limiter.throttled_count, 3)
+
+    def test_not_below_min_rate(self):
+        limiter = rate_limiter.AdaptiveRateLimiter("api", max_qps=10, min_qps=4)
+        for _ in range(3):
+            limiter.on_throttled()
+            self.clock.now += 1
+        self.assertEqual(limiter.rate, 4)
+
+    def test_success_grows_rate_to_max(self):
+        limiter = rate_limiter.AdaptiveRateLimiter("api", max_qps=10, min_qps=1)
+        limiter.on_throttled()
+        limiter.on_success()
+        self.assertAlmostEqual(limiter.rate, 5.2)
+        for _ in range(100):
+            limiter.on_success()
+        self.assertEqual(limiter.rate, 10)
+
+    def test_invalid_rates(self):
+        with self.assertRaises(ValueError):
+            rate_limiter.AdaptiveRateLimiter("api", max_qps=1, min_qps=2)
+
+
+class GetRateLimiterTest(absltest.TestCase):
+    @flagsaver.flagsaver(api_max_qps=7)
+    def test_shared_per_endpoint(self):
+        limiter = rate_limiter.get_rate_limiter("get-rate-limiter-test-a")
+        self.assertIs(
+            rate_limiter.get_rate_limiter("get-rate-limiter-test-a"), limiter
+        )
+        self.assertIsNot(
+            rate_limiter.get_rate_limiter("get-rate-limiter-test-b"), limiter
+        )
+        self.assertEqual(limiter.max_qps, 7)
+
+    @flagsaver.flagsaver(api_max_qps=0)
+    def test_disabled(self):
+        self.assertIsNone(rate_limiter.get_rate_limiter("endpoint"))
+
+
+if __name__ == "__main__":
+    absltest.main()
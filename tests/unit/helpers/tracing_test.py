@@ -0,0 +1,82 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+
+from absl.testing import absltest
+from absl.testing import flagsaver
+
+from framework.helpers import tracing
+
+
+class TracingTest(absltest.TestCase):
+    def _complete_events(self, recorder: tracing.TraceRecorder):
+        return [e for e in recorder.trace_events() if e["ph"] == "X"]
+
+    def test_span_disabled(self):
+        with tracing.span("outside_test"):
+            pass
+        with tracing.test_trace("test_disabled") as recorder:
+            with tracing.span("inside_test"):
+                pass
+        self.assertIsNone(recorder)
+
+    @flagsaver.flagsaver(trace_phases=True)
+    def test_spans_nest(self):
+        @tracing.traced("inner")
+        def inner():
+            return 42
+
+        with tracing.test_trace("test_nest") as recorder:
+            with tracing.span("outer", category="phase", resource="r1"):
+                self.assertEqual(inner(), 42)
+
+        events = {e["name"]: e for e in self._complete_events(recorder)}
+        self.assertCountEqual(events.keys(), ["test_nest", "outer", "inner"])
+        outer, inner_event = events["outer"], events["inner"]
+        self.assertEqual(outer["args"], {"resource": "r1"})
+        self.assertEqual(outer["cat"], "phase")
+        self.assertLessEqual(outer["ts"], inner_event["ts"])
+        self.assertGreaterEqual(
+            outer["ts"] + outer["dur"],
+            inner_event["ts"] + inner_event["dur"],
+        )
+
+        trace_dir = tracing.logs.log_get_root_dir() / tracing.TRACE_DIR_NAME
+        saved = json.loads((trace_dir / "test_nest.trace.json").read_text())
+        self.assertLen([e for e in saved["traceEvents"] if e["ph"] == "X"], 3)
+
+    @flagsaver.flagsaver(trace_phases=True)
+    def test_thread_ids(self):
+        with tracing.test_trace("test_threads") as recorder:
+
+            def worker():
+                with tracing.span("in_thread"):
+                    pass
+
+            thread = threading.Thread(target=worker, name="worker")
+            thread.start()
+            thread.join()
+
+        events = recorder.trace_events()
+        span = next(e for e in events if e["name"] == "in_thread")
+        self.assertEqual(span["tid"], thread.ident)
+        self.assertIn(
+            {"name": "worker"},
+            [e["args"] for e in events if e["name"] == "thread_name"],
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,169 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import time
+
+from absl.testing import absltest
+import httplib2
+import urllib3
+
+from framework.infrastructure import api_cassette
+
+Cassette = api_cassette.Cassette
+CassetteHttp = api_cassette.CassetteHttp
+CassettePoolManager = api_cassette.CassettePoolManager
+
+_COMPUTE_URI = "https://compute.googleapis.com/compute/v1/projects/p/global"
+
+
+class FakeHttp:
+    def __init__(self, responses: list[tuple[int, bytes]]):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, uri, method="GET", body=None, headers=None):
+        self.requests.append((method, uri))
+        status, content = self.responses.pop(0)
+        response = httplib2.Response(
+            {"status": status, "content-type": "application/json"}
+        )
+        return response, content
+
+    def close(self):
+        pass
+
+
+class FakePoolManager:
+    def __init__(self, responses: list[tuple[int, bytes]]):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, fields=None, **kwargs):
+        self.requests.append((method, url, fields))
+        status, content = self.responses.pop(0)
+        return urllib3.HTTPResponse(
+            body=content,
+            headers={"Content-Type": "application/json"},
+            status=status,
+            preload_content=True,
+        )
+
+
+class RequestKeyTest(absltest.TestCase):
+    def test_gcp_drops_api_key_and_sorts_query(self):
+        self.assertEqual(
+            api_cassette.request_key(
+                api_cassette.API_GCP, "get", f"{_COMPUTE_URI}?b=2&key=s&a=1"
+            ),
+            (api_cassette.API_GCP, "GET", f"{_COMPUTE_URI}?a=1&b=2"),
+        )
+
+    def test_k8s_drops_host(self):
+        self.assertEqual(
+            api_cassette.request_key(
+                api_cassette.API_K8S,
+                "GET",
+                "https://10.0.0.1/api/v1/namespaces/ns?pretty=true",
+            ),
+            (api_cassette.API_K8S, "GET", "/api/v1/namespaces/ns?pretty=true"),
+        )
+
+
+class CassetteTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = pathlib.Path(self.create_tempfile().full_path)
+
+    def _replay_cassette(self) -> Cassette:
+        cassette = Cassette(self.path, api_cassette.MODE_REPLAY)
+        cassette.load()
+        return cassette
+
+    def test_gcp_record_and_replay(self):
+        recorder = Cassette(self.path, api_cassette.MODE_RECORD)
+        fake_http = FakeHttp([(200, b'{"status": "RUNNING"}'), (200, b"\xff")])
+        http = CassetteHttp(recorder, http=fake_http)
+        http.request(f"{_COMPUTE_URI}?key=secret")
+        http.request(f"{_COMPUTE_URI}?key=secret")
+        recorder.save()
+        self.assertNotIn("secret", self.path.read_text())
+
+        http = CassetteHttp(self._replay_cassette(), http=None)
+        response, content = http.request(_COMPUTE_URI, method="GET")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response["content-type"], "application/json")
+        self.assertEqual(content, b'{"status": "RUNNING"}')
+        # Binary bodies survive.
+        self.assertEqual(http.request(_COMPUTE_URI)[1], b"\xff")
+        # The last response is repeated.
+        self.assertEqual(http.request(_COMPUTE_URI)[1], b"\xff")
+
+    def test_unrecorded_request(self):
+        Cassette(self.path, api_cassette.MODE_RECORD).save()
+        http = CassetteHttp(self._replay_cassette(), http=None)
+        with self.assertRaises(api_cassette.CassetteError):
+            http.request(_COMPUTE_URI, method="DELETE")
+
+    def test_k8s_record_and_replay(self):
+        recorder = Cassette(self.path, api_cassette.MODE_RECORD)
+        fake_pool = FakePoolManager([(404, b"{}"), (200, b'{"kind": "Pod"}')])
+        pool = CassettePoolManager(recorder, pool_manager=fake_pool)
+        url = "https://10.0.0.1/api/v1/namespaces/ns/pods/p"
+        pool.request("GET", url, fields=[("pretty", "true")])
+        # The dynamic client doesn't preload the content.
+        pool.request("DELETE", url, body="{}", preload_content=False)
+        recorder.save()
+
+        pool = CassettePoolManager(self._replay_cassette(), pool_manager=None)
+        other_host_url = "https://10.0.0.2/api/v1/namespaces/ns/pods/p"
+        response = pool.request(
+            "GET", other_host_url, fields=[("pretty", "true")]
+        )
+        self.assertEqual(response.status, 404)
+        response = pool.request("DELETE", other_host_url, body="{}")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.data, b'{"kind": "Pod"}')
+        self.assertEqual(response.headers["content-type"], "application/json")
+
+    def test_k8s_streaming_not_replayed(self):
+        Cassette(self.path, api_cassette.MODE_RECORD).save()
+        pool = CassettePoolManager(self._replay_cassette(), pool_manager=None)
+        with self.assertRaises(api_cassette.CassetteError):
+            pool.request(
+                "GET",
+                "https://h/api/v1/namespaces/ns/pods/p/log",
+                fields=[("follow", "True")],
+                preload_content=False,
+            )
+
+
+class VirtualClockTest(absltest.TestCase):
+    def test_sleep_advances_time(self):
+        clock = api_cassette.VirtualClock()
+        real_start = time.monotonic()
+        clock.install()
+        try:
+            start = time.monotonic()
+            start_time = time.time()
+            time.sleep(3600)
+            self.assertGreaterEqual(time.monotonic() - start, 3600)
+            self.assertGreaterEqual(time.time() - start_time, 3600)
+        finally:
+            clock.uninstall()
+        self.assertLess(time.monotonic() - real_start, 60)
+        self.assertEqual(clock.skipped, 3600)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,215 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime as dt
+from unittest import mock
+
+from absl.testing import absltest
+
+from framework.infrastructure.gcp import cloud_run
+
+_SERVICE = "projects/fake-project/locations/us-central1/services/server"
+_REVISION = f"{_SERVICE}/revisions/server-00001-abc"
+_TIME = "2026-01-01T00:00:00.000000Z"
+
+
+# The shapes of the Cloud Run API v2 responses, see
+# https://cloud.google.com/run/docs/reference/rest/v2/projects.locations.services
+# and .../projects.locations.services.revisions
+def _condition(condition_type: str, state: str, **fields) -> dict:
+    return {
+        "type": condition_type,
+        "state": state,
+        "lastTransitionTime": _TIME,
+        **fields,
+    }
+
+
+def _service(ready_state: str = "", **fields) -> dict:
+    service = {
+        "name": _SERVICE,
+        "uid": "1b2c3d4e",
+        "generation": "1",
+        "createTime": _TIME,
+        "updateTime": _TIME,
+        "launchStage": "GA",
+        "uri": "https://server-abc123-uc.a.run.app",
+        "reconciling": False,
+        "etag": '"ABC123"',
+        **fields,
+    }
+    if ready_state:
+        # The Ready condition of the service is its terminalCondition.
+        service["terminalCondition"] = _condition("Ready", ready_state)
+        service["conditions"] = [
+            _condition("RoutesReady", ready_state),
+            _condition("ConfigurationsReady", ready_state),
+        ]
+    return service
+
+
+def _revision(ready_state: str = "", **ready_fields) -> dict:
+    revision = {
+        "name": _REVISION,
+        "uid": "5f6a7b8c",
+        "generation": "1",
+        "createTime": _TIME,
+        "service": _SERVICE,
+        "reconciling": ready_state != "CONDITION_SUCCEEDED",
+        "observedGeneration": "1",
+        "etag": '"DEF456"',
+    }
+    if ready_state:
+        # Revisions don't have the terminalCondition.
+        revision["conditions"] = [
+            _condition("ResourcesAvailable", "CONDITION_SUCCEEDED"),
+            _condition("ContainerHealthy", ready_state),
+            _condition("Ready", ready_state, **ready_fields),
+        ]
+    return revision
+
+
+class ConditionsTest(absltest.TestCase):
+    def test_ready_condition_state(self):
+        self.assertIsNone(cloud_run.ready_condition_state(_service()))
+        self.assertIsNone(cloud_run.ready_condition_state(_revision()))
+        self.assertEqual(
+            cloud_run.ready_condition_state(_service("CONDITION_PENDING")),
+            "CONDITION_PENDING",
+        )
+        self.assertEqual(
+            cloud_run.ready_condition_state(_revision("CONDITION_RECONCILING")),
+            "CONDITION_RECONCILING",
+        )
+
+    def test_check_revision_ready(self):
+        self.assertFalse(cloud_run.check_revision_ready(_revision()))
+        self.assertFalse(
+            cloud_run.check_revision_ready(_revision("CONDITION_PENDING"))
+        )
+        self.assertTrue(
+            cloud_run.check_revision_ready(_revision("CONDITION_SUCCEEDED"))
+        )
+
+    def test_check_revision_failed(self):
+        revision = _revision(
+            "CONDITION_FAILED",
+            revisionReason="HEALTH_CHECK_CONTAINER_ERROR",
+            message="The user-provided container failed to start",
+        )
+        with self.assertRaisesRegex(
+            cloud_run.DeploymentError,
+            "HEALTH_CHECK_CONTAINER_ERROR: The user-provided container",
+        ):
+            cloud_run.check_revision_ready(revision)
+
+    def test_check_revision_failed_common_reason(self):
+        revision = _revision(
+            "CONDITION_FAILED",
+            reason="CONTAINER_MISSING",
+            message="Image not found",
+        )
+        with self.assertRaisesRegex(
+            cloud_run.DeploymentError, "CONTAINER_MISSING: Image not found"
+        ):
+            cloud_run.check_revision_ready(revision)
+
+    def test_is_traffic_assigned(self):
+        self.assertTrue(
+            cloud_run.is_traffic_assigned(
+                _service("CONDITION_SUCCEEDED", latestReadyRevision=_REVISION),
+                _REVISION,
+            )
+        )
+        self.assertFalse(
+            cloud_run.is_traffic_assigned(
+                _service(
+                    "CONDITION_SUCCEEDED",
+                    latestReadyRevision=_REVISION,
+                    reconciling=True,
+                ),
+                _REVISION,
+            )
+        )
+        self.assertFalse(
+            cloud_run.is_traffic_assigned(
+                _service("CONDITION_SUCCEEDED", latestReadyRevision="old"),
+                _REVISION,
+            )
+        )
+
+
+class WaitForServiceReadyTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        api_manager = mock.Mock()
+        self.cloud_run = cloud_run.CloudRunV2(
+            api_manager, "fake-project", "us-central1"
+        )
+        self.cloud_run._POLL_WAIT_MIN = dt.timedelta(0)
+        self.cloud_run._POLL_WAIT_MAX = dt.timedelta(0)
+        services = api_manager.cloudrun.return_value.projects().locations()
+        self.services = services.services.return_value
+
+    def test_stages(self):
+        self.services.get.return_value.execute.side_effect = [
+            _service(),
+            _service(
+                "CONDITION_RECONCILING",
+                latestCreatedRevision=_REVISION,
+                reconciling=True,
+            ),
+            _service(
+                "CONDITION_SUCCEEDED",
+                latestCreatedRevision=_REVISION,
+                latestReadyRevision=_REVISION,
+            ),
+        ]
+        revisions = self.services.revisions.return_value
+        revisions.get.return_value.execute.side_effect = [
+            _revision(),
+            _revision("CONDITION_RECONCILING"),
+            _revision("CONDITION_SUCCEEDED"),
+        ]
+
+        timings = cloud_run.DeploymentTimings("server")
+        service = self.cloud_run.wait_for_service_ready(
+            "server", timings=timings
+        )
+
+        self.assertEqual(service.revision, _REVISION)
+        self.assertEqual(service.uri, "https://server-abc123-uc.a.run.app")
+        self.assertEqual(
+            list(timings.stages),
+            [cloud_run.STAGE_REVISION_READY, cloud_run.STAGE_TRAFFIC_ASSIGNED],
+        )
+        revisions.get.assert_called_with(name=_REVISION)
+        self.assertEqual(revisions.get.return_value.execute.call_count, 3)
+
+    def test_revision_failed(self):
+        self.services.get.return_value.execute.return_value = _service(
+            "CONDITION_RECONCILING", latestCreatedRevision=_REVISION
+        )
+        revisions = self.services.revisions.return_value
+        revisions.get.return_value.execute.return_value = _revision(
+            "CONDITION_FAILED",
+            revisionReason="HEALTH_CHECK_CONTAINER_ERROR",
+            message="The user-provided container failed to start",
+        )
+        with self.assertRaises(cloud_run.DeploymentError):
+            self.cloud_run.wait_for_service_ready("server")
+        revisions.get.return_value.execute.assert_called_once()
+
+
+if __name__ == "__main__":
+    absltest.main()
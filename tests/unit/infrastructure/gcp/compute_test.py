@@ -0,0 +1,110 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest import mock
+
+from absl.testing import absltest
+import google.auth.credentials
+
+from framework.infrastructure import gcp
+from framework.infrastructure.gcp import fake_api_server
+
+_PROJECT = "fake-project"
+# The API returns the full URLs of the referenced resources.
+_COMPUTE_URL = f"https://www.googleapis.com/compute/v1/projects/{_PROJECT}"
+
+
+class ComputeV1Test(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = fake_api_server.FakeGcpApiServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        api_manager = gcp.api.GcpApiManager(
+            v1_discovery_uri=self.server.v1_discovery_uri,
+            v2_discovery_uri=self.server.v2_discovery_uri,
+            credentials=google.auth.credentials.AnonymousCredentials(),
+        )
+        self.addCleanup(api_manager.close)
+        self.compute = gcp.compute.ComputeV1(api_manager, _PROJECT)
+
+    def _create_forwarding_rule(self, name: str, port_range: str, network: str):
+        self.compute.api.globalForwardingRules().insert(
+            project=_PROJECT,
+            body={
+                "name": name,
+                "portRange": port_range,
+                "network": f"{_COMPUTE_URL}/global/networks/{network}",
+                "loadBalancingScheme": "INTERNAL_SELF_MANAGED",
+            },
+        ).execute()
+
+    def test_list_forwarding_rule_ports(self):
+        self._create_forwarding_rule("fr-1", "8080", "default")
+        self._create_forwarding_rule("fr-2", "9000-9002", "default")
+        self._create_forwarding_rule("fr-3", "7070", "other")
+        self.assertEqual(
+            self.compute.list_forwarding_rule_ports("global/networks/default"),
+            {8080, 9000, 9001, 9002},
+        )
+
+    def _create_health_checks(self, *names: str):
+        for name in names:
+            self.compute.create_health_check(
+                name, self.compute.HealthCheckProtocol.TCP
+            )
+
+    @mock.patch.object(fake_api_server, "_DEFAULT_PAGE_SIZE", 2)
+    def test_list_resource_pages(self):
+        names = [f"hc-{i}" for i in range(5)]
+        self._create_health_checks(*names)
+        list_requests = self.server.request_counts["GET compute"]
+
+        health_checks = self.compute.list_health_check()
+        self.assertEqual(next(health_checks)["name"], "hc-0")
+        # The next page is requested once the current one is consumed.
+        self.assertEqual(
+            self.server.request_counts["GET compute"], list_requests + 1
+        )
+        self.assertEqual(
+            [hc["name"] for hc in health_checks],
+            ["hc-1", "hc-2", "hc-3", "hc-4"],
+        )
+        self.assertEqual(
+            self.server.request_counts["GET compute"], list_requests + 3
+        )
+
+    def test_list_resource_empty(self):
+        self.assertEmpty(list(self.compute.list_health_check()))
+
+    @mock.patch.object(fake_api_server, "_DEFAULT_PAGE_SIZE", 2)
+    def test_list_resource_filter(self):
+        self._create_health_checks(
+            "psm-interop-hc-a",
+            "other-hc-b",
+            "test-hc-c",
+            "psm-interop-hc-d",
+            "the-test-hc-e",
+        )
+        health_checks = self.compute.list_health_check(
+            resource_filter='name eq "(?:psm-interop|test-hc).*"'
+        )
+        # Filtered by the server before paging.
+        self.assertEqual(
+            [hc["name"] for hc in health_checks],
+            ["psm-interop-hc-a", "test-hc-c", "psm-interop-hc-d"],
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,156 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime as dt
+
+from absl.testing import absltest
+import google.auth.credentials
+from googleapiclient import errors
+
+from framework.infrastructure import gcp
+from framework.infrastructure.gcp import fake_api_server
+
+_PROJECT = "fake-project"
+
+
+class FakeGcpApiServerTest(absltest.TestCase):
+    def _api_manager(
+        self, server: fake_api_server.FakeGcpApiServer
+    ) -> gcp.api.GcpApiManager:
+        api_manager = gcp.api.GcpApiManager(
+            v1_discovery_uri=server.v1_discovery_uri,
+            v2_discovery_uri=server.v2_discovery_uri,
+            credentials=google.auth.credentials.AnonymousCredentials(),
+        )
+        self.addCleanup(api_manager.close)
+        return api_manager
+
+    def _start_server(self, **kwargs) -> fake_api_server.FakeGcpApiServer:
+        server = fake_api_server.FakeGcpApiServer(seed=0, **kwargs)
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_compute_resources(self):
+        server = self._start_server()
+        compute = gcp.compute.ComputeV1(self._api_manager(server), _PROJECT)
+
+        health_check = compute.create_health_check(
+            "hc", compute.HealthCheckProtocol.GRPC
+        )
+        self.assertEqual(health_check.name, "hc")
+        self.assertEqual(
+            compute.get_health_check("hc").url,
+            f"{server.url}/compute/v1/projects/{_PROJECT}/global"
+            "/healthChecks/hc",
+        )
+        self.assertEqual(
+            [hc["name"] for hc in compute.list_health_check()], ["hc"]
+        )
+        compute.delete_health_check("hc")
+        self.assertEmpty(list(compute.list_health_check()))
+
+    def test_compute_already_exists(self):
+        server = self._start_server()
+        compute = gcp.compute.ComputeV1(self._api_manager(server), _PROJECT)
+        compute.create_health_check("hc", compute.HealthCheckProtocol.TCP)
+        with self.assertRaises(errors.HttpError) as cm:
+            compute.create_health_check("hc", compute.HealthCheckProtocol.TCP)
+        self.assertEqual(cm.exception.resp.status, 409)
+
+    def test_compute_list_filter(self):
+        server = self._start_server()
+        compute = gcp.compute.ComputeV1(self._api_manager(server), _PROJECT)
+        url_map = compute.create_url_map_with_content({"name": "url-map"})
+        target_proxy = compute.create_target_grpc_proxy("proxy", url_map)
+        compute.create_forwarding_rule("fr", 8080, target_proxy, "default")
+        self.assertTrue(compute.exists_forwarding_rule(8080))
+        self.assertFalse(compute.exists_forwarding_rule(8081))
+
+    def test_network_services_resources(self):
+        server = self._start_server()
+        network_services = gcp.network_services.NetworkServicesV1(
+            self._api_manager(server), _PROJECT
+        )
+        network_services.create_mesh("mesh", {"description": "test"})
+        self.assertEqual(network_services.get_mesh("mesh").name, "mesh")
+        self.assertLen(list(network_services.list_meshes()), 1)
+        self.assertTrue(network_services.delete_mesh("mesh"))
+        self.assertEmpty(list(network_services.list_meshes()))
+
+    def test_network_services_patch(self):
+        server = self._start_server()
+        network_services = gcp.network_services.NetworkServicesV1(
+            self._api_manager(server), _PROJECT
+        )
+        network_services.create_grpc_route(
+            "route", {"hostnames": ["a:8080"], "description": "test"}
+        )
+        network_services.patch_grpc_route(
+            "route", {"hostnames": ["b:8080"]}, ["hostnames", "description"]
+        )
+        route = network_services.get_grpc_route_body("route")
+        self.assertEqual(route["hostnames"], ["b:8080"])
+        self.assertNotIn("description", route)
+
+    def test_operation_latency(self):
+        server = self._start_server(operation_latency=dt.timedelta(hours=1))
+        compute = self._api_manager(server).compute("v1")
+        operation = (
+            compute.firewalls()
+            .insert(project=_PROJECT, body={"name": "fw"})
+            .execute()
+        )
+        self.assertEqual(operation["status"], "RUNNING")
+        operation = (
+            compute.globalOperations()
+            .get(project=_PROJECT, operation=operation["name"])
+            .execute()
+        )
+        self.assertEqual(operation["status"], "RUNNING")
+        # The change itself is visible right away.
+        firewall = (
+            compute.firewalls().get(project=_PROJECT, firewall="fw").execute()
+        )
+        self.assertEqual(firewall["name"], "fw")
+
+    def test_rate_limited(self):
+        server = self._start_server(error_rate=1.0)
+        compute = self._api_manager(server).compute("v1")
+        with self.assertRaises(errors.HttpError) as cm:
+            compute.firewalls().list(project=_PROJECT).execute(num_retries=0)
+        self.assertEqual(cm.exception.resp.status, 429)
+        self.assertEqual(server.request_counts["GET compute"], 1)
+
+
+class MatchesFilterTest(absltest.TestCase):
+    def test_eq_ne(self):
+        resource = {"portRange": "8080-8080", "IPAddress": "0.0.0.0"}
+        self.assertTrue(
+            fake_api_server.matches_filter(
+                resource, '(portRange eq "8080-8080") (IPAddress eq "0.0.0.0")'
+            )
+        )
+        self.assertFalse(
+            fake_api_server.matches_filter(resource, '(portRange eq "8080")')
+        )
+        self.assertTrue(
+            fake_api_server.matches_filter(resource, '(portRange ne "90.*")')
+        )
+        self.assertFalse(
+            fake_api_server.matches_filter(resource, '(name eq "fr")')
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,217 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent import futures
+import dataclasses
+import threading
+import time
+from unittest import mock
+
+from absl.testing import absltest
+
+from framework.infrastructure.gcp import iam
+
+_ROLE = "roles/iam.workloadIdentityUser"
+_ACCOUNT = "sa@fake-project.iam.gserviceaccount.com"
+
+
+def _policy(*members: str, etag: str = "e0") -> iam.Policy:
+    bindings = [iam.Policy.Binding(_ROLE, frozenset(members))]
+    return iam.Policy(
+        bindings=frozenset(bindings) if members else frozenset(), etag=etag
+    )
+
+
+class FakeIam:
+    """Keeps the policy of a single service account, checks the etags."""
+
+    def __init__(self, policy: iam.Policy):
+        self.policy = policy
+        self.closed = False
+        self.get_count = 0
+        self.set_count = 0
+        self.set_started = threading.Event()
+        self.set_can_finish = threading.Event()
+        self.set_can_finish.set()
+
+    def service_account_resource_name(self, account: str) -> str:
+        return f"projects/fake-project/serviceAccounts/{account}"
+
+    def get_service_account_iam_policy(self, account: str) -> iam.Policy:
+        del account
+        assert not self.closed, "IAM client used after close"
+        self.get_count += 1
+        return self.policy
+
+    def set_service_account_iam_policy(
+        self, account: str, policy: iam.Policy
+    ) -> iam.Policy:
+        del account
+        self.set_started.set()
+        self.set_can_finish.wait()
+        self.set_count += 1
+        if policy.etag != self.policy.etag:
+            raise iam.EtagConflict
+        self.policy = dataclasses.replace(policy, etag=f"e{self.set_count}")
+        return self.policy
+
+    def members(self) -> frozenset[str]:
+        binding = self.policy.find_binding_for_role(_ROLE)
+        return binding.members if binding else frozenset()
+
+
+def _add(member: str) -> iam.BindingChange:
+    return iam.BindingChange(role=_ROLE, member=member, add=True)
+
+
+def _remove(member: str) -> iam.BindingChange:
+    return iam.BindingChange(role=_ROLE, member=member, add=False)
+
+
+class ApplyBindingChangesTest(absltest.TestCase):
+    def test_add_and_remove(self):
+        policy = iam.apply_binding_changes(
+            _policy("a"), [_add("b"), _add("c"), _remove("a")]
+        )
+        self.assertEqual(
+            policy.find_binding_for_role(_ROLE).members, {"b", "c"}
+        )
+        self.assertEqual(policy.etag, "e0")
+
+    def test_noop(self):
+        policy = _policy("a")
+        self.assertIs(
+            iam.apply_binding_changes(policy, [_add("a"), _remove("b")]),
+            policy,
+        )
+
+    def test_remove_last_member(self):
+        policy = iam.apply_binding_changes(_policy("a"), [_remove("a")])
+        self.assertEmpty(policy.bindings)
+
+
+class ServiceAccountPolicyBatcherTest(absltest.TestCase):
+    def test_noop_grant_uses_cached_policy(self):
+        fake_iam = FakeIam(_policy())
+        batcher = iam.ServiceAccountPolicyBatcher(_ACCOUNT)
+        batcher.apply(fake_iam, _add("a"))
+        batcher.apply(fake_iam, _add("a"))
+        self.assertEqual(fake_iam.members(), {"a"})
+        self.assertEqual(fake_iam.get_count, 1)
+        self.assertEqual(fake_iam.set_count, 1)
+
+    def test_concurrent_changes_batched(self):
+        fake_iam = FakeIam(_policy("old"))
+        batcher = iam.ServiceAccountPolicyBatcher(_ACCOUNT)
+        # The first change is written while the others are pending.
+        fake_iam.set_can_finish.clear()
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(batcher.apply, fake_iam, _add("a"))
+            fake_iam.set_started.wait()
+            pending = [
+                executor.submit(batcher.apply, fake_iam, change)
+                for change in (_add("b"), _add("c"), _remove("old"))
+            ]
+            while len(batcher._pending) < len(pending):
+                time.sleep(0.01)
+            fake_iam.set_can_finish.set()
+            for future in [first, *pending]:
+                future.result()
+
+        self.assertEqual(fake_iam.members(), {"a", "b", "c"})
+        self.assertEqual(fake_iam.get_count, 1)
+        self.assertEqual(fake_iam.set_count, 2)
+
+    def test_conflict_merged(self):
+        fake_iam = FakeIam(_policy())
+        batcher = iam.ServiceAccountPolicyBatcher(_ACCOUNT)
+        batcher.apply(fake_iam, _add("a"))
+        # Changed elsewhere: the cached policy is stale.
+        fake_iam.policy = dataclasses.replace(
+            iam.apply_binding_changes(fake_iam.policy, [_add("other")]),
+            etag="elsewhere",
+        )
+        batcher.apply(fake_iam, _add("b"))
+        self.assertEqual(fake_iam.members(), {"a", "b", "other"})
+        self.assertEqual(fake_iam.get_count, 2)
+
+    def test_error_raised(self):
+        fake_iam = FakeIam(_policy())
+        fake_iam.get_service_account_iam_policy = _raise_value_error
+        batcher = iam.ServiceAccountPolicyBatcher(_ACCOUNT)
+        with self.assertRaises(ValueError):
+            batcher.apply(fake_iam, _add("a"))
+        self.assertFalse(batcher._running)
+
+    def test_interrupted(self):
+        fake_iam = FakeIam(_policy())
+        batcher = iam.ServiceAccountPolicyBatcher(_ACCOUNT)
+        fake_iam.set_can_finish.clear()
+        with futures.ThreadPoolExecutor(max_workers=2) as executor:
+            with mock.patch.object(
+                fake_iam,
+                "set_service_account_iam_policy",
+                side_effect=_interrupt_when_released(fake_iam),
+            ):
+                first = executor.submit(batcher.apply, fake_iam, _add("a"))
+                fake_iam.set_started.wait()
+                pending = executor.submit(batcher.apply, fake_iam, _add("b"))
+                while not batcher._pending:
+                    time.sleep(0.01)
+                fake_iam.set_can_finish.set()
+                with self.assertRaises(KeyboardInterrupt):
+                    first.result()
+                with self.assertRaises(futures.CancelledError):
+                    pending.result()
+
+        self.assertFalse(batcher._running)
+        self.assertEmpty(batcher._pending)
+        # The next change isn't blocked.
+        batcher.apply(fake_iam, _add("c"))
+        self.assertEqual(fake_iam.members(), {"c"})
+
+
+class GetPolicyBatcherTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.enter_context(mock.patch.object(iam, "_policy_batchers", {}))
+
+    def test_new_client_used(self):
+        first_iam = FakeIam(_policy())
+        batcher = iam.get_policy_batcher(first_iam, _ACCOUNT)
+        batcher.apply(first_iam, _add("a"))
+        # F.e. the client of the next test, with the policy changed since.
+        first_iam.closed = True
+        second_iam = FakeIam(_policy("other"))
+        self.assertIs(iam.get_policy_batcher(second_iam, _ACCOUNT), batcher)
+        batcher.apply(second_iam, _add("b"))
+        self.assertEqual(second_iam.members(), {"other", "b"})
+        self.assertEqual(first_iam.members(), {"a"})
+
+
+def _raise_value_error(account: str):
+    raise ValueError(account)
+
+
+def _interrupt_when_released(fake_iam: FakeIam):
+    def set_policy(account: str, policy: iam.Policy):
+        del account, policy
+        fake_iam.set_started.set()
+        fake_iam.set_can_finish.wait()
+        raise KeyboardInterrupt
+
+    return set_policy
+
+
+if __name__ == "__main__":
+    absltest.main()
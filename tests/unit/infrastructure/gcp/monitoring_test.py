@@ -0,0 +1,142 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import collections
+import datetime as dt
+import threading
+
+from absl.testing import absltest
+from google.cloud import monitoring_v3
+
+from framework.infrastructure.gcp import monitoring
+
+_PROJECT = "fake-project"
+_INTERVAL = monitoring_v3.TimeInterval(
+    start_time={"seconds": 1000}, end_time={"seconds": 1090}
+)
+
+
+def _query(metric: str) -> monitoring.MetricQuery:
+    return monitoring.MetricQuery(metric, f'metric.type = "{metric}"')
+
+
+class FakeMetricClient:
+    """Finds the metrics after the given number of requests."""
+
+    def __init__(self, found_after: dict[str, int], barrier_parties: int = 0):
+        self.found_after = found_after
+        self.requests = collections.Counter()
+        self._lock = threading.Lock()
+        self._barrier = (
+            threading.Barrier(barrier_parties, timeout=5)
+            if barrier_parties
+            else None
+        )
+
+    def list_time_series(self, *, name, filter, interval, view, retry):
+        del name, interval, view, retry
+        if self._barrier:
+            # Fails unless the requests are sent concurrently.
+            self._barrier.wait()
+        metric = filter.split('"')[1]
+        with self._lock:
+            self.requests[metric] += 1
+            if self.requests[metric] < self.found_after[metric]:
+                return iter([])
+        return iter([monitoring_v3.TimeSeries(metric={"type": metric})])
+
+
+class MetricQueryEngineTest(absltest.TestCase):
+    def _engine(self, client: FakeMetricClient, **kwargs):
+        return monitoring.MetricQueryEngine(
+            client,
+            _PROJECT,
+            empty_retry_wait=dt.timedelta(0),
+            **kwargs,
+        )
+
+    def test_concurrent(self):
+        metrics = [f"metric-{i}" for i in range(4)]
+        client = FakeMetricClient(dict.fromkeys(metrics, 1), barrier_parties=4)
+        results = self._engine(client, max_workers=4).query(
+            [_query(metric) for metric in metrics], _INTERVAL
+        )
+        self.assertEqual([q.metric for q in results], metrics)
+        for time_series in results.values():
+            self.assertLen(time_series, 1)
+
+    def test_retries_only_empty(self):
+        client = FakeMetricClient({"found": 1, "late": 3, "missing": 100})
+        results = self._engine(client).query(
+            [_query("found"), _query("late"), _query("missing")], _INTERVAL
+        )
+        self.assertLen(results[_query("found")], 1)
+        self.assertLen(results[_query("late")], 1)
+        self.assertEmpty(results[_query("missing")])
+        self.assertEqual(client.requests, {"found": 1, "late": 3, "missing": 3})
+
+    def test_cached(self):
+        client = FakeMetricClient({"found": 1})
+        engine = self._engine(client)
+        engine.query([_query("found")], _INTERVAL)
+        engine.query([_query("found")], _INTERVAL)
+        self.assertEqual(client.requests["found"], 1)
+
+        other_interval = monitoring_v3.TimeInterval(
+            start_time={"seconds": 1000}, end_time={"seconds": 1100}
+        )
+        engine.query([_query("found")], other_interval)
+        self.assertEqual(client.requests["found"], 2)
+
+        engine.clear_cache()
+        engine.query([_query("found")], _INTERVAL)
+        self.assertEqual(client.requests["found"], 3)
+
+
+class BuildMetricQueriesTest(absltest.TestCase):
+    def test_namespaces(self):
+        queries = monitoring.build_metric_queries(
+            client_namespace="client-ns",
+            server_namespace="server-ns",
+            histogram_filter_fn=lambda metric, ns, remote_ns: (
+                f"histogram {metric} {ns} {remote_ns}"
+            ),
+            counter_filter_fn=lambda metric, ns, remote_ns: (
+                f"counter {metric} {ns} {remote_ns}"
+            ),
+            histogram_client_metrics=["client/duration"],
+            histogram_server_metrics=["server/duration", "server/size"],
+            counter_client_metrics=["client/started"],
+        )
+        self.assertEqual(
+            [(query.metric, query.filter) for query in queries],
+            [
+                (
+                    "server/duration",
+                    "histogram server/duration server-ns client-ns",
+                ),
+                ("server/size", "histogram server/size server-ns client-ns"),
+                (
+                    "client/duration",
+                    "histogram client/duration client-ns server-ns",
+                ),
+                (
+                    "client/started",
+                    "counter client/started client-ns server-ns",
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
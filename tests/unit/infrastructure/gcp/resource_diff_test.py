@@ -0,0 +1,200 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from absl.testing import absltest
+
+from framework.infrastructure.gcp import resource_diff
+
+_COMPUTE_URL = "https://www.googleapis.com/compute/v1"
+_BACKEND_SERVICE = "projects/p/global/backendServices/bs"
+_URL_MAP = {
+    "kind": "compute#urlMap",
+    "id": "1234",
+    "selfLink": f"{_COMPUTE_URL}/projects/p/global/urlMaps/um",
+    "fingerprint": "abc=",
+    "name": "um",
+    "defaultService": f"{_COMPUTE_URL}/{_BACKEND_SERVICE}",
+    "hostRules": [{"hosts": ["host:8080"], "pathMatcher": "pm"}],
+    "pathMatchers": [
+        {
+            "name": "pm",
+            "defaultService": f"{_COMPUTE_URL}/{_BACKEND_SERVICE}",
+            "routeRules": [{"priority": 0, "service": _BACKEND_SERVICE}],
+        }
+    ],
+}
+
+
+class ChangedFieldsTest(absltest.TestCase):
+    def _desired(self, **fields):
+        return {
+            "name": "um",
+            "defaultService": _BACKEND_SERVICE,
+            "hostRules": [{"hosts": ["host:8080"], "pathMatcher": "pm"}],
+            "pathMatchers": [
+                {
+                    "name": "pm",
+                    "defaultService": _BACKEND_SERVICE,
+                    "routeRules": [
+                        {"priority": 0, "service": _BACKEND_SERVICE}
+                    ],
+                }
+            ],
+            **fields,
+        }
+
+    def test_unchanged(self):
+        # The output-only fields and the full URLs don't count.
+        self.assertEmpty(
+            resource_diff.changed_fields(_URL_MAP, self._desired())
+        )
+
+    def test_empty_fields_omitted_by_api(self):
+        self.assertEmpty(
+            resource_diff.changed_fields(
+                _URL_MAP, self._desired(description="", tests=[])
+            )
+        )
+
+    def test_defaults_omitted_by_api(self):
+        desired = self._desired(
+            validateForProxyless=False,
+            priority=0,
+            defaultRouteAction={"retryPolicy": {"numRetries": 0}},
+        )
+        self.assertEmpty(resource_diff.changed_fields(_URL_MAP, desired))
+        desired = self._desired(
+            validateForProxyless=True,
+            defaultRouteAction={"retryPolicy": {"numRetries": 1}},
+        )
+        self.assertEqual(
+            resource_diff.changed_fields(_URL_MAP, desired),
+            ["validateForProxyless", "defaultRouteAction"],
+        )
+
+    def test_changed_nested_field(self):
+        desired = self._desired()
+        desired["hostRules"][0]["hosts"] = ["host:8081"]
+        self.assertEqual(
+            resource_diff.changed_fields(_URL_MAP, desired),
+            ["hostRules[0].hosts[0]"],
+        )
+
+    def test_list_length_changed(self):
+        desired = self._desired()
+        desired["pathMatchers"][0]["routeRules"].append(
+            {"priority": 1, "service": _BACKEND_SERVICE}
+        )
+        self.assertEqual(
+            resource_diff.changed_fields(_URL_MAP, desired),
+            ["pathMatchers[0].routeRules"],
+        )
+
+    def test_stale_list_item_fields(self):
+        # The patch replaces the lists, so the fields left out are cleared.
+        route_rule = {
+            "priority": 0,
+            "service": _BACKEND_SERVICE,
+            "headerAction": {"requestHeadersToAdd": [{"headerName": "h"}]},
+            "matchRules": [
+                {
+                    "prefixMatch": "/",
+                    "headerMatches": [{"headerName": "h", "exactMatch": "v"}],
+                    "ignoreCase": False,
+                }
+            ],
+        }
+        current = {
+            **_URL_MAP,
+            "pathMatchers": [
+                {**_URL_MAP["pathMatchers"][0], "routeRules": [route_rule]}
+            ],
+        }
+        desired = self._desired()
+        desired["pathMatchers"][0]["routeRules"][0]["matchRules"] = [
+            {"prefixMatch": "/"}
+        ]
+        self.assertEqual(
+            resource_diff.changed_fields(current, desired),
+            [
+                "pathMatchers[0].routeRules[0].matchRules[0].headerMatches",
+                "pathMatchers[0].routeRules[0].headerAction",
+            ],
+        )
+
+    def test_added_field(self):
+        self.assertEqual(
+            resource_diff.changed_fields(
+                _URL_MAP, self._desired(description="new")
+            ),
+            ["description"],
+        )
+
+    def test_int64_as_string(self):
+        self.assertEmpty(
+            resource_diff.changed_fields(
+                {"maxRequests": "100"}, {"maxRequests": 100}
+            )
+        )
+        self.assertEqual(
+            resource_diff.changed_fields({"enable": True}, {"enable": "True"}),
+            ["enable"],
+        )
+
+
+class UnmanagedFieldsTest(absltest.TestCase):
+    def test_output_only_ignored(self):
+        desired = {"defaultService": _BACKEND_SERVICE}
+        current = {**_URL_MAP, "hostRules": [], "pathMatchers": []}
+        del current["name"]
+        self.assertEmpty(resource_diff.unmanaged_fields(current, desired))
+
+    def test_not_desired(self):
+        current = {
+            **_URL_MAP,
+            "defaultRouteAction": {"maxStreamDuration": {"seconds": "5"}},
+            "description": "stale",
+            "tests": [],
+        }
+        desired = {"name": "um", "defaultService": _BACKEND_SERVICE}
+        self.assertEqual(
+            resource_diff.unmanaged_fields(current, desired),
+            ["defaultRouteAction", "description", "hostRules", "pathMatchers"],
+        )
+
+    def test_network_services_route(self):
+        current = {
+            "name": "projects/p/locations/global/grpcRoutes/route",
+            "createTime": "2026-01-01T00:00:00Z",
+            "updateTime": "2026-01-01T00:00:00Z",
+            "hostnames": ["host:8080"],
+            "gateways": ["projects/p/locations/global/gateways/gw"],
+        }
+        self.assertEqual(
+            resource_diff.unmanaged_fields(current, {"hostnames": ["a"]}),
+            ["gateways"],
+        )
+
+
+class TopLevelFieldsTest(absltest.TestCase):
+    def test_top_level_fields(self):
+        self.assertEqual(
+            resource_diff.top_level_fields(
+                ["rules[0].action", "hostnames", "rules[1]", "meshes[0]"]
+            ),
+            ["hostnames", "meshes", "rules"],
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,109 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent import futures
+import threading
+from unittest import mock
+
+from absl.testing import absltest
+from absl.testing import flagsaver
+import google.auth.credentials
+import httplib2
+
+from framework.helpers import rate_limiter
+from framework.infrastructure import gcp
+from framework.infrastructure.gcp import fake_api_server
+from framework.infrastructure.gcp import transport
+
+_PROJECT = "fake-project"
+_THREADS = 8
+
+
+def _fake_http(status: int) -> mock.Mock:
+    http = mock.Mock()
+    http.request.return_value = (httplib2.Response({"status": status}), b"")
+    return http
+
+
+class ThreadLocalHttpTest(absltest.TestCase):
+    def test_http_per_thread(self):
+        http = transport.ThreadLocalHttp(mock.Mock)
+        main_http = http.thread_http()
+        self.assertIs(http.thread_http(), main_http)
+
+        with futures.ThreadPoolExecutor(max_workers=2) as executor:
+            barrier = threading.Barrier(2)
+
+            def worker_http():
+                barrier.wait()
+                return http.thread_http()
+
+            worker_https = list(executor.map(lambda _: worker_http(), range(2)))
+
+        self.assertLen({id(h) for h in [main_http, *worker_https]}, 3)
+
+    def test_request_uses_thread_http(self):
+        http = transport.ThreadLocalHttp(lambda: _fake_http(200))
+        http.request("https://example.com", method="POST", body="{}")
+        http.thread_http().request.assert_called_once_with(
+            "https://example.com", method="POST", body="{}", headers=None
+        )
+
+    @flagsaver.flagsaver(api_max_qps=10)
+    def test_rate_limited(self):
+        http = transport.ThreadLocalHttp(lambda: _fake_http(429))
+        http.request("https://transport-test.googleapis.com/v1/a")
+        limiter = rate_limiter.get_rate_limiter("transport-test.googleapis.com")
+        self.assertEqual(limiter.throttled_count, 1)
+        self.assertEqual(limiter.rate, 5)
+
+    def test_close_all(self):
+        http = transport.ThreadLocalHttp(mock.Mock)
+        main_http = http.thread_http()
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            worker_http = executor.submit(http.thread_http).result()
+            # Closed through the API resource, see discovery.Resource.close.
+            http.http.close()
+        main_http.close.assert_called_once()
+        worker_http.close.assert_called_once()
+
+
+class ConcurrentApiRequestsTest(absltest.TestCase):
+    def test_shared_api_resource(self):
+        with fake_api_server.FakeGcpApiServer() as server:
+            api_manager = gcp.api.GcpApiManager(
+                v1_discovery_uri=server.v1_discovery_uri,
+                v2_discovery_uri=server.v2_discovery_uri,
+                credentials=google.auth.credentials.AnonymousCredentials(),
+            )
+            self.addCleanup(api_manager.close)
+            compute = api_manager.compute("v1")
+
+            def insert_and_get(i: int) -> str:
+                compute.firewalls().insert(
+                    project=_PROJECT, body={"name": f"fw-{i}"}
+                ).execute()
+                return (
+                    compute.firewalls()
+                    .get(project=_PROJECT, firewall=f"fw-{i}")
+                    .execute()["name"]
+                )
+
+            with futures.ThreadPoolExecutor(max_workers=_THREADS) as executor:
+                names = list(executor.map(insert_and_get, range(_THREADS * 4)))
+
+        self.assertEqual(names, [f"fw-{i}" for i in range(_THREADS * 4)])
+
+
+if __name__ == "__main__":
+    absltest.main()
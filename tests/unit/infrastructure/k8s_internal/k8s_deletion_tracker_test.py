@@ -0,0 +1,146 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime as dt
+import threading
+from typing import Optional
+
+from absl.testing import absltest
+
+from framework.infrastructure.k8s_internal import k8s_deletion_tracker
+
+_LOGGER = k8s_deletion_tracker.logger.name
+_FAST_POLL = dt.timedelta(milliseconds=10)
+_NEVER_POLL = dt.timedelta(hours=1)
+_WAIT = dt.timedelta(seconds=5)
+_NO_WAIT = dt.timedelta(milliseconds=50)
+
+
+class FakeNamespace:
+    """A namespace deleted by the k8s API server in the background."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.deleted = threading.Event()
+        self.get_error: Optional[Exception] = None
+
+    def get(self) -> Optional[str]:
+        if self.get_error:
+            error, self.get_error = self.get_error, None
+            raise error
+        return None if self.deleted.is_set() else self.name
+
+
+class DeletionTrackerTest(absltest.TestCase):
+    def _tracker(self, poll_interval: dt.timedelta = _FAST_POLL):
+        tracker = k8s_deletion_tracker.DeletionTracker(poll_interval)
+        self.addCleanup(tracker.shutdown)
+        return tracker
+
+    def _track(
+        self,
+        tracker: k8s_deletion_tracker.DeletionTracker,
+        namespace: FakeNamespace,
+        timeout: dt.timedelta = _WAIT,
+    ) -> k8s_deletion_tracker.PendingDeletion:
+        # Same as KubernetesBaseRunner hands off the namespace deletion.
+        return tracker.track(
+            "namespace",
+            namespace.name,
+            namespace.name,
+            is_deleted=lambda: namespace.get() is None,
+            timeout=timeout,
+        )
+
+    def _wait_if_pending(self, tracker, namespace, timeout=_WAIT) -> bool:
+        return tracker.wait_if_pending(
+            "namespace", namespace.name, namespace.name, timeout
+        )
+
+    def test_confirmed_by_poll(self):
+        tracker = self._tracker()
+        namespace = FakeNamespace("psm-server-a")
+        deletion = self._track(tracker, namespace)
+        self.assertEqual(tracker.pending(), [deletion])
+        self.assertEqual(str(deletion), "namespace psm-server-a")
+
+        # Still terminating.
+        self.assertFalse(self._wait_if_pending(tracker, namespace, _NO_WAIT))
+
+        namespace.deleted.set()
+        self.assertTrue(self._wait_if_pending(tracker, namespace))
+        self.assertTrue(deletion.done.is_set())
+        self.assertEmpty(tracker.pending())
+
+    def test_not_pending(self):
+        tracker = self._tracker()
+        self.assertTrue(
+            tracker.wait_if_pending("deployment", "ns", "name", _NO_WAIT)
+        )
+        # Nothing tracked, nothing polled.
+        self.assertIsNone(tracker._thread)
+
+    def test_poll_error_retried(self):
+        tracker = self._tracker()
+        namespace = FakeNamespace("psm-server-a")
+        namespace.get_error = RuntimeError("API unavailable")
+        namespace.deleted.set()
+        self._track(tracker, namespace)
+        self.assertTrue(self._wait_if_pending(tracker, namespace))
+        self.assertIsNone(namespace.get_error)
+
+    def test_overdue_reported_once(self):
+        tracker = self._tracker(_NEVER_POLL)
+        namespace = FakeNamespace("psm-server-a")
+        deletion = self._track(tracker, namespace, timeout=dt.timedelta(-1))
+        with self.assertLogs(_LOGGER, "WARNING") as logs:
+            tracker._poll()
+            tracker._poll()
+        self.assertTrue(deletion.reported_overdue)
+        self.assertLen(logs.records, 1)
+        self.assertIn("still pending", logs.output[0])
+
+    def test_tracked_again(self):
+        tracker = self._tracker(_NEVER_POLL)
+        namespace = FakeNamespace("psm-server-a")
+        first = self._track(tracker, namespace)
+        second = self._track(tracker, namespace)
+        self.assertEqual(tracker.pending(), [second])
+
+        namespace.deleted.set()
+        tracker._poll()
+        self.assertFalse(first.done.is_set())
+        self.assertTrue(second.done.is_set())
+
+    def test_shutdown(self):
+        tracker = self._tracker(_NEVER_POLL)
+        deleted = FakeNamespace("psm-server-a")
+        straggler = FakeNamespace("psm-client-a")
+        self._track(tracker, deleted)
+        self._track(tracker, straggler)
+        deleted.deleted.set()
+
+        with self.assertLogs(_LOGGER, "WARNING") as logs:
+            tracker.shutdown()
+        self.assertFalse(tracker._thread.is_alive())
+        # The final poll confirms the deleted one.
+        self.assertEqual(
+            [deletion.name for deletion in tracker.pending()],
+            ["psm-client-a"],
+        )
+        self.assertLen(logs.records, 1)
+        self.assertIn("namespace psm-client-a not confirmed", logs.output[0])
+
+
+if __name__ == "__main__":
+    absltest.main()
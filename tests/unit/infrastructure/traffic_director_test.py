@@ -0,0 +1,218 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import copy
+import functools
+
+from absl.testing import absltest
+import google.auth.credentials
+
+from framework.infrastructure import gcp
+from framework.infrastructure import traffic_director
+from framework.infrastructure.gcp import compute
+from framework.infrastructure.gcp import fake_api_server
+
+GcpResource = compute.ComputeV1.GcpResource
+_PROJECT = "fake-project"
+_SUFFIX = "env0"
+_BACKEND_SERVICE = GcpResource(
+    f"psm-test-backend-service-{_SUFFIX}", "url/backend-service"
+)
+_HEALTH_CHECK = GcpResource(f"psm-test-health-check-{_SUFFIX}", "url/hc")
+
+
+class FakeCompute:
+    def __init__(self):
+        self.calls: list[tuple[str, str]] = []
+
+    def delete_backend_service(self, name: str):
+        self.calls.append(("delete_backend_service", name))
+
+    def delete_health_check(self, name: str):
+        self.calls.append(("delete_health_check", name))
+
+    def backend_service_remove_all_backends(self, backend_service):
+        self.calls.append(("remove_all_backends", backend_service.name))
+
+
+def _make_td() -> traffic_director.TrafficDirectorManager:
+    # Bypass the API client creation.
+    td = traffic_director.TrafficDirectorManager.__new__(
+        traffic_director.TrafficDirectorManager
+    )
+    td.compute = FakeCompute()
+    td.resource_prefix = "psm-test"
+    td.resource_suffix = _SUFFIX
+    td.health_check = _HEALTH_CHECK
+    td.backend_service = _BACKEND_SERVICE
+    td.backends = set()
+    td.adopt_pooled_resources(
+        health_check=_HEALTH_CHECK,
+        health_check_port=8081,
+        backend_service=_BACKEND_SERVICE,
+    )
+    return td
+
+
+class PooledResourcesTest(absltest.TestCase):
+    def test_kept(self):
+        td = _make_td()
+        td.delete_backend_service()
+        td.delete_health_check()
+        self.assertEqual(
+            td.compute.calls,
+            [("remove_all_backends", _BACKEND_SERVICE.name)],
+        )
+        self.assertFalse(td.pooled_resources_released)
+
+    def test_force_deleted(self):
+        td = _make_td()
+        td.delete_backend_service(force=True)
+        td.delete_health_check(force=True)
+        self.assertEqual(
+            td.compute.calls,
+            [
+                ("delete_backend_service", _BACKEND_SERVICE.name),
+                ("delete_health_check", _HEALTH_CHECK.name),
+            ],
+        )
+        self.assertIsNone(td.pooled_backend_service)
+        self.assertIsNone(td.pooled_health_check)
+        self.assertTrue(td.pooled_resources_released)
+
+
+class AdoptExistingResourcesTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = fake_api_server.FakeGcpApiServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        api_manager = gcp.api.GcpApiManager(
+            v1_discovery_uri=self.server.v1_discovery_uri,
+            v2_discovery_uri=self.server.v2_discovery_uri,
+            credentials=google.auth.credentials.AnonymousCredentials(),
+        )
+        self.addCleanup(api_manager.close)
+        self.compute = gcp.compute.ComputeV1(api_manager, _PROJECT)
+        self.netsvc = gcp.network_services.NetworkServicesV1(
+            api_manager, _PROJECT
+        )
+        self.td = traffic_director.TrafficDirectorManager.__new__(
+            traffic_director.TrafficDirectorManager
+        )
+        self.td.compute = self.compute
+
+    def _patch_count(self) -> int:
+        return self.server.request_counts["PATCH compute"]
+
+    def test_url_map_unmanaged_fields_cleared(self):
+        desired = {
+            "name": "url-map",
+            "defaultService": "global/backendServices/bs",
+        }
+        self.compute.create_url_map_with_content(
+            {
+                **desired,
+                "description": "left by another test",
+                "defaultRouteAction": {"maxStreamDuration": {"seconds": "5"}},
+            }
+        )
+
+        self.td.create_url_map_with_content(desired)
+        url_map = self.compute.get_url_map("url-map")
+        self.assertNotIn("description", url_map)
+        self.assertNotIn("defaultRouteAction", url_map)
+        self.assertEqual(url_map["defaultService"], desired["defaultService"])
+        self.assertEqual(self._patch_count(), 1)
+
+        # Up to date now.
+        self.td.create_url_map_with_content(desired)
+        self.assertEqual(self._patch_count(), 1)
+
+    def test_url_map_defaults_not_patched(self):
+        self.compute.create_url_map_with_content(
+            {"name": "url-map", "defaultService": "global/backendServices/bs"}
+        )
+        # The API omits the fields with the default values.
+        self.td.create_url_map_with_content(
+            {
+                "name": "url-map",
+                "defaultService": "global/backendServices/bs",
+                "defaultRouteAction": {"retryPolicy": {"numRetries": 0}},
+            }
+        )
+        self.assertEqual(self._patch_count(), 0)
+
+    def test_patch_url_map_stale_fields_cleared(self):
+        self.td.resource_prefix = "prefix"
+        self.td.resource_suffix = ""
+        backend_service = GcpResource("bs", "global/backendServices/bs")
+        body = self.td._generate_url_map_body(
+            "prefix-url-map",
+            "prefix-path-matcher",
+            ["host:8080"],
+            backend_service,
+        )
+        route_rule = {
+            "priority": 0,
+            "service": backend_service.url,
+            "headerAction": {"requestHeadersToRemove": ["h"]},
+        }
+        stale = copy.deepcopy(body)
+        stale["pathMatchers"][0]["routeRules"] = [route_rule]
+        stale["description"] = "left by another test"
+        self.td.url_map = self.compute.create_url_map_with_content(stale)
+
+        self.td.patch_url_map("host", 8080, backend_service)
+        url_map = self.compute.get_url_map("prefix-url-map")
+        self.assertNotIn("description", url_map)
+        self.assertNotIn("routeRules", url_map["pathMatchers"][0])
+        self.assertEqual(self._patch_count(), 1)
+
+        # Up to date now.
+        self.td.patch_url_map("host", 8080, backend_service)
+        self.assertEqual(self._patch_count(), 1)
+
+    def test_route_unmanaged_fields_cleared(self):
+        self.netsvc.create_grpc_route(
+            "route",
+            {
+                "hostnames": ["host:8080"],
+                "gateways": ["projects/p/locations/global/gateways/gw"],
+            },
+        )
+        desired = {"hostnames": ["host:8080"]}
+        create_or_patch = functools.partial(
+            traffic_director.TrafficDirectorAppNetManager._create_or_patch_route,
+            "GrpcRoute",
+            "route",
+            desired,
+            get_body_fn=self.netsvc.get_grpc_route_body,
+            create_fn=self.netsvc.create_grpc_route,
+            patch_fn=self.netsvc.patch_grpc_route,
+        )
+        create_or_patch()
+        route = self.netsvc.get_grpc_route_body("route")
+        self.assertNotIn("gateways", route)
+        self.assertEqual(route["hostnames"], ["host:8080"])
+        patches = self.server.request_counts["PATCH networkservices"]
+        self.assertEqual(patches, 1)
+
+        create_or_patch()
+        self.assertEqual(
+            self.server.request_counts["PATCH networkservices"], patches
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
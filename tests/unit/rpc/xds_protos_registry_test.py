@@ -0,0 +1,143 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import pathlib
+import subprocess
+import sys
+
+from absl.testing import absltest
+from envoy.config.listener.v3 import listener_pb2
+from envoy.extensions.filters.network.http_connection_manager.v3 import (
+    http_connection_manager_pb2,
+)
+from envoy.service.status.v3 import csds_pb2
+from google.protobuf import any_pb2
+
+from framework.rpc import xds_protos_registry
+
+_LISTENER_MODULE = listener_pb2.__name__
+_HCM_MODULE = http_connection_manager_pb2.__name__
+_REPO_ROOT = pathlib.Path(__file__).parents[3]
+
+# Parses the ClientConfig from stdin in a fresh interpreter, where none of
+# the packed types are imported yet.
+_PARSE_CLIENT_CONFIG = f"""\
+import json
+import sys
+
+from google.protobuf import json_format
+
+from framework.rpc import grpc_csds
+
+modules = {[_LISTENER_MODULE, _HCM_MODULE]!r}
+config = grpc_csds.ClientConfig.FromString(sys.stdin.buffer.read())
+imported_before = [m for m in modules if m in sys.modules]
+grpc_csds.DumpedXdsConfig.from_message(config)
+imported_after = [m for m in modules if m in sys.modules]
+print(json.dumps({{
+    "imported_before": imported_before,
+    "imported_after": imported_after,
+    "config": json_format.MessageToDict(config),
+}}))
+"""
+
+
+def _pack(message) -> any_pb2.Any:
+    packed = any_pb2.Any()
+    packed.Pack(message)
+    return packed
+
+
+def _client_config(*xds_configs: any_pb2.Any) -> csds_pb2.ClientConfig:
+    config = csds_pb2.ClientConfig()
+    for xds_config in xds_configs:
+        config.generic_xds_configs.add(
+            type_url=xds_config.type_url, xds_config=xds_config
+        )
+    return config
+
+
+def _listener() -> listener_pb2.Listener:
+    hcm = http_connection_manager_pb2.HttpConnectionManager()
+    hcm.rds.route_config_name = "route-config"
+    listener = listener_pb2.Listener(name="listener")
+    listener.api_listener.api_listener.Pack(hcm)
+    return listener
+
+
+class LoadAnyTypesTest(absltest.TestCase):
+    def test_lazy_import(self):
+        config = _client_config(_pack(_listener()))
+        result = subprocess.run(
+            [sys.executable, "-c", _PARSE_CLIENT_CONFIG],
+            input=config.SerializeToString(),
+            capture_output=True,
+            cwd=_REPO_ROOT,
+            check=True,
+        )
+        parsed = json.loads(result.stdout)
+        self.assertEmpty(parsed["imported_before"])
+        # Including the type packed into the packed Listener.
+        self.assertEqual(
+            parsed["imported_after"], [_LISTENER_MODULE, _HCM_MODULE]
+        )
+        listener = parsed["config"]["genericXdsConfigs"][0]["xdsConfig"]
+        self.assertEqual(listener["name"], "listener")
+        self.assertEqual(
+            listener["apiListener"]["apiListener"]["rds"]["routeConfigName"],
+            "route-config",
+        )
+
+    def test_unknown_type_url(self):
+        unknown = any_pb2.Any(
+            type_url="type.googleapis.com/example.v1.Unknown", value=b"\x08\x01"
+        )
+        config = _client_config(unknown, _pack(_listener()))
+        # Skipped, the rest of the types are still loaded.
+        xds_protos_registry.load_any_types(config)
+        self.assertFalse(xds_protos_registry.import_type("example.v1.Unknown"))
+        listener = listener_pb2.Listener()
+        self.assertTrue(
+            config.generic_xds_configs[1].xds_config.Unpack(listener)
+        )
+        self.assertEqual(listener.name, "listener")
+
+    def test_empty_type_url(self):
+        config = _client_config(any_pb2.Any())
+        xds_protos_registry.load_any_types(config)
+
+
+class ImportTypeTest(absltest.TestCase):
+    def test_already_imported(self):
+        self.assertTrue(
+            xds_protos_registry.import_type("envoy.config.listener.v3.Listener")
+        )
+
+    def test_nested_type(self):
+        self.assertEqual(
+            xds_protos_registry._find_module(
+                "envoy.config.listener.v3.Listener.ConnectionBalanceConfig"
+            ),
+            _LISTENER_MODULE,
+        )
+
+    def test_unknown(self):
+        self.assertIsNone(
+            xds_protos_registry._find_module("example.v1.Unknown")
+        )
+        self.assertFalse(xds_protos_registry.import_type("example.v1.Unknown"))
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,527 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime as dt
+import json
+import threading
+from typing import Optional
+from unittest import mock
+
+from absl.testing import absltest
+from absl.testing import parameterized
+import dateutil.parser
+import google.auth.credentials
+
+from bin.cleanup import cleanup
+from framework.helpers import retryers
+from framework.infrastructure import gcp
+from framework.infrastructure.gcp import fake_api_server
+
+CleanupRecord = cleanup.CleanupRecord
+_PROJECT = "fake-project"
+_KINDS = {kind.kind: kind for kind in cleanup.TD_RESOURCE_KINDS}
+_PREFIXES = [cleanup.PSM_INTEROP_PREFIX, cleanup.URL_MAP_TEST_PREFIX]
+_OLD = "2026-01-01T00:00:00.000-07:00"
+_NEW = "2026-01-02T00:00:00.000-07:00"
+
+
+class FakeTask:
+    """Tracks how many tasks run at the same time."""
+
+    def __init__(
+        self,
+        tracker: "ConcurrencyTracker",
+        *,
+        status: Optional[str] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.tracker = tracker
+        self.status = status
+        self.error = error
+
+    def __call__(self) -> Optional[str]:
+        with self.tracker:
+            if self.error:
+                raise self.error
+            return self.status
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def __enter__(self):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self.running -= 1
+
+
+def _fail():
+    raise ConnectionError("API unavailable")
+
+
+def _retry_error() -> retryers.RetryError:
+    retryer = retryers.constant_retryer(wait_fixed=dt.timedelta(0), attempts=1)
+    try:
+        retryer(_fail)
+    except retryers.RetryError as err:
+        return err
+    raise AssertionError("RetryError not raised")
+
+
+class RunCleanupTasksTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.result = cleanup.CleanupResult()
+        self.enter_context(
+            mock.patch.object(cleanup, "_CLEANUP_RESULT", self.result)
+        )
+        self.tracker = ConcurrencyTracker()
+
+    def _task(self, **kwargs) -> FakeTask:
+        return FakeTask(self.tracker, **kwargs)
+
+    def test_statuses(self):
+        tasks = [
+            ("psm-a-*-deleted", self._task()),
+            ("psm-a-*-gone", self._task(status=cleanup.STATUS_NOT_FOUND)),
+            ("psm-a-*-retried", self._task(error=_retry_error())),
+            ("psm-a-*-broken", self._task(error=ValueError("bad input"))),
+        ]
+        cleanup.run_cleanup_tasks("td", iter(tasks), max_workers=2)
+
+        records = {r.name: r for r in self.result.records}
+        self.assertEqual(
+            {name: r.status for name, r in records.items()},
+            {
+                "psm-a-*-deleted": cleanup.STATUS_DELETED,
+                "psm-a-*-gone": cleanup.STATUS_NOT_FOUND,
+                "psm-a-*-retried": cleanup.STATUS_FAILED,
+                "psm-a-*-broken": cleanup.STATUS_FAILED,
+            },
+        )
+        self.assertEqual({r.kind for r in records.values()}, {"td"})
+        self.assertEqual(records["psm-a-*-broken"].error, "bad input")
+        self.assertEqual(records["psm-a-*-deleted"].error, "")
+
+        # Only the failed tasks are counted as errors.
+        self.assertEqual(self.result.error_count, 2)
+        messages = self.result.format_messages()
+        self.assertIn("Retries exhausted while cleaning up td", messages)
+        self.assertIn(
+            "Unexpected error while cleaning up td psm-a-*-broken: bad input",
+            messages,
+        )
+
+    def test_max_workers(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def task():
+            with self.tracker:
+                # Fails unless two tasks run at the same time.
+                barrier.wait()
+
+        tasks = [(f"ns-{i}", task) for i in range(6)]
+        cleanup.run_cleanup_tasks("namespace", tasks, max_workers=2)
+        self.assertEqual(self.tracker.max_running, 2)
+        self.assertEqual(self.result.error_count, 0)
+        self.assertLen(self.result.records, 6)
+
+    def test_summary(self):
+        self.result.add_record(CleanupRecord("td", "td-a", "deleted", 3.0))
+        self.result.add_record(CleanupRecord("td", "td-b", "kept"))
+        self.result.add_record(
+            CleanupRecord("namespace", "ns-a", "failed", 12.5, "timeout")
+        )
+        self.result.add_error("ns-a timeout")
+
+        self.assertEqual(
+            self.result.format_summary(20.0),
+            "\n".join(
+                [
+                    "Cleanup finished in 20.0s",
+                    "  namespace: failed=1; total time 12.5s",
+                    "  td: deleted=1, kept=1; total time 3.0s",
+                    "  Slowest:",
+                    "       12.5s namespace ns-a [failed]",
+                    "        3.0s td td-a [deleted]",
+                ]
+            ),
+        )
+
+        summary_file = self.create_tempfile("summary.json").full_path
+        cleanup.save_summary(summary_file, 20.0001)
+        with open(summary_file) as f:
+            summary = json.load(f)
+        self.assertEqual(summary["elapsed_sec"], 20.0)
+        self.assertEqual(summary["error_count"], 1)
+        self.assertEqual(
+            summary["resources"][2],
+            {
+                "kind": "namespace",
+                "name": "ns-a",
+                "status": "failed",
+                "duration_sec": 12.5,
+                "error": "timeout",
+            },
+        )
+        self.assertLen(summary["resources"], 3)
+
+
+class ListLeakedResourcesTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = fake_api_server.FakeGcpApiServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        api_manager = gcp.api.GcpApiManager(
+            v1_discovery_uri=self.server.v1_discovery_uri,
+            v2_discovery_uri=self.server.v2_discovery_uri,
+            credentials=google.auth.credentials.AnonymousCredentials(),
+        )
+        self.addCleanup(api_manager.close)
+        self.compute = gcp.compute.ComputeV1(api_manager, _PROJECT)
+        for name in (
+            "test-hc-a",
+            "psm-interop-hc-b",
+            "test-hc-c",
+            "test-template-d",
+            "my-test-hc-e",
+        ):
+            self.compute.create_health_check(
+                name, self.compute.HealthCheckProtocol.TCP
+            )
+
+    def _list_leaked(self, expire_timestamp: dt.datetime, prefixes):
+        with mock.patch.object(
+            cleanup, "get_expire_timestamp", return_value=expire_timestamp
+        ):
+            return [
+                resource["name"]
+                for resource in cleanup.list_leaked_resources(
+                    self.compute.list_health_check, prefixes
+                )
+            ]
+
+    @mock.patch.object(fake_api_server, "_DEFAULT_PAGE_SIZE", 1)
+    def test_prefixes(self):
+        expired = dt.datetime.now(dt.timezone.utc) + dt.timedelta(hours=1)
+        self.assertEqual(
+            self._list_leaked(expired, ["test-hc", "psm-interop"]),
+            ["test-hc-a", "psm-interop-hc-b", "test-hc-c"],
+        )
+        self.assertEqual(
+            self._list_leaked(expired, ["test-"]),
+            ["test-hc-a", "test-hc-c", "test-template-d"],
+        )
+        # Not listed at all.
+        list_requests = self.server.request_counts["GET compute"]
+        self.assertEmpty(self._list_leaked(expired, []))
+        self.assertEqual(
+            self.server.request_counts["GET compute"], list_requests
+        )
+
+    def test_not_expired(self):
+        not_expired = dt.datetime.now(dt.timezone.utc) - dt.timedelta(hours=1)
+        self.assertEmpty(self._list_leaked(not_expired, ["test-hc"]))
+
+
+class ParseTdResourceNameTest(parameterized.TestCase):
+    @parameterized.named_parameters(
+        (
+            "current_prefix",
+            "backend_service",
+            "psm-interop-backend-service-20260101-1200-abc12",
+            ("psm-interop", "20260101-1200-abc12"),
+        ),
+        (
+            "legacy_url_map_prefix",
+            "url_map",
+            "interop-psm-url-map-url-map-abc12",
+            ("interop-psm-url-map", "abc12"),
+        ),
+        # The longest resource names are matched first.
+        (
+            "alt_suffix",
+            "backend_service",
+            "psm-interop-backend-service-alt-abc12",
+            ("psm-interop", "abc12"),
+        ),
+        (
+            "affinity_suffix",
+            "backend_service",
+            "psm-interop-backend-service-affinity-abc12",
+            ("psm-interop", "abc12"),
+        ),
+        (
+            "ipv6_suffix",
+            "forwarding_rule",
+            "psm-interop-forwarding-rule-ipv6-abc12",
+            ("psm-interop", "abc12"),
+        ),
+        (
+            "firewall_rule",
+            "firewall_rule",
+            "psm-interop-allow-health-checks-abc12",
+            ("psm-interop", "abc12"),
+        ),
+        (
+            "netsec_policy",
+            "server_tls_policy",
+            "psm-interop-server-tls-policy-abc12",
+            ("psm-interop", "abc12"),
+        ),
+    )
+    def test_matched(self, kind, name, expected):
+        self.assertEqual(
+            cleanup.parse_td_resource_name(name, _PREFIXES, _KINDS[kind].names),
+            expected,
+        )
+
+    @parameterized.named_parameters(
+        # Created without a suffix, shared between the tests.
+        ("shared", "health_check", "psm-interop-health-check"),
+        ("shared_alt", "url_map", "psm-interop-url-map-alt"),
+        ("other_prefix", "backend_service", "psm-csm-backend-service-abc12"),
+        ("prefix_substring", "mesh", "psm-interopx-mesh-abc12"),
+        ("no_prefix", "mesh", "mesh-abc12"),
+        ("other_kind", "backend_service", "psm-interop-url-map-abc12"),
+        ("no_separator", "backend_service", "psm-interop-backend-serviceabc"),
+        ("legacy_driver", "health_check", "test-hc-abc12"),
+    )
+    def test_not_matched(self, kind, name):
+        self.assertIsNone(
+            cleanup.parse_td_resource_name(name, _PREFIXES, _KINDS[kind].names)
+        )
+
+    def test_overlapping_prefixes(self):
+        # The longest prefix is matched first.
+        self.assertEqual(
+            cleanup.parse_td_resource_name(
+                "psm-interop-url-map-url-map-abc12",
+                ["psm-interop", "psm-interop-url-map"],
+                _KINDS["url_map"].names,
+            ),
+            ("psm-interop-url-map", "abc12"),
+        )
+
+
+class FakeApi:
+    """Lists the resources by the list method name, records the deletions."""
+
+    def __init__(self, resources: dict[str, list[dict]]):
+        self.resources = resources
+        self.filters: dict[str, str] = {}
+        self.deleted: list[tuple[str, str]] = []
+
+    def __getattr__(self, method: str):
+        if method.startswith("delete_"):
+            return lambda name: self.deleted.append((method, name))
+
+        def list_fn(resource_filter=None):
+            if resource_filter:
+                self.filters[method] = resource_filter
+            return iter(self.resources.get(method, []))
+
+        return list_fn
+
+
+def _resources(time_field: str, created: str, *names: str) -> list[dict]:
+    return [{"name": name, time_field: created} for name in names]
+
+
+class TdResourceInventoryTest(absltest.TestCase):
+    def test_load(self):
+        compute = FakeApi(
+            {
+                "list_backend_service": _resources(
+                    "creationTimestamp",
+                    _OLD,
+                    "psm-interop-backend-service-a",
+                    "psm-interop-backend-service-alt-a",
+                    "psm-interop-backend-service-b",
+                    "psm-interop-backend-service",
+                ),
+                "list_url_map": _resources(
+                    "creationTimestamp",
+                    _NEW,
+                    "interop-psm-url-map-url-map-a",
+                    "psm-interop-url-map-a",
+                ),
+                "list_health_check": _resources(
+                    "creationTimestamp", _OLD, "psm-interop-health-check-b"
+                ),
+            }
+        )
+        netsvc = FakeApi(
+            {
+                # Cloud API resource names are the full paths.
+                "list_meshes": _resources(
+                    "createTime",
+                    _NEW,
+                    "projects/p/locations/global/meshes/psm-interop-mesh-a",
+                    "projects/p/locations/global/meshes/psm-csm-mesh-a",
+                ),
+            }
+        )
+        apis = cleanup.TdApis(
+            compute=compute, netsvc=netsvc, netsec=FakeApi({})
+        )
+
+        inventory = cleanup.TdResourceInventory(_PREFIXES)
+        inventory.load(apis)
+
+        self.assertEqual(
+            compute.filters["list_backend_service"],
+            'name eq "(?:psm-interop|interop-psm-url-map)-.*"',
+        )
+        # Other APIs don't support the filters.
+        self.assertEmpty(netsvc.filters)
+
+        self.assertCountEqual(
+            inventory.groups,
+            [
+                ("psm-interop", "a"),
+                ("psm-interop", "b"),
+                ("interop-psm-url-map", "a"),
+            ],
+        )
+        group_a = inventory.groups[("psm-interop", "a")]
+        self.assertEqual(group_a.name, "psm-interop-*-a")
+        self.assertEqual(
+            dict(group_a.resources),
+            {
+                "backend_service": [
+                    "psm-interop-backend-service-a",
+                    "psm-interop-backend-service-alt-a",
+                ],
+                "url_map": ["psm-interop-url-map-a"],
+                "mesh": ["psm-interop-mesh-a"],
+            },
+        )
+        # The last created resource of any kind.
+        self.assertEqual(group_a.last_created, dateutil.parser.isoparse(_NEW))
+        group_b = inventory.groups[("psm-interop", "b")]
+        self.assertEqual(
+            dict(group_b.resources),
+            {
+                "backend_service": ["psm-interop-backend-service-b"],
+                "health_check": ["psm-interop-health-check-b"],
+            },
+        )
+        self.assertEqual(group_b.last_created, dateutil.parser.isoparse(_OLD))
+
+    def test_cleanup_tasks_share_apis(self):
+        self.enter_context(
+            mock.patch.object(
+                cleanup, "_CLEANUP_RESULT", cleanup.CleanupResult()
+            )
+        )
+        self.enter_context(
+            mock.patch.object(
+                cleanup,
+                "get_expire_timestamp",
+                return_value=dateutil.parser.isoparse(_NEW),
+            )
+        )
+        self.enter_context(
+            mock.patch.object(
+                cleanup, "is_marked_as_keep_gke", return_value=False
+            )
+        )
+        compute = FakeApi(
+            {
+                "list_backend_service": _resources(
+                    "creationTimestamp",
+                    _OLD,
+                    "psm-interop-backend-service-a",
+                    "psm-interop-backend-service-b",
+                ),
+                "list_url_map": _resources(
+                    "creationTimestamp", _OLD, "psm-interop-url-map-a"
+                ),
+            }
+        )
+        apis = cleanup.TdApis(
+            compute=compute, netsvc=FakeApi({}), netsec=FakeApi({})
+        )
+        inventory = cleanup.TdResourceInventory(_PREFIXES)
+        inventory.load(apis)
+
+        with mock.patch.object(cleanup.TdApis, "create") as create:
+            for _, task in cleanup._td_inventory_cleanup_tasks(
+                False, inventory, apis
+            ):
+                task()
+        create.assert_not_called()
+        # In the dependency order.
+        self.assertEqual(
+            compute.deleted,
+            [
+                ("delete_url_map", "psm-interop-url-map-a"),
+                ("delete_backend_service", "psm-interop-backend-service-a"),
+                ("delete_backend_service", "psm-interop-backend-service-b"),
+            ],
+        )
+
+
+class LegacyTdCleanupTasksTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.enter_context(
+            mock.patch.object(
+                cleanup, "_CLEANUP_RESULT", cleanup.CleanupResult()
+            )
+        )
+
+    def test_grouped_by_suffix(self):
+        def remove_fn(**kwargs):
+            del kwargs
+
+        rules = [
+            (r"test-hc(.*)", "", lambda suffix: suffix == "-kept", remove_fn),
+            (r"test-template(.*)", "", lambda suffix: False, remove_fn),
+        ]
+        resources = [
+            {"name": "test-hc-a"},
+            {"name": "test-template-a"},
+            {"name": "test-template-b"},
+            {"name": "test-hc-kept"},
+            {"name": "other-hc-c"},
+        ]
+        tasks = list(
+            cleanup._td_cleanup_tasks(
+                False, rules, _PROJECT, "default", resources
+            )
+        )
+        self.assertEqual(
+            [(name, task.keywords["suffix"]) for name, task in tasks],
+            [("test-hc-a", "-a"), ("test-template-b", "-b")],
+        )
+        self.assertEqual(
+            [(r.name, r.status) for r in cleanup._CLEANUP_RESULT.records],
+            [
+                ("test-hc-kept", cleanup.STATUS_KEPT),
+                ("other-hc-c", cleanup.STATUS_NO_MATCH),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,286 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+from typing import Optional
+
+from absl import app
+from absl import flags
+from absl.testing import absltest
+from absl.testing import flagsaver
+
+from bin import run_tests_parallel
+
+Scheduler = run_tests_parallel.Scheduler
+TestJob = run_tests_parallel.TestJob
+
+# Prints its arguments, and waits for the .release file next to it.
+_FAKE_TEST = """\
+import pathlib
+import sys
+import time
+
+print(sys.argv[1:], flush=True)
+release = pathlib.Path(__file__).with_suffix(".release")
+while not release.exists():
+    time.sleep(0.01)
+sys.exit(0)
+"""
+
+
+class MakeJobTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.module = self.create_tempfile(
+            "baseline_test.py", content="import framework\n"
+        ).full_path
+        self.secondary_module = self.create_tempfile(
+            "failover_test.py",
+            content=(
+                "from framework import xds_k8s_flags\n"
+                "xds_k8s_flags.require_secondary_context(__file__)\n"
+            ),
+        ).full_path
+
+    @flagsaver.flagsaver(
+        project="flag-project",
+        kube_context="primary",
+        secondary_kube_context="secondary",
+    )
+    def test_from_flags(self):
+        job = run_tests_parallel._make_job(3, [f"{self.module}:Test.test_a"])
+        self.assertEqual(job.name, "03-baseline_test.Test.test_a")
+        self.assertEqual(job.test_filter, "Test.test_a")
+        self.assertEqual(job.project, "flag-project")
+        self.assertEqual(job.network, "default")
+        self.assertEqual(job.clusters, ("primary",))
+
+        job = run_tests_parallel._make_job(4, [self.secondary_module])
+        self.assertIsNone(job.test_filter)
+        self.assertEqual(job.clusters, ("primary", "secondary"))
+
+    @flagsaver.flagsaver(project="flag-project", kube_context="primary")
+    def test_test_flags_override(self):
+        job = run_tests_parallel._make_job(
+            1,
+            [
+                self.secondary_module,
+                "--project=test-project",
+                "--network=test-network",
+                "--kube_context",
+                "other",
+                "--secondary_kube_context=other-secondary",
+            ],
+        )
+        self.assertEqual(job.project, "test-project")
+        self.assertEqual(job.network, "test-network")
+        self.assertEqual(job.clusters, ("other", "other-secondary"))
+
+    def test_module_not_found(self):
+        with self.assertRaises(app.UsageError):
+            run_tests_parallel._make_job(1, ["tests/no_such_test.py"])
+
+
+class UsesSecondaryClusterTest(absltest.TestCase):
+    def test_called(self):
+        self.assertTrue(
+            run_tests_parallel.uses_secondary_cluster("tests/failover_test.py")
+        )
+
+    def test_only_mentioned(self):
+        module = self.create_tempfile(
+            content=(
+                "# Doesn't use require_secondary_context.\n"
+                "x = self.secondary_k8s_api_manager\n"
+                'y = "require_secondary_context"\n'
+            )
+        )
+        self.assertFalse(
+            run_tests_parallel.uses_secondary_cluster(module.full_path)
+        )
+
+
+class ForwardedFlagsTest(absltest.TestCase):
+    def test_forwarded(self):
+        flag_values = flags.FlagValues()
+        flags.DEFINE_string("project", None, "", flag_values=flag_values)
+        flags.DEFINE_string("unset", "default", "", flag_values=flag_values)
+        flags.DEFINE_bool("debug", True, "", flag_values=flag_values)
+        flags.DEFINE_multi_string("tag", [], "", flag_values=flag_values)
+        flags.DEFINE_integer("parallelism", 1, "", flag_values=flag_values)
+        flags.DEFINE_integer("server_xds_port", 0, "", flag_values=flag_values)
+        flag_values(
+            [
+                "prog",
+                "--project=p",
+                "--nodebug",
+                "--tag=a",
+                "--tag=b",
+                "--parallelism=3",
+                "--server_xds_port=8080",
+            ]
+        )
+        self.assertEqual(
+            run_tests_parallel.forwarded_flags(flag_values),
+            ["--project=p", "--nodebug", "--tag=a", "--tag=b"],
+        )
+
+
+class XdsPortRangeTest(absltest.TestCase):
+    def _check(self, port_range: list[str], parallelism: int) -> bool:
+        return run_tests_parallel._check_xds_port_range_size(
+            {"xds_port_range": port_range, "parallelism": parallelism}
+        )
+
+    def test_validator(self):
+        self.assertTrue(self._check(["10", "12"], 3))
+        self.assertFalse(self._check(["10", "11"], 3))
+
+    def test_allocate(self):
+        scheduler = _make_scheduler([], xds_port_range=(10, 11))
+        ports = {scheduler._allocate_xds_port("p", "n") for _ in range(2)}
+        self.assertEqual(ports, {10, 11})
+        with self.assertRaises(RuntimeError):
+            scheduler._allocate_xds_port("p", "n")
+
+    def test_allocate_skips_forwarding_rule_ports(self):
+        calls = []
+
+        def forwarding_rule_ports(project: str, network: str) -> set[int]:
+            calls.append((project, network))
+            return {9, 10, 12}
+
+        scheduler = _make_scheduler(
+            [],
+            xds_port_range=(10, 12),
+            forwarding_rule_ports_fn=forwarding_rule_ports,
+        )
+        self.assertEqual(scheduler._allocate_xds_port("p", "n"), 11)
+        self.assertEqual(calls, [("p", "n")])
+        with self.assertRaises(RuntimeError):
+            scheduler._allocate_xds_port("p", "n")
+
+
+def _make_scheduler(
+    jobs: list[TestJob],
+    *,
+    out_dir: Optional[pathlib.Path] = None,
+    xds_port_range: tuple[int, int] = (10000, 10010),
+    **kwargs,
+) -> Scheduler:
+    params = dict(
+        parallelism=3,
+        max_per_project=None,
+        max_per_cluster=None,
+        forwarding_rule_ports_fn=lambda project, network: set(),
+    )
+    params.update(kwargs)
+    return Scheduler(
+        jobs,
+        out_dir=out_dir,
+        base_flags=["--project=p"],
+        xds_port_range=xds_port_range,
+        **params,
+    )
+
+
+class SchedulerTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.dir = pathlib.Path(self.create_tempdir().full_path)
+
+    def _job(self, index: int, name: str, cluster: str) -> TestJob:
+        module = self.dir / f"{name}.py"
+        module.write_text(_FAKE_TEST)
+        return TestJob(
+            index=index,
+            module=str(module),
+            test_filter=None,
+            test_flags=[],
+            project="p",
+            network="default",
+            clusters=(cluster,),
+        )
+
+    def _finish(self, scheduler: Scheduler, *jobs: TestJob):
+        for job in jobs:
+            pathlib.Path(job.module).with_suffix(".release").touch()
+            job.process.wait(timeout=10)
+        scheduler._collect_finished()
+
+    def test_accounting(self):
+        jobs = [
+            self._job(1, "a1", "cluster-a"),
+            self._job(2, "a2", "cluster-a"),
+            self._job(3, "b1", "cluster-b"),
+        ]
+        a1, a2, b1 = jobs
+        scheduler = _make_scheduler(
+            jobs, out_dir=self.dir / "out", max_per_cluster=1
+        )
+        self.addCleanup(scheduler.terminate)
+
+        # The busy cluster-a doesn't hold up cluster-b.
+        scheduler._start_ready()
+        self.assertEqual(scheduler.running, [a1, b1])
+        self.assertEqual(list(scheduler.pending), [a2])
+        self.assertEqual(scheduler._cluster_usage["cluster-a"], 1)
+        self.assertEqual(scheduler._project_usage["p"], 2)
+        self.assertNotEqual(a1.xds_port, b1.xds_port)
+        self.assertEqual(scheduler._xds_ports_used, {a1.xds_port, b1.xds_port})
+
+        self._finish(scheduler, a1)
+        self.assertEqual(scheduler.finished, [a1])
+        self.assertTrue(a1.passed)
+        self.assertEqual(scheduler._cluster_usage["cluster-a"], 0)
+        self.assertEqual(scheduler._xds_ports_used, {b1.xds_port})
+
+        scheduler._start_ready()
+        self.assertEqual(scheduler.running, [b1, a2])
+        self._finish(scheduler, a2, b1)
+        self.assertEmpty(scheduler.running)
+        self.assertEqual(scheduler._project_usage["p"], 0)
+        self.assertEmpty(scheduler._xds_ports_used)
+
+        args = a1.log_file.read_text()
+        self.assertIn("'--project=p'", args)
+        self.assertIn(f"'--server_xds_port={a1.xds_port}'", args)
+        self.assertIn(f"'--xml_output_file={a1.xml_file}'", args)
+
+    @flagsaver.as_parsed(server_xds_port="0")
+    def test_xds_port_picked_by_test(self):
+        job = self._job(1, "t1", "cluster")
+        scheduler = _make_scheduler([job], out_dir=self.dir / "out")
+        self.addCleanup(scheduler.terminate)
+        scheduler._start_ready()
+        self._finish(scheduler, job)
+        self.assertIsNone(job.xds_port)
+        self.assertIn("'--server_xds_port=0'", job.log_file.read_text())
+
+    def test_max_per_project(self):
+        jobs = [self._job(i, f"t{i}", f"cluster-{i}") for i in range(3)]
+        scheduler = _make_scheduler(
+            jobs, out_dir=self.dir / "out", max_per_project=2
+        )
+        self.addCleanup(scheduler.terminate)
+        scheduler._start_ready()
+        self.assertLen(scheduler.running, 2)
+        self.assertLen(scheduler.pending, 1)
+        self._finish(scheduler, *list(scheduler.running))
+        scheduler._start_ready()
+        self.assertLen(scheduler.running, 1)
+        self._finish(scheduler, *list(scheduler.running))
+
+
+if __name__ == "__main__":
+    absltest.main()
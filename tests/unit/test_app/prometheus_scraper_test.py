@@ -0,0 +1,148 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime as dt
+import http.server
+import json
+import threading
+import time
+
+from absl.testing import absltest
+
+from framework.test_app import prometheus_scraper
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):  # pylint: disable=invalid-name
+        server: "_FakePod" = self.server
+        with server.lock:
+            server.calls += 1
+            body = (
+                "# TYPE calls counter\n"
+                f'calls_total{{pod="{server.name}"}} {server.calls}\n'
+            ).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        del args
+
+
+class _TricklingHandler(http.server.BaseHTTPRequestHandler):
+    """Sends a line each 50ms, each read well within the timeout."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.end_headers()
+        try:
+            for i in range(100):
+                self.wfile.write(f"line_{i:060} {i}\n".encode())
+                self.wfile.flush()
+                time.sleep(0.05)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        del args
+
+
+class _FakePod(http.server.ThreadingHTTPServer):
+    def __init__(self, name: str, handler=_MetricsHandler):
+        super().__init__(("127.0.0.1", 0), handler)
+        self.name = name
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    @property
+    def target(self) -> prometheus_scraper.ScrapeTarget:
+        return prometheus_scraper.ScrapeTarget(
+            role="server",
+            pod_name=self.name,
+            host="127.0.0.1",
+            port=self.server_address[1],
+        )
+
+
+class PrometheusScraperTest(absltest.TestCase):
+    def _start_pod(self, name: str, handler=_MetricsHandler) -> _FakePod:
+        pod = _FakePod(name, handler)
+        thread = threading.Thread(target=pod.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(pod.server_close)
+        self.addCleanup(pod.shutdown)
+        return pod
+
+    def test_scrape_rounds(self):
+        pods = [self._start_pod(f"pod-{i}") for i in range(3)]
+        output_path = self.create_tempfile().full_path
+        scraper = prometheus_scraper.PrometheusScraper(
+            [pod.target for pod in pods], output_path=output_path
+        )
+        for _ in range(3):
+            scraper.scrape_round(deadline=time.time() + 5)
+        scraper.stop()
+
+        self.assertEqual(scraper.rounds, 3)
+        for pod in pods:
+            self.assertEqual(scraper.latest(pod.target).value("calls_total"), 3)
+            self.assertEqual(
+                scraper.increase(pod.target).value("calls_total"), 2
+            )
+
+        with open(output_path, encoding="utf-8") as f:
+            output = json.load(f)
+        self.assertLen(output["targets"], 3)
+        self.assertEqual(output["names"], ["calls_total"])
+        self.assertLen(output["label_sets"], 3)
+        columns = output["columns"]
+        self.assertLen(columns["value"], 9)
+        self.assertCountEqual(columns["target"], [0, 1, 2] * 3)
+
+    def test_unreachable_target(self):
+        pod = self._start_pod("pod")
+        unreachable = prometheus_scraper.ScrapeTarget(
+            role="client", pod_name="gone", host="127.0.0.1", port=1
+        )
+        scraper = prometheus_scraper.PrometheusScraper(
+            [pod.target, unreachable]
+        )
+        scraper.scrape_round(deadline=time.time() + 5)
+        scraper.stop()
+        self.assertIsNotNone(scraper.latest(pod.target))
+        self.assertIsNone(scraper.latest(unreachable))
+
+    def test_deadline_bounds_whole_response(self):
+        pod = self._start_pod("slow", _TricklingHandler)
+        scraper = prometheus_scraper.PrometheusScraper([pod.target])
+        start = time.time()
+        scraper.scrape_round(deadline=start + 0.5)
+        elapsed = time.time() - start
+        scraper.stop()
+        self.assertIsNone(scraper.latest(pod.target))
+        self.assertLess(elapsed, 2)
+
+    def test_background_schedule(self):
+        pod = self._start_pod("pod")
+        with prometheus_scraper.PrometheusScraper(
+            [pod.target], interval=dt.timedelta(milliseconds=50)
+        ) as scraper:
+            deadline = time.monotonic() + 5
+            while scraper.rounds < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertGreaterEqual(scraper.rounds, 2)
+
+
+if __name__ == "__main__":
+    absltest.main()
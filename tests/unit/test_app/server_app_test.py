@@ -79,6 +79,24 @@ class ServerAppTest(absltest.TestCase):
             msg="Must be empty when only port is set",
         )
 
+    def test_make_xds_uri(self):
+        """Verifies make_xds_uri() matches xds_uri of the started server."""
+        xds_server = XdsTestServer(
+            ip=CANNED_IP,
+            rpc_port=CANNED_RPC_PORT,
+            hostname=CANNED_HOSTNAME,
+        )
+        for xds_host, xds_port in (
+            (CANNED_XDS_HOST, CANNED_XDS_PORT),
+            (CANNED_XDS_HOST, None),
+            (None, CANNED_XDS_PORT),
+        ):
+            xds_server.set_xds_address(xds_host, xds_port)
+            self.assertEqual(
+                XdsTestServer.make_xds_uri(xds_host, xds_port),
+                xds_server.xds_uri,
+            )
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -0,0 +1,99 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import collections
+import datetime as dt
+import threading
+
+from absl.testing import absltest
+
+from framework.helpers import retryers
+from framework.test_cases import concurrent_cleanup
+
+CleanupStep = concurrent_cleanup.CleanupStep
+_NO_WAIT = dt.timedelta(0)
+
+
+class RunCleanupStepsTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.lock = threading.Lock()
+        self.order: list[str] = []
+        self.calls: collections.Counter[str] = collections.Counter()
+
+    def _step_fn(self, name: str, *, fail_times: int = 0):
+        def fn():
+            with self.lock:
+                self.calls[name] += 1
+                if self.calls[name] <= fail_times:
+                    raise RuntimeError(f"{name} failed")
+                self.order.append(name)
+
+        return fn
+
+    def test_dependencies_respected(self):
+        concurrent_cleanup.run_cleanup_steps(
+            [
+                CleanupStep("server", self._step_fn("server"), after=("td",)),
+                CleanupStep("td", self._step_fn("td")),
+                CleanupStep("client", self._step_fn("client")),
+            ],
+            retry_wait=_NO_WAIT,
+        )
+        self.assertCountEqual(self.order, ["td", "server", "client"])
+        self.assertLess(self.order.index("td"), self.order.index("server"))
+
+    def test_only_failed_steps_retried(self):
+        concurrent_cleanup.run_cleanup_steps(
+            [
+                CleanupStep("td", self._step_fn("td", fail_times=2)),
+                CleanupStep("client", self._step_fn("client")),
+            ],
+            retry_wait=_NO_WAIT,
+        )
+        self.assertEqual(self.calls, {"td": 3, "client": 1})
+
+    def test_dependent_step_runs_after_failure(self):
+        with self.assertRaises(retryers.RetryError) as cm:
+            concurrent_cleanup.run_cleanup_steps(
+                [
+                    CleanupStep("td", self._step_fn("td", fail_times=5)),
+                    CleanupStep(
+                        "server", self._step_fn("server"), after=("td",)
+                    ),
+                ],
+                attempts=2,
+                retry_wait=_NO_WAIT,
+            )
+        self.assertEqual(self.calls, {"td": 2, "server": 1})
+        self.assertEqual(self.order, ["server"])
+        self.assertIsInstance(
+            cm.exception.last_attempt.exception(), RuntimeError
+        )
+
+    def test_invalid_dependencies(self):
+        with self.assertRaisesRegex(ValueError, "unknown"):
+            concurrent_cleanup.run_cleanup_steps(
+                [CleanupStep("a", self._step_fn("a"), after=("b",))]
+            )
+        with self.assertRaisesRegex(ValueError, "Circular"):
+            concurrent_cleanup.run_cleanup_steps(
+                [
+                    CleanupStep("a", self._step_fn("a"), after=("b",)),
+                    CleanupStep("b", self._step_fn("b"), after=("a",)),
+                ]
+            )
+
+
+if __name__ == "__main__":
+    absltest.main()
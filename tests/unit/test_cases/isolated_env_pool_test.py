@@ -0,0 +1,166 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import dataclasses
+import datetime as dt
+import threading
+import time
+from typing import Callable
+from unittest import mock
+
+from absl.testing import absltest
+from absl.testing import flagsaver
+
+from framework.infrastructure import gcp
+from framework.infrastructure import k8s
+from framework.test_cases import isolated_env_pool
+
+IsolatedEnv = isolated_env_pool.IsolatedEnv
+_CONFIG = isolated_env_pool.PoolConfig(
+    project="fake-project",
+    network="default",
+    resource_prefix="psm-test",
+    compute_api_version="v1",
+    kube_context="fake-context",
+    health_check_port=8081,
+)
+_LEASE_TIMEOUT = dt.timedelta(seconds=5)
+_NO_WAIT = dt.timedelta(milliseconds=100)
+
+
+def _wait_until(condition: Callable[[], bool]):
+    deadline = time.monotonic() + 5
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not met in time")
+        time.sleep(0.01)
+
+
+class FakeEnvPool(isolated_env_pool.IsolatedEnvPool):
+    """Keeps the pool logic, fakes the GCP and k8s resources."""
+
+    def __init__(
+        self,
+        config: isolated_env_pool.PoolConfig,
+        size: int,
+        *,
+        max_provisioned: int = 100,
+    ):
+        with mock.patch.object(gcp.api, "GcpApiManager"), mock.patch.object(
+            k8s, "KubernetesApiManager"
+        ):
+            super().__init__(config, size)
+        self.max_provisioned = max_provisioned
+        self.provisioned: list[str] = []
+        self.discarded: list[str] = []
+        self.verify_problem = ""
+
+    def _provision(self) -> IsolatedEnv:
+        if len(self.provisioned) >= self.max_provisioned:
+            # Out of quota: fail until closed.
+            self._stop_event.wait()
+            raise RuntimeError("Quota exceeded")
+        env = self._make_env(f"env{len(self.provisioned)}")
+        self.provisioned.append(env.resource_suffix)
+        return env
+
+    def _verify(self, env: IsolatedEnv) -> str:
+        del env
+        return self.verify_problem
+
+    def _discard(self, env: IsolatedEnv):
+        self.discarded.append(env.resource_suffix)
+
+
+class IsolatedEnvPoolTest(absltest.TestCase):
+    def _start_pool(self, size: int, **kwargs) -> FakeEnvPool:
+        pool = FakeEnvPool(_CONFIG, size, **kwargs)
+        pool.start()
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_lease_and_release(self):
+        pool = self._start_pool(1)
+        env = pool.lease(_LEASE_TIMEOUT)
+        self.assertEqual(env.resource_suffix, "env0")
+        self.assertEqual(env.server_namespace, "psm-test-server-env0")
+        self.assertEqual(env.client_namespace, "psm-test-client-env0")
+
+        # A replacement is provisioned, and the released env is verified
+        # and leased again.
+        pool.release(env, reusable=True)
+        leased = {pool.lease(_LEASE_TIMEOUT).resource_suffix for _ in range(2)}
+        self.assertEqual(leased, {"env0", "env1"})
+        self.assertEmpty(pool.discarded)
+
+    def test_exhausted(self):
+        pool = self._start_pool(1, max_provisioned=1)
+        self.assertIsNotNone(pool.lease(_LEASE_TIMEOUT))
+        self.assertIsNone(pool.lease(_NO_WAIT))
+
+    def test_not_reusable_discarded(self):
+        pool = self._start_pool(1)
+        env = pool.lease(_LEASE_TIMEOUT)
+        pool.release(env, reusable=False)
+        _wait_until(lambda: pool.discarded == ["env0"])
+
+    def test_verify_failed_discarded(self):
+        pool = self._start_pool(1)
+        env = pool.lease(_LEASE_TIMEOUT)
+        pool.verify_problem = "backend service backends is set"
+        pool.release(env, reusable=True)
+        _wait_until(lambda: pool.discarded == ["env0"])
+        self.assertEqual(pool.lease(_LEASE_TIMEOUT).resource_suffix, "env1")
+
+    def test_close(self):
+        pool = self._start_pool(2)
+        _wait_until(lambda: pool._available.qsize() == 2)
+        leased = pool.lease(_LEASE_TIMEOUT)
+        pool.release(leased, reusable=False)
+
+        pool.close()
+        self.assertFalse(pool._thread.is_alive())
+        self.assertCountEqual(pool.discarded, pool.provisioned)
+        # Idempotent, f.e. called by the test and at exit.
+        pool.close()
+        self.assertCountEqual(pool.discarded, pool.provisioned)
+
+
+class GetPoolTest(absltest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.enter_context(mock.patch.object(isolated_env_pool, "_pool", None))
+        self.enter_context(
+            mock.patch.object(isolated_env_pool, "IsolatedEnvPool", FakeEnvPool)
+        )
+        self.enter_context(mock.patch.object(isolated_env_pool, "atexit"))
+
+    def test_disabled(self):
+        self.assertIsNone(isolated_env_pool.get_pool(_CONFIG))
+
+    @flagsaver.flagsaver(isolated_env_pool_size=1)
+    def test_config_mismatch(self):
+        pool = isolated_env_pool.get_pool(_CONFIG)
+        self.addCleanup(pool.close)
+        self.assertEqual(pool.size, 1)
+
+        other_config = dataclasses.replace(_CONFIG, health_check_port=None)
+        self.assertIsNone(isolated_env_pool.get_pool(other_config))
+        self.assertIs(isolated_env_pool.get_pool(_CONFIG), pool)
+        # The pool provisioned for its own config only.
+        _wait_until(lambda: pool.provisioned)
+        self.assertEqual(pool.config, _CONFIG)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,140 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+from absl.testing import absltest
+
+from framework import xds_url_map_test_resources
+
+GcpResourceManager = xds_url_map_test_resources.GcpResourceManager
+_TIMEOUT_SEC = 5
+
+
+class FakeServerRunner:
+    def __init__(
+        self, name: str, barrier: threading.Barrier, *, fail: bool = False
+    ):
+        self.service_name = name
+        self.barrier = barrier
+        self.fail = fail
+        self.deployed = threading.Event()
+        self.finished = threading.Event()
+
+    def run(self, *, test_port, maintenance_port, replica_count):
+        del test_port, maintenance_port, replica_count
+        try:
+            # Fails unless all the runners are started concurrently.
+            self.barrier.wait()
+            if self.fail:
+                raise RuntimeError(f"{self.service_name} failed")
+            self.deployed.set()
+        finally:
+            self.finished.set()
+
+
+class FakeNamespace:
+    WAIT_MEDIUM_TIMEOUT_SEC = _TIMEOUT_SEC
+
+    def __init__(self, runners: list[FakeServerRunner]):
+        self.runners = {runner.service_name: runner for runner in runners}
+
+    def wait_for_namespace_created(self):
+        pass
+
+    def wait_for_service_neg_status_annotation(self, service_name, timeout_sec):
+        runner = self.runners[service_name]
+        runner.finished.wait(timeout_sec)
+        if not runner.deployed.is_set():
+            raise TimeoutError(f"No NEG annotation on {service_name}")
+
+    def parse_service_neg_status(self, service_name, service_port):
+        del service_port
+        return f"neg-{service_name}", ["zone-a"]
+
+
+class FakeTrafficDirector:
+    def __init__(self, runners: list[FakeServerRunner]):
+        self.runners = runners
+        self.added: list[tuple[str, str, str]] = []
+        self.threads: set[threading.Thread] = set()
+
+    def _add_neg_backends(self, backend_service: str, runner_index: int):
+        def add(neg_name, neg_zones):
+            del neg_zones
+            # The NEG must not be added before its deployment is done.
+            assert self.runners[runner_index].deployed.is_set()
+            self.threads.add(threading.current_thread())
+            self.added.append((backend_service, neg_name))
+
+        return add
+
+    @property
+    def backend_service_add_neg_backends(self):
+        return self._add_neg_backends("default", 0)
+
+    @property
+    def alternative_backend_service_add_neg_backends(self):
+        return self._add_neg_backends("alternative", 1)
+
+    @property
+    def affinity_backend_service_add_neg_backends(self):
+        return self._add_neg_backends("affinity", 2)
+
+
+class RunTestServersTest(absltest.TestCase):
+    def _manager(self, *, fail: tuple[str, ...] = ()) -> GcpResourceManager:
+        barrier = threading.Barrier(3, timeout=_TIMEOUT_SEC)
+        runners = [
+            FakeServerRunner(name, barrier, fail=name in fail)
+            for name in ("default", "alternative", "affinity")
+        ]
+        # Bypass the singleton metaclass, and the flags it injects.
+        manager = GcpResourceManager.__new__(GcpResourceManager)
+        manager.test_server_runner = runners[0]
+        manager.test_server_alternative_runner = runners[1]
+        manager.test_server_affinity_runner = runners[2]
+        manager.k8s_namespace = FakeNamespace(runners)
+        manager.td = FakeTrafficDirector(runners)
+        manager.server_port = 8080
+        manager.server_maintenance_port = 8081
+        return manager
+
+    def test_concurrent_start_and_neg_attach(self):
+        manager = self._manager()
+        manager._run_test_servers()
+        self.assertCountEqual(
+            manager.td.added,
+            [
+                ("default", "neg-default"),
+                ("alternative", "neg-alternative"),
+                ("affinity", "neg-affinity"),
+            ],
+        )
+        # The GCP calls are made from the calling thread.
+        self.assertEqual(manager.td.threads, {threading.current_thread()})
+
+    def test_error_raised_after_in_flight_done(self):
+        manager = self._manager(fail=("alternative",))
+        # Either the deployment or its NEG wait fails first.
+        with self.assertRaisesRegex(
+            (RuntimeError, TimeoutError), "alternative"
+        ):
+            manager._run_test_servers()
+        for runner in manager.k8s_namespace.runners.values():
+            self.assertTrue(runner.finished.is_set())
+        self.assertNotIn(("alternative", "neg-alternative"), manager.td.added)
+
+
+if __name__ == "__main__":
+    absltest.main()